@@ -743,15 +743,17 @@ def _print_pipeline_summary(
 
     # LLM usage line
     llm_calls = getattr(result, "llm_calls", 0)
-    if llm_calls > 0:
+    llm_cache_hits = getattr(result, "llm_cache_hits", 0)
+    if llm_calls > 0 or llm_cache_hits > 0:
         llm_in = getattr(result, "llm_input_tokens", 0)
         llm_out = getattr(result, "llm_output_tokens", 0)
         model = getattr(result, "llm_model", "")
         provider = getattr(result, "llm_provider", "")
         cost = estimate_cost(model, llm_in, llm_out)
         cost_str = f" · ~${cost:.2f}" if cost is not None else ""
+        cached_str = f" · {llm_cache_hits:,} cached" if llm_cache_hits else ""
         console.print(
-            f"  [dim]LLM: {llm_in:,} in · {llm_out:,} out{cost_str} ({model})[/dim]"
+            f"  [dim]LLM: {llm_in:,} in · {llm_out:,} out{cost_str}{cached_str} ({model})[/dim]"
         )
         url = PRICING_URLS.get(provider, "")
         if url:
@@ -759,7 +761,7 @@ def _print_pipeline_summary(
 
     # Done / error line
     elapsed = getattr(result, "elapsed_seconds", 0.0)
-    llm_ran = getattr(result, "llm_calls", 0) > 0
+    llm_ran = getattr(result, "llm_calls", 0) + llm_cache_hits > 0
     no_quotes = getattr(result, "total_quotes", 0) == 0
     has_errors = llm_ran and no_quotes
 
@@ -1075,6 +1077,14 @@ def run(
             "Run `bristlenose doctor --fetch` first to pre-warm the cache.",
         ),
     ] = False,
+    no_llm_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-llm-cache",
+            help="Send every LLM request to the provider instead of replaying "
+            "identical requests from .bristlenose/llm-cache/.",
+        ),
+    ] = False,
 ) -> None:
     """Analyse a folder of interviews and open the report in your browser."""
     # Default output location: inside the input folder
@@ -1142,6 +1152,8 @@ def run(
         settings_kwargs["whisper_model"] = whisper_model
     if codebook is not None:
         settings_kwargs["codebook"] = codebook
+    if no_llm_cache:
+        settings_kwargs["llm_cache"] = False
     # Record the forward-or-not decision in the resolution ledger BEFORE resolving,
     # attributed to this CLI layer. load_settings only sees the result (llm_provider
     # present in overrides or not); this names the actor that chose. See the 8 Jun
@@ -1231,7 +1243,7 @@ def run(
 
     # Legacy path: pipeline ran cleanly but produced zero usable quotes
     # (silent audio, no spoken content). Not an abandon — just empty input.
-    llm_ran = getattr(result, "llm_calls", 0) > 0
+    llm_ran = getattr(result, "llm_calls", 0) + getattr(result, "llm_cache_hits", 0) > 0
     pipeline_errored = llm_ran and getattr(result, "total_quotes", 0) == 0
 
     if pipeline_errored:
@@ -1402,6 +1414,14 @@ def analyze(
             "Run `bristlenose doctor --fetch` first to pre-warm the cache.",
         ),
     ] = False,
+    no_llm_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-llm-cache",
+            help="Send every LLM request to the provider instead of replaying "
+            "identical requests from .bristlenose/llm-cache/.",
+        ),
+    ] = False,
 ) -> None:
     """Run LLM analysis on existing transcripts (skip ingestion and transcription)."""
     # Default output location: if transcripts_dir is transcripts-raw/ inside a bristlenose-output,
@@ -1429,6 +1449,8 @@ def analyze(
         settings_kwargs["llm_provider"] = llm_provider
     if codebook is not None:
         settings_kwargs["codebook"] = codebook
+    if no_llm_cache:
+        settings_kwargs["llm_cache"] = False
     # See run() — record the --llm forward-or-not decision in the ledger, attributed
     # to this CLI layer, before load_settings resolves the winner.
     from bristlenose.config import (
@@ -2505,6 +2527,10 @@ def _help_config() -> None:
     console.print("  BRISTLENOSE_LLM_MAX_TOKENS       Max response tokens (default: 8192)")
     console.print("  BRISTLENOSE_LLM_TEMPERATURE      Temperature (default: 0.1)")
     console.print("  BRISTLENOSE_LLM_CONCURRENCY      Parallel LLM calls (default: 3)")
+    console.print("  BRISTLENOSE_LLM_CACHE            Replay identical requests from disk (default: true)")
+    console.print("  BRISTLENOSE_LLM_CACHE_MAX_MB     Response cache size cap (default: 200)")
+    console.print("  BRISTLENOSE_LLM_CACHE_MAX_AGE_DAYS  Drop cached responses older than N days (default: 30)")
+    console.print("  BRISTLENOSE_LLM_PROMPT_CACHING   Claude prompt-cache breakpoints on stable prefixes (default: true)")
     console.print()
     console.print("  [bold]Transcription[/bold]")
     console.print("  BRISTLENOSE_WHISPER_BACKEND      auto | mlx | faster-whisper")
@@ -2512,15 +2538,20 @@ def _help_config() -> None:
     console.print("  BRISTLENOSE_WHISPER_LANGUAGE      Language code (default: en)")
     console.print("  BRISTLENOSE_WHISPER_DEVICE        cpu | cuda | auto (faster-whisper only)")
     console.print("  BRISTLENOSE_WHISPER_COMPUTE_TYPE  int8 | float16 | float32")
+    console.print("  BRISTLENOSE_WHISPER_WORKERS       Parallel CPU model replicas (default: 1, 0 = auto)")
+    console.print("  BRISTLENOSE_WHISPER_CHUNK_SECONDS Split long files into windows of N seconds (default: 0 = off)")
     console.print()
     console.print("  [bold]PII[/bold]")
     console.print("  BRISTLENOSE_PII_ENABLED           true | false (default: false)")
     console.print("  BRISTLENOSE_PII_LLM_PASS          Extra LLM PII pass (default: false)")
     console.print("  BRISTLENOSE_PII_CUSTOM_NAMES      Comma-separated names to redact")
+    console.print("  BRISTLENOSE_PII_WORKERS           Parallel Presidio processes (default: 1, 0 = auto)")
     console.print()
     console.print("  [bold]Pipeline[/bold]")
     console.print("  BRISTLENOSE_MIN_QUOTE_WORDS       Minimum words per quote (default: 5)")
+    console.print("  BRISTLENOSE_CLUSTER_BATCH_QUOTES  Quotes per clustering request before batching (default: 400)")
     console.print("  BRISTLENOSE_MERGE_SPEAKER_GAP_SECONDS  Speaker merge gap (default: 2.0)")
+    console.print("  BRISTLENOSE_PIPELINE_STREAMING    Analyse sessions while others transcribe (default: true)")
     console.print()
     console.print("See .env.example in the repository for a template.")
     console.print()
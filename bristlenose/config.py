@@ -133,6 +133,17 @@ class BristlenoseSettings(BaseSettings):
     llm_model: str = "claude-sonnet-4-6"
     llm_max_tokens: int = 64000
     llm_temperature: float = 0.1
+    # Content-addressed response cache under <output>/.bristlenose/llm-cache/.
+    # Identical requests (same prompt, model, temperature, schema) replay from
+    # disk instead of the API. --no-llm-cache / BRISTLENOSE_LLM_CACHE=0 bypasses.
+    llm_cache: bool = True
+    llm_cache_max_mb: int = Field(default=200, ge=1)
+    llm_cache_max_age_days: int = Field(default=30, ge=1)
+    # Mark the stable request prefix (tool schema + system prompt, plus a
+    # caller-supplied leading slice of the user prompt such as the AutoCode
+    # taxonomy) as an Anthropic prompt-cache breakpoint. Other providers cache
+    # long shared prefixes automatically and ignore this.
+    llm_prompt_caching: bool = True
 
     # Azure OpenAI. Also accept the names the openai SDK's AzureOpenAI client
     # reads natively (AZURE_OPENAI_API_KEY / AZURE_OPENAI_ENDPOINT) — an Azure
@@ -171,6 +182,16 @@ class BristlenoseSettings(BaseSettings):
     whisper_language: str = "en"
     whisper_device: str = "auto"  # "cpu", "cuda", "auto" (faster-whisper only)
     whisper_compute_type: str = "int8"  # faster-whisper only
+    # Parallel faster-whisper replicas on CPU, one session per replica at a
+    # time. 1 = serial (one model, every core); 0 = auto-size from detected
+    # cores and RAM. Ignored on CUDA and MLX, which share a single device.
+    # When one model runs with chunking on, the number of windows it decodes
+    # side by side.
+    whisper_workers: int = Field(default=1, ge=0)
+    # Split recordings longer than 1.5x this many seconds into VAD-bounded,
+    # overlapping windows that transcribe concurrently and resume per window.
+    # 0 = one pass per file. faster-whisper only.
+    whisper_chunk_seconds: int = Field(default=0, ge=0)
 
     # PII
     pii_enabled: bool = False
@@ -183,6 +204,10 @@ class BristlenoseSettings(BaseSettings):
     # 0.9 = conservative (minimise false positives, risk missing some PII)
     # See: https://microsoft.github.io/presidio/analyzer/
     pii_score_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
+    # Presidio processes for stage 7, each with its own spaCy pipeline.
+    # 1 = in-process (still batched through nlp.pipe); 0 = auto-size from
+    # detected cores and RAM.
+    pii_workers: int = Field(default=1, ge=0)
 
     # Codebook (AutoCode framework). Slug matches a YAML file under
     # bristlenose/server/codebook/ (e.g. "garrett", "norman", "uxr").
@@ -201,6 +226,11 @@ class BristlenoseSettings(BaseSettings):
     # BRISTLENOSE_EXPERIMENTAL_CHAT_LENS=0. What it is testing is whether the
     # citations are honest, not whether the model can answer.
     experimental_chat_lens: bool = True
+    # Corpus budget per chat-lens question, in characters (~4 per token). A
+    # project within it is sent whole; a larger one sends the quotes most
+    # relevant to the question (server/grounding.py). Lower it to trade the
+    # whole-corpus view for cheaper questions.
+    chat_lens_corpus_chars: int = Field(default=120_000, ge=2_000)
 
     # Miro
     miro_access_token: str = ""
@@ -212,6 +242,9 @@ class BristlenoseSettings(BaseSettings):
     # Pipeline
     skip_transcription: bool = False
     write_intermediate: bool = True
+    # Transcript segment shards (stage 5): "json" keeps them inspectable,
+    # "binary" deflates each one. Reads accept either.
+    intermediate_format: str = "json"  # "json" or "binary"
 
     # Preflight model-fetch policy. When True, missing runtime-fetched models
     # (Whisper, spaCy, etc.) abort the pipeline with an instructive message
@@ -225,8 +258,28 @@ class BristlenoseSettings(BaseSettings):
     min_quote_words: int = 5
     merge_speaker_gap_seconds: float = 2.0
 
-    # Concurrency
+    # Clustering and theming (stages 10-11). Above this many quotes a stage
+    # clusters session batches in parallel and merges the labels in a second
+    # pass, so large studies don't outgrow one request's context window.
+    cluster_batch_quotes: int = Field(default=400, ge=20)
+
+    # Concurrency. LLM requests share one adaptive window per provider
+    # (bristlenose/llm/concurrency.py): it starts at llm_concurrency, grows
+    # while the provider keeps up, to at most llm_concurrency_max, and halves
+    # on rate limits. llm_tokens_per_minute (0 = none) caps estimated input
+    # tokens per trailing minute, for accounts with a low TPM tier.
     llm_concurrency: int = 3
+    llm_concurrency_max: int = Field(default=16, ge=1)
+    llm_tokens_per_minute: int = Field(default=0, ge=0)
+    # AutoCode lexical pre-filter (bristlenose/server/lexical.py): each quote
+    # keeps its N likeliest tags by local BM25 relevance and a batch's prompt
+    # lists only its quotes' tags. Higher keeps more recall; 0 sends the whole
+    # taxonomy with every batch.
+    autocode_tag_shortlist: int = Field(default=0, ge=0)
+    # Start speaker identification, PII removal, topics and quotes for each
+    # session as soon as its transcript exists, while the rest transcribe.
+    # Fresh runs only; resumed runs use the staged path.
+    pipeline_streaming: bool = True
 
 
 # Provider/model resolution ledger. Each load_settings() call rebuilds this as
@@ -32,6 +32,20 @@ def _canonical(path: Path) -> Path:
         return path.absolute()
 
 
+def file_identity(path: Path) -> tuple[str, int, int] | None:
+    """``(resolved path, size, mtime_ns)`` — the size+mtime fast path for one file.
+
+    ``None`` when the file does not exist.  The same identity
+    :func:`hash_file_metadata` hashes, for callers that key a cache on it.
+    """
+    p = _canonical(path)
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        return None
+    return str(p), st.st_size, st.st_mtime_ns
+
+
 def hash_file_metadata(paths: list[Path]) -> str:
     """Hash file identity by (resolved path, size, mtime_ns) — no content read.
 
@@ -0,0 +1,179 @@
+"""Content-addressed on-disk cache of structured LLM responses.
+
+Lives at ``<project>/.bristlenose/llm-cache/`` — the same ``run_dir`` that
+telemetry writes ``llm-calls.jsonl`` into, resolved from the run context set
+by ``run_lifecycle``. Outside a run (ad-hoc callers, most of serve mode) there
+is no run directory and nothing is cached.
+
+**Key.** SHA-256 over every input that can change the answer: provider,
+request model, temperature, system prompt, user prompt, the response model's
+JSON schema, and the ``PromptTemplate`` sha. A prompt edit, a schema change
+or a model switch is therefore a miss by construction — there is no manual
+invalidation step to forget. The per-call nonce ``wrap_untrusted`` puts in
+each ``<untrusted_NAME_xxxx>`` tag is stripped before hashing; otherwise no
+two requests would ever share a key.
+
+**Trust boundary.** Entries hold model output derived from transcripts, so
+they get the ``llm-calls.jsonl`` treatment: mode ``0o600``, never exported,
+never bundled. ``--no-llm-cache`` / ``BRISTLENOSE_LLM_CACHE=0`` bypasses the
+cache entirely (no reads, no writes).
+
+**Eviction.** Entries older than ``max_age_seconds`` are dropped, then the
+least-recently-used (by mtime — a hit touches its file) until the directory
+is under ``max_bytes``. Pruning runs once when the cache is opened; a single
+run cannot grow it meaningfully past the cap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "llm-cache"
+
+T = TypeVar("T", bound=BaseModel)
+
+# Envelope tags from ``bristlenose.llm.boundary.wrap_untrusted``; group 1 is
+# the tag without its random ``_xxxx`` suffix.
+_ENVELOPE_NONCE_RE = re.compile(r"(</?untrusted_[a-z_]+?)_[0-9a-f]{4}>")
+
+
+def _strip_nonces(prompt: str) -> str:
+    """Drop ``wrap_untrusted`` nonces so equal content hashes equally."""
+    return _ENVELOPE_NONCE_RE.sub(r"\1>", prompt)
+
+
+def schema_hash(response_model: type[BaseModel]) -> str:
+    """Stable digest of a response model's JSON schema."""
+    schema = json.dumps(response_model.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
+
+
+def make_key(
+    *,
+    provider: str,
+    model: str,
+    temperature: float,
+    system_prompt: str,
+    user_prompt: str,
+    response_model: type[BaseModel],
+    prompt_sha: str | None,
+) -> str:
+    """Content address for one request. Field order is part of the format."""
+    parts = [
+        provider,
+        model,
+        repr(float(temperature)),
+        schema_hash(response_model),
+        prompt_sha or "",
+        _strip_nonces(system_prompt),
+        _strip_nonces(user_prompt),
+    ]
+    h = hashlib.sha256()
+    for part in parts:
+        # Length-prefix each field so ("ab", "c") and ("a", "bc") differ.
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+class ResponseCache:
+    """Directory of ``<key[:2]>/<key>.json`` entries, one validated response each."""
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int,
+        max_age_seconds: float,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str, response_model: type[T]) -> T | None:
+        """Return the cached response, or None on miss / stale / unreadable."""
+        path = self._path(key)
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        if time.time() - st.st_mtime > self.max_age_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            value = response_model.model_validate(payload["response"])
+        except (OSError, ValueError, KeyError, ValidationError):
+            logger.debug("llm_cache: dropping unreadable entry %s", path.name)
+            path.unlink(missing_ok=True)
+            return None
+        # Touch so LRU eviction sees the hit.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: BaseModel) -> None:
+        """Store ``value`` atomically. Never raises — a cache is optional."""
+        path = self._path(key)
+        data = json.dumps({
+            "schema": type(value).__name__,
+            "response": value.model_dump(mode="json"),
+        }).encode("utf-8")
+        tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp, path)
+        except OSError:
+            logger.debug("llm_cache: could not write %s", path.name, exc_info=True)
+
+    def prune(self) -> tuple[int, int]:
+        """Apply age then size eviction. Returns (entries_removed, bytes_kept)."""
+        if not self.directory.is_dir():
+            return 0, 0
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        removed = 0
+        for path in self.directory.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if now - st.st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()  # oldest first
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        if removed:
+            logger.info("llm_cache_pruned | removed=%d | bytes=%d", removed, total)
+        return removed, total
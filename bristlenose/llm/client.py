@@ -7,6 +7,8 @@ import copy
 import json
 import logging
 import time
+from contextvars import ContextVar
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal, TypeVar
 
 from pydantic import BaseModel
@@ -15,10 +17,13 @@ if TYPE_CHECKING:
     # Type-only imports — keeps the lazy-import discipline (SDKs are imported
     # inside the methods that use them) while letting annotations name them.
     import anthropic
+    import httpx
     import openai
 
 from bristlenose.config import BristlenoseSettings
 from bristlenose.llm import telemetry
+from bristlenose.llm.cache import CACHE_DIRNAME, ResponseCache, make_key
+from bristlenose.llm.concurrency import CONGESTION_STATUSES, controller_for
 from bristlenose.llm.pricing import PRICE_TABLE_VERSION
 from bristlenose.llm.prompts import PromptTemplate
 
@@ -26,6 +31,14 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Set for the duration of one ``analyze`` call so the per-provider
+# ``_record_call`` sites tag their row as a cache miss without each of them
+# growing a parameter. Per-task (asyncio copies context), so concurrent calls
+# don't see each other's state.
+_response_cache_state: ContextVar[Literal["hit", "miss"] | None] = ContextVar(
+    "_response_cache_state", default=None,
+)
+
 
 def _repo_relative_prompt_path(template: PromptTemplate) -> str:
     """Return the prompt file path as a repo-relative string.
@@ -37,6 +50,39 @@ def _repo_relative_prompt_path(template: PromptTemplate) -> str:
     return f"bristlenose/llm/prompts/{template.path.name}"
 
 
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _anthropic_cache_breakpoints(
+    system_prompt: str,
+    user_prompt: str,
+    cacheable_prefix: str | None,
+) -> tuple[list[dict[str, object]], str | list[dict[str, object]]]:
+    """Split a request into content blocks with prompt-cache breakpoints.
+
+    Anthropic caches the request prefix in order tools → system → messages,
+    up to the last block carrying ``cache_control``. A breakpoint on the
+    system block covers the tool schema and system prompt — the part every
+    call of a stage shares. When the caller names a stable leading slice of
+    the user prompt, a second breakpoint ends there so batch N+1 reads
+    everything before its own quotes from cache.
+
+    Prefixes under the model's minimum cacheable length (1024 tokens on
+    Sonnet/Opus) are silently processed uncached by the API, so this is
+    safe to apply unconditionally.
+    """
+    system = [{"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL}]
+    if not cacheable_prefix or not user_prompt.startswith(cacheable_prefix):
+        return system, user_prompt
+    rest = user_prompt[len(cacheable_prefix):]
+    blocks: list[dict[str, object]] = [
+        {"type": "text", "text": cacheable_prefix, "cache_control": _EPHEMERAL},
+    ]
+    if rest:
+        blocks.append({"type": "text", "text": rest})
+    return system, blocks
+
+
 # ---------------------------------------------------------------------------
 # Gemini schema helpers
 # ---------------------------------------------------------------------------
@@ -117,16 +163,27 @@ def _clamp_max_tokens(model: str, requested: int) -> int:
     return min(requested, cap) if cap else requested
 
 
+def request_model_for(settings: BristlenoseSettings) -> str:
+    """The model a provider is actually asked for: Azure's deployment name,
+    Ollama's local model, else ``llm_model``."""
+    if settings.llm_provider == "azure":
+        return settings.azure_deployment or ""
+    if settings.llm_provider == "local":
+        return settings.local_model
+    return settings.llm_model
+
+
 # Cloud-provider client retry budget. The Anthropic / OpenAI / Azure SDKs all
 # retry 429 / 408 / 409 / 5xx / connection errors with exponential backoff,
 # honouring the server's `Retry-After` (and `retry-after-ms`) header — we don't
 # hand-roll any of that. The SDK default of 2 is too few for the request bursts
 # smart-split quote extraction can produce on a low-TPM tier (a Tier-1 gpt-4o
-# account is 30k TPM). 6 rides out transient rate-limit windows. This is the
-# reactive layer only; global adaptive concurrency (AIMD) is a measure-first
-# follow-up if the logs ever show *sustained* (not transient) 429 pressure.
-# Local (Ollama) talks to localhost — no provider rate limits — so it keeps the
-# SDK default and its own JSON-parse retry loop.
+# account is 30k TPM). 6 rides out transient rate-limit windows. That is the
+# reactive layer; sustained pressure is handled by the adaptive concurrency
+# window (bristlenose/llm/concurrency.py), which sees each retried 429 through
+# the HTTP hook the clients are built with. Local (Ollama) talks to localhost —
+# no provider rate limits — so it keeps the SDK default and its own JSON-parse
+# retry loop.
 _CLOUD_MAX_RETRIES = 6
 
 
@@ -170,6 +227,8 @@ class LLMUsageTracker:
         self.input_tokens: int = 0
         self.output_tokens: int = 0
         self.calls: int = 0
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
 
     def record(self, input_tokens: int, output_tokens: int) -> None:
         """Record token usage from a single API call."""
@@ -202,6 +261,7 @@ class LLMClient:
         self._google_client: object | None = None
         self._local_client: object | None = None
         self.tracker = LLMUsageTracker()
+        self._response_cache: ResponseCache | None = None
 
         # Log the resolved target BEFORE validation so we capture it even when
         # the key/endpoint check below raises. This is the single most useful
@@ -289,6 +349,7 @@ class LLMClient:
         response_model: type[T],
         max_tokens: int | None = None,
         prompt_template: PromptTemplate | None = None,
+        cacheable_prefix: str | None = None,
     ) -> T:
         """Send a prompt and parse the response into a Pydantic model.
 
@@ -300,6 +361,11 @@ class LLMClient:
             prompt_template: Optional template carrying id/version/sha for
                 telemetry. When None, the JSONL row's prompt fields stay
                 null — used by ad-hoc callers without registered prompts.
+            cacheable_prefix: Optional leading slice of ``user_prompt`` that is
+                identical across a burst of calls (e.g. the codebook taxonomy
+                ahead of each quote batch). Anthropic gets a prompt-cache
+                breakpoint after it; ignored if ``user_prompt`` doesn't start
+                with it, and by providers that cache prefixes automatically.
 
         Returns:
             An instance of response_model populated from the LLM response.
@@ -316,97 +382,176 @@ class LLMClient:
             )
         input_chars = len(system_prompt) + len(user_prompt)
 
-        logger.debug(
-            "llm_call_start | provider=%s | request_model=%s | schema=%s | "
-            "input_chars=%d | max_tokens=%d",
-            self.provider,
-            self._provider_request_model(),
-            response_model.__name__,
-            input_chars,
-            max_tokens,
-        )
-
-        t0 = time.perf_counter()
-        try:
-            try:
-                if self.provider == "anthropic":
-                    result = await self._analyze_anthropic(
-                        system_prompt, user_prompt, response_model, max_tokens,
-                        prompt_template, input_chars, t0,
-                    )
-                elif self.provider == "openai":
-                    result = await self._analyze_openai(
-                        system_prompt, user_prompt, response_model, max_tokens,
-                        prompt_template, input_chars, t0,
-                    )
-                elif self.provider == "azure":
-                    result = await self._analyze_azure(
-                        system_prompt, user_prompt, response_model, max_tokens,
-                        prompt_template, input_chars, t0,
-                    )
-                elif self.provider == "google":
-                    result = await self._analyze_google(
-                        system_prompt, user_prompt, response_model, max_tokens,
-                        prompt_template, input_chars, t0,
-                    )
-                elif self.provider == "local":
-                    result = await self._analyze_local(
-                        system_prompt, user_prompt, response_model, max_tokens,
-                        prompt_template, input_chars, t0,
-                    )
-                else:
-                    raise ValueError(f"Unsupported LLM provider: {self.provider}")
-            except asyncio.CancelledError:
+        cache = self._cache_for_run()
+        cache_key: str | None = None
+        if cache is not None:
+            cache_key = make_key(
+                provider=self.provider,
+                model=self._provider_request_model(),
+                temperature=self.settings.llm_temperature,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                response_model=response_model,
+                prompt_sha=prompt_template.sha if prompt_template else None,
+            )
+            t_lookup = time.perf_counter()
+            cached = cache.get(cache_key, response_model)
+            if cached is not None:
+                self.tracker.cache_hits += 1
+                logger.info(
+                    "llm_cache_hit | provider=%s | model=%s | schema=%s | key=%s",
+                    self.provider,
+                    self._provider_request_model(),
+                    response_model.__name__,
+                    cache_key[:12],
+                )
                 self._record_call(
                     request_model=self._provider_request_model(),
                     response_model=None,
                     input_chars=input_chars,
-                    elapsed_ms=int((time.perf_counter() - t0) * 1000),
-                    outcome="cancelled",
+                    elapsed_ms=int((time.perf_counter() - t_lookup) * 1000),
+                    outcome="ok",
                     prompt_template=prompt_template,
                     usage_source="missing",
+                    response_cache="hit",
                 )
-                raise
-            except Exception as exc:
-                # Surface BOTH halves of the call on any failure — the recurring
-                # bug is a provider/model mismatch (anthropic endpoint rejecting
-                # gpt-4o with a 404), which is invisible if only the error string
-                # is logged. errno/status come through in str(exc).
-                logger.warning(
-                    "llm_call_failed | provider=%s | request_model=%s | "
-                    "schema=%s | error_type=%s | error=%s",
+                return cached
+            self.tracker.cache_misses += 1
+        # One slot from the provider's shared, adaptive window — or the slot
+        # this task already holds, when the call site took one.
+        controller = controller_for(self.settings)
+        async with controller as slot:
+            slot.wait_s += await controller.spend(input_chars)
+            cache_token = _response_cache_state.set("miss" if cache is not None else None)
+
+            logger.debug(
+                "llm_call_start | provider=%s | request_model=%s | schema=%s | "
+                "input_chars=%d | max_tokens=%d",
+                self.provider,
+                self._provider_request_model(),
+                response_model.__name__,
+                input_chars,
+                max_tokens,
+            )
+
+            t0 = time.perf_counter()
+            try:
+                try:
+                    if self.provider == "anthropic":
+                        result = await self._analyze_anthropic(
+                            system_prompt, user_prompt, response_model, max_tokens,
+                            prompt_template, input_chars, t0,
+                            cacheable_prefix=cacheable_prefix,
+                        )
+                    elif self.provider == "openai":
+                        result = await self._analyze_openai(
+                            system_prompt, user_prompt, response_model, max_tokens,
+                            prompt_template, input_chars, t0,
+                        )
+                    elif self.provider == "azure":
+                        result = await self._analyze_azure(
+                            system_prompt, user_prompt, response_model, max_tokens,
+                            prompt_template, input_chars, t0,
+                        )
+                    elif self.provider == "google":
+                        result = await self._analyze_google(
+                            system_prompt, user_prompt, response_model, max_tokens,
+                            prompt_template, input_chars, t0,
+                        )
+                    elif self.provider == "local":
+                        result = await self._analyze_local(
+                            system_prompt, user_prompt, response_model, max_tokens,
+                            prompt_template, input_chars, t0,
+                        )
+                    else:
+                        raise ValueError(f"Unsupported LLM provider: {self.provider}")
+                    if cache is not None and cache_key is not None:
+                        cache.put(cache_key, result)
+                except asyncio.CancelledError:
+                    self._record_call(
+                        request_model=self._provider_request_model(),
+                        response_model=None,
+                        input_chars=input_chars,
+                        elapsed_ms=int((time.perf_counter() - t0) * 1000),
+                        outcome="cancelled",
+                        prompt_template=prompt_template,
+                        usage_source="missing",
+                    )
+                    raise
+                except Exception as exc:
+                    # Surface BOTH halves of the call on any failure — the recurring
+                    # bug is a provider/model mismatch (anthropic endpoint rejecting
+                    # gpt-4o with a 404), which is invisible if only the error string
+                    # is logged. errno/status come through in str(exc).
+                    logger.warning(
+                        "llm_call_failed | provider=%s | request_model=%s | "
+                        "schema=%s | error_type=%s | error=%s",
+                        self.provider,
+                        self._provider_request_model(),
+                        response_model.__name__,
+                        type(exc).__name__,
+                        exc,
+                    )
+                    raise
+            finally:
+                _response_cache_state.reset(cache_token)
+                elapsed_ms = int((time.perf_counter() - t0) * 1000)
+                # Stable, greppable prefix for perf baselining — see
+                # docs/design-perf-fossda-baseline.md step 5.
+                logger.info(
+                    "llm_request | provider=%s | model=%s | elapsed_ms=%d | "
+                    "schema=%s",
                     self.provider,
-                    self._provider_request_model(),
+                    self.settings.llm_model,
+                    elapsed_ms,
                     response_model.__name__,
-                    type(exc).__name__,
-                    exc,
                 )
-                raise
-        finally:
-            elapsed_ms = int((time.perf_counter() - t0) * 1000)
-            # Stable, greppable prefix for perf baselining — see
-            # docs/design-perf-fossda-baseline.md step 5.
-            logger.info(
-                "llm_request | provider=%s | model=%s | elapsed_ms=%d | "
-                "schema=%s",
-                self.provider,
-                self.settings.llm_model,
-                elapsed_ms,
-                response_model.__name__,
+            return result
+
+    def _cache_for_run(self) -> ResponseCache | None:
+        """Return the response cache for the active run, or None to bypass.
+
+        The cache lives beside ``llm-calls.jsonl`` in the run's
+        ``.bristlenose/`` directory, so it is only available inside a run
+        context. Opened (and pruned) once per run directory.
+        """
+        if not self.settings.llm_cache:
+            return None
+        run_dir = telemetry.current_run_dir()
+        if run_dir is None:
+            return None
+        directory = Path(run_dir) / CACHE_DIRNAME
+        if self._response_cache is None or self._response_cache.directory != directory:
+            cache = ResponseCache(
+                directory,
+                max_bytes=self.settings.llm_cache_max_mb * 1024 * 1024,
+                max_age_seconds=self.settings.llm_cache_max_age_days * 86400,
             )
-        return result
+            try:
+                cache.prune()
+            except OSError:
+                logger.debug("llm_cache prune failed", exc_info=True)
+            self._response_cache = cache
+        return self._response_cache
 
     def _provider_request_model(self) -> str:
         """Return the per-provider 'request model' string used in telemetry."""
-        if self.provider == "azure":
-            return self.settings.azure_deployment or ""
-        if self.provider == "local":
-            return self.settings.local_model
-        return self.settings.llm_model
+        return request_model_for(self.settings)
+
+    async def _on_http_response(self, response: httpx.Response) -> None:
+        """HTTP hook: report congestion statuses, including ones the SDK retries.
+
+        Runs inside the request's task, so the slot it charges is the one the
+        call is being made in.
+        """
+        if response.status_code in CONGESTION_STATUSES:
+            controller = controller_for(self.settings)
+            controller.congestion(controller.current_slot())
 
     # Lazy, cached client constructors. Each carries `max_retries` so the SDK's
     # built-in Retry-After-honouring backoff actually gets enough attempts —
-    # see `_CLOUD_MAX_RETRIES`. Kept as one-liners so the retry budget can't
+    # see `_CLOUD_MAX_RETRIES` — and an HTTP client whose response hook feeds
+    # the concurrency window. Kept as one-liners so the retry budget can't
     # silently drift between providers.
     def _ensure_anthropic_client(self) -> anthropic.AsyncAnthropic:
         import anthropic
@@ -415,6 +560,9 @@ class LLMClient:
             self._anthropic_client = anthropic.AsyncAnthropic(
                 api_key=self.settings.anthropic_api_key,
                 max_retries=_CLOUD_MAX_RETRIES,
+                http_client=anthropic.DefaultAsyncHttpxClient(
+                    event_hooks={"response": [self._on_http_response]},
+                ),
             )
         return self._anthropic_client
 
@@ -425,6 +573,9 @@ class LLMClient:
             self._openai_client = openai.AsyncOpenAI(
                 api_key=self.settings.openai_api_key,
                 max_retries=_CLOUD_MAX_RETRIES,
+                http_client=openai.DefaultAsyncHttpxClient(
+                    event_hooks={"response": [self._on_http_response]},
+                ),
             )
         return self._openai_client
 
@@ -437,6 +588,9 @@ class LLMClient:
                 azure_endpoint=self.settings.azure_endpoint,
                 api_version=self.settings.azure_api_version,
                 max_retries=_CLOUD_MAX_RETRIES,
+                http_client=openai.DefaultAsyncHttpxClient(
+                    event_hooks={"response": [self._on_http_response]},
+                ),
             )
         return self._azure_client
 
@@ -456,9 +610,33 @@ class LLMClient:
         retry_count: int = 0,
         finish_reason: str | None = None,
         usage_source: Literal["reported", "missing"] = "reported",
+        response_cache: Literal["hit", "miss"] | None = None,
+        error: BaseException | None = None,
     ) -> None:
-        """Thin wrapper around ``telemetry.record_call`` — never raises."""
+        """Thin wrapper around ``telemetry.record_call`` — never raises.
+
+        Also the feedback point for adaptive concurrency: every provider call
+        ends in exactly one row, so the row's outcome, latency and ``error``
+        are handed to the controller here, and its decision is recorded.
+        """
         try:
+            controller = controller_for(self.settings)
+            slot = controller.current_slot() if response_cache != "hit" else None
+            concurrency: dict[str, object] = {}
+            if slot is not None:
+                wait_ms = int(slot.wait_s * 1000)
+                concurrency = {
+                    "concurrency_decision": controller.observe(
+                        slot,
+                        elapsed_s=elapsed_ms / 1000,
+                        input_chars=input_chars,
+                        outcome=outcome,
+                        error=error,
+                    ),
+                    "concurrency_limit": controller.limit,
+                    "concurrency_in_flight": slot.in_flight,
+                    "concurrency_wait_ms": wait_ms,
+                }
             telemetry.record_call(
                 provider=self.provider,
                 request_model=request_model,
@@ -474,6 +652,7 @@ class LLMClient:
                 retry_count=retry_count,
                 finish_reason=finish_reason,
                 usage_source=usage_source,
+                response_cache=response_cache or _response_cache_state.get(),
                 prompt_id=prompt_template.id if prompt_template else None,
                 prompt_version=prompt_template.version if prompt_template else None,
                 prompt_path=(
@@ -481,6 +660,7 @@ class LLMClient:
                     if prompt_template else None
                 ),
                 prompt_sha=prompt_template.sha if prompt_template else None,
+                **concurrency,  # type: ignore[arg-type]
             )
         except Exception:
             # Telemetry must never break a real LLM call. First failure per
@@ -505,6 +685,7 @@ class LLMClient:
         prompt_template: PromptTemplate | None,
         input_chars: int,
         t0: float,
+        cacheable_prefix: str | None = None,
     ) -> T:
         """Call Anthropic API with tool use for structured output."""
         client = self._ensure_anthropic_client()
@@ -519,6 +700,13 @@ class LLMClient:
             "input_schema": schema,
         }
 
+        system: str | list[dict[str, object]] = system_prompt
+        user_content: str | list[dict[str, object]] = user_prompt
+        if self.settings.llm_prompt_caching:
+            system, user_content = _anthropic_cache_breakpoints(
+                system_prompt, user_prompt, cacheable_prefix,
+            )
+
         logger.info("Calling Anthropic API: model=%s", self.settings.llm_model)
 
         request_model = self.settings.llm_model
@@ -527,8 +715,8 @@ class LLMClient:
                 model=request_model,
                 max_tokens=max_tokens,
                 temperature=self.settings.llm_temperature,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
+                system=system,
+                messages=[{"role": "user", "content": user_content}],
                 tools=[tool],
                 tool_choice={"type": "tool", "name": tool_name},
                 # Explicit timeout bypasses the SDK's heuristic that rejects
@@ -537,13 +725,14 @@ class LLMClient:
             )
         except asyncio.CancelledError:
             raise
-        except Exception:
+        except Exception as exc:
             self._record_call(
                 request_model=request_model,
                 response_model=None,
                 input_chars=input_chars,
                 elapsed_ms=int((time.perf_counter() - t0) * 1000),
                 outcome="error",
+                error=exc,
                 prompt_template=prompt_template,
                 usage_source="missing",
             )
@@ -660,12 +849,13 @@ class LLMClient:
             )
         except asyncio.CancelledError:
             raise
-        except Exception:
+        except Exception as exc:
             self._record_call(
                 request_model=request_model, response_model=None,
                 input_chars=input_chars,
                 elapsed_ms=int((time.perf_counter() - t0) * 1000),
                 outcome="error", prompt_template=prompt_template,
+                error=exc,
                 usage_source="missing",
             )
             raise
@@ -767,12 +957,13 @@ class LLMClient:
             )
         except asyncio.CancelledError:
             raise
-        except Exception:
+        except Exception as exc:
             self._record_call(
                 request_model=request_model, response_model=None,
                 input_chars=input_chars,
                 elapsed_ms=int((time.perf_counter() - t0) * 1000),
                 outcome="error", prompt_template=prompt_template,
+                error=exc,
                 usage_source="missing",
             )
             raise
@@ -875,12 +1066,13 @@ class LLMClient:
             )
         except asyncio.CancelledError:
             raise
-        except Exception:
+        except Exception as exc:
             self._record_call(
                 request_model=request_model, response_model=None,
                 input_chars=input_chars,
                 elapsed_ms=int((time.perf_counter() - t0) * 1000),
                 outcome="error", prompt_template=prompt_template,
+                error=exc,
                 usage_source="missing",
             )
             raise
@@ -1014,12 +1206,13 @@ class LLMClient:
                     )
                 except asyncio.CancelledError:
                     raise
-                except Exception:
+                except Exception as exc:
                     self._record_call(
                         request_model=model, response_model=None,
                         input_chars=input_chars,
                         elapsed_ms=int((time.perf_counter() - t0) * 1000),
                         outcome="error", prompt_template=prompt_template,
+                        error=exc,
                         input_tokens=sum_input_tokens if any_usage else None,
                         output_tokens=sum_output_tokens if any_usage else None,
                         retry_count=max(attempts_used - 1, 0),
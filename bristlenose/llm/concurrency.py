@@ -0,0 +1,553 @@
+"""Adaptive LLM concurrency — one controller per provider, shared process-wide.
+
+Every LLM fan-out used to bound itself with its own
+``asyncio.Semaphore(settings.llm_concurrency)``: a fixed 3 whatever the
+account's tier, per call site, and blind to 429s (the SDKs retry them
+quietly). Provider requests now take a slot from their provider's
+:class:`ConcurrencyController`, which sizes its window from what the provider
+tells it (AIMD, as in TCP congestion control):
+
+- **Additive increase.** A healthy completion — it succeeded, and was no
+  slower per input character than ``_SLOW_FACTOR`` times the smoothed
+  rate — grows the window by ``1 / window``, so it gains one slot per
+  window's worth of completions, up to ``llm_concurrency_max``.
+- **Multiplicative decrease.** A congestion signal halves the window, down
+  to one: a 429 / 503 / 529 response (seen by the SDK's HTTP hook, even
+  when the SDK goes on to retry it), or a call that failed rate-limited,
+  overloaded or timed out. One overload produces a burst of signals, so the
+  window is cut at most once per ``_BACKOFF_INTERVAL_S``.
+- **Token budget.** With ``llm_tokens_per_minute`` set, each request also
+  waits until its estimated input tokens (``input_chars / 4``) fit in the
+  trailing minute's budget.
+
+Slow calls and other failures hold the window where it is. Each call's
+``llm-calls.jsonl`` row records the window, the requests in flight, the time
+it queued and what it did to the window (the ``concurrency_*`` fields).
+
+The controller is a drop-in for the call sites' semaphores
+(``async with controller:``), so a job's cancellation checkpoint still runs
+only once it has a slot. A task that holds a slot reuses it for every
+:meth:`LLMClient.analyze` call it makes, rather than queueing again behind
+itself. The controller is shared by every event loop in the process, so its
+state sits behind a thread lock and each waiter is woken on its own loop.
+
+It is also the process's LLM scheduler. Code that makes requests tags them
+with :func:`llm_work` — a :class:`Priority` and a job key — and a free slot
+goes to the most urgent priority first (a researcher waiting on a chat
+answer, before pipeline stages, before background AutoCode), then, within a
+priority, to the job that has been granted the fewest slots (so two AutoCode
+frameworks share the window rather than running one after the other), then
+to whoever asked first. :func:`cancel_llm_job` drops a job's queued requests,
+and :func:`queue_snapshot` reports queue depth and waits for ``GET
+/api/llm/queue``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING, Literal
+
+from bristlenose.llm.failure_classifier import LLMFailureKind, classify_exception
+
+if TYPE_CHECKING:
+    from bristlenose.config import BristlenoseSettings
+
+logger = logging.getLogger(__name__)
+
+Decision = Literal["increase", "decrease", "hold"]
+
+#: HTTP statuses that mean "slow down": rate limited, unavailable, and
+#: Anthropic's overloaded.
+CONGESTION_STATUSES = frozenset({429, 503, 529})
+
+_CHARS_PER_TOKEN = 4
+_TOKEN_WINDOW_S = 60.0
+_TOKEN_POLL_S = 0.25
+# A call this many times slower (per input character) than the smoothed
+# rate holds the window instead of growing it.
+_SLOW_FACTOR = 3.0
+_LATENCY_ALPHA = 0.2
+# Short prompts cost a fixed round trip; below this size, rates are taken
+# as if the prompt were this long.
+_LATENCY_CHARS_FLOOR = 2000
+_BACKOFF_INTERVAL_S = 2.0
+# Granted waits remembered per priority, for the queue snapshot.
+_RECENT_WAITS = 50
+
+
+class Priority(IntEnum):
+    """Who is waiting on an LLM request; lower values get slots first."""
+
+    INTERACTIVE = 0  # a researcher watching the screen: chat, elaboration
+    NORMAL = 1  # pipeline runs and other foreground batches
+    BACKGROUND = 2  # AutoCode and its re-apply
+
+
+class LLMJobCancelledError(Exception):
+    """The request's job was cancelled while it queued for a slot."""
+
+
+@dataclass(frozen=True)
+class _Work:
+    priority: Priority
+    job: str
+
+
+_work: ContextVar[_Work] = ContextVar("_llm_work", default=_Work(Priority.NORMAL, ""))
+
+
+@contextmanager
+def llm_work(priority: Priority, job: str = "") -> Iterator[None]:
+    """Tag the LLM requests made inside the block with a priority and a job.
+
+    Tasks created inside the block (``asyncio.gather`` batches) inherit the
+    tag. ``job`` is the unit of fair sharing and of :func:`cancel_llm_job`;
+    untagged requests share the ``""`` job at :attr:`Priority.NORMAL`.
+    """
+    token = _work.set(_Work(priority, job))
+    try:
+        yield
+    finally:
+        _work.reset(token)
+
+
+@dataclass
+class Slot:
+    """One granted request slot, and the feedback pending against it."""
+
+    in_flight: int  # requests in flight when granted, this one included
+    wait_s: float  # queued for the slot (and token budget) before the call
+    throttled: bool = False  # the HTTP hook saw a congestion status
+    decision: Decision | None = None  # what the hook did to the window
+    released: bool = False
+
+
+@dataclass(eq=False)
+class _Waiter:
+    loop: asyncio.AbstractEventLoop
+    priority: Priority
+    job: str
+    seq: int
+    since: float
+    future: asyncio.Future[None] | None = None
+    cancelled: bool = False
+
+
+@dataclass
+class _Held:
+    controller: ConcurrencyController
+    slot: Slot
+    task: asyncio.Task | None
+    depth: int = 0
+    token: object = field(default=None, repr=False)
+
+
+_held: ContextVar[_Held | None] = ContextVar("_held_llm_slot", default=None)
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def is_congestion(provider: str, exc: BaseException) -> bool:
+    """Whether a failed call tells us to back off (rate limit, overload, timeout)."""
+    if isinstance(exc, (TimeoutError, asyncio.TimeoutError)):
+        return True
+    if "timeout" in type(exc).__name__.lower():
+        return True
+    return classify_exception(provider, exc) in (
+        LLMFailureKind.RATE_LIMITED, LLMFailureKind.SERVER_ERROR,
+    )
+
+
+class ConcurrencyController:
+    """AIMD window over one provider's in-flight requests.
+
+    Args:
+        provider: Provider slug, for logs and failure classification.
+        initial: Starting window.
+        ceiling: Largest window the controller grows to.
+        floor: Smallest window it backs off to.
+        tokens_per_minute: Input-token budget per trailing minute; 0 for none.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        initial: int,
+        ceiling: int,
+        floor: int = 1,
+        tokens_per_minute: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._floor = max(1, floor)
+        self._ceiling = max(self._floor, ceiling)
+        self._initial = initial
+        self._window = float(min(max(initial, self._floor), self._ceiling))
+        self._tokens_per_minute = tokens_per_minute
+        self._in_flight = 0
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+        # Slots granted per job with requests queued — the fair-share clock.
+        self._served: dict[str, int] = {}
+        self._recent_waits: dict[Priority, deque[float]] = {
+            p: deque(maxlen=_RECENT_WAITS) for p in Priority
+        }
+        self._spent: deque[tuple[float, int]] = deque()
+        self._spent_total = 0
+        self._rate: float | None = None  # smoothed seconds per 1k input chars
+        self._last_decrease = -math.inf
+
+    def configure(self, *, initial: int, ceiling: int, tokens_per_minute: int) -> None:
+        """Apply settings; the learned window is kept unless ``initial`` changed."""
+        with self._lock:
+            self._ceiling = max(self._floor, ceiling)
+            if initial != self._initial:
+                self._initial = initial
+                self._window = float(max(initial, self._floor))
+            self._window = min(self._window, self._ceiling)
+            self._tokens_per_minute = tokens_per_minute
+            self._wake_head()
+
+    @property
+    def limit(self) -> int:
+        """Current window — the most requests allowed in flight."""
+        return int(self._window)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    # -- Slots --------------------------------------------------------------
+
+    def _head(self) -> _Waiter | None:
+        """The waiter next in line: priority, then fair share, then arrival.
+
+        Lock held.
+        """
+        return min(
+            self._waiters,
+            key=lambda w: (w.priority, self._served[w.job], w.seq),
+            default=None,
+        )
+
+    def _wake(self, waiter: _Waiter) -> None:
+        if waiter.future is not None and not waiter.future.done():
+            waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+
+    def _wake_head(self) -> None:
+        """Wake the next waiter to re-check for a slot.  Lock held."""
+        head = self._head()
+        if head is not None:
+            self._wake(head)
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        """Lock held.  A job joining the queue starts level with its peers."""
+        if waiter.job not in self._served:
+            self._served[waiter.job] = min(
+                (self._served[w.job] for w in self._waiters if w.priority == waiter.priority),
+                default=0,
+            )
+        self._waiters.append(waiter)
+
+    def _dequeue(self, waiter: _Waiter) -> None:
+        """Lock held."""
+        self._waiters.remove(waiter)
+        if not any(w.job == waiter.job for w in self._waiters):
+            del self._served[waiter.job]
+
+    async def acquire(self) -> Slot:
+        """Wait for a slot, in scheduling order (see the module docstring).
+
+        Raises:
+            LLMJobCancelledError: :meth:`cancel_job` cancelled the request's job
+                while it waited.
+        """
+        work = _work.get()
+        start = self._clock()
+        waiter = _Waiter(
+            asyncio.get_running_loop(), work.priority, work.job, next(self._seq), start,
+        )
+        with self._lock:
+            self._enqueue(waiter)
+        try:
+            while True:
+                with self._lock:
+                    if waiter.cancelled:
+                        raise LLMJobCancelledError(waiter.job)
+                    if self._head() is waiter and self._in_flight < self.limit:
+                        self._served[waiter.job] += 1
+                        self._dequeue(waiter)
+                        self._in_flight += 1
+                        wait_s = self._clock() - start
+                        self._recent_waits[waiter.priority].append(wait_s)
+                        slot = Slot(in_flight=self._in_flight, wait_s=wait_s)
+                        self._wake_head()
+                        return slot
+                    waiter.future = waiter.loop.create_future()
+                await waiter.future
+        except BaseException:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._dequeue(waiter)
+                self._wake_head()
+            raise
+
+    def cancel_job(self, job: str) -> int:
+        """Fail ``job``'s queued requests with :class:`LLMJobCancelledError`.
+
+        Requests already holding a slot run to completion.  Returns how many
+        queued requests were cancelled.
+        """
+        cancelled = 0
+        with self._lock:
+            for waiter in self._waiters:
+                if waiter.job == job and not waiter.cancelled:
+                    waiter.cancelled = True
+                    self._wake(waiter)
+                    cancelled += 1
+        if cancelled:
+            logger.info(
+                "llm_concurrency | provider=%s | cancel | job=%s | queued=%d",
+                self.provider, job, cancelled,
+            )
+        return cancelled
+
+    def snapshot(self) -> dict[str, object]:
+        """Window, occupancy and queue state, for the queue endpoint."""
+        now = self._clock()
+        with self._lock:
+            priorities: dict[str, object] = {}
+            for priority in Priority:
+                queued = [w for w in self._waiters if w.priority == priority]
+                recent = self._recent_waits[priority]
+                priorities[priority.name.lower()] = {
+                    "queued": len(queued),
+                    "oldest_wait_s": round(max((now - w.since for w in queued), default=0.0), 3),
+                    "recent_wait_s": round(sum(recent) / len(recent), 3) if recent else None,
+                }
+            jobs: dict[str, int] = {}
+            for waiter in self._waiters:
+                jobs[waiter.job] = jobs.get(waiter.job, 0) + 1
+            return {
+                "provider": self.provider,
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "queued": len(self._waiters),
+                "priorities": priorities,
+                "jobs": jobs,
+            }
+
+    def release(self, slot: Slot) -> None:
+        """Give a slot back (idempotent)."""
+        with self._lock:
+            if slot.released:
+                return
+            slot.released = True
+            self._in_flight -= 1
+            self._wake_head()
+
+    async def __aenter__(self) -> Slot:
+        held = _held.get()
+        task = asyncio.current_task()
+        if held is not None and held.controller is self and held.task is task:
+            held.depth += 1
+            return held.slot
+        slot = await self.acquire()
+        record = _Held(self, slot, task)
+        record.token = _held.set(record)
+        return slot
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        held = _held.get()
+        if held is None or held.controller is not self:
+            return
+        if held.depth:
+            held.depth -= 1
+            return
+        _held.reset(held.token)  # type: ignore[arg-type]
+        self.release(held.slot)
+
+    def current_slot(self) -> Slot | None:
+        """The slot the running task holds from this controller, if any."""
+        held = _held.get()
+        if held is None or held.controller is not self:
+            return None
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            return None
+        return held.slot if held.task is task else None
+
+    # -- Token budget -------------------------------------------------------
+
+    async def spend(self, input_chars: int) -> float:
+        """Charge a request's estimated tokens, waiting for budget; seconds waited.
+
+        A request larger than the whole budget goes through once the trailing
+        minute is empty, rather than never.
+        """
+        if not self._tokens_per_minute:
+            return 0.0
+        tokens = math.ceil(input_chars / _CHARS_PER_TOKEN)
+        start = self._clock()
+        while True:
+            with self._lock:
+                now = self._clock()
+                while self._spent and self._spent[0][0] <= now - _TOKEN_WINDOW_S:
+                    self._spent_total -= self._spent.popleft()[1]
+                if not self._spent or self._spent_total + tokens <= self._tokens_per_minute:
+                    self._spent.append((now, tokens))
+                    self._spent_total += tokens
+                    return now - start
+                delay = self._spent[0][0] + _TOKEN_WINDOW_S - now
+            await asyncio.sleep(min(max(delay, 0.0), _TOKEN_POLL_S))
+
+    # -- Feedback -----------------------------------------------------------
+
+    def _increase(self) -> Decision:
+        if self._window >= self._ceiling:
+            return "hold"
+        old = self.limit
+        self._window = min(float(self._ceiling), self._window + 1 / self._window)
+        if self.limit == old:
+            return "hold"
+        logger.info(
+            "llm_concurrency | provider=%s | increase | %d -> %d",
+            self.provider, old, self.limit,
+        )
+        self._wake_head()
+        return "increase"
+
+    def _decrease(self) -> Decision:
+        now = self._clock()
+        if now - self._last_decrease < _BACKOFF_INTERVAL_S:
+            return "hold"
+        self._last_decrease = now
+        old = self.limit
+        self._window = max(float(self._floor), self._window / 2)
+        logger.info(
+            "llm_concurrency | provider=%s | decrease | %d -> %d",
+            self.provider, old, self.limit,
+        )
+        return "decrease"
+
+    def congestion(self, slot: Slot | None = None) -> Decision:
+        """A congestion status arrived — possibly one the SDK will retry."""
+        with self._lock:
+            decision = self._decrease()
+            if slot is not None:
+                slot.throttled = True
+                if decision == "decrease":
+                    slot.decision = decision
+        return decision
+
+    def observe(
+        self,
+        slot: Slot,
+        *,
+        elapsed_s: float,
+        input_chars: int,
+        outcome: str,
+        error: BaseException | None = None,
+    ) -> Decision:
+        """Feed back one finished call made in ``slot``; return its decision."""
+        congested = (
+            outcome == "error" and error is not None
+            and is_congestion(self.provider, error)
+        )
+        with self._lock:
+            if slot.throttled:
+                # The hook already reacted; the latency includes SDK backoff.
+                decision: Decision = slot.decision or "hold"
+            elif congested:
+                decision = self._decrease()
+            elif outcome in ("ok", "truncated"):
+                rate = elapsed_s / max(input_chars, _LATENCY_CHARS_FLOOR) * 1000
+                slow = self._rate is not None and rate > _SLOW_FACTOR * self._rate
+                self._rate = rate if self._rate is None else (
+                    (1 - _LATENCY_ALPHA) * self._rate + _LATENCY_ALPHA * rate
+                )
+                decision = "hold" if slow else self._increase()
+            else:
+                decision = "hold"
+            slot.throttled = False
+            slot.decision = None
+            slot.wait_s = 0.0
+        return decision
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+_controllers: dict[str, ConcurrencyController] = {}
+_registry_lock = threading.Lock()
+
+
+def _bounds(settings: BristlenoseSettings) -> tuple[int, int]:
+    initial = max(1, settings.llm_concurrency)
+    if settings.llm_provider == "local":
+        # A local model shares this machine; more requests only queue there.
+        return initial, initial
+    return initial, max(initial, settings.llm_concurrency_max)
+
+
+def controller_for(settings: BristlenoseSettings) -> ConcurrencyController:
+    """The process-wide controller for ``settings.llm_provider``."""
+    initial, ceiling = _bounds(settings)
+    with _registry_lock:
+        controller = _controllers.get(settings.llm_provider)
+        if controller is None:
+            controller = _controllers[settings.llm_provider] = ConcurrencyController(
+                settings.llm_provider,
+                initial=initial,
+                ceiling=ceiling,
+                tokens_per_minute=settings.llm_tokens_per_minute,
+            )
+            return controller
+    controller.configure(
+        initial=initial, ceiling=ceiling, tokens_per_minute=settings.llm_tokens_per_minute,
+    )
+    return controller
+
+
+def cancel_llm_job(job: str) -> int:
+    """Cancel ``job``'s queued requests at every provider; how many were dropped."""
+    with _registry_lock:
+        controllers = list(_controllers.values())
+    return sum(controller.cancel_job(job) for controller in controllers)
+
+
+def queue_snapshot() -> list[dict[str, object]]:
+    """:meth:`ConcurrencyController.snapshot` for every provider in use."""
+    with _registry_lock:
+        controllers = sorted(_controllers.values(), key=lambda c: c.provider)
+    return [controller.snapshot() for controller in controllers]
+
+
+def reset_controllers() -> None:
+    """Forget every provider's learned window (tests, provider switches)."""
+    with _registry_lock:
+        _controllers.clear()
@@ -206,6 +206,25 @@ class ScreenClusteringResult(BaseModel):
     )
 
 
+class ScreenClusterMergeItem(BaseModel):
+    """A merged screen/task cluster built from per-batch clusters."""
+
+    screen_label: str = Field(description="Normalised label for this screen or task")
+    description: str = Field(description="Brief 1-2 sentence description of this screen/task")
+    display_order: int = Field(description="Order in the logical product flow (1-based)")
+    cluster_indices: list[int] = Field(
+        description="Indices of the per-batch clusters (0-based) merged into this screen"
+    )
+
+
+class ScreenClusterMergeResult(BaseModel):
+    """LLM output for the reduce pass of batched screen clustering."""
+
+    clusters: list[ScreenClusterMergeItem] = Field(
+        description="Merged screen clusters ordered by logical product flow"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Thematic grouping (Stage 11)
 # ---------------------------------------------------------------------------
@@ -229,6 +248,24 @@ class ThematicGroupingResult(BaseModel):
     )
 
 
+class ThemeMergeItem(BaseModel):
+    """A merged theme built from per-batch themes."""
+
+    theme_label: str = Field(description="Concise label for this theme")
+    description: str = Field(description="Brief 1-2 sentence description of this theme")
+    theme_indices: list[int] = Field(
+        description="Indices of the per-batch themes (0-based) merged into this theme. Each index should appear in exactly one theme."
+    )
+
+
+class ThemeMergeResult(BaseModel):
+    """LLM output for the reduce pass of batched thematic grouping."""
+
+    themes: list[ThemeMergeItem] = Field(
+        description="Emergent themes merged across all batches"
+    )
+
+
 # ---------------------------------------------------------------------------
 # AutoCode — codebook tag application (serve mode)
 # ---------------------------------------------------------------------------
@@ -98,9 +98,21 @@ class LLMCallEvent(BaseModel):
     finish_reason: str | None = None
     outcome: Literal["ok", "truncated", "error", "cancelled"]
     usage_source: Literal["reported", "missing"] = "reported"
+    # "hit" rows were served from the on-disk response cache (no provider
+    # call; usage_source="missing" so cost medians ignore them). None when
+    # the cache was not consulted.
+    response_cache: Literal["hit", "miss"] | None = None
     price_table_version: str
     cost_usd_actual_estimate: float | None = None
     cost_usd_predicted: float | None = None
+    # Adaptive concurrency (bristlenose/llm/concurrency.py): the provider's
+    # window after this call, requests in flight when its slot was granted,
+    # time queued for the slot and token budget, and what the call did to the
+    # window. None for cache hits.
+    concurrency_limit: int | None = None
+    concurrency_in_flight: int | None = None
+    concurrency_wait_ms: int | None = None
+    concurrency_decision: Literal["increase", "decrease", "hold"] | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -124,6 +136,11 @@ def reset_run_context(tokens: tuple[object, object]) -> None:
     _run_dir.reset(run_dir_token)  # type: ignore[arg-type]
 
 
+def current_run_dir() -> Path | None:
+    """Return the active run's ``.bristlenose/`` directory, or None outside a run."""
+    return _run_dir.get()
+
+
 @contextmanager
 def stage(name: str) -> Iterator[None]:
     """Bind ``_stage_id`` for the duration of the block."""
@@ -180,12 +197,17 @@ def record_call(
     retry_count: int = 0,
     finish_reason: str | None = None,
     usage_source: Literal["reported", "missing"] = "reported",
+    response_cache: Literal["hit", "miss"] | None = None,
     prompt_id: str | None = None,
     prompt_version: str | None = None,
     prompt_path: str | None = None,
     prompt_sha: str | None = None,
     cost_usd_actual_estimate: float | None = None,
     cost_usd_predicted: float | None = None,
+    concurrency_limit: int | None = None,
+    concurrency_in_flight: int | None = None,
+    concurrency_wait_ms: int | None = None,
+    concurrency_decision: Literal["increase", "decrease", "hold"] | None = None,
     operation_name: str = "chat",
     run_dir: Path | None = None,
     run_id: str | None = None,
@@ -255,9 +277,14 @@ def record_call(
         finish_reason=finish_reason,
         outcome=outcome,
         usage_source=usage_source,
+        response_cache=response_cache,
         price_table_version=price_table_version,
         cost_usd_actual_estimate=cost_usd_actual_estimate,
         cost_usd_predicted=cost_usd_predicted,
+        concurrency_limit=concurrency_limit,
+        concurrency_in_flight=concurrency_in_flight,
+        concurrency_wait_ms=concurrency_wait_ms,
+        concurrency_decision=concurrency_decision,
     )
 
     target_dir.mkdir(parents=True, exist_ok=True)
@@ -60,6 +60,10 @@ class StageRecord(BaseModel):
     sessions: dict[str, SessionRecord] | None = None  # only for per-session stages
     content_hash: str | None = None  # SHA-256 of the stage output file
     input_hashes: dict[str, str] | None = None  # Phase 2c: hashes of stage inputs
+    # Sub-session progress for stages that split one session into windows
+    # (chunked transcription): session_id -> completed window keys. Cleared
+    # per session by ``mark_session_complete``.
+    windows: dict[str, list[str]] | None = None
 
 
 class PipelineManifest(BaseModel):
@@ -265,9 +269,47 @@ def mark_session_complete(
         model=model,
         content_hash=content_hash,
     )
+    if record.windows is not None:
+        record.windows.pop(session_id, None)
     manifest.updated_at = _now_iso()
 
 
+def mark_window_complete(
+    manifest: PipelineManifest,
+    stage: str,
+    session_id: str,
+    window_key: str,
+) -> None:
+    """Record one finished window of a session that is still in progress.
+
+    Lets a long recording resume mid-file: the next run reuses every window
+    listed here (and present on disk) and only transcribes the rest.
+    """
+    record = manifest.stages.get(stage)
+    if record is None:
+        record = StageRecord(status=StageStatus.RUNNING, started_at=_now_iso())
+        manifest.stages[stage] = record
+    if record.windows is None:
+        record.windows = {}
+    keys = record.windows.setdefault(session_id, [])
+    if window_key not in keys:
+        keys.append(window_key)
+    manifest.updated_at = _now_iso()
+
+
+def get_completed_windows(
+    manifest: PipelineManifest | None,
+    stage: str,
+) -> dict[str, set[str]]:
+    """Return session_id -> completed window keys for an unfinished session."""
+    if manifest is None:
+        return {}
+    record = manifest.stages.get(stage)
+    if record is None or not record.windows:
+        return {}
+    return {sid: set(keys) for sid, keys in record.windows.items()}
+
+
 def _derive_stage_status(record: StageRecord) -> StageStatus:
     """Derive overall stage status from session-level records.
 
@@ -0,0 +1,111 @@
+"""Persistent ffprobe results for ingest — ``.bristlenose/media-probe.json``.
+
+Stage 1 probes every audio and video file for its duration, and stage 2
+probes videos again for an audio stream.  Each probe is an ffprobe process,
+and on a network or cloud-synced volume each one reads the file's header
+over the wire — for a 200-file study that is minutes before any real work,
+repeated on every run although the recordings never change.
+
+The cache keeps one :class:`~bristlenose.utils.audio.MediaProbe` per file,
+keyed on the same ``(resolved path, size, mtime_ns)`` identity as
+:func:`bristlenose.hashing.hash_file_metadata`: a file whose size or mtime
+moved is probed again.  Only clean probes are stored, so a file that failed
+to probe (or a missing ffprobe) is retried next run.  Entries for files the
+latest scan did not see are dropped on save.
+
+Best-effort throughout: an unreadable cache is an empty one, and a failed
+save only costs the next run its probes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from bristlenose.hashing import file_identity
+from bristlenose.utils.audio import MediaProbe
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "media-probe.json"
+CACHE_VERSION = 1
+
+
+def cache_path(output_dir: Path) -> Path:
+    """Where a project keeps its probe cache."""
+    return output_dir / ".bristlenose" / CACHE_FILENAME
+
+
+class MediaProbeCache:
+    """Probe results by file identity, loaded from and saved to ``path``.
+
+    Args:
+        path: The cache file, or None for a cache that lives only in memory.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable %s: %s", path, exc)
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._entries = dict(data.get("files") or {})
+
+    def get(self, file: Path) -> MediaProbe | None:
+        """The stored probe for ``file``, or None if absent or stale."""
+        identity = file_identity(file)
+        if identity is None:
+            return None
+        key, size, mtime_ns = identity
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if entry is None or entry.get("size") != size or entry.get("mtime_ns") != mtime_ns:
+            return None
+        return MediaProbe(entry.get("duration"), bool(entry.get("has_audio")))
+
+    def put(self, file: Path, probe: MediaProbe) -> None:
+        identity = file_identity(file)
+        if identity is None:
+            return
+        key, size, mtime_ns = identity
+        self._seen.add(key)
+        self._entries[key] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "duration": probe.duration,
+            "has_audio": probe.has_audio,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write entries for the files looked up since loading (atomic)."""
+        if self.path is None:
+            return
+        stale = set(self._entries) - self._seen
+        if not self._dirty and not stale:
+            return
+        body = {
+            "version": CACHE_VERSION,
+            "files": {k: self._entries[k] for k in sorted(self._entries) if k in self._seen},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(body, indent=1), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as exc:
+            logger.warning("Could not write %s: %s", self.path, exc)
+            return
+        self._entries = body["files"]
+        self._dirty = False
@@ -149,6 +149,8 @@ class InputFile(BaseModel):
     created_at: datetime
     size_bytes: int
     duration_seconds: float | None = None
+    # From the ingest probe; None when not probed (stage 2 probes it then).
+    has_audio_stream: bool | None = None
     error: str | None = None
 
 
@@ -357,6 +359,7 @@ class PipelineResult(BaseModel):
     llm_input_tokens: int = 0
     llm_output_tokens: int = 0
     llm_calls: int = 0
+    llm_cache_hits: int = 0  # responses replayed from .bristlenose/llm-cache/
     llm_model: str = ""
     llm_provider: str = ""
     total_quotes: int = 0
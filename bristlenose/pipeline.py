@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -26,6 +28,7 @@ from bristlenose.events import (
 )
 from bristlenose.hashing import hash_bytes, hash_file_metadata, verify_file_hash
 from bristlenose.llm import telemetry as _llm_telemetry
+from bristlenose.llm.concurrency import controller_for
 from bristlenose.manifest import (
     STAGE_CLUSTER_AND_GROUP,
     STAGE_EXTRACT_AUDIO,
@@ -39,14 +42,17 @@ from bristlenose.manifest import (
     StageStatus,
     create_manifest,
     get_completed_session_ids,
+    get_completed_windows,
     load_manifest,
     mark_session_complete,
     mark_stage_complete,
     mark_stage_running,
+    mark_window_complete,
     write_manifest,
 )
 from bristlenose.manifest import STAGE_RENDER as _M_STAGE_RENDER
 from bristlenose.manifest import STAGE_TRANSCRIBE as _M_STAGE_TRANSCRIBE
+from bristlenose.media_probe_cache import cache_path as probe_cache_path
 from bristlenose.models import (
     ExtractedQuote,
     FileType,
@@ -60,13 +66,16 @@ from bristlenose.models import (
     ThemeGroup,
     TranscriptSegment,
 )
+from bristlenose.output_paths import OutputPaths
 from bristlenose.refusals import UnusableReason
 from bristlenose.refusals import stage_failure as refusal_stage_failure
+from bristlenose.segment_store import SegmentStore
 from bristlenose.ui_kinds import MessageKind, cli_prefix
 from bristlenose.utils.fs import is_os_metadata
 from bristlenose.utils.text import count_noun
 
 if TYPE_CHECKING:  # annotation only — s01 stays a lazy import
+    from bristlenose.session_stream import SessionStream
     from bristlenose.stages.s01_ingest import SkippedFile
 
 logger = logging.getLogger(__name__)
@@ -74,6 +83,15 @@ console = Console(width=min(80, Console().width))
 
 
 
+def _sum_outcomes(outcomes: list[StageOutcome]) -> StageOutcome:
+    """Combine per-call outcomes into one stage rollup (durations dropped)."""
+    return StageOutcome(
+        attempted=sum(o.attempted for o in outcomes),
+        succeeded=sum(o.succeeded for o in outcomes),
+        failed=[f for o in outcomes for f in o.failed],
+    )
+
+
 def _dominant_cause(
     failures: list,
     *,
@@ -482,6 +500,13 @@ class Pipeline:
         # includes whatever ran before the failing stage.
         self._summary = PipelineSummary()
 
+        # Look-ahead through stages 5b–9 for the run in progress (run() only);
+        # cancelled on the way out so an abandon can't leak LLM calls.
+        self._session_stream: SessionStream | None = None
+        # Stage 6b, running alongside the LLM stages until render awaits it;
+        # cancelled on the way out for the same reason.
+        self._thumbnails_task: asyncio.Task[dict[str, Path]] | None = None
+
         # Logging is configured later (once output_dir is known) via
         # _configure_logging().  Pipeline methods call it at the top of
         # run() / run_analysis_only() / run_transcription_only() /
@@ -589,10 +614,24 @@ class Pipeline:
         Returns:
             PipelineResult with all data and paths.
         """
+        try:
+            return await self._run(input_dir, output_dir)
+        finally:
+            # An abandon or crash mid-run must not leave look-ahead LLM calls
+            # or thumbnail extraction running on the caller's event loop.
+            if self._session_stream is not None:
+                self._session_stream.cancel()
+                self._session_stream = None
+            if self._thumbnails_task is not None:
+                self._thumbnails_task.cancel()
+                self._thumbnails_task = None
+
+    async def _run(self, input_dir: Path, output_dir: Path) -> PipelineResult:
         import time
         from collections import Counter
 
         from bristlenose.llm.client import LLMClient
+        from bristlenose.session_stream import SessionStream
         from bristlenose.stages.s01_ingest import ingest
         from bristlenose.stages.s02_extract_audio import extract_audio_for_sessions
         from bristlenose.stages.s05b_identify_speakers import (
@@ -609,6 +648,7 @@ class Pipeline:
             write_raw_transcripts,
             write_raw_transcripts_md,
         )
+        from bristlenose.stages.s06b_thumbnails import extract_session_thumbnails
         from bristlenose.stages.s07_pii_removal import (
             remove_pii,
             write_cooked_transcripts,
@@ -649,7 +689,7 @@ class Pipeline:
         mark_stage_running(manifest, STAGE_INGEST)
         t0 = time.perf_counter()
         declined: list[SkippedFile] = []
-        sessions = ingest(input_dir, declined)
+        sessions = ingest(input_dir, declined, probe_cache_path(output_dir))
         if not sessions:
             console.print("[red]No supported files found.[/red]")
             return self._empty_result(output_dir)
@@ -774,7 +814,8 @@ class Pipeline:
             intermediate = output_dir / ".bristlenose" / "intermediate"
 
             # ── Stages 3-5: Parse existing transcripts + Transcribe ──
-            _ss_path = intermediate / "session_segments.json"
+            _ss_store = SegmentStore(intermediate, self.settings.intermediate_format)
+            _tx_window_dir = intermediate / "transcribe-windows"
             _source_paths = [f.path for s in sessions for f in s.files]
             _tx_input_hashes = {"source_files": hash_file_metadata(_source_paths)}
             # Outer-scope defaults — both branches below populate these.
@@ -783,46 +824,50 @@ class Pipeline:
             # work this run actually did, per the contract).
             _fresh_transcript_outcome = StageOutcome()
             _transcribe_elapsed: float | None = None
+            # Per-session look-ahead through 5b–9 while Whisper runs. Only on
+            # a fresh analysis: resumed runs mix cached and new sessions per
+            # stage, and participant numbering has to see them in order.
+            _stream: SessionStream | None = None
+            # A verified index still loads shard by shard; if one fails its
+            # hash, fall through to per-session resume, which re-transcribes
+            # just that session.
+            _ss_full: dict[str, list[TranscriptSegment]] | None = None
+            # Sessions whose transcription raised this run. They are not
+            # marked complete, so windows they finished stay recorded (and on
+            # disk) for the next run to resume from.
+            _tx_failed: set[str] = set()
             if _is_stage_verified(
-                _prev_manifest, _M_STAGE_TRANSCRIBE, [_ss_path],
+                _prev_manifest, _M_STAGE_TRANSCRIBE, [_ss_store.index_path],
                 current_input_hashes=_tx_input_hashes,
-            ):
-                import json as _json
-
-                _ss_raw = _json.loads(_ss_path.read_text(encoding="utf-8"))
-                session_segments = {
-                    sid: [TranscriptSegment.model_validate(s) for s in segs]
-                    for sid, segs in _ss_raw.items()
-                }
+            ) and not get_completed_windows(_prev_manifest, _M_STAGE_TRANSCRIBE):
+                _stored = set(_ss_store.session_ids())
+                _ss_sids = [s.session_id for s in sessions if s.session_id in _stored]
+                _ss_full = _ss_store.load(_ss_sids)
+                if len(_ss_full) < len(_ss_sids):
+                    _ss_full = None
+            if _ss_full is not None:
+                session_segments = _ss_full
                 total_segments = sum(len(s) for s in session_segments.values())
                 _print_cached_step(
                     f"Transcribed {count_noun(len(sessions), 'session')}"
                     f" ({count_noun(total_segments, 'segment')})",
                 )
             else:
-                import json as _json
-
                 # Per-session resume: load cached segments for completed
                 # sessions and only transcribe the remaining ones.
                 _cached_tx_sids = get_completed_session_ids(
                     _prev_manifest, _M_STAGE_TRANSCRIBE,
                 )
                 _cached_segments: dict[str, list[TranscriptSegment]] = {}
-                if _cached_tx_sids and _ss_path.exists():
-                    _ss_raw = _load_cached_json(_ss_path)
-                    if _ss_raw is None:
-                        # Corrupt/truncated cache (e.g. power loss mid-write):
-                        # drop the cached set so every session is re-transcribed
-                        # rather than silently skipped from _remaining_sessions.
-                        _cached_tx_sids = set()
-                    else:
-                        _cached_segments = {
-                            sid: [
-                                TranscriptSegment.model_validate(s) for s in segs
-                            ]
-                            for sid, segs in _ss_raw.items()
-                            if sid in _cached_tx_sids
-                        }
+                if _cached_tx_sids and _ss_store.exists():
+                    _cached_segments = _ss_store.load(
+                        s.session_id for s in sessions
+                        if s.session_id in _cached_tx_sids
+                    )
+                # A session whose shard is missing or damaged (e.g. power loss
+                # mid-write) is re-transcribed rather than silently skipped
+                # from _remaining_sessions.
+                _cached_tx_sids = set(_cached_segments)
 
                 _remaining_sessions = [
                     s for s in sessions
@@ -852,6 +897,20 @@ class Pipeline:
                             for sid, sr in _prev_tx_rec.sessions.items()
                             if sr.status == StageStatus.COMPLETE
                         }
+                # Windows of long files a previous run finished before it was
+                # interrupted — carried forward so a second interruption
+                # doesn't lose them, and handed to s05 to skip re-decoding.
+                _resumed_windows = {
+                    sid: keys
+                    for sid, keys in get_completed_windows(
+                        _prev_manifest, _M_STAGE_TRANSCRIBE,
+                    ).items()
+                    if sid not in _cached_tx_sids
+                }
+                if _resumed_windows:
+                    manifest.stages[_M_STAGE_TRANSCRIBE].windows = {
+                        sid: sorted(keys) for sid, keys in _resumed_windows.items()
+                    }
 
                 # Whisper preflight is front-loaded (runs right after
                 # ingest), so by the time we hit transcribe stage 5 the
@@ -861,6 +920,25 @@ class Pipeline:
                 status.update("[dim]Transcribing...[/dim]")
                 t0 = time.perf_counter()
 
+                if (
+                    self.settings.pipeline_streaming
+                    and _remaining_sessions
+                    and not _cached_tx_sids
+                    and not any(
+                        get_completed_session_ids(_prev_manifest, _st)
+                        for _st in (
+                            STAGE_IDENTIFY_SPEAKERS,
+                            STAGE_TOPIC_SEGMENTATION,
+                            STAGE_QUOTE_EXTRACTION,
+                        )
+                    )
+                ):
+                    _stream = SessionStream(
+                        sessions, self.settings, LLMClient(self.settings),
+                        input_dir,
+                    )
+                    self._session_stream = _stream
+
                 if _remaining_sessions:
                     def _on_transcribe_progress(
                         current: int, total: int,
@@ -904,33 +982,62 @@ class Pipeline:
                             stage_fraction=stage_frac,
                         )
 
+                    def _on_transcribe_window(sid: str, key: str) -> None:
+                        mark_window_complete(
+                            manifest, _M_STAGE_TRANSCRIBE, sid, key,
+                        )
+                        write_manifest(manifest, output_dir)
+
+                    _on_transcribe_session = None
+                    if _stream is not None:
+                        _loop = asyncio.get_running_loop()
+                        _stream_cb = _stream.session_ready
+
+                        def _on_transcribe_session(
+                            sid: str, segments: list[TranscriptSegment],
+                        ) -> None:
+                            # Called from the transcription thread.
+                            _loop.call_soon_threadsafe(_stream_cb, sid, segments)
+
                     _fresh_segments, _fresh_transcript_outcome = (
                         await self._gather_all_segments(
                             _remaining_sessions,
                             on_progress=_on_transcribe_progress,
                             on_segment=_on_transcribe_segment,
+                            window_dir=(
+                                _tx_window_dir
+                                if self.settings.write_intermediate else None
+                            ),
+                            resumed_windows=_resumed_windows,
+                            on_window=_on_transcribe_window,
+                            on_session=_on_transcribe_session,
                         )
                     )
+                    if _stream is not None:
+                        _stream.transcription_done(_fresh_segments)
+                    _tx_failed = {
+                        f.session_id for f in _fresh_transcript_outcome.failed
+                        if f.session_id is not None
+                    }
                     for sid in _fresh_segments:
-                        mark_session_complete(
-                            manifest, _M_STAGE_TRANSCRIBE, sid,
-                        )
+                        if sid not in _tx_failed:
+                            mark_session_complete(
+                                manifest, _M_STAGE_TRANSCRIBE, sid,
+                            )
                 else:
                     _fresh_segments = {}
                     _fresh_transcript_outcome = StageOutcome()
 
                 session_segments = {**_cached_segments, **_fresh_segments}
 
-                # Write intermediate JSON for resume
+                # Write segment shards for resume — only sessions transcribed
+                # this run (or cached ones still in a legacy monolithic file).
                 if self.settings.write_intermediate:
-                    intermediate.mkdir(parents=True, exist_ok=True)
-                    _ss_data = {
-                        sid: [seg.model_dump(mode="json") for seg in segs]
-                        for sid, segs in session_segments.items()
-                    }
-                    _ss_path.write_text(
-                        _json.dumps(_ss_data, indent=2), encoding="utf-8",
-                    )
+                    _stored_sids = set(_ss_store.shard_hashes())
+                    for sid, segs in session_segments.items():
+                        if sid in _fresh_segments or sid not in _stored_sids:
+                            _ss_store.put(sid, segs)
+                    _ss_store.prune(session_segments)
 
                 total_segments = sum(
                     len(s) for s in session_segments.values()
@@ -964,13 +1071,24 @@ class Pipeline:
                     input_size=total_audio_mins,
                 )
                 self._emit_remaining(STAGE_TRANSCRIBE, _transcribe_elapsed)
-            _tx_hash = hash_bytes(_ss_path.read_bytes()) if _ss_path.exists() else None
+            _tx_hash = _ss_store.content_hash()
             mark_stage_complete(
                 manifest, _M_STAGE_TRANSCRIBE,
                 content_hash=_tx_hash,
                 input_hashes=_tx_input_hashes,
             )
             write_manifest(manifest, output_dir)
+            # Window files only matter until their session has a segment
+            # shard, which has just been written. A session that failed keeps
+            # its finished windows for the next run.
+            if _tx_window_dir.exists():
+                import shutil as _shutil
+
+                for _win_dir in _tx_window_dir.iterdir():
+                    if _win_dir.name not in _tx_failed:
+                        _shutil.rmtree(_win_dir, ignore_errors=True)
+                if not any(_tx_window_dir.iterdir()):
+                    _tx_window_dir.rmdir()
 
             # ── Transcript outcome rollup + abandon check ──────────────
             # Success semantics: a session is "succeeded" when transcription
@@ -1064,8 +1182,11 @@ class Pipeline:
             import json as _json
 
             _si_dir = intermediate / "speaker-info"
-            llm_client: LLMClient | None = None
-            concurrency = self.settings.llm_concurrency
+            llm_client: LLMClient | None = (
+                _stream.llm_client if _stream is not None else None
+            )
+            # Every LLM fan-out below shares the provider's adaptive window.
+            llm_slots = controller_for(self.settings)
 
             # Check for fully cached speaker ID stage
             _si_session_files = {
@@ -1155,26 +1276,42 @@ class Pipeline:
 
                 status.update("[dim]Identifying speakers...[/dim]")
                 t0 = time.perf_counter()
-                llm_client = LLMClient(self.settings)
+                if llm_client is None:
+                    llm_client = LLMClient(self.settings)
                 _speaker_errors: list[str] = []
 
                 if _remaining_si_sids:
+                    # Sessions the look-ahead already identified skip the
+                    # calls below; their results join the fresh ones.
+                    _streamed_si: dict[str, list[SpeakerInfo]] = {}
+                    if _stream is not None:
+                        await _stream.wait_speakers()
+                        _speaker_errors.extend(_stream.speaker_errors)
+                        _streamed_si = {
+                            sid: _stream.speaker_infos[sid]
+                            for sid in _remaining_si_sids
+                            if sid in _stream.speaker_infos
+                        }
+                    _todo_si_sids = {
+                        sid for sid in _remaining_si_sids
+                        if sid not in _streamed_si
+                    }
+
                     # Split single-speaker transcripts (LLM pre-pass)
                     _split_sids = [
-                        sid for sid in _remaining_si_sids
+                        sid for sid in _todo_si_sids
                         if len(set(
                             seg.speaker_label or "Unknown"
                             for seg in session_segments[sid]
                         )) <= 1
                     ]
                     if _split_sids:
-                        _sem_split = asyncio.Semaphore(concurrency)
 
                         async def _split(
                             sid: str,
                             segments: list[TranscriptSegment],
                         ) -> None:
-                            async with _sem_split:
+                            async with llm_slots:
                                 with _llm_telemetry.session(sid):
                                     await split_single_speaker_llm(
                                         segments, llm_client,
@@ -1188,18 +1325,17 @@ class Pipeline:
                             ))
 
                     # Heuristic pass for remaining sessions
-                    for sid in _remaining_si_sids:
+                    for sid in _todo_si_sids:
                         identify_speaker_roles_heuristic(
                             session_segments[sid],
                         )
 
                     # LLM refinement concurrently
-                    _sem_5b = asyncio.Semaphore(concurrency)
 
                     async def _identify(
                         sid: str, segments: list[TranscriptSegment],
                     ) -> tuple[str, list]:
-                        async with _sem_5b:
+                        async with llm_slots:
                             with _llm_telemetry.session(sid):
                                 infos = await identify_speaker_roles_llm(
                                     segments, llm_client,
@@ -1210,9 +1346,9 @@ class Pipeline:
                     with _llm_telemetry.stage("s05b_identify_speakers"):
                         _results_5b = await asyncio.gather(*(
                             _identify(sid, session_segments[sid])
-                            for sid in _remaining_si_sids
+                            for sid in _todo_si_sids
                     ))
-                    for sid, infos in _results_5b:
+                    for sid, infos in [*_streamed_si.items(), *_results_5b]:
                         all_speaker_infos[sid] = infos
                         mark_session_complete(
                             manifest, STAGE_IDENTIFY_SPEAKERS, sid,
@@ -1313,14 +1449,38 @@ class Pipeline:
             mark_stage_complete(manifest, STAGE_MERGE_TRANSCRIPT)
             write_manifest(manifest, output_dir)
 
+            # ── Stage 6b: Video thumbnails (background) ──────────────
+            # Needs only media + speaker roles, both settled now. Runs
+            # alongside the LLM stages below; render awaits it.
+            thumbnails_task = self._thumbnails_task = asyncio.create_task(
+                extract_session_thumbnails(
+                    sessions, transcripts,
+                    OutputPaths(output_dir, self.settings.project_name).thumbnails_dir,
+                ),
+            )
+
             # ── Stage 7: PII removal ────────────────────────────────
             if self.settings.pii_enabled:
                 mark_stage_running(manifest, STAGE_PII_REMOVAL)
                 status.update("[dim]Removing PII...[/dim]")
                 t0 = time.perf_counter()
-                clean_transcripts, pii_redactions = remove_pii(
-                    transcripts, self.settings,
-                )
+                if _stream is not None:
+                    await _stream.wait_pii()
+                if _stream is not None and all(
+                    t.session_id in _stream.clean_transcripts for t in transcripts
+                ):
+                    clean_transcripts = [
+                        _stream.clean_transcripts[t.session_id]
+                        for t in transcripts
+                    ]
+                    pii_redactions = [
+                        r for t in transcripts
+                        for r in _stream.pii_redactions[t.session_id]
+                    ]
+                else:
+                    clean_transcripts, pii_redactions = remove_pii(
+                        transcripts, self.settings,
+                    )
                 cooked_dir = output_dir / "transcripts-cooked"
                 write_cooked_transcripts(clean_transcripts, cooked_dir)
                 write_cooked_transcripts_md(clean_transcripts, cooked_dir)
@@ -1420,13 +1580,47 @@ class Pipeline:
                 status.update("[dim]Segmenting topics...[/dim]")
                 t0 = time.perf_counter()
                 if _remaining_transcripts:
-                    if llm_client is None:
-                        llm_client = LLMClient(self.settings)
-                    with _llm_telemetry.stage("s08_topic_segmentation"):
-                        _fresh_topic_maps, _seg_outcome = await segment_topics(
-                            _remaining_transcripts, llm_client,
-                            concurrency=concurrency, errors=_seg_errors,
-                        )
+                    _streamed_topics: dict[
+                        str, tuple[SessionTopicMap, StageOutcome]
+                    ] = {}
+                    if _stream is not None:
+                        await _stream.wait_topics()
+                        _seg_errors.extend(_stream.topic_errors)
+                        _streamed_topics = _stream.topic_maps
+                    _todo_topics = [
+                        t for t in _remaining_transcripts
+                        if t.session_id not in _streamed_topics
+                    ]
+                    _todo_topic_maps: list[SessionTopicMap] = []
+                    _todo_seg_outcome = StageOutcome()
+                    if _todo_topics:
+                        if llm_client is None:
+                            llm_client = LLMClient(self.settings)
+                        with _llm_telemetry.stage("s08_topic_segmentation"):
+                            (
+                                _todo_topic_maps, _todo_seg_outcome,
+                            ) = await segment_topics(
+                                _todo_topics, llm_client,
+                                errors=_seg_errors, semaphore=llm_slots,
+                            )
+                    _by_sid_topics = {
+                        t.session_id: m
+                        for t, m in zip(_todo_topics, _todo_topic_maps)
+                    }
+                    _fresh_topic_maps = [
+                        _streamed_topics[t.session_id][0]
+                        if t.session_id in _streamed_topics
+                        else _by_sid_topics[t.session_id]
+                        for t in _remaining_transcripts
+                    ]
+                    _seg_outcome = _sum_outcomes([
+                        _todo_seg_outcome,
+                        *(
+                            _streamed_topics[t.session_id][1]
+                            for t in _remaining_transcripts
+                            if t.session_id in _streamed_topics
+                        ),
+                    ])
                     # Record per-session completion only for sessions whose
                     # boundaries were actually produced (skip-after-failure
                     # entries return an empty SessionTopicMap that is NOT a
@@ -1600,17 +1794,58 @@ class Pipeline:
                 t0 = time.perf_counter()
 
                 if _remaining_transcripts_q:
-                    if llm_client is None:
-                        llm_client = LLMClient(self.settings)
-                    with _llm_telemetry.stage("s09_quote_extraction"):
-                        _fresh_quotes, _fresh_quote_outcome = await extract_quotes(
-                            _remaining_transcripts_q,
-                            _remaining_topic_maps,
-                            llm_client,
-                            min_quote_words=self.settings.min_quote_words,
-                            concurrency=concurrency,
-                            errors=_quote_errors,
+                    _streamed_quotes: dict[
+                        str, tuple[list[ExtractedQuote], StageOutcome]
+                    ] = {}
+                    if _stream is not None:
+                        await _stream.wait_quotes()
+                        _quote_errors.extend(_stream.quote_errors)
+                        _streamed_quotes = _stream.quotes
+                    _todo_q = [
+                        (t, tm)
+                        for t, tm in zip(
+                            _remaining_transcripts_q, _remaining_topic_maps,
+                        )
+                        if t.session_id not in _streamed_quotes
+                    ]
+                    _todo_quotes: list[ExtractedQuote] = []
+                    _todo_quote_outcome = StageOutcome()
+                    if _todo_q:
+                        if llm_client is None:
+                            llm_client = LLMClient(self.settings)
+                        with _llm_telemetry.stage("s09_quote_extraction"):
+                            (
+                                _todo_quotes, _todo_quote_outcome,
+                            ) = await extract_quotes(
+                                [t for t, _ in _todo_q],
+                                [tm for _, tm in _todo_q],
+                                llm_client,
+                                min_quote_words=self.settings.min_quote_words,
+                                errors=_quote_errors,
+                                semaphore=llm_slots,
+                            )
+                    # Reassemble in transcript order so extracted_quotes.json
+                    # matches a run without look-ahead.
+                    _todo_by_sid: dict[str, list[ExtractedQuote]] = {}
+                    for q in _todo_quotes:
+                        _todo_by_sid.setdefault(q.session_id, []).append(q)
+                    _fresh_quotes = [
+                        q
+                        for t in _remaining_transcripts_q
+                        for q in (
+                            _streamed_quotes[t.session_id][0]
+                            if t.session_id in _streamed_quotes
+                            else _todo_by_sid.get(t.session_id, [])
                         )
+                    ]
+                    _fresh_quote_outcome = _sum_outcomes([
+                        _todo_quote_outcome,
+                        *(
+                            _streamed_quotes[t.session_id][1]
+                            for t in _remaining_transcripts_q
+                            if t.session_id in _streamed_quotes
+                        ),
+                    ])
                     # Record per-session completion — derive session_ids
                     # from the transcripts that were processed.
                     for t in _remaining_transcripts_q:
@@ -1740,14 +1975,20 @@ class Pipeline:
                 t0 = time.perf_counter()
                 assert llm_client is not None  # narrowed by upstream lazy-init guards
                 _client_cg = llm_client
+                # One limit across both stages: each may fan out into batches.
+                _batch_cg = self.settings.cluster_batch_quotes
 
                 async def _run_clustering() -> tuple[list[ScreenCluster], StageOutcome]:
                     with _llm_telemetry.stage("s10_quote_clustering"):
-                        return await cluster_by_screen(all_quotes, _client_cg)
+                        return await cluster_by_screen(
+                            all_quotes, _client_cg, _batch_cg, llm_slots,
+                        )
 
                 async def _run_grouping() -> tuple[list[ThemeGroup], StageOutcome]:
                     with _llm_telemetry.stage("s11_thematic_grouping"):
-                        return await group_by_theme(all_quotes, _client_cg)
+                        return await group_by_theme(
+                            all_quotes, _client_cg, _batch_cg, llm_slots,
+                        )
 
                 _clustering, _grouping = await asyncio.gather(
                     _run_clustering(), _run_grouping(),
@@ -1886,6 +2127,7 @@ class Pipeline:
                 people=people,
                 transcripts=transcripts,
                 analysis=analysis,
+                thumbnails=await thumbnails_task,
             )
             _render_elapsed = time.perf_counter() - t0
             _print_step("Rendered report", _render_elapsed)
@@ -1932,6 +2174,7 @@ class Pipeline:
             llm_input_tokens=llm_client.tracker.input_tokens if llm_client else 0,
             llm_output_tokens=llm_client.tracker.output_tokens if llm_client else 0,
             llm_calls=llm_client.tracker.calls if llm_client else 0,
+            llm_cache_hits=llm_client.tracker.cache_hits if llm_client else 0,
             llm_model=self.settings.llm_model,
             llm_provider=self.settings.llm_provider,
             total_quotes=len(all_quotes),
@@ -1968,7 +2211,7 @@ class Pipeline:
         # ── Stage 1: Ingest ──
         t0 = time.perf_counter()
         declined: list[SkippedFile] = []
-        sessions = ingest(input_dir, declined)
+        sessions = ingest(input_dir, declined, probe_cache_path(output_dir))
         if not sessions:
             console.print("[red]No supported files found.[/red]")
             raise PipelineAbandonedError(
@@ -2179,7 +2422,7 @@ class Pipeline:
             return self._empty_result(output_dir)
 
         llm_client = LLMClient(self.settings)
-        concurrency = self.settings.llm_concurrency
+        llm_slots = controller_for(self.settings)
 
         console.print(
             f"[dim]{count_noun(len(clean_transcripts), 'transcript')} in"
@@ -2210,8 +2453,8 @@ class Pipeline:
             _seg_errors_a: list[str] = []
             with _llm_telemetry.stage("s08_topic_segmentation"):
                 topic_maps, _seg_outcome_a = await segment_topics(
-                    clean_transcripts, llm_client, concurrency=concurrency,
-                    errors=_seg_errors_a,
+                    clean_transcripts, llm_client,
+                    errors=_seg_errors_a, semaphore=llm_slots,
                 )
             if self.settings.write_intermediate:
                 write_intermediate_json(
@@ -2257,8 +2500,8 @@ class Pipeline:
                 all_quotes, _quote_outcome_a = await extract_quotes(
                     clean_transcripts, topic_maps, llm_client,
                     min_quote_words=self.settings.min_quote_words,
-                    concurrency=concurrency,
                     errors=_quote_errors_a,
+                    semaphore=llm_slots,
                 )
             # Stamp duration_ms before the abandon check so the partial
             # summary on the abandoned terminus event carries timing too.
@@ -2296,13 +2539,19 @@ class Pipeline:
             # ── Cluster + group ──
             status.update("[dim]Clustering and grouping...[/dim]")
             t0 = time.perf_counter()
+            _batch_cg_a = self.settings.cluster_batch_quotes
+
             async def _run_clustering_a() -> tuple[list[ScreenCluster], StageOutcome]:
                 with _llm_telemetry.stage("s10_quote_clustering"):
-                    return await cluster_by_screen(all_quotes, llm_client)
+                    return await cluster_by_screen(
+                        all_quotes, llm_client, _batch_cg_a, llm_slots,
+                    )
 
             async def _run_grouping_a() -> tuple[list[ThemeGroup], StageOutcome]:
                 with _llm_telemetry.stage("s11_thematic_grouping"):
-                    return await group_by_theme(all_quotes, llm_client)
+                    return await group_by_theme(
+                        all_quotes, llm_client, _batch_cg_a, llm_slots,
+                    )
 
             _clustering_a, _grouping_a = await asyncio.gather(
                 _run_clustering_a(),
@@ -2409,6 +2658,7 @@ class Pipeline:
             llm_input_tokens=llm_client.tracker.input_tokens,
             llm_output_tokens=llm_client.tracker.output_tokens,
             llm_calls=llm_client.tracker.calls,
+            llm_cache_hits=llm_client.tracker.cache_hits,
             llm_model=self.settings.llm_model,
             llm_provider=self.settings.llm_provider,
             total_quotes=len(all_quotes),
@@ -2485,13 +2735,25 @@ class Pipeline:
         sessions: list[InputSession],
         *,
         on_progress: object | None = None,
-        on_segment: object | None = None,
+        on_segment: Callable[[int, int, float, float], None] | None = None,
+        window_dir: Path | None = None,
+        resumed_windows: dict[str, set[str]] | None = None,
+        on_window: Callable[[str, str], None] | None = None,
+        on_session: Callable[[str, list[TranscriptSegment]], None] | None = None,
     ) -> tuple[dict[str, list[TranscriptSegment]], StageOutcome]:
         """Gather transcript segments from all sources (subtitle, docx, whisper).
 
         Args:
             sessions: Input sessions.
             on_progress: Optional callback(current, total) for transcription progress.
+            window_dir / resumed_windows / on_window: per-window resume for
+                chunked transcription, passed through to ``transcribe_sessions``.
+            on_session: Optional callback(session_id, segments) as each
+                session's transcript becomes available — parsed transcripts
+                straight away, Whisper ones as they finish. When set, Whisper
+                runs in a worker thread so the event loop stays free for the
+                work the callback starts; the callback is then invoked from
+                that thread and must hand off thread-safely.
 
         Returns:
             Tuple of (session_segments, transcript_outcome). Subtitle / docx
@@ -2581,6 +2843,8 @@ class Pipeline:
 
             if segments:
                 session_segments[session.session_id] = segments
+                if on_session is not None:
+                    on_session(session.session_id, segments)
             # If no existing transcript, audio will be transcribed below
 
         # Sessions whose transcript failed to parse and that produced nothing
@@ -2607,12 +2871,33 @@ class Pipeline:
                 if s.session_id not in session_segments and s.audio_path is not None
             ]
             if needs_transcription:
-                whisper_results, whisper_outcome = transcribe_sessions(
-                    needs_transcription,
-                    self.settings,
-                    on_progress=on_progress,
-                    on_segment=on_segment,
-                )
+                window_kwargs: dict[str, Any] = {}
+                if self.settings.whisper_chunk_seconds > 0:
+                    window_kwargs = {
+                        "window_dir": window_dir,
+                        "resumed_windows": resumed_windows,
+                        "on_window": on_window,
+                    }
+                if on_session is not None:
+                    whisper_results, whisper_outcome = await asyncio.to_thread(
+                        functools.partial(
+                            transcribe_sessions,
+                            needs_transcription,
+                            self.settings,
+                            on_progress=on_progress,
+                            on_segment=on_segment,
+                            on_session=on_session,
+                            **window_kwargs,
+                        )
+                    )
+                else:
+                    whisper_results, whisper_outcome = transcribe_sessions(
+                        needs_transcription,
+                        self.settings,
+                        on_progress=on_progress,
+                        on_segment=on_segment,
+                        **window_kwargs,
+                    )
                 session_segments.update(whisper_results)
                 transcript_outcome.attempted += whisper_outcome.attempted
                 transcript_outcome.succeeded += whisper_outcome.succeeded
@@ -2645,6 +2930,7 @@ class Pipeline:
         from bristlenose.models import ExtractedQuote, ScreenCluster, ThemeGroup
         from bristlenose.stages.s12_render import render_html
         from bristlenose.stages.s12_render_output import render_markdown
+        from bristlenose.utils.video import extract_thumbnails
 
         self._configure_logging(output_dir)
 
@@ -2684,7 +2970,7 @@ class Pipeline:
         # --- Re-ingest input files for video linking ---
         from bristlenose.stages.s01_ingest import ingest
 
-        sessions = ingest(input_dir)
+        sessions = ingest(input_dir, probe_cache=probe_cache_path(output_dir))
 
         # --- Load existing people file for display names ---
         from bristlenose.people import build_display_name_map, load_people_file
@@ -2725,6 +3011,11 @@ class Pipeline:
             display_names=display_names,
             people=people,
         )
+        # Stage 6b, inline: there are no LLM stages here to overlap with.
+        thumbnails = extract_thumbnails(
+            sessions, transcripts,
+            OutputPaths(output_dir, self.settings.project_name).thumbnails_dir,
+        ) if transcripts else {}
         report_path = render_html(
             screen_clusters, theme_groups, sessions,
             self.settings.project_name, output_dir,
@@ -2734,6 +3025,7 @@ class Pipeline:
             people=people,
             transcripts=transcripts,
             analysis=analysis,
+            thumbnails=thumbnails,
         )
         _print_step("Rendered report", time.perf_counter() - t0)
 
@@ -0,0 +1,232 @@
+"""Per-session transcript segments — the sharded intermediate store.
+
+Stage 5 used to write every session's segments into one
+``session_segments.json``, so every resume and every import parsed (and
+validated) the whole corpus even when it needed one session.  The store
+keeps one shard per session instead, under
+``.bristlenose/intermediate/session-segments/``::
+
+    index.json      {"version": 1, "sessions": {sid: {"file", "sha256", "segments"}}}
+    s1.json         compact JSON list of TranscriptSegment dumps
+    s2.bin          the same, "BNSS" + u32 version + zlib-deflated JSON
+
+Readers load only the sessions they ask for, and each shard is checked
+against the SHA-256 in the index before it is trusted — a damaged shard is
+reported missing, so only that session is recomputed.  :meth:`SegmentStore.put`
+replaces one shard and then the index, both atomically, so an interrupted
+run never leaves the index pointing at a half-written file.
+
+A project written before the store existed has only the monolithic
+``session_segments.json``; it is read as a fallback until the next run
+writes shards and :meth:`SegmentStore.prune` removes it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from bristlenose.hashing import hash_bytes
+from bristlenose.models import TranscriptSegment
+
+logger = logging.getLogger(__name__)
+
+SEGMENTS_DIRNAME = "session-segments"
+INDEX_FILENAME = "index.json"
+LEGACY_FILENAME = "session_segments.json"
+FORMATS = ("json", "binary")
+
+INDEX_VERSION = 1
+_MAGIC = b"BNSS"
+_BINARY_VERSION = 1
+_HEADER = struct.Struct("<4sI")
+_SUFFIX = {"json": ".json", "binary": ".bin"}
+
+_SEGMENT_LIST = TypeAdapter(list[TranscriptSegment])
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+class SegmentStore:
+    """Transcript segments for a project's sessions, one shard per session.
+
+    Args:
+        intermediate: The ``.bristlenose/intermediate`` directory.
+        fmt: Shard format for writes — ``"json"`` or ``"binary"``.  Reads
+            accept either, so a project can switch between runs.
+    """
+
+    def __init__(self, intermediate: Path, fmt: str = "json") -> None:
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown segment store format {fmt!r}")
+        self.intermediate = intermediate
+        self.dir = intermediate / SEGMENTS_DIRNAME
+        self.index_path = self.dir / INDEX_FILENAME
+        self.legacy_path = intermediate / LEGACY_FILENAME
+        self.fmt = fmt
+        self._index: dict[str, dict[str, Any]] | None = None
+
+    # -- Index --------------------------------------------------------------
+
+    def _entries(self) -> dict[str, dict[str, Any]]:
+        if self._index is None:
+            self._index = {}
+            try:
+                data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable %s: %s", self.index_path, exc)
+            else:
+                if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+                    self._index = dict(data.get("sessions") or {})
+        return self._index
+
+    def _write_index(self) -> None:
+        body = {"version": INDEX_VERSION, "sessions": dict(sorted(self._entries().items()))}
+        _write_atomic(self.index_path, json.dumps(body, indent=1).encode("utf-8"))
+
+    def exists(self) -> bool:
+        """True when there is anything to read — shards or a legacy file."""
+        return self.index_path.is_file() or self.legacy_path.is_file()
+
+    def session_ids(self) -> list[str]:
+        """Sessions with a shard (or, for a legacy project, in the old file)."""
+        if self.index_path.is_file():
+            return sorted(self._entries())
+        return sorted(self._legacy() or {})
+
+    def shard_hashes(self) -> dict[str, str]:
+        """``{session_id: sha256}`` from the index — no shard is read."""
+        return {sid: entry["sha256"] for sid, entry in self._entries().items()}
+
+    def content_hash(self) -> str | None:
+        """Hash of the index, which pins every shard's hash; None when absent."""
+        if not self.index_path.is_file():
+            return None
+        return hash_bytes(self.index_path.read_bytes())
+
+    # -- Reading ------------------------------------------------------------
+
+    def _legacy(self) -> dict[str, list[dict[str, Any]]] | None:
+        try:
+            data = json.loads(self.legacy_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable %s: %s", self.legacy_path, exc)
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _shard_json(self, sid: str) -> bytes | None:
+        """A shard's segments as JSON bytes, or None if missing or damaged."""
+        entry = self._entries().get(sid)
+        if entry is None:
+            return None
+        path = self.dir / entry["file"]
+        try:
+            data = path.read_bytes()
+        except OSError as exc:
+            logger.warning("Segment shard %s unreadable: %s", path, exc)
+            return None
+        if hash_bytes(data) != entry["sha256"]:
+            logger.warning("Segment shard %s does not match its index hash", path)
+            return None
+        if path.suffix == _SUFFIX["json"]:
+            return data
+        if len(data) < _HEADER.size:
+            return None
+        magic, version = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _BINARY_VERSION:
+            logger.warning("Segment shard %s: not a v%d shard", path, _BINARY_VERSION)
+            return None
+        try:
+            return bytes(zlib.decompress(data[_HEADER.size:]))
+        except zlib.error as exc:
+            logger.warning("Segment shard %s: %s", path, exc)
+            return None
+
+    def load_raw(
+        self, sids: Iterable[str] | None = None,
+    ) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        """Yield ``(session_id, segment dicts)`` without model validation.
+
+        For readers that only pick a few fields (the importer's word
+        timings).  ``sids=None`` means every stored session; sessions with
+        no readable shard are skipped.
+        """
+        if not self.index_path.is_file():
+            legacy = self._legacy() or {}
+            for sid in legacy if sids is None else sids:
+                if sid in legacy:
+                    yield sid, legacy[sid]
+            return
+        for sid in self.session_ids() if sids is None else sids:
+            data = self._shard_json(sid)
+            if data is not None:
+                try:
+                    yield sid, json.loads(data)
+                except ValueError as exc:
+                    logger.warning("Segment shard for %s unparseable: %s", sid, exc)
+
+    def load(self, sids: Iterable[str] | None = None) -> dict[str, list[TranscriptSegment]]:
+        """Validated segments for ``sids`` (default: every stored session).
+
+        Shards are validated straight from their JSON bytes, one session at
+        a time, so peak memory is one session's parse rather than the
+        corpus's.  Missing or damaged sessions are absent from the result.
+        """
+        if not self.index_path.is_file():
+            return {
+                sid: [TranscriptSegment.model_validate(s) for s in segs]
+                for sid, segs in self.load_raw(sids)
+            }
+        result: dict[str, list[TranscriptSegment]] = {}
+        for sid in self.session_ids() if sids is None else sids:
+            data = self._shard_json(sid)
+            if data is None:
+                continue
+            try:
+                result[sid] = _SEGMENT_LIST.validate_json(data)
+            except ValueError as exc:
+                logger.warning("Segment shard for %s invalid: %s", sid, exc)
+        return result
+
+    # -- Writing ------------------------------------------------------------
+
+    def put(self, sid: str, segments: list[TranscriptSegment]) -> None:
+        """Write (or replace) one session's shard, then the index."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        data = _SEGMENT_LIST.dump_json(segments)
+        if self.fmt == "binary":
+            data = _HEADER.pack(_MAGIC, _BINARY_VERSION) + zlib.compress(data)
+        name = sid + _SUFFIX[self.fmt]
+        entries = self._entries()
+        old = entries.get(sid)
+        _write_atomic(self.dir / name, data)
+        entries[sid] = {"file": name, "sha256": hash_bytes(data), "segments": len(segments)}
+        self._write_index()
+        if old is not None and old["file"] != name:
+            (self.dir / old["file"]).unlink(missing_ok=True)
+
+    def prune(self, keep: Iterable[str]) -> None:
+        """Drop shards of sessions not in ``keep``, and the legacy file."""
+        keep = set(keep)
+        entries = self._entries()
+        stale = [sid for sid in entries if sid not in keep]
+        for sid in stale:
+            (self.dir / entries.pop(sid)["file"]).unlink(missing_ok=True)
+        if stale:
+            self._write_index()
+        self.legacy_path.unlink(missing_ok=True)
@@ -0,0 +1,44 @@
+"""Import fingerprint for incremental serve-start imports.
+
+Adds ``projects.import_fingerprint`` — JSON ``{input: sha256}`` over the
+pipeline files the last import read. ``import_project`` compares it with
+the files on disk: an unchanged project skips the import, a changed one
+re-applies only the inputs that differ. ``NULL`` (every existing row after
+this upgrade) means "never fingerprinted", so the first import after the
+upgrade is a full one, exactly as before.
+
+Guarded per the Alembic discipline: ``upgrade()`` runs on a fresh DB too,
+but ``_has_column`` skips the ALTER there (``create_all()`` already made
+the column from the model).
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    return any(c["name"] == column for c in columns)
+
+
+def upgrade() -> None:
+    if _has_column("projects", "import_fingerprint"):
+        return
+    op.add_column(
+        "projects",
+        sa.Column("import_fingerprint", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    if _has_column("projects", "import_fingerprint"):
+        op.drop_column("projects", "import_fingerprint")
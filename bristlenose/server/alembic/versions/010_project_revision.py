@@ -0,0 +1,43 @@
+"""Project revision counter for cached read models.
+
+Adds ``projects.revision`` — a monotonically increasing integer bumped in
+the same transaction as every committed write to project data (see
+``server/read_model.py``). ``GET /quotes`` serves a cached projection while
+the revision is unchanged and uses it in the response ETag. Existing rows
+start at 0; their first write after the upgrade moves them on.
+
+Guarded per the Alembic discipline: ``upgrade()`` runs on a fresh DB too,
+but ``_has_column`` skips the ALTER there (``create_all()`` already made
+the column from the model).
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    return any(c["name"] == column for c in columns)
+
+
+def upgrade() -> None:
+    if _has_column("projects", "revision"):
+        return
+    op.add_column(
+        "projects",
+        sa.Column("revision", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    if _has_column("projects", "revision"):
+        op.drop_column("projects", "revision")
@@ -0,0 +1,58 @@
+"""Precomputed per-session transcript coverage.
+
+Adds ``session_coverages`` — one row per session holding the word counts
+and omitted-segment list the dashboard's coverage panel shows (see
+``server/coverage_store.py``). Purely derived data: an upgraded database
+starts with no rows and fills them on the next import or dashboard load.
+
+Guarded per the Alembic discipline: ``upgrade()`` runs on a fresh DB too, but
+``_has_table`` skips the CREATE there (``create_all()`` already made the table).
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(table: str) -> bool:
+    return table in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    if not _has_table("session_coverages"):
+        op.create_table(
+            "session_coverages",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "session_id",
+                sa.Integer(),
+                sa.ForeignKey("sessions.id"),
+                nullable=False,
+                unique=True,
+            ),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column("segment_count", sa.Integer(), nullable=False),
+            sa.Column("participant_words", sa.Integer(), nullable=False),
+            sa.Column("participant_words_in_quotes", sa.Integer(), nullable=False),
+            sa.Column("moderator_words", sa.Integer(), nullable=False),
+            sa.Column("omitted_json", sa.Text(), nullable=False),
+            sa.Column(
+                "computed_at",
+                sa.DateTime(),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+        )
+
+
+def downgrade() -> None:
+    if _has_table("session_coverages"):
+        op.drop_table("session_coverages")
@@ -0,0 +1,64 @@
+"""Per-quote AutoCode verdict cache.
+
+Adds ``autocode_caches`` — one row per (project, cache key) holding the LLM's
+assignments for one quote under one framework/prompt/taxonomy/model setup
+(see ``AutoCodeCache`` and ``server/autocode.py``) — and
+``autocode_jobs.cache_hits``, the quotes a job restored from it. Purely
+derived data: an upgraded database starts with an empty cache and old jobs
+report 0 hits.
+
+Guarded per the Alembic discipline: ``upgrade()`` runs on a fresh DB too, but
+``_has_table`` / ``_has_column`` skip the DDL there (``create_all()`` already
+made both).
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(table: str) -> bool:
+    return table in sa.inspect(op.get_bind()).get_table_names()
+
+
+def _has_column(table: str, column: str) -> bool:
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    if not _has_table("autocode_caches"):
+        op.create_table(
+            "autocode_caches",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("project_id", sa.Integer(), nullable=False, index=True),
+            sa.Column("framework_id", sa.String(length=50), nullable=False),
+            sa.Column("cache_key", sa.String(length=64), nullable=False),
+            sa.Column("assignments", sa.Text(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.UniqueConstraint(
+                "project_id", "cache_key", name="uq_autocode_cache_project_key"
+            ),
+        )
+    if not _has_column("autocode_jobs", "cache_hits"):
+        op.add_column(
+            "autocode_jobs",
+            sa.Column("cache_hits", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+
+def downgrade() -> None:
+    if _has_table("autocode_caches"):
+        op.drop_table("autocode_caches")
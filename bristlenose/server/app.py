@@ -22,6 +22,7 @@ from starlette.responses import PlainTextResponse, Response
 
 from bristlenose.server.db import create_session_factory, db_url_for_project, get_engine, init_db
 from bristlenose.server.middleware import AUTH_COOKIE_NAME, BearerTokenMiddleware
+from bristlenose.server.read_model import ProjectionCache
 from bristlenose.server.routes.analysis import router as analysis_router
 from bristlenose.server.routes.autocode import router as autocode_router
 from bristlenose.server.routes.clips_export import router as clips_export_router
@@ -34,6 +35,7 @@ from bristlenose.server.routes.data import router as data_router
 from bristlenose.server.routes.doctor import router as doctor_router
 from bristlenose.server.routes.export import router as export_router
 from bristlenose.server.routes.health import router as health_router
+from bristlenose.server.routes.llm import router as llm_router
 from bristlenose.server.routes.miro import router as miro_router
 from bristlenose.server.routes.pipeline import router as pipeline_router
 from bristlenose.server.routes.quotes import router as quotes_router
@@ -164,13 +166,22 @@ def create_app(
     # browser back/forward cache) from holding /api/projects/* responses
     # across the switch. See `desktop/Bristlenose/Bristlenose/ServeManager.swift`
     # `switchProject(to:)` for the Swift side.
+    #
+    # The one exception is a response carrying an ETag (GET /quotes): those
+    # get ``no-cache`` — stored, but revalidated with the server on every
+    # use. The ETag folds in the project's identity and revision
+    # (read_model.projection_etag), so project B's server can never answer
+    # 304 to project A's cached copy, and revalidation is what lets a
+    # repeat load skip the multi-megabyte body.
     @app.middleware("http")
     async def _no_store_for_project_api(
         request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
         response = await call_next(request)
         if request.url.path.startswith("/api/projects/"):
-            response.headers["Cache-Control"] = "no-store"
+            response.headers["Cache-Control"] = (
+                "no-cache" if "etag" in response.headers else "no-store"
+            )
         return response
 
     # Bearer token middleware — must be added before CORS so it runs after CORS
@@ -202,12 +213,15 @@ def create_app(
 
     # Store session factory, DB URL, and project dir in app state for dependency injection
     app.state.db_factory = session_factory
+    # Serialised read models (GET /quotes), rebuilt per project revision.
+    app.state.projections = ProjectionCache()
     app.state.db_url = db_url or ""
     app.state.project_dir = project_dir
     app.state.dev = dev
 
     app.include_router(health_router)
     app.include_router(doctor_router)
+    app.include_router(llm_router)
     app.include_router(analysis_router)
     app.include_router(autocode_router)
     app.include_router(clips_export_router)
@@ -7,14 +7,29 @@ Public API::
 
     build_tag_taxonomy(template)      → formatted prompt text
     build_quote_batch(quotes)         → formatted quote text
+    plan_batches(quotes, template, k) → batches, each with its tag shortlist
     resolve_tag_name_to_id(name, map) → TagDefinition.id or None
+    autocode_cache_key(scope, quote)  → per-quote verdict cache key
     run_autocode_job(...)             → top-level async job runner
+
+Verdicts are cached per quote (``AutoCodeCache``), keyed on everything that
+shapes the LLM's answer for it — framework, prompt version, taxonomy, tag
+shortlist size, provider/model and the quote as the prompt renders it. A run
+sends only the quotes without a cached verdict; the rest are restored and
+counted in the job's ``cache_hits``.
+
+With ``autocode_tag_shortlist`` set, a local BM25 pre-filter
+(``bristlenose.server.lexical``) narrows each batch's taxonomy to the tags
+its quotes plausibly match, so a large codebook is not re-sent in full with
+every 25 quotes.
 """
 
 from __future__ import annotations
 
 import asyncio
 import difflib
+import hashlib
+import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -22,6 +37,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from bristlenose.server.codebook import CodebookTemplate, TemplateGroup, TemplateTag
+from bristlenose.server.lexical import tag_shortlists
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -29,6 +45,8 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Session as SASession
 
     from bristlenose.config import BristlenoseSettings
+    from bristlenose.llm.structured import AutoCodeBatchResult
+    from bristlenose.server.models import Quote
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +55,15 @@ logger = logging.getLogger(__name__)
 BATCH_SIZE = 25
 
 
+def llm_job_key(project_id: int, framework_id: str) -> str:
+    """The LLM scheduler's job key for one framework's AutoCode work.
+
+    Shared by the initial run and its re-applies, so the cancel endpoint can
+    drop the framework's queued batches with ``cancel_llm_job``.
+    """
+    return f"autocode:{project_id}:{framework_id}"
+
+
 # ---------------------------------------------------------------------------
 # Dataclasses
 # ---------------------------------------------------------------------------
@@ -59,23 +86,28 @@ class QuoteBatchItem:
 # ---------------------------------------------------------------------------
 
 
-def build_tag_taxonomy(template: CodebookTemplate) -> str:
+def build_tag_taxonomy(template: CodebookTemplate, keep: set[str] | None = None) -> str:
     """Format a codebook template's groups and tags as LLM prompt text.
 
     Groups become ``### Group Name — subtitle`` headers.  Tags get their
     discrimination prompts (definition, apply_when, not_this) indented
     below.  Tags without discrimination prompts get a name-only entry.
+
+    ``keep`` limits the text to those tag names (a batch's shortlist);
+    groups left with no tags are omitted.
     """
     parts: list[str] = []
     for group in template.groups:
-        parts.append(_format_group(group))
+        tags = [t for t in group.tags if keep is None or t.name in keep]
+        if tags or keep is None:
+            parts.append(_format_group(group, tags))
     return "\n\n".join(parts)
 
 
-def _format_group(group: TemplateGroup) -> str:
+def _format_group(group: TemplateGroup, tags: list[TemplateTag]) -> str:
     """Format one group and its tags."""
     lines: list[str] = [f"### {group.name} — {group.subtitle}"]
-    for tag in group.tags:
+    for tag in tags:
         lines.append(_format_tag(tag))
     return "\n\n".join(lines)
 
@@ -100,6 +132,30 @@ def _format_tag(tag: TemplateTag) -> str:
     return "\n".join(lines)
 
 
+def _taxonomy_prefix(user_prompt: str) -> str:
+    """Return the part of a batch prompt ahead of its quotes envelope.
+
+    Codebook title, preamble and taxonomy are identical for every batch of a
+    job, so they are handed to the client as a prompt-cache prefix — each
+    batch after the first reads them from cache instead of re-sending them.
+    """
+    return user_prompt.split("<untrusted_quotes_", 1)[0]
+
+
+def _batch_taxonomy(template: CodebookTemplate, full: str, keep: set[str] | None) -> str:
+    """The taxonomy text for one batch — ``full`` unless it has a shortlist."""
+    return full if keep is None else build_tag_taxonomy(template, keep)
+
+
+def _batch_prefix(user_prompt: str, keep: set[str] | None) -> str | None:
+    """The batch's prompt-cache prefix, or None when its taxonomy is shortlisted.
+
+    A shortlisted taxonomy differs from batch to batch, so a cache write
+    (billed above a plain read) would rarely be read back.
+    """
+    return _taxonomy_prefix(user_prompt) if keep is None else None
+
+
 # ---------------------------------------------------------------------------
 # Quote batching
 # ---------------------------------------------------------------------------
@@ -123,6 +179,50 @@ def build_quote_batch(quotes: list[QuoteBatchItem]) -> str:
     return "\n\n".join(lines)
 
 
+def _tag_match_text(tag: TemplateTag) -> str:
+    """A tag's text for lexical matching — ``not_this`` describes its neighbours."""
+    return f"{tag.definition}\n{tag.apply_when}"
+
+
+def plan_batches(
+    items: list[QuoteBatchItem],
+    template: CodebookTemplate,
+    tag_shortlist: int,
+    batch_size: int = BATCH_SIZE,
+) -> list[tuple[list[QuoteBatchItem], set[str] | None]]:
+    """Chunk quotes into batches, each with the tag names its prompt lists.
+
+    With ``tag_shortlist`` 0 every batch lists the whole taxonomy (``None``).
+    Otherwise each quote keeps its ``tag_shortlist`` likeliest tags by local
+    BM25 relevance, quotes are ordered by their likeliest tag so a batch's
+    quotes share most of their shortlists, and each batch lists the union —
+    or the whole taxonomy if one of its quotes matched no tag lexically.
+    """
+    if tag_shortlist <= 0:
+        return [(items[i : i + batch_size], None) for i in range(0, len(items), batch_size)]
+    tags = {tag.name: _tag_match_text(tag) for group in template.groups for tag in group.tags}
+    shortlists = tag_shortlists([item.text for item in items], tags, tag_shortlist)
+    position = {name: i for i, name in enumerate(tags)}
+
+    def lead(n: int) -> int:
+        shortlist = shortlists[n]
+        return position[shortlist[0]] if shortlist else len(position)
+
+    order = sorted(range(len(items)), key=lead)
+    batches: list[tuple[list[QuoteBatchItem], set[str] | None]] = []
+    for i in range(0, len(order), batch_size):
+        chunk = order[i : i + batch_size]
+        keep: set[str] | None = set()
+        for n in chunk:
+            shortlist = shortlists[n]
+            if shortlist is None:
+                keep = None
+                break
+            keep.update(shortlist)
+        batches.append(([items[n] for n in chunk], keep))
+    return batches
+
+
 # ---------------------------------------------------------------------------
 # Tag name resolution
 # ---------------------------------------------------------------------------
@@ -172,6 +272,202 @@ def build_tag_name_map(
     return result
 
 
+# ---------------------------------------------------------------------------
+# Per-quote verdict cache
+# ---------------------------------------------------------------------------
+
+
+def autocode_cache_scope(
+    framework_id: str,
+    prompt_version: str,
+    taxonomy_text: str,
+    settings: BristlenoseSettings,
+) -> str:
+    """Hash of the run-wide half of a cache key (one per job).
+
+    The model is the one the client requests (``request_model_for``), so a
+    new Ollama model or Azure deployment starts a fresh set of verdicts.
+    """
+    from bristlenose.llm.client import request_model_for
+
+    parts = [
+        framework_id,
+        prompt_version,
+        hashlib.sha256(taxonomy_text.encode("utf-8")).hexdigest(),
+        f"{settings.llm_provider}:{request_model_for(settings)}",
+        # A shortlisted batch shows the quote fewer tags to choose from.
+        f"tag_shortlist={settings.autocode_tag_shortlist}",
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def autocode_cache_key(scope: str, item: QuoteBatchItem) -> str:
+    """Cache key for one quote's verdict under ``scope``.
+
+    The quote is hashed as the prompt renders it (effective text plus its
+    session, participant, topic and sentiment), without its batch position.
+    """
+    rendered = build_quote_batch([item])
+    return hashlib.sha256(f"{scope}\n{rendered}".encode()).hexdigest()
+
+
+def load_cached_verdicts(
+    db: SASession, project_id: int, keys: set[str]
+) -> dict[str, list[dict]]:
+    """``{cache_key: assignments}`` for the keys with a usable cached verdict."""
+    from bristlenose.server.models import AutoCodeCache
+
+    if not keys:
+        return {}
+    rows = db.query(AutoCodeCache.cache_key, AutoCodeCache.assignments).filter(
+        AutoCodeCache.project_id == project_id,
+        AutoCodeCache.cache_key.in_(keys),
+    )
+    verdicts: dict[str, list[dict]] = {}
+    for key, raw in rows:
+        try:
+            assignments = json.loads(raw)
+        except ValueError:
+            continue  # unreadable → a miss; the quote is sent again
+        if isinstance(assignments, list) and all(
+            isinstance(a, dict) and {"tag_name", "confidence", "rationale"} <= a.keys()
+            for a in assignments
+        ):
+            verdicts[key] = assignments
+    return verdicts
+
+
+def save_cached_verdicts(
+    db: SASession,
+    project_id: int,
+    framework_id: str,
+    verdicts: dict[str, list[dict]],
+) -> None:
+    """Upsert fresh verdicts into the caller's transaction (no commit)."""
+    from bristlenose.server.models import AutoCodeCache
+
+    if not verdicts:
+        return
+    db.query(AutoCodeCache).filter(
+        AutoCodeCache.project_id == project_id,
+        AutoCodeCache.cache_key.in_(verdicts),
+    ).delete(synchronize_session=False)
+    for key, assignments in verdicts.items():
+        db.add(AutoCodeCache(
+            project_id=project_id,
+            framework_id=framework_id,
+            cache_key=key,
+            assignments=json.dumps(assignments),
+        ))
+
+
+def prune_cached_verdicts(
+    db: SASession, project_id: int, framework_id: str, keep: set[str]
+) -> None:
+    """Drop a framework's verdicts for quotes no longer in the project as-is.
+
+    Called after a full run, whose keys cover every current quote — an
+    edited or removed quote's old verdict can never hit again.
+    """
+    from bristlenose.server.models import AutoCodeCache
+
+    db.query(AutoCodeCache).filter(
+        AutoCodeCache.project_id == project_id,
+        AutoCodeCache.framework_id == framework_id,
+        AutoCodeCache.cache_key.notin_(keep),
+    ).delete(synchronize_session=False)
+
+
+def verdict_proposals(
+    item: QuoteBatchItem,
+    assignments: list[dict],
+    tag_map: dict[str, int],
+) -> list[tuple[int, int, float, str]]:
+    """``(quote_id, tag_def_id, confidence, rationale)`` for a quote's verdict.
+
+    Tag names are resolved against the current ``tag_map``, so a cached
+    verdict follows the framework's tag definitions as they are now.
+    """
+    out: list[tuple[int, int, float, str]] = []
+    for a in assignments:
+        tag_def_id = resolve_tag_name_to_id(a["tag_name"], tag_map)
+        if tag_def_id is not None:
+            out.append((item.db_id, tag_def_id, a["confidence"], a["rationale"]))
+    return out
+
+
+def _batch_verdicts(
+    batch: list[QuoteBatchItem], result: AutoCodeBatchResult
+) -> list[list[dict]]:
+    """Split a batch result into one assignment list per quote, in batch order."""
+    verdicts: list[list[dict]] = [[] for _ in batch]
+    for assignment in result.assignments:
+        if assignment.quote_index < 0 or assignment.quote_index >= len(batch):
+            logger.warning(
+                "Invalid quote_index %d in batch of %d",
+                assignment.quote_index,
+                len(batch),
+            )
+            continue
+        verdicts[assignment.quote_index].append({
+            "tag_name": assignment.tag_name,
+            "confidence": assignment.confidence,
+            "rationale": assignment.rationale,
+        })
+    return verdicts
+
+
+def _restore_cached(
+    db: SASession,
+    project_id: int,
+    scope: str,
+    items: list[QuoteBatchItem],
+    tag_map: dict[str, int],
+) -> tuple[dict[int, str], list[tuple[int, int, float, str]], list[QuoteBatchItem]]:
+    """Split ``items`` into cache hits and quotes still to send.
+
+    Returns ``(cache key per quote id, proposals restored from hits, misses)``.
+    """
+    cache_keys = {item.db_id: autocode_cache_key(scope, item) for item in items}
+    cached = load_cached_verdicts(db, project_id, set(cache_keys.values()))
+    restored: list[tuple[int, int, float, str]] = []
+    pending: list[QuoteBatchItem] = []
+    for item in items:
+        verdict = cached.get(cache_keys[item.db_id])
+        if verdict is None:
+            pending.append(item)
+        else:
+            restored.extend(verdict_proposals(item, verdict, tag_map))
+    return cache_keys, restored, pending
+
+
+def _batch_items(db: SASession, quotes: list[Quote]) -> list[QuoteBatchItem]:
+    """Quotes as the prompt sees them — with the researcher's latest edit."""
+    from bristlenose.server.models import QuoteEdit
+
+    edited: dict[int, str] = {}
+    ids = [q.id for q in quotes]
+    if ids:
+        edits = (
+            db.query(QuoteEdit.quote_id, QuoteEdit.edited_text)
+            .filter(QuoteEdit.quote_id.in_(ids))
+            .order_by(QuoteEdit.edited_at.asc(), QuoteEdit.id.asc())
+        )
+        for quote_id, text in edits:  # ascending order: the latest edit wins
+            edited[quote_id] = text
+    return [
+        QuoteBatchItem(
+            db_id=q.id,
+            text=edited.get(q.id, q.text),
+            session_id=q.session_id,
+            participant_id=q.participant_id,
+            topic_label=q.topic_label or "",
+            sentiment=q.sentiment or "",
+        )
+        for q in quotes
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Job runner
 # ---------------------------------------------------------------------------
@@ -196,6 +492,12 @@ async def run_autocode_job(
     """
     from bristlenose.llm import telemetry
     from bristlenose.llm.client import LLMClient
+    from bristlenose.llm.concurrency import (
+        LLMJobCancelledError,
+        Priority,
+        controller_for,
+        llm_work,
+    )
     from bristlenose.llm.prompts import get_prompt_template
     from bristlenose.llm.structured import AutoCodeBatchResult
     from bristlenose.server.codebook import get_template
@@ -250,17 +552,7 @@ async def run_autocode_job(
             return
 
         # Build batch items
-        batch_items = [
-            QuoteBatchItem(
-                db_id=q.id,
-                text=q.text,
-                session_id=q.session_id,
-                participant_id=q.participant_id,
-                topic_label=q.topic_label or "",
-                sentiment=q.sentiment or "",
-            )
-            for q in quotes_rows
-        ]
+        batch_items = _batch_items(db, quotes_rows)
 
         job.total_quotes = len(batch_items)
         job.llm_provider = settings.llm_provider
@@ -301,18 +593,39 @@ async def run_autocode_job(
         # Record the prompt version so a later re-apply can reproduce this run.
         job.prompt_version = prompt_tmpl.version
 
-        # Chunk into batches
-        batches: list[list[QuoteBatchItem]] = []
-        for i in range(0, len(batch_items), BATCH_SIZE):
-            batches.append(batch_items[i : i + BATCH_SIZE])
+        # Restore the verdicts of quotes already coded under this exact setup;
+        # only the rest (new, edited, or after a prompt/taxonomy/model change)
+        # go to the LLM.
+        scope = autocode_cache_scope(framework_id, prompt_tmpl.version, taxonomy_text, settings)
+        cache_keys, restored, pending_items = _restore_cached(
+            db, project_id, scope, batch_items, tag_map
+        )
+        cache_hits = len(batch_items) - len(pending_items)
+        job.cache_hits = cache_hits
+        job.processed_quotes = cache_hits
+        db.commit()
+        if cache_hits:
+            logger.info(
+                "AutoCode cache: %d/%d quotes restored, %d to send",
+                cache_hits,
+                len(batch_items),
+                len(pending_items),
+            )
+
+        # Chunk into batches, each listing only its quotes' likeliest tags
+        # when the lexical shortlist is on.
+        batches = plan_batches(pending_items, template, settings.autocode_tag_shortlist)
 
-        # Process batches with bounded concurrency
-        semaphore = asyncio.Semaphore(settings.llm_concurrency)
+        # Process batches within the provider's shared, adaptive LLM window
+        semaphore = controller_for(settings)
         proposed_count = 0
-        processed_count = 0
+        processed_count = cache_hits
+        fresh_verdicts: dict[str, list[dict]] = {}
         progress_lock = asyncio.Lock()
 
-        async def _process_batch(batch: list[QuoteBatchItem]) -> list[ProposedTag]:
+        async def _process_batch(
+            batch: list[QuoteBatchItem], keep: set[str] | None
+        ) -> list[ProposedTag]:
             nonlocal processed_count
             async with semaphore:
                 # Cancellation checkpoint — check DB before starting LLM call.
@@ -334,7 +647,7 @@ async def run_autocode_job(
                 user_prompt = prompt_tmpl.user.format(
                     codebook_title=template.title,
                     codebook_preamble=template.preamble,
-                    formatted_tag_taxonomy=taxonomy_text,
+                    formatted_tag_taxonomy=_batch_taxonomy(template, taxonomy_text, keep),
                     formatted_quotes=wrap_untrusted("quotes", quote_text),
                 )
                 with telemetry.stage("serve_autocode"):
@@ -343,30 +656,25 @@ async def run_autocode_job(
                         user_prompt=user_prompt,
                         response_model=AutoCodeBatchResult,
                         prompt_template=prompt_tmpl,
+                        cacheable_prefix=_batch_prefix(user_prompt, keep),
                     )
-                # Map assignments to ProposedTag rows
+                # Map assignments to ProposedTag rows, caching each quote's
+                # verdict (an empty one too — "no tag" is an answer).
                 proposals: list[ProposedTag] = []
-                for assignment in result.assignments:
-                    if assignment.quote_index < 0 or assignment.quote_index >= len(batch):
-                        logger.warning(
-                            "Invalid quote_index %d in batch of %d",
-                            assignment.quote_index,
-                            len(batch),
-                        )
-                        continue
-                    quote_item = batch[assignment.quote_index]
-                    tag_def_id = resolve_tag_name_to_id(assignment.tag_name, tag_map)
-                    if tag_def_id is None:
-                        continue
-                    proposals.append(
-                        ProposedTag(
-                            job_id=job.id,
-                            quote_id=quote_item.db_id,
-                            tag_definition_id=tag_def_id,
-                            confidence=assignment.confidence,
-                            rationale=assignment.rationale,
+                for item, verdict in zip(batch, _batch_verdicts(batch, result)):
+                    fresh_verdicts[cache_keys[item.db_id]] = verdict
+                    for quote_id, tag_def_id, confidence, rationale in verdict_proposals(
+                        item, verdict, tag_map
+                    ):
+                        proposals.append(
+                            ProposedTag(
+                                job_id=job.id,
+                                quote_id=quote_id,
+                                tag_definition_id=tag_def_id,
+                                confidence=confidence,
+                                rationale=rationale,
+                            )
                         )
-                    )
                 processed_count += len(batch)
                 logger.info(
                     "AutoCode batch done: %d/%d quotes, %d proposals",
@@ -412,15 +720,32 @@ async def run_autocode_job(
                         progress_db.close()
                 return proposals
 
-        # Gather all batches
-        batch_results = await asyncio.gather(
-            *(_process_batch(b) for b in batches),
-            return_exceptions=True,
-        )
+        # Gather all batches. AutoCode is background work: interactive
+        # requests (chat, elaboration) jump its queued batches, and two
+        # frameworks running at once share the window between them.
+        with llm_work(Priority.BACKGROUND, llm_job_key(project_id, framework_id)):
+            batch_results = await asyncio.gather(
+                *(_process_batch(b, keep) for b, keep in batches),
+                return_exceptions=True,
+            )
+
+        for quote_id, tag_def_id, confidence, rationale in restored:
+            db.add(
+                ProposedTag(
+                    job_id=job.id,
+                    quote_id=quote_id,
+                    tag_definition_id=tag_def_id,
+                    confidence=confidence,
+                    rationale=rationale,
+                )
+            )
+            proposed_count += 1
 
         # Store results, handling per-batch errors gracefully
         batch_errors = 0
         for batch_result in batch_results:
+            if isinstance(batch_result, LLMJobCancelledError):
+                continue  # dropped from the queue by the cancel endpoint
             if isinstance(batch_result, BaseException):
                 logger.error("Batch failed: %s", batch_result)
                 batch_errors += 1
@@ -430,11 +755,14 @@ async def run_autocode_job(
                 proposed_count += 1
 
         logger.info(
-            "AutoCode job finished: %d proposals from %d quotes (%d batch errors)",
+            "AutoCode job finished: %d proposals from %d quotes "
+            "(%d from cache, %d batch errors)",
             proposed_count,
             len(batch_items),
+            cache_hits,
             batch_errors,
         )
+        save_cached_verdicts(db, project_id, framework_id, fresh_verdicts)
 
         # Re-read job status — it may have been cancelled during processing.
         db.expire(job)
@@ -447,6 +775,7 @@ async def run_autocode_job(
             db.commit()
             return
 
+        prune_cached_verdicts(db, project_id, framework_id, set(cache_keys.values()))
         job.status = "completed"
         job.processed_quotes = processed_count
         job.proposed_count = proposed_count
@@ -602,6 +931,12 @@ async def reapply_to_new_quotes(
     from bristlenose.llm import telemetry
     from bristlenose.llm.boundary import wrap_untrusted
     from bristlenose.llm.client import LLMClient
+    from bristlenose.llm.concurrency import (
+        LLMJobCancelledError,
+        Priority,
+        controller_for,
+        llm_work,
+    )
     from bristlenose.llm.prompts import get_prompt_template
     from bristlenose.llm.structured import AutoCodeBatchResult
     from bristlenose.server.codebook import get_template
@@ -671,17 +1006,7 @@ async def reapply_to_new_quotes(
         if not new_quotes:
             return 0
 
-        batch_items = [
-            QuoteBatchItem(
-                db_id=q.id,
-                text=q.text,
-                session_id=q.session_id,
-                participant_id=q.participant_id,
-                topic_label=q.topic_label or "",
-                sentiment=q.sentiment or "",
-            )
-            for q in new_quotes
-        ]
+        batch_items = _batch_items(db, new_quotes)
 
         taxonomy_text = build_tag_taxonomy(template)
         framework_groups = (
@@ -699,20 +1024,25 @@ async def reapply_to_new_quotes(
         llm_client = LLMClient(settings)
         prompt_tmpl = get_prompt_template("autocode")
 
-        batches = [
-            batch_items[i : i + BATCH_SIZE]
-            for i in range(0, len(batch_items), BATCH_SIZE)
-        ]
-        semaphore = asyncio.Semaphore(settings.llm_concurrency)
+        # A re-imported session's unchanged quotes restore from the cache.
+        scope = autocode_cache_scope(framework_id, prompt_tmpl.version, taxonomy_text, settings)
+        cache_keys, restored, pending_items = _restore_cached(
+            db, project_id, scope, batch_items, tag_map
+        )
+        cache_hits = len(batch_items) - len(pending_items)
+        fresh_verdicts: dict[str, list[dict]] = {}
+
+        batches = plan_batches(pending_items, template, settings.autocode_tag_shortlist)
+        semaphore = controller_for(settings)
 
         async def _batch(
-            batch: list[QuoteBatchItem],
+            batch: list[QuoteBatchItem], keep: set[str] | None
         ) -> list[tuple[int, int, float, str]]:
             async with semaphore:
                 user_prompt = prompt_tmpl.user.format(
                     codebook_title=template.title,
                     codebook_preamble=template.preamble,
-                    formatted_tag_taxonomy=taxonomy_text,
+                    formatted_tag_taxonomy=_batch_taxonomy(template, taxonomy_text, keep),
                     formatted_quotes=wrap_untrusted("quotes", build_quote_batch(batch)),
                 )
                 with telemetry.stage("serve_autocode_reapply"):
@@ -721,22 +1051,18 @@ async def reapply_to_new_quotes(
                         user_prompt=user_prompt,
                         response_model=AutoCodeBatchResult,
                         prompt_template=prompt_tmpl,
+                        cacheable_prefix=_batch_prefix(user_prompt, keep),
                     )
                 out: list[tuple[int, int, float, str]] = []
-                for a in result.assignments:
-                    if a.quote_index < 0 or a.quote_index >= len(batch):
-                        continue
-                    tag_def_id = resolve_tag_name_to_id(a.tag_name, tag_map)
-                    if tag_def_id is None:
-                        continue
-                    out.append(
-                        (batch[a.quote_index].db_id, tag_def_id, a.confidence, a.rationale)
-                    )
+                for item, verdict in zip(batch, _batch_verdicts(batch, result)):
+                    fresh_verdicts[cache_keys[item.db_id]] = verdict
+                    out.extend(verdict_proposals(item, verdict, tag_map))
                 return out
 
-        results = await asyncio.gather(
-            *(_batch(b) for b in batches), return_exceptions=True
-        )
+        with llm_work(Priority.BACKGROUND, llm_job_key(project_id, framework_id)):
+            results = await asyncio.gather(
+                *(_batch(b, keep) for b, keep in batches), return_exceptions=True
+            )
 
         accepted = 0
         new_proposed = 0
@@ -750,7 +1076,9 @@ async def reapply_to_new_quotes(
         # new sessions re-selected and re-fail on every subsequent run, forever,
         # silently. Deduping here keeps the collision from ever forming.
         best_by_quote: dict[int, tuple[int, int, float, str]] = {}
-        for res in results:
+        for res in [restored, *results]:
+            if isinstance(res, LLMJobCancelledError):
+                continue
             if isinstance(res, BaseException):
                 logger.error("Re-apply batch failed: %s", res)
                 continue
@@ -793,7 +1121,9 @@ async def reapply_to_new_quotes(
                     )
                     accepted += 1
 
+        save_cached_verdicts(db, project_id, framework_id, fresh_verdicts)
         job.total_quotes += len(batch_items)
+        job.cache_hits += cache_hits
         job.proposed_count += new_proposed
         job.completed_at = now
         if track_status:
@@ -801,9 +1131,11 @@ async def reapply_to_new_quotes(
             job.status = "completed"
         db.commit()
         logger.info(
-            "Re-apply %s: %d new quotes, %d proposals, %d auto-accepted at >=%.2f",
+            "Re-apply %s: %d new quotes (%d from cache), %d proposals, "
+            "%d auto-accepted at >=%.2f",
             framework_id,
             len(batch_items),
+            cache_hits,
             new_proposed,
             accepted,
             threshold,
@@ -3,10 +3,12 @@
 Prototype per ``docs/design-chat-lens.md`` §6 as corrected by §5a,
 templated on ``elaboration.py``: an LLM call from serve mode,
 provider-agnostic via ``LLMClient(settings)``, structured output through
-``analyze(..., response_model=ChatLensAnswer)``. No retrieval — the whole
-curated corpus is context-stuffed (a few hundred quotes fit comfortably).
-No history, no streaming, no cache: every ask is a live call metered on
-the researcher's own key.
+``analyze(..., response_model=ChatLensAnswer)``. The whole curated corpus
+is context-stuffed while it fits ``chat_lens_corpus_chars`` (a few hundred
+quotes fit comfortably); a larger project sends the quotes most relevant to
+the question, stated as an excerpt (``grounding.retrieve_corpus_context``).
+No history, no streaming, no answer cache: every ask is a live call metered
+on the researcher's own key.
 
 Two mechanisms make the answer honest, and they are different jobs:
 
@@ -37,8 +39,8 @@ from bristlenose.server.grounding import (
     INVARIANTS,
     CorpusContext,
     CorpusQuote,
-    assemble_corpus_context,
     resolve_quote_indices,
+    retrieve_corpus_context,
 )
 
 if TYPE_CHECKING:
@@ -240,11 +242,14 @@ async def ask_question(
     if not ok:
         raise ValueError(reason)
 
-    corpus = assemble_corpus_context(db, project_id)
+    corpus = retrieve_corpus_context(
+        db, project_id, question, max_chars=settings.chat_lens_corpus_chars
+    )
 
     from bristlenose.llm import telemetry
     from bristlenose.llm.boundary import wrap_untrusted
     from bristlenose.llm.client import LLMClient
+    from bristlenose.llm.concurrency import Priority, llm_work
     from bristlenose.llm.prompts import get_prompt_template
     from bristlenose.llm.structured import ChatLensAnswer
 
@@ -257,7 +262,10 @@ async def ask_question(
 
     client = LLMClient(settings)
     t0 = time.perf_counter()
-    with telemetry.stage("serve_chat_lens"):
+    # The researcher is waiting on this answer: it takes the next free LLM
+    # slot ahead of queued pipeline and AutoCode work (the support check too).
+    llm_job = f"chat-lens:{project_id}"
+    with llm_work(Priority.INTERACTIVE, llm_job), telemetry.stage("serve_chat_lens"):
         answer = await client.analyze(
             system_prompt=prompt_tmpl.system,
             user_prompt=user_prompt,
@@ -284,7 +292,8 @@ async def ask_question(
             )
         )
 
-    await _run_support_check(claims, client)
+    with llm_work(Priority.INTERACTIVE, llm_job):
+        await _run_support_check(claims, client)
     elapsed_ms = int((time.perf_counter() - t0) * 1000)
 
     return AskResult(
@@ -27,11 +27,28 @@ class ClipBackend(Protocol):
         """Extract a clip. Returns output path on success, None on failure."""
         ...
 
+    def extract_clips(
+        self, source: Path, cuts: list[tuple[Path, float, float]],
+    ) -> list[Path | None]:
+        """Extract several ``(output, start, end)`` clips from one source.
+
+        Returns one entry per cut, in order — as :meth:`extract_clip` would.
+        """
+        ...
+
     def check_available(self) -> tuple[bool, str]:
         """Check if this backend is available. Returns (ok, message)."""
         ...
 
 
+#: Most clips cut by one FFmpeg invocation — each opens its own input.
+MAX_CUTS_PER_PROCESS = 8
+
+
+def _written(output: Path) -> bool:
+    return output.exists() and output.stat().st_size > 0
+
+
 class FFmpegBackend:
     """FFmpeg stream-copy backend for clip extraction."""
 
@@ -94,7 +111,70 @@ class FFmpegBackend:
             logger.warning("FFmpeg not found when extracting clip from %s", source.name)
             return None
 
-        if output.exists() and output.stat().st_size > 0:
+        if _written(output):
             return output
 
         return None
+
+    def extract_clips(
+        self, source: Path, cuts: list[tuple[Path, float, float]],
+    ) -> list[Path | None]:
+        """Cut several clips from one source in a single FFmpeg process.
+
+        The source is opened once per cut, each with its own input seek
+        (``-ss``/``-to`` before ``-i``, as in :meth:`extract_clip`), and
+        mapped to its own output — one process start-up instead of one per
+        clip.  If the combined run fails, the cuts it did not write are
+        retried one at a time, so one bad range only loses its own clip.
+        At most :data:`MAX_CUTS_PER_PROCESS` cuts per call.
+        """
+        if len(cuts) > MAX_CUTS_PER_PROCESS:
+            raise ValueError(f"at most {MAX_CUTS_PER_PROCESS} cuts per call")
+        if len(cuts) == 1:
+            output, start, end = cuts[0]
+            return [self.extract_clip(source, output, start, end)]
+
+        try:
+            ensure_materialised(source)
+        except CloudFetchTimeoutError as exc:
+            logger.warning("Clip extraction skipped for %s: %s", source.name, exc)
+            return [None] * len(cuts)
+
+        ffmpeg = bundled_binary_path("ffmpeg") or "ffmpeg"
+        cmd = [ffmpeg]
+        for _, start, end in cuts:
+            cmd += ["-ss", f"{start:.3f}", "-to", f"{end:.3f}", "-i", str(source)]
+        for i, (output, _, _) in enumerate(cuts):
+            output.parent.mkdir(parents=True, exist_ok=True)
+            # Explicit maps replace FFmpeg's default stream selection, which
+            # would otherwise draw every output from the first input.
+            if output.suffix != ".m4a":
+                cmd += ["-map", f"{i}:v:0?"]
+            cmd += ["-map", f"{i}:a:0?", "-c", "copy", "-y", str(output)]
+
+        ok = False
+        try:
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, timeout=120 * len(cuts),
+            )
+            ok = result.returncode == 0
+            if not ok:
+                logger.warning(
+                    "Batched clip extraction failed for %s (exit %d): %s",
+                    source.name,
+                    result.returncode,
+                    result.stderr[-500:],
+                )
+        except subprocess.TimeoutExpired:
+            logger.warning("Batched clip extraction timed out for %s", source.name)
+        except FileNotFoundError:
+            logger.warning("FFmpeg not found when extracting clips from %s", source.name)
+            return [None] * len(cuts)
+
+        results: list[Path | None] = []
+        for output, start, end in cuts:
+            if ok and _written(output):
+                results.append(output)
+            else:
+                results.append(self.extract_clip(source, output, start, end))
+        return results
@@ -14,6 +14,7 @@ Two entry points, covering the researcher's loop:
                               call into a refinement pass (fold judgements back in
                               so the next pass is sharper — one template handles both)
     find_candidates(...)    → score uncoded quotes against that prompt, ranked
+                              (scanned likeliest-first by a local lexical pre-rank)
 
 The pure formatting / ranking / hashing helpers carry no LLM dependency and are
 unit-tested directly; the three ``async`` functions orchestrate the LLM calls.
@@ -27,6 +28,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from bristlenose.server.lexical import BM25Index
+
 if TYPE_CHECKING:
     from bristlenose.config import BristlenoseSettings
 
@@ -230,6 +233,21 @@ def rank_candidates(
     return out
 
 
+def order_by_relevance(
+    tag_name: str, draft: PromptDraft, quotes: list[CandidateQuote]
+) -> list[CandidateQuote]:
+    """The pool with the quotes lexically closest to the tag's prompt first.
+
+    Local BM25 over the quote texts, queried with the tag name, definition and
+    "apply when" (not "not this", which names what the tag excludes). Only the
+    order changes — every quote is still scanned — but batches go out
+    likeliest-first, so the strongest candidates are scored first on a busy
+    LLM window and survive a partial scan. Ties keep pool order.
+    """
+    query = f"{tag_name}\n{draft.definition}\n{draft.apply_when}"
+    return [quotes[i] for i in BM25Index([q.text for q in quotes]).rank(query)]
+
+
 def _chunk(items: list[CandidateQuote], size: int) -> list[list[CandidateQuote]]:
     return [items[i : i + size] for i in range(0, len(items), size)]
 
@@ -268,6 +286,7 @@ async def synthesize_prompt(
     from bristlenose.llm import telemetry
     from bristlenose.llm.boundary import wrap_untrusted
     from bristlenose.llm.client import LLMClient
+    from bristlenose.llm.concurrency import Priority, llm_work
     from bristlenose.llm.prompts import get_prompt_template
     from bristlenose.llm.structured import SynthesizedTagPrompt
 
@@ -282,7 +301,8 @@ async def synthesize_prompt(
         feedback_block=feedback_block,
     )
     llm_client = LLMClient(settings)
-    with telemetry.stage("serve_codebook_synthesize"):
+    llm_job = f"codebook-synthesize:{tag_name}"
+    with llm_work(Priority.INTERACTIVE, llm_job), telemetry.stage("serve_codebook_synthesize"):
         result = await llm_client.analyze(
             system_prompt=prompt_tmpl.system,
             user_prompt=user_prompt,
@@ -332,13 +352,15 @@ async def find_candidates(
 ) -> CandidateScan:
     """Score a pool of uncoded quotes against a tag's prompt, ranked by fit.
 
-    Batches the quotes, runs one LLM call per batch with bounded concurrency,
-    and returns the positive matches sorted by confidence. Per-batch errors are
-    counted, not fatal — a partial scan still returns its good batches.
+    Batches the quotes (likeliest first, see ``order_by_relevance``), runs one
+    LLM call per batch with bounded concurrency, and returns the positive
+    matches sorted by confidence. Per-batch errors are counted, not fatal — a
+    partial scan still returns its good batches.
     """
     from bristlenose.llm import telemetry
     from bristlenose.llm.boundary import wrap_untrusted
     from bristlenose.llm.client import LLMClient
+    from bristlenose.llm.concurrency import Priority, controller_for, llm_work
     from bristlenose.llm.prompts import get_prompt_template
     from bristlenose.llm.structured import CandidateMatchResult
 
@@ -348,8 +370,8 @@ async def find_candidates(
     prompt_tmpl = get_prompt_template("codebook-candidates")
     tag_prompt_text = format_tag_prompt(draft)
     llm_client = LLMClient(settings)
-    batches = _chunk(quotes, CANDIDATE_BATCH_SIZE)
-    semaphore = asyncio.Semaphore(settings.llm_concurrency)
+    batches = _chunk(order_by_relevance(tag_name, draft, quotes), CANDIDATE_BATCH_SIZE)
+    semaphore = controller_for(settings)
 
     async def _score(batch: list[CandidateQuote]) -> list[Candidate]:
         async with semaphore:
@@ -371,9 +393,12 @@ async def find_candidates(
             ]
             return rank_candidates(verdicts, batch, min_confidence=min_confidence)
 
-    results = await asyncio.gather(
-        *(_score(b) for b in batches), return_exceptions=True
-    )
+    # A scan is foreground work — the builder waits on it — so it queues with
+    # pipeline runs, ahead of background AutoCode.
+    with llm_work(Priority.NORMAL, f"codebook-candidates:{tag_name}"):
+        results = await asyncio.gather(
+            *(_score(b) for b in batches), return_exceptions=True
+        )
 
     scan = CandidateScan(scanned=len(quotes))
     for r in results:
@@ -0,0 +1,158 @@
+"""Precomputed transcript coverage — one ``SessionCoverage`` row per session.
+
+The dashboard's coverage panel (how much of what participants said made it
+into the report, how much was the moderator, what was left out) is a pure
+function of each session's transcript segments and its quotes' timecodes.
+Recomputing it on every dashboard load means reading the whole transcript
+corpus; instead it is computed per session and stored.
+
+Both inputs are written only by the importer, which calls
+:func:`refresh_coverage` for the sessions it touched before committing.
+Researcher edits and hides do not change coverage — a hidden or edited
+quote still covers the transcript it was extracted from. The dashboard calls
+:func:`load_coverage`, which reads the stored rows and computes only the
+missing ones (a database imported before this table existed, or a bump of
+:data:`COVERAGE_VERSION`).
+
+The algorithm mirrors ``bristlenose/coverage.py`` over SQLAlchemy rows.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy.orm import Session
+
+from bristlenose.server.models import Quote, SessionCoverage, TranscriptSegment
+from bristlenose.server.models import Session as SessionModel
+
+#: Bump when the computation below changes; older rows are recomputed.
+COVERAGE_VERSION = 1
+
+# Segments with this many words or fewer are collapsed into fragment summaries.
+# Matches FRAGMENT_THRESHOLD in bristlenose/coverage.py.
+_FRAGMENT_THRESHOLD = 3
+
+
+def _is_moderator_code(code: str) -> bool:
+    """Check if a speaker code is moderator or observer (not participant)."""
+    return code.startswith("m") or code.startswith("o")
+
+
+def _compute(
+    row: SessionCoverage,
+    segments: Iterable[tuple[str, float, str]],
+    ranges: list[tuple[float, float]],
+) -> None:
+    """Fill ``row`` from one session's ``(speaker_code, start, text)`` segments."""
+    segment_count = participant = in_quotes = moderator = 0
+    full_segments: list[list[object]] = []
+    fragments: list[str] = []
+    for code, start_time, text in segments:
+        segment_count += 1
+        wc = len(text.split())
+        if _is_moderator_code(code):
+            moderator += wc
+            continue
+        # Participant (or unknown code — treat as participant)
+        participant += wc
+        if any(start <= start_time <= end for start, end in ranges):
+            in_quotes += wc
+        elif wc > _FRAGMENT_THRESHOLD:
+            full_segments.append([code, start_time, text])
+        else:
+            fragments.append(text)
+
+    row.version = COVERAGE_VERSION
+    row.segment_count = segment_count
+    row.participant_words = participant
+    row.participant_words_in_quotes = in_quotes
+    row.moderator_words = moderator
+    row.omitted_json = json.dumps({
+        "segments": full_segments,
+        "fragments": [[t, n] for t, n in Counter(fragments).most_common()],
+    })
+
+
+def refresh_coverage(
+    db: Session, sessions: list[SessionModel],
+) -> dict[int, SessionCoverage]:
+    """Recompute and stage the coverage rows of ``sessions``; caller commits.
+
+    Two queries whatever the session count: the sessions' segments, and
+    their quotes' timecodes.
+    """
+    if not sessions:
+        return {}
+    pks = [s.id for s in sessions]
+    existing = {
+        row.session_id: row
+        for row in db.query(SessionCoverage).filter(SessionCoverage.session_id.in_(pks))
+    }
+
+    segments: dict[int, list[tuple[str, float, str]]] = {pk: [] for pk in pks}
+    for sid, code, start, text in (
+        db.query(
+            TranscriptSegment.session_id,
+            TranscriptSegment.speaker_code,
+            TranscriptSegment.start_time,
+            TranscriptSegment.text,
+        )
+        .filter(TranscriptSegment.session_id.in_(pks))
+        .order_by(TranscriptSegment.session_id, TranscriptSegment.start_time)
+    ):
+        segments[sid].append((code, start, text))
+
+    ranges: dict[str, list[tuple[float, float]]] = {}
+    for str_sid, start, end in (
+        db.query(Quote.session_id, Quote.start_timecode, Quote.end_timecode)
+        .filter(
+            Quote.project_id == sessions[0].project_id,
+            Quote.session_id.in_([s.session_id for s in sessions]),
+        )
+    ):
+        ranges.setdefault(str_sid, []).append((start, end))
+
+    rows: dict[int, SessionCoverage] = {}
+    for sess in sessions:
+        row = existing.get(sess.id)
+        if row is None:
+            row = SessionCoverage(session_id=sess.id)
+            db.add(row)
+        _compute(row, segments[sess.id], ranges.get(sess.session_id, []))
+        rows[sess.id] = row
+    db.flush()
+    return rows
+
+
+def load_coverage(
+    db: Session, sessions: list[SessionModel],
+) -> tuple[dict[int, SessionCoverage], bool]:
+    """Stored coverage for ``sessions``, filling in missing or outdated rows.
+
+    Returns ``(rows by session pk, whether anything was recomputed)`` — the
+    caller commits when the second is True.
+    """
+    pks = [s.id for s in sessions]
+    rows = {
+        row.session_id: row
+        for row in db.query(SessionCoverage).filter(SessionCoverage.session_id.in_(pks))
+        if row.version == COVERAGE_VERSION
+    }
+    missing = [s for s in sessions if s.id not in rows]
+    if missing:
+        rows.update(refresh_coverage(db, missing))
+    return rows, bool(missing)
+
+
+def omitted_content(
+    row: SessionCoverage,
+) -> tuple[list[tuple[str, float, str]], list[tuple[str, int]]]:
+    """``(full segments, fragment counts)`` stored on ``row``."""
+    data = json.loads(row.omitted_json or "{}")
+    return (
+        [(code, start, text) for code, start, text in data.get("segments", [])],
+        [(text, count) for text, count in data.get("fragments", [])],
+    )
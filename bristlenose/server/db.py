@@ -71,7 +71,13 @@ def _set_sqlite_pragma(dbapi_connection, connection_record):  # type: ignore[no-
     JJG/Nielsen tag stuck at count 0). A 5 s timeout makes the loser wait for the
     lock instead of erroring; the writes finish in milliseconds, so contention just
     resolves. Applies to every connection (the event fires on each connect).
+
+    Also registers the quote search fallback's SQL function, used when this
+    SQLite has no FTS5 (see ``quote_search.fallback_filter``).
     """
+    from bristlenose.server.quote_search import register_match_function
+
+    register_match_function(dbapi_connection)
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA foreign_keys=ON")
@@ -80,8 +86,16 @@ def _set_sqlite_pragma(dbapi_connection, connection_record):  # type: ignore[no-
 
 
 def create_session_factory(engine: Engine) -> sessionmaker[Session]:
-    """Create a sessionmaker bound to the given engine."""
-    return sessionmaker(bind=engine)
+    """Create a sessionmaker bound to the given engine.
+
+    Sessions from it bump ``Project.revision`` on every committed write
+    (see ``read_model.track_revisions``).
+    """
+    from bristlenose.server.read_model import track_revisions
+
+    factory = sessionmaker(bind=engine)
+    track_revisions(factory)
+    return factory
 
 
 def run_migrations(engine: Engine) -> None:
@@ -146,11 +160,17 @@ def run_migrations(engine: Engine) -> None:
 
 
 def init_db(engine: Engine) -> None:
-    """Create all tables and run migrations. Safe to call repeatedly."""
+    """Create all tables, run migrations, install the quote search index.
+
+    Safe to call repeatedly.
+    """
     from bristlenose.server import models  # noqa: F401 — registers all tables
+    from bristlenose.server.quote_search import install_quote_index
 
     Base.metadata.create_all(bind=engine)
     run_migrations(engine)
+    # After migrations: a batch-mode rebuild of ``quotes`` drops its triggers.
+    install_quote_index(engine)
 
 
 def get_db(engine: Engine) -> Generator[Session, None, None]:
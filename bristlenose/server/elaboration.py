@@ -332,6 +332,7 @@ async def generate_elaborations(
         from bristlenose.llm import telemetry
         from bristlenose.llm.boundary import wrap_untrusted
         from bristlenose.llm.client import LLMClient
+        from bristlenose.llm.concurrency import Priority, llm_work
         from bristlenose.llm.prompts import get_prompt_template
         from bristlenose.llm.structured import SignalElaborationResult
 
@@ -340,7 +341,9 @@ async def generate_elaborations(
         user_prompt = prompt_tmpl.user.format(signals_text=wrap_untrusted("signals", signals_text))
 
         client = LLMClient(settings)
-        with telemetry.stage("serve_signal_elaboration"):
+        # Elaborations render while the researcher watches the dashboard.
+        work = llm_work(Priority.INTERACTIVE, f"elaboration:{project_id}")
+        with work, telemetry.stage("serve_signal_elaboration"):
             result = await client.analyze(
                 system_prompt=prompt_tmpl.system,
                 user_prompt=user_prompt,
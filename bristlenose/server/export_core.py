@@ -3,6 +3,7 @@
 Provides:
 - ``ExportableQuote`` — flat dataclass with all 11 export columns.
 - ``extract_quotes_for_export()`` — single query joining the full quote graph.
+- ``iter_quotes_for_export()`` — the same rows, streamed in batches.
 - ``pick_featured_quotes()`` — select top quotes for dashboard / clip extraction.
 - ``csv_safe()`` — defence against CSV formula injection (CWE-1236).
 - ``excel_sheet_name()`` — sanitise project name for Excel sheet tab.
@@ -12,8 +13,10 @@ from __future__ import annotations
 
 import os
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session as DbSession
 
 from bristlenose.server.models import (
@@ -102,6 +105,12 @@ class ExportableQuote:
 # Extraction
 # ---------------------------------------------------------------------------
 
+#: Quotes assembled per round of related-data queries when streaming.
+EXPORT_BATCH_SIZE = 500
+
+#: Sort position of quotes outside every section — after all of them.
+_UNSECTIONED_ORDER = 999
+
 
 def extract_quotes_for_export(
     db: DbSession,
@@ -129,36 +138,83 @@ def extract_quotes_for_export(
     list[ExportableQuote]
         Ordered by section display_order, then start_timecode.
     """
-    # ── Resolve quote rows ─────────────────────────────────────────────
+    return list(iter_quotes_for_export(db, project_id, quote_ids, anonymise=anonymise))
+
+
+def iter_quotes_for_export(
+    db: DbSession,
+    project_id: int,
+    quote_ids: list[str] | None = None,
+    anonymise: bool = False,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[ExportableQuote]:
+    """Yield export rows in export order, ``batch_size`` quotes at a time.
+
+    Same parameters and ordering as :func:`extract_quotes_for_export`, but
+    the sort happens in SQL and the quotes are streamed from one query, so
+    only one batch (plus its edits, stars, themes and tags) is in memory
+    at a time.  Used by the streaming CSV / XLSX downloads.
+    """
+    # ── One ordered query: quote + its section ─────────────────────────
+    query = (
+        db.query(Quote, ScreenCluster.screen_label)
+        .outerjoin(ClusterQuote, ClusterQuote.quote_id == Quote.id)
+        .outerjoin(ScreenCluster, ScreenCluster.id == ClusterQuote.cluster_id)
+        .filter(Quote.project_id == project_id)
+    )
     if quote_ids is not None:
-        quotes = _resolve_quote_ids(db, project_id, quote_ids)
+        db_ids = _resolve_quote_ids(db, project_id, quote_ids)
+        if not db_ids:
+            return
+        query = query.filter(Quote.id.in_(db_ids))
     else:
-        quotes = _load_all_visible(db, project_id)
+        query = query.outerjoin(QuoteState, QuoteState.quote_id == Quote.id).filter(
+            (QuoteState.is_hidden == False) | (QuoteState.id == None),  # noqa: E711, E712
+        )
+    query = query.order_by(
+        func.coalesce(ScreenCluster.display_order, _UNSECTIONED_ORDER),
+        Quote.start_timecode,
+        Quote.id,
+    ).yield_per(batch_size)
 
-    if not quotes:
-        return []
+    speaker_map = _load_speakers(db, project_id)
 
-    quote_db_ids = [q.id for q in quotes]
+    # A quote in two sections comes back twice; export it under the first.
+    seen: set[int] = set()
+    batch: list[tuple[Quote, str]] = []
+    for q, section in query:
+        if q.id in seen:
+            continue
+        seen.add(q.id)
+        batch.append((q, section or ""))
+        if len(batch) >= batch_size:
+            yield from _assemble_batch(db, batch, speaker_map, anonymise)
+            batch = []
+    if batch:
+        yield from _assemble_batch(db, batch, speaker_map, anonymise)
+
+
+def _assemble_batch(
+    db: DbSession,
+    batch: list[tuple[Quote, str]],
+    speaker_map: dict[tuple[str, str], tuple[str, str]],
+    anonymise: bool,
+) -> Iterator[ExportableQuote]:
+    """Build export rows for one batch of ``(quote, section label)`` pairs."""
+    quote_db_ids = [q.id for q, _ in batch]
 
     # ── Bulk-load related data ─────────────────────────────────────────
     edits_map = _load_edits(db, quote_db_ids)
     state_map = _load_states(db, quote_db_ids)
-    section_map = _load_sections(db, quote_db_ids)
     theme_map = _load_themes(db, quote_db_ids)
     tags_map = _load_tags(db, quote_db_ids)
-    speaker_map = _load_speakers(db, project_id)
-
-    # ── Build section ordering ─────────────────────────────────────────
-    section_order = _load_section_order(db, project_id)
 
     # ── Assemble rows ──────────────────────────────────────────────────
-    results: list[ExportableQuote] = []
-    for q in quotes:
+    for q, section in batch:
         text = edits_map.get(q.id, q.text)
         state = state_map.get(q.id)
         starred = state.is_starred if state else False
 
-        section = section_map.get(q.id, "")
         themes = theme_map.get(q.id, [])
         theme_str = " / ".join(themes)
 
@@ -177,27 +233,20 @@ def extract_quotes_for_export(
             else:
                 source_file = os.path.basename(speaker_info[1]) if speaker_info[1] else ""
 
-        results.append(
-            ExportableQuote(
-                text=text,
-                participant_code=q.participant_id,
-                participant_name=participant_name,
-                section=section,
-                theme=theme_str,
-                sentiment=q.sentiment or "",
-                tags=tags_str,
-                starred=starred,
-                timecode=format_timecode(q.start_timecode),
-                session=q.session_id,
-                source_file=source_file,
-            )
+        yield ExportableQuote(
+            text=text,
+            participant_code=q.participant_id,
+            participant_name=participant_name,
+            section=section,
+            theme=theme_str,
+            sentiment=q.sentiment or "",
+            tags=tags_str,
+            starred=starred,
+            timecode=format_timecode(q.start_timecode),
+            session=q.session_id,
+            source_file=source_file,
         )
 
-    # ── Sort by section display order, then timecode ───────────────────
-    results.sort(key=lambda eq: (section_order.get(eq.section, 999), eq.timecode))
-
-    return results
-
 
 # ---------------------------------------------------------------------------
 # Internal loaders
@@ -206,16 +255,16 @@ def extract_quotes_for_export(
 
 def _resolve_quote_ids(
     db: DbSession, project_id: int, dom_ids: list[str]
-) -> list[Quote]:
-    """Resolve DOM IDs to Quote rows (order preserved)."""
-    quotes: list[Quote] = []
+) -> list[int]:
+    """Resolve DOM IDs to Quote primary keys."""
+    db_ids: list[int] = []
     for dom_id in dom_ids:
         try:
             participant_id, timecode = _parse_dom_quote_id(dom_id)
         except ValueError:
             continue
-        q = (
-            db.query(Quote)
+        row = (
+            db.query(Quote.id)
             .filter(
                 Quote.project_id == project_id,
                 Quote.participant_id == participant_id,
@@ -224,22 +273,9 @@ def _resolve_quote_ids(
             )
             .first()
         )
-        if q:
-            quotes.append(q)
-    return quotes
-
-
-def _load_all_visible(db: DbSession, project_id: int) -> list[Quote]:
-    """Load all non-hidden quotes for a project."""
-    return (
-        db.query(Quote)
-        .outerjoin(QuoteState, QuoteState.quote_id == Quote.id)
-        .filter(
-            Quote.project_id == project_id,
-            (QuoteState.is_hidden == False) | (QuoteState.id == None),  # noqa: E711, E712
-        )
-        .all()
-    )
+        if row:
+            db_ids.append(row[0])
+    return db_ids
 
 
 def _load_edits(db: DbSession, quote_ids: list[int]) -> dict[int, str]:
@@ -268,17 +304,6 @@ def _load_states(db: DbSession, quote_ids: list[int]) -> dict[int, QuoteState]:
     return {s.quote_id: s for s in rows}
 
 
-def _load_sections(db: DbSession, quote_ids: list[int]) -> dict[int, str]:
-    """Map quote_id → section label (ScreenCluster.screen_label)."""
-    rows = (
-        db.query(ClusterQuote.quote_id, ScreenCluster.screen_label)
-        .join(ScreenCluster, ScreenCluster.id == ClusterQuote.cluster_id)
-        .filter(ClusterQuote.quote_id.in_(quote_ids))
-        .all()
-    )
-    return {qid: label for qid, label in rows}
-
-
 def _load_themes(db: DbSession, quote_ids: list[int]) -> dict[int, list[str]]:
     """Map quote_id → list of theme labels."""
     rows = (
@@ -330,16 +355,6 @@ def _load_speakers(
     return {(sid, code): (name, sf) for sid, code, name, sf in rows}
 
 
-def _load_section_order(db: DbSession, project_id: int) -> dict[str, int]:
-    """Map section label → display_order for sorting."""
-    rows = (
-        db.query(ScreenCluster.screen_label, ScreenCluster.display_order)
-        .filter(ScreenCluster.project_id == project_id)
-        .all()
-    )
-    return {label: order for label, order in rows}
-
-
 # ---------------------------------------------------------------------------
 # Featured quote selection (shared by dashboard + clip export)
 # ---------------------------------------------------------------------------
@@ -9,6 +9,7 @@ model-facing invariants. Whichever workstream needs more generality extends
 Public API::
 
     assemble_corpus_context(db, project_id, max_chars=…)  → CorpusContext
+    retrieve_corpus_context(db, project_id, question, …)  → CorpusContext
     resolve_quote_ids(quote_ids, corpus)                  → (resolved, rejected)
     load_signals(db, project_id, lens, top_n=…)           → SignalsResult
     INVARIANTS                                            — statements for the model
@@ -26,13 +27,27 @@ predates this module (it maps ids to ORM rows for state writes). This
 module's validation is deliberately stricter: an id is valid only if it
 was actually *in the assembled corpus* — a hidden or truncated-out quote
 is not citable even though it exists in the DB.
+
+Caching: the DB reads behind a corpus (quotes, curation, tags, grouping
+joins) are kept per project revision (``read_model``), so consecutive
+questions re-render from memory until the next committed write.
+
+Retrieval: a corpus that fits its budget is sent whole (design-chat-lens.md
+§5a — a retriever that drops the evidence turns into a false "no evidence").
+Only when it does not fit does ``retrieve_corpus_context`` rank quotes
+against the question with local BM25 and pack the most relevant, stating
+the excerpt in the corpus text — never a silent cut.
 """
 
 from __future__ import annotations
 
 import os
+import threading
+import weakref
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from bristlenose.server.lexical import BM25Index
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session as SASession
@@ -105,6 +120,31 @@ class CorpusContext:
     hidden_excluded: int
     truncated: bool
     char_count: int
+    retrieved: bool = False
+
+
+@dataclass
+class _CorpusSnapshot:
+    """One project revision's corpus, before rendering: what the DB said."""
+
+    project_name: str
+    speakers: list[str]
+    blocks: list[tuple[str, str, list[CorpusQuote]]]  # (kind, heading, quotes)
+    total_quotes: int
+    hidden_excluded: int
+    _index: BM25Index | None = field(default=None, repr=False)
+
+    def quotes(self) -> list[CorpusQuote]:
+        """Every quote in report order."""
+        return [cq for _, _, members in self.blocks for cq in members]
+
+    def index(self) -> BM25Index:
+        """BM25 over quote text, tags and section/theme heading (built once)."""
+        if self._index is None:
+            self._index = BM25Index([
+                f"{cq.text}\n{' '.join(cq.tags)}\n{cq.where}" for cq in self.quotes()
+            ])
+        return self._index
 
 
 # ---------------------------------------------------------------------------
@@ -135,23 +175,16 @@ def _quote_line(index: int, cq: CorpusQuote) -> str:
     return f'- [{index}] ({"; ".join(meta)}) "{cq.text}"'
 
 
-def assemble_corpus_context(
-    db: SASession,
-    project_id: int,
-    max_chars: int = DEFAULT_MAX_CHARS,
-) -> CorpusContext:
-    """Assemble a project's quotes into a deterministic prompt corpus.
+def _load_snapshot(db: SASession, project_id: int, project: Any) -> _CorpusSnapshot:
+    """Read a project's curated quotes and their grouping, in report order.
 
     Order mirrors the report: sections (screen clusters by display order,
     quotes by start timecode) then themes (by id, quotes by session +
     timecode). Uncategorised pinned quotes — rare orphans that lost their
-    grouping — are not included. Truncation at ``max_chars`` is stated in
-    the corpus text itself and reported on the returned context; nothing
-    is dropped silently.
+    grouping — are not included.
     """
     from bristlenose.server.models import (
         ClusterQuote,
-        Project,
         Quote,
         QuoteEdit,
         QuoteState,
@@ -162,7 +195,6 @@ def assemble_corpus_context(
         ThemeQuote,
     )
 
-    project = db.query(Project).filter_by(id=project_id).first()
     project_name = project.name if project else f"project {project_id}"
 
     all_quotes = db.query(Quote).filter_by(project_id=project_id).all()
@@ -270,23 +302,87 @@ def assemble_corpus_context(
     # Speaker roster from codes only (anonymisation boundary).
     codes = sorted({q.participant_id for q in all_quotes if q.id not in hidden_pks})
 
-    total_visible = len([q for q in all_quotes if q.id not in hidden_pks])
+    return _CorpusSnapshot(
+        project_name=project_name,
+        speakers=codes,
+        blocks=blocks,
+        total_quotes=len([q for q in all_quotes if q.id not in hidden_pks]),
+        hidden_excluded=len(hidden_pks),
+    )
+
+
+#: Snapshots per database and project, tagged with the revision ETag they
+#: were read at. Weakly keyed on the engine, so a closed test database (or a
+#: recreated one reusing project id 1) never serves another's corpus.
+_snapshots: weakref.WeakKeyDictionary[Any, dict[int, tuple[str, _CorpusSnapshot]]] = (
+    weakref.WeakKeyDictionary()
+)
+_snapshots_lock = threading.Lock()
 
-    # Render with a character budget. The cut is per whole quote line and is
-    # announced in the corpus itself.
-    lines: list[str] = [f"# Study: {project_name}", ""]
-    if codes:
-        lines.append("Speakers: " + ", ".join(codes))
+
+def _corpus_snapshot(db: SASession, project_id: int) -> _CorpusSnapshot:
+    """The project's snapshot at its current revision, read only on a miss.
+
+    ``Project.revision`` moves with every committed write (read_model), so
+    the cached snapshot is exactly what a fresh read would return. A session
+    holding its own uncommitted writes reads through, uncached.
+    """
+    from bristlenose.server.models import Project
+    from bristlenose.server.read_model import has_pending_writes, projection_etag
+
+    project = db.query(Project).filter_by(id=project_id).first()
+    if project is None or has_pending_writes(db):
+        return _load_snapshot(db, project_id, project)
+    etag = projection_etag(project, "corpus")
+    bind = db.get_bind()
+    with _snapshots_lock:
+        entry = _snapshots.get(bind, {}).get(project_id)
+    if entry is not None and entry[0] == etag:
+        return entry[1]
+    snapshot = _load_snapshot(db, project_id, project)
+    with _snapshots_lock:
+        _snapshots.setdefault(bind, {})[project_id] = (etag, snapshot)
+    return snapshot
+
+
+def _prelude(snapshot: _CorpusSnapshot, note: str) -> list[str]:
+    lines: list[str] = [f"# Study: {snapshot.project_name}", ""]
+    if snapshot.speakers:
+        lines.append("Speakers: " + ", ".join(snapshot.speakers))
+        lines.append("")
+    if note:
+        lines.append(note)
         lines.append("")
+    return lines
+
+
+def _render(
+    snapshot: _CorpusSnapshot,
+    max_chars: int,
+    chosen: set[int] | None = None,
+    note: str = "",
+) -> CorpusContext:
+    """Render ``snapshot`` (or only the ``chosen`` report positions) as a corpus.
 
+    Citation indices are dense ``1..n`` over the quotes rendered, in report
+    order. The cut at ``max_chars`` is per whole quote line and is announced
+    in the corpus itself.
+    """
+    lines = _prelude(snapshot, note)
     quotes_by_id: dict[str, CorpusQuote] = {}
     quotes_by_index: dict[int, CorpusQuote] = {}
     included = 0
     truncated = False
+    position = 0
     char_count = sum(len(line) + 1 for line in lines)
-    for kind, heading, members in blocks:
+    for kind, heading, members in snapshot.blocks:
         if truncated:
             break
+        if chosen is not None:
+            start, position = position, position + len(members)
+            members = [cq for i, cq in enumerate(members, start) if i in chosen]
+            if not members:
+                continue
         header_line = f"## {kind}: {heading}"
         char_count += len(header_line) + 2
         lines.append(header_line)
@@ -304,7 +400,7 @@ def assemble_corpus_context(
 
     if truncated:
         lines.append(
-            f"[corpus truncated: {included} of {total_visible} quotes included]"
+            f"[corpus truncated: {included} of {snapshot.total_quotes} quotes included]"
         )
 
     text = "\n".join(lines).strip() + "\n"
@@ -313,13 +409,95 @@ def assemble_corpus_context(
         quotes_by_id=quotes_by_id,
         quotes_by_index=quotes_by_index,
         quote_count=included,
-        total_quotes=total_visible,
-        hidden_excluded=len(hidden_pks),
+        total_quotes=snapshot.total_quotes,
+        hidden_excluded=snapshot.hidden_excluded,
         truncated=truncated,
         char_count=len(text),
     )
 
 
+def assemble_corpus_context(
+    db: SASession,
+    project_id: int,
+    max_chars: int = DEFAULT_MAX_CHARS,
+) -> CorpusContext:
+    """Assemble a project's quotes into a deterministic prompt corpus.
+
+    Order mirrors the report: sections (screen clusters by display order,
+    quotes by start timecode) then themes (by id, quotes by session +
+    timecode). Uncategorised pinned quotes — rare orphans that lost their
+    grouping — are not included. Truncation at ``max_chars`` is stated in
+    the corpus text itself and reported on the returned context; nothing
+    is dropped silently.
+    """
+    return _render(_corpus_snapshot(db, project_id), max_chars)
+
+
+def _excerpt_note(included: int, total: int) -> str:
+    return (
+        f"[excerpt: the {included} of {total} quotes most relevant to the question, "
+        "in report order. The rest of the study is not shown — do not count or "
+        "generalise across the whole study from this excerpt.]"
+    )
+
+
+def retrieve_corpus_context(
+    db: SASession,
+    project_id: int,
+    question: str,
+    max_chars: int = DEFAULT_MAX_CHARS,
+) -> CorpusContext:
+    """The corpus for one question: whole if it fits, else its best excerpt.
+
+    A corpus within ``max_chars`` is returned exactly as
+    ``assemble_corpus_context`` renders it. A larger one is ranked against
+    ``question`` with local BM25 (quote text, tags, section/theme heading)
+    and packed best-first into the budget — quotes sharing no term with the
+    question fill what is left, starred first — then rendered in report
+    order under a stated excerpt note, with ``retrieved`` set. Either way
+    the citation space is the dense ``[1]..[n]`` over what was rendered, so
+    ``resolve_quote_indices`` validates it unchanged.
+    """
+    snapshot = _corpus_snapshot(db, project_id)
+    whole = _render(snapshot, max_chars)
+    if not whole.truncated:
+        return whole
+
+    quotes = snapshot.quotes()
+    scores = snapshot.index().scores(question)
+    ranked = sorted(
+        range(len(quotes)), key=lambda i: (-scores[i], not quotes[i].starred, i)
+    )
+    block_of: list[int] = []
+    headers: list[str] = []
+    for b, (kind, heading, members) in enumerate(snapshot.blocks):
+        headers.append(f"## {kind}: {heading}")
+        block_of.extend([b] * len(members))
+
+    # Budget with the widest index and note, so the render never has to cut.
+    widest = len(quotes)
+    budget = max_chars - sum(
+        len(line) + 1 for line in _prelude(snapshot, _excerpt_note(widest, widest))
+    )
+    chosen: set[int] = set()
+    opened: set[int] = set()
+    for i in ranked:
+        cost = len(_quote_line(widest, quotes[i])) + 1
+        if block_of[i] not in opened:
+            cost += len(headers[block_of[i]]) + 2
+        if cost > budget:
+            continue
+        budget -= cost
+        chosen.add(i)
+        opened.add(block_of[i])
+
+    corpus = _render(
+        snapshot, max_chars, chosen, _excerpt_note(len(chosen), snapshot.total_quotes)
+    )
+    corpus.retrieved = True
+    return corpus
+
+
 # ---------------------------------------------------------------------------
 # Citation validation
 # ---------------------------------------------------------------------------
@@ -4,10 +4,13 @@ Reads intermediate JSON files from the pipeline output directory and
 populates all project-scoped tables.  Built as upsert from day one —
 matched by stable key, researcher state never overwritten.
 
-Called on ``bristlenose serve`` startup.  Always re-imports to pick up
-pipeline re-runs (added/removed sessions).  Stale data from deleted
-sessions is cleaned up; researcher state (starred, hidden, tags, edits,
-deleted badges) is preserved for quotes that survive the re-import.
+Called on ``bristlenose serve`` startup and after every ``run_completed``.
+Each import records a content-hash fingerprint of the files it read
+(``Project.import_fingerprint``); a project whose files are unchanged is
+skipped outright, and a changed one re-applies only the inputs that differ.
+Stale data from deleted sessions is cleaned up; researcher state (starred,
+hidden, tags, edits, deleted badges) is preserved for quotes that survive
+the re-import.
 """
 
 from __future__ import annotations
@@ -18,10 +21,15 @@ import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
+from sqlalchemy import insert, select, update
 from sqlalchemy import text as sa_text  # `text` clashes with a loop var below
 from sqlalchemy.orm import Session
 
+from bristlenose.hashing import hash_bytes
+from bristlenose.segment_store import LEGACY_FILENAME, SegmentStore
+from bristlenose.server.coverage_store import refresh_coverage
 from bristlenose.server.models import (
     ClusterQuote,
     CodebookGroup,
@@ -36,6 +44,7 @@ from bristlenose.server.models import (
     QuoteState,
     QuoteTag,
     ScreenCluster,
+    SessionCoverage,
     SessionSpeaker,
     SourceFile,
     TagDefinition,
@@ -48,6 +57,7 @@ from bristlenose.server.models import (
     Session as SessionModel,
 )
 from bristlenose.utils.fs import is_os_metadata
+from bristlenose.word_timings import WordTimings, session_timings_path
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +139,82 @@ def _find_transcripts_dir(project_dir: Path, output_dir: Path) -> Path:
     return output_dir / "transcripts-raw"
 
 
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+# Bump when the importer starts reading inputs differently, so every project
+# fingerprinted by an older importer gets one full re-import.
+_IMPORT_FORMAT = "2"  # 2: word timings moved from words_json to .bnwt files
+
+# Intermediate files the importer reads, relative to ``.bristlenose/intermediate``.
+_INTERMEDIATE_INPUTS = (
+    "metadata.json",
+    "screen_clusters.json",
+    "theme_groups.json",
+    "topic_boundaries.json",
+    LEGACY_FILENAME,  # monolithic segments, from projects predating the shard store
+)
+
+_TRANSCRIPT_KEY = "transcript:"
+_SEGMENTS_KEY = "segments:"
+
+
+def _import_fingerprint(output_dir: Path, transcripts_dir: Path) -> dict[str, str]:
+    """Content hashes of every file ``import_project`` reads.
+
+    Keys are stable input names (``"theme_groups.json"``,
+    ``"transcript:s3"``, ...); a missing file is simply absent, so adding or
+    removing one shows up as a changed key.  Thumbnails are fingerprinted by
+    name only — the importer records their presence, not their pixels.
+    """
+    fp: dict[str, str] = {
+        "importer": _IMPORT_FORMAT,
+        "transcripts_dir": str(transcripts_dir),
+    }
+    intermediate = output_dir / ".bristlenose" / "intermediate"
+    for name in _INTERMEDIATE_INPUTS:
+        path = intermediate / name
+        if path.is_file():
+            fp[name] = hash_bytes(path.read_bytes())
+    # Segment shards are fingerprinted by the hashes their index records.
+    for sid, digest in SegmentStore(intermediate).shard_hashes().items():
+        fp[_SEGMENTS_KEY + sid] = digest
+    people_path = output_dir / "people.yaml"
+    if people_path.is_file():
+        fp["people.yaml"] = hash_bytes(people_path.read_bytes())
+    if transcripts_dir.is_dir():
+        for txt_file in sorted(transcripts_dir.glob("*.txt")):
+            if is_os_metadata(txt_file):
+                continue
+            fp[_TRANSCRIPT_KEY + txt_file.stem] = hash_bytes(txt_file.read_bytes())
+    thumbnails_dir = output_dir / "assets" / "thumbnails"
+    if thumbnails_dir.is_dir():
+        names = sorted(p.name for p in thumbnails_dir.glob("*.jpg"))
+        fp["thumbnails"] = hash_bytes("\n".join(names).encode("utf-8"))
+    return fp
+
+
+def _load_fingerprint(project: Project) -> dict[str, str]:
+    """The fingerprint stored by the last import; empty when there is none."""
+    if not project.import_fingerprint:
+        return {}
+    try:
+        data = json.loads(project.import_fingerprint)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _changed_inputs(previous: dict[str, str], current: dict[str, str]) -> set[str]:
+    """Input names whose hash differs, including ones added or removed."""
+    return {
+        key
+        for key in previous.keys() | current.keys()
+        if previous.get(key) != current.get(key)
+    }
+
+
 # ---------------------------------------------------------------------------
 # Import logic
 # ---------------------------------------------------------------------------
@@ -194,10 +280,12 @@ def _same_path(stored: str, target: Path) -> bool:
 def import_project(db: Session, project_dir: Path) -> Project:
     """Import pipeline output into the database.
 
-    Always re-imports to pick up pipeline re-runs (added/removed sessions).
-    Stale data from deleted sessions is cleaned up; researcher state
-    (starred, hidden, tags, edits, deleted badges) is preserved for quotes
-    that survive the re-import.
+    Picks up pipeline re-runs (added/removed sessions) incrementally: the
+    files read are fingerprinted, an unchanged project returns without
+    touching the database, and a changed one re-applies only what differs
+    (see ``_import_fingerprint``).  Stale data from deleted sessions is
+    cleaned up; researcher state (starred, hidden, tags, edits, deleted
+    badges) is preserved for quotes that survive the re-import.
 
     Args:
         db: SQLAlchemy database session.
@@ -267,6 +355,36 @@ def import_project(db: Session, project_dir: Path) -> Project:
             project.name = project_name
             project.slug = project_name.lower().replace(" ", "-")[:100]
 
+    # --- Change detection ------------------------------------------------
+    transcripts_dir = _find_transcripts_dir(project_dir, output_dir)
+    fingerprint = _import_fingerprint(output_dir, transcripts_dir)
+    previous = _load_fingerprint(project)
+    if previous == fingerprint:
+        # Nothing the importer reads has changed since the last import, so
+        # every row it would write is already there.  Commit only the path
+        # and name heals above and the un-pin scrub.
+        _scrub_unpinned(db, project.id)
+        db.commit()
+        logger.info("Project id=%d unchanged since last import.", project.id)
+        return project
+    changed = _changed_inputs(previous, fingerprint)
+    full = not previous or "importer" in changed
+    if full or "transcripts_dir" in changed:
+        refresh_sids = {
+            key[len(_TRANSCRIPT_KEY):]
+            for key in fingerprint.keys() | previous.keys()
+            if key.startswith(_TRANSCRIPT_KEY)
+        }
+    else:
+        refresh_sids = {
+            key[len(_TRANSCRIPT_KEY):]
+            for key in changed
+            if key.startswith(_TRANSCRIPT_KEY)
+        }
+    quotes_changed = full or bool(
+        {"screen_clusters.json", "theme_groups.json"} & changed
+    )
+
     # --- Import timestamp ------------------------------------------------
     # Every entity touched during this import gets this timestamp.
     # After import, anything with an older last_imported_at is stale
@@ -285,7 +403,6 @@ def import_project(db: Session, project_dir: Path) -> Project:
         theme_groups_data = json.loads(tg_path.read_text(encoding="utf-8"))
 
     # --- Parse transcripts for session metadata --------------------------
-    transcripts_dir = _find_transcripts_dir(project_dir, output_dir)
     session_meta = _parse_transcript_headers(transcripts_dir)
 
     # --- Build sessions from all data sources ----------------------------
@@ -302,15 +419,15 @@ def import_project(db: Session, project_dir: Path) -> Project:
     session_ids.discard("")
 
     # Create sessions
+    existing_sessions = {
+        s.session_id: s
+        for s in db.query(SessionModel).filter_by(project_id=project.id)
+    }
     session_map: dict[str, SessionModel] = {}  # session_id → SessionModel
     for sid in sorted(session_ids):
         meta = session_meta.get(sid, {})
         num = int(sid[1:]) if len(sid) > 1 and sid[1:].isdigit() else 0
-        sess = (
-            db.query(SessionModel)
-            .filter_by(project_id=project.id, session_id=sid)
-            .first()
-        )
+        sess = existing_sessions.get(sid)
         if sess is None:
             sess = SessionModel(
                 project_id=project.id,
@@ -323,8 +440,8 @@ def import_project(db: Session, project_dir: Path) -> Project:
                 first_imported_at=now,  # never updated; drives the "New" flag
             )
             db.add(sess)
-            db.flush()
         session_map[sid] = sess
+    db.flush()  # new sessions get their ids
 
     # --- Import source files ---------------------------------------------
     _import_source_files(db, session_map, session_meta, project_dir)
@@ -332,36 +449,68 @@ def import_project(db: Session, project_dir: Path) -> Project:
     # --- Scan for video thumbnails ---------------------------------------
     _import_thumbnails(session_map, output_dir)
 
-    # --- Import transcript segments --------------------------------------
-    _import_transcript_segments(db, session_map, transcripts_dir)
-    db.flush()  # ensure segments have IDs before word enrichment
-    _enrich_words_from_intermediate(db, session_map, output_dir)
+    # --- Import transcript segments (changed transcripts only) ------------
+    _import_transcript_segments(db, session_map, transcripts_dir, refresh_sids)
+    if full or LEGACY_FILENAME in changed:
+        timing_sids = None
+    else:
+        timing_sids = refresh_sids | {
+            key[len(_SEGMENTS_KEY):] for key in changed if key.startswith(_SEGMENTS_KEY)
+        }
+    _write_word_timings(session_map, output_dir, timing_sids)
 
     # --- Import persons + session_speakers from transcript segments ------
-    _import_speakers(db, session_map, transcripts_dir, output_dir)
+    if refresh_sids or "people.yaml" in changed:
+        _import_speakers(db, session_map, transcripts_dir, output_dir)
 
     # --- Import quotes, clusters, themes ---------------------------------
-    quote_map = _import_quotes_from_clusters(
-        db, project, session_map, screen_clusters_data, now,
-    )
-    _import_quotes_from_themes(
-        db, project, session_map, theme_groups_data, quote_map, now,
-    )
+    if quotes_changed:
+        quote_ids = _upsert_quotes(
+            db, project,
+            [
+                q
+                for group in (*screen_clusters_data, *theme_groups_data)
+                for q in group.get("quotes", [])
+            ],
+            now,
+        )
+        _import_quotes_from_clusters(
+            db, project, screen_clusters_data, quote_ids, now,
+        )
+        _import_quotes_from_themes(
+            db, project, theme_groups_data, quote_ids, now,
+        )
+    else:
+        _restamp_pipeline_rows(db, project, now)
 
     # --- Auto-import sentiment framework + auto-tag from pipeline ---------
     _auto_import_sentiment_framework(db, project)
-    _auto_tag_from_sentiment_field(db, project)
+    if quotes_changed:
+        _auto_tag_from_sentiment_field(db, project)
 
-    # --- Import topic boundaries (if available) --------------------------
-    tb_path = intermediate / "topic_boundaries.json"
-    if tb_path.exists():
-        _import_topic_boundaries(db, session_map, tb_path)
+    # --- Import topic boundaries (if changed) ----------------------------
+    if full or "topic_boundaries.json" in changed:
+        _import_topic_boundaries(
+            db, session_map, intermediate / "topic_boundaries.json",
+        )
 
     # --- Clean up stale data from previous pipeline runs -----------------
     _cleanup_stale_data(db, project, session_ids, now)
 
+    # --- Precompute transcript coverage for the dashboard -----------------
+    # Coverage depends on segments and quote timecodes only, so a session
+    # needs it recomputed when its transcript or the quotes changed.
+    refresh_coverage(
+        db,
+        [
+            sess for sid, sess in sorted(session_map.items())
+            if quotes_changed or sid in refresh_sids
+        ],
+    )
+
     # --- Mark project as imported ----------------------------------------
     project.imported_at = now
+    project.import_fingerprint = json.dumps(fingerprint, sort_keys=True)
     db.commit()
     # Flush the WAL so out-of-process `immutable=1` readers (the desktop
     # sidebar's session-count read) see the just-imported rows immediately.
@@ -424,6 +573,12 @@ def _import_source_files(
     project_dir: Path,
 ) -> None:
     """Import source file records from transcript metadata."""
+    imported = {
+        sid
+        for (sid,) in db.query(SourceFile.session_id).filter(
+            SourceFile.session_id.in_([s.id for s in session_map.values()])
+        )
+    }
     for sid, meta in session_meta.items():
         sess = session_map.get(sid)
         if not sess:
@@ -431,14 +586,7 @@ def _import_source_files(
         source_name = meta.get("source", "")
         if not source_name:
             continue
-
-        # Check if already imported
-        existing = (
-            db.query(SourceFile)
-            .filter_by(session_id=sess.id)
-            .first()
-        )
-        if existing:
+        if sess.id in imported:
             continue
 
         # Try to find the actual file.  New transcripts store a relative path
@@ -508,24 +656,34 @@ def _import_transcript_segments(
     db: Session,
     session_map: dict[str, SessionModel],
     transcripts_dir: Path,
+    refresh_sids: set[str],
 ) -> None:
-    """Import transcript segments from raw transcript files."""
+    """Import transcript segments from raw transcript files.
+
+    Only sessions in ``refresh_sids`` (their transcript file is new or
+    changed since the last import) are touched: their old segments are
+    deleted and the file's segments bulk-inserted.  No other table points
+    at a segment row, so replacing them loses nothing.
+    """
     if not transcripts_dir.is_dir():
         return
 
+    refresh_db_ids = [
+        session_map[sid].id for sid in refresh_sids if sid in session_map
+    ]
+    if not refresh_db_ids:
+        return
+    db.query(TranscriptSegment).filter(
+        TranscriptSegment.session_id.in_(refresh_db_ids)
+    ).delete(synchronize_session=False)
+
+    rows: list[dict[str, Any]] = []
     for txt_file in sorted(transcripts_dir.glob("*.txt")):
         if is_os_metadata(txt_file):
             continue
         sid = txt_file.stem
         sess = session_map.get(sid)
-        if not sess:
-            continue
-
-        # Skip if segments already imported
-        existing_count = (
-            db.query(TranscriptSegment).filter_by(session_id=sess.id).count()
-        )
-        if existing_count > 0:
+        if not sess or sid not in refresh_sids:
             continue
 
         content = txt_file.read_text(encoding="utf-8")
@@ -539,80 +697,52 @@ def _import_transcript_segments(
             else:
                 end = start + 10.0  # rough estimate for last segment
 
-            seg = TranscriptSegment(
-                session_id=sess.id,
-                speaker_code=speaker_code,
-                start_time=start,
-                end_time=end,
-                text=text.strip(),
-                source="transcript",
-                segment_index=i,
-            )
-            db.add(seg)
+            rows.append({
+                "session_id": sess.id,
+                "speaker_code": speaker_code,
+                "start_time": start,
+                "end_time": end,
+                "text": text.strip(),
+                "source": "transcript",
+                "segment_index": i,
+            })
+    if rows:
+        db.execute(insert(TranscriptSegment), rows)
 
 
-def _enrich_words_from_intermediate(
-    db: Session,
+def _write_word_timings(
     session_map: dict[str, SessionModel],
     output_dir: Path,
+    session_ids: set[str] | None = None,
 ) -> None:
-    """Populate ``words_json`` on transcript segments from intermediate JSON.
-
-    The pipeline's ``session_segments.json`` contains Whisper word-level
-    timestamps (``Word`` objects with text, start_time, end_time).  The
-    ``.txt`` importer doesn't capture these — this function reads the
-    intermediate JSON and backfills ``words_json`` by matching segments on
-    ``segment_index``.
-
-    Compact JSON format: ``[{"t":"word","s":0.5,"e":0.8},...]``
+    """Write each session's Whisper word timings as a columnar ``.bnwt`` file.
+
+    The pipeline's segment shards carry word-level timestamps
+    (``Word`` objects with text, start_time, end_time, confidence) that the
+    ``.txt`` importer doesn't capture.  They are stored per session under
+    ``.bristlenose/word-timings/`` (see ``bristlenose/word_timings.py``),
+    keyed by ``segment_index`` — the same key the transcript segments carry —
+    and memory-mapped by the transcript API.  ``session_ids`` limits the
+    rewrite to sessions whose transcript or segments changed; ``None`` means
+    every session.  Only those sessions' shards are read.
     """
-    ss_path = output_dir / ".bristlenose" / "intermediate" / "session_segments.json"
-    if not ss_path.exists():
+    store = SegmentStore(output_dir / ".bristlenose" / "intermediate")
+    if not store.exists():
         return
 
-    try:
-        raw = json.loads(ss_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return
-
-    for sid, pipeline_segs in raw.items():
-        sess = session_map.get(sid)
-        if not sess:
-            continue
-
-        # Build lookup from segment_index → word data
-        word_lookup: dict[int, list[dict[str, object]]] = {}
+    wanted = session_map.keys() if session_ids is None else session_ids & session_map.keys()
+    for sid, pipeline_segs in store.load_raw(sorted(wanted)):
+        # Prefer explicit segment_index; fall back to position in list
+        keyed = []
         for i, pseg in enumerate(pipeline_segs):
-            words = pseg.get("words", [])
-            if not words:
-                continue
             seg_idx = pseg.get("segment_index", -1)
-            # Prefer explicit segment_index; fall back to position in list
-            key = seg_idx if seg_idx >= 0 else i
-            compact = [
-                {"t": w["text"], "s": w["start_time"], "e": w["end_time"]}
-                for w in words
-                if w.get("text")
-            ]
-            if compact:
-                word_lookup[key] = compact
-
-        if not word_lookup:
-            continue
-
-        # Match DB segments and populate words_json
-        db_segs = (
-            db.query(TranscriptSegment)
-            .filter_by(session_id=sess.id)
-            .order_by(TranscriptSegment.start_time)
-            .all()
-        )
-        for db_seg in db_segs:
-            compact = word_lookup.get(db_seg.segment_index)
-            if compact:
-                db_seg.words_json = json.dumps(compact, separators=(",", ":"))
-
-    db.flush()
+            keyed.append((seg_idx if seg_idx >= 0 else i, pseg.get("words", [])))
+        timings = WordTimings.from_segments(keyed)
+        path = session_timings_path(output_dir, sid)
+        if len(timings):
+            timings.write(path)
+        else:
+            path.unlink(missing_ok=True)
 
 
 def _load_people_for_import(output_dir: Path) -> dict[str, dict[str, str]] | None:
@@ -671,6 +801,12 @@ def _import_speakers(
     # Load people.yaml once for all sessions.
     people = _load_people_for_import(output_dir)
 
+    speakers_by_session: dict[int, list[SessionSpeaker]] = {}
+    for sp in db.query(SessionSpeaker).filter(
+        SessionSpeaker.session_id.in_([s.id for s in session_map.values()])
+    ):
+        speakers_by_session.setdefault(sp.session_id, []).append(sp)
+
     for txt_file in sorted(transcripts_dir.glob("*.txt")):
         if is_os_metadata(txt_file):
             continue
@@ -680,9 +816,7 @@ def _import_speakers(
             continue
 
         # Check if speakers already imported
-        existing_speakers = (
-            db.query(SessionSpeaker).filter_by(session_id=sess.id).all()
-        )
+        existing_speakers = speakers_by_session.get(sess.id)
         if existing_speakers:
             # Speakers exist — update Person rows from people.yaml
             # (fill empty fields only, never overwrite).
@@ -769,67 +903,117 @@ def _update_persons_from_people(
             person.notes = yaml_data["notes"]
 
 
-def _get_or_create_quote(
+# Pipeline-owned quote columns and their values for a brand-new row.  The
+# stable key columns and all researcher state live elsewhere.
+_QUOTE_FIELDS: dict[str, object] = {
+    "end_timecode": 0.0,
+    "text": "",
+    "verbatim_excerpt": "",
+    "topic_label": "",
+    "quote_type": "",
+    "researcher_context": None,
+    "sentiment": None,
+    "intensity": 1,
+    "segment_index": -1,
+}
+
+# Ids per ``IN (...)`` clause — well under SQLite's bound-parameter limit.
+_IN_BATCH = 500
+
+_QuoteKey = tuple[str, str, float]
+
+
+def _quote_key(quote_data: dict[str, Any]) -> _QuoteKey:
+    """Stable key within a project: (session_id, participant_id, start_timecode)."""
+    return (
+        quote_data.get("session_id", ""),
+        quote_data.get("participant_id", ""),
+        float(quote_data.get("start_timecode", 0.0)),
+    )
+
+
+def _quote_values(quote_data: dict[str, Any], base: dict[str, object]) -> dict[str, object]:
+    """Pipeline fields for one quote: ``quote_data`` over ``base``, coerced."""
+    values = {
+        field: quote_data[field] if field in quote_data else base[field]
+        for field in _QUOTE_FIELDS
+    }
+    values["end_timecode"] = float(values["end_timecode"])  # type: ignore[arg-type]
+    values["intensity"] = int(values["intensity"])  # type: ignore[call-overload]
+    values["segment_index"] = int(values["segment_index"])  # type: ignore[call-overload]
+    return values
+
+
+def _upsert_quotes(
     db: Session,
     project: Project,
-    quote_data: dict,
+    quotes_data: list[dict[str, Any]],
     now: datetime,
-) -> Quote:
-    """Get or create a quote by stable key.
-
-    Stable key: (project_id, session_id, participant_id, start_timecode).
+) -> dict[_QuoteKey, int]:
+    """Upsert every incoming quote by stable key; returns key → quote id.
+
+    The project's existing keys are loaded once into a dict.  New quotes are
+    bulk-inserted, quotes whose pipeline fields changed are bulk-updated by
+    primary key, and the rest only have ``last_imported_at`` moved forward.
+    A key that appears twice (a quote in a section *and* a theme) takes the
+    values of its last occurrence.
     """
-    session_id = quote_data.get("session_id", "")
-    participant_id = quote_data.get("participant_id", "")
-    start_timecode = float(quote_data.get("start_timecode", 0.0))
-
-    # Try to find existing quote by stable key
-    existing = (
-        db.query(Quote)
-        .filter_by(
-            project_id=project.id,
-            session_id=session_id,
-            participant_id=participant_id,
-            start_timecode=start_timecode,
-        )
-        .first()
-    )
-    if existing:
-        # Update pipeline fields (upsert)
-        existing.text = quote_data.get("text", existing.text)
-        existing.end_timecode = float(quote_data.get("end_timecode", existing.end_timecode))
-        existing.verbatim_excerpt = quote_data.get("verbatim_excerpt", existing.verbatim_excerpt)
-        existing.topic_label = quote_data.get("topic_label", existing.topic_label)
-        existing.quote_type = quote_data.get("quote_type", existing.quote_type)
-        existing.researcher_context = quote_data.get(
-            "researcher_context", existing.researcher_context
+    incoming: dict[_QuoteKey, dict[str, Any]] = {}
+    for q_data in quotes_data:
+        incoming[_quote_key(q_data)] = q_data
+
+    columns = [getattr(Quote, field) for field in _QUOTE_FIELDS]
+    existing: dict[_QuoteKey, tuple[int, dict[str, object]]] = {}
+    for row in db.execute(
+        select(
+            Quote.id, Quote.session_id, Quote.participant_id,
+            Quote.start_timecode, *columns,
+        ).where(Quote.project_id == project.id)
+    ):
+        qid, sid, pid, start, *values = row
+        existing[(sid, pid, start)] = (qid, dict(zip(_QUOTE_FIELDS, values)))
+
+    new_rows: list[dict[str, Any]] = []
+    changed_rows: list[dict[str, Any]] = []
+    unchanged_ids: list[int] = []
+    for key, q_data in incoming.items():
+        if key not in existing:
+            new_rows.append({
+                "project_id": project.id,
+                "session_id": key[0],
+                "participant_id": key[1],
+                "start_timecode": key[2],
+                **_quote_values(q_data, _QUOTE_FIELDS),
+                "last_imported_at": now,
+            })
+            continue
+        qid, current = existing[key]
+        values = _quote_values(q_data, current)
+        if values != current:
+            changed_rows.append({"id": qid, **values, "last_imported_at": now})
+        else:
+            unchanged_ids.append(qid)
+
+    if changed_rows:
+        db.execute(update(Quote), changed_rows)
+    for i in range(0, len(unchanged_ids), _IN_BATCH):
+        db.execute(
+            update(Quote)
+            .where(Quote.id.in_(unchanged_ids[i:i + _IN_BATCH]))
+            .values(last_imported_at=now)
         )
-        existing.sentiment = quote_data.get("sentiment", existing.sentiment)
-        existing.intensity = int(quote_data.get("intensity", existing.intensity))
-        existing.segment_index = int(quote_data.get("segment_index", existing.segment_index))
-        existing.last_imported_at = now
-        return existing
-
-    # Create new quote
-    q = Quote(
-        project_id=project.id,
-        session_id=session_id,
-        participant_id=participant_id,
-        start_timecode=start_timecode,
-        end_timecode=float(quote_data.get("end_timecode", 0.0)),
-        text=quote_data.get("text", ""),
-        verbatim_excerpt=quote_data.get("verbatim_excerpt", ""),
-        topic_label=quote_data.get("topic_label", ""),
-        quote_type=quote_data.get("quote_type", ""),
-        researcher_context=quote_data.get("researcher_context"),
-        sentiment=quote_data.get("sentiment"),
-        intensity=int(quote_data.get("intensity", 1)),
-        segment_index=int(quote_data.get("segment_index", -1)),
-        last_imported_at=now,
-    )
-    db.add(q)
-    db.flush()
-    return q
+
+    ids = {key: qid for key, (qid, _) in existing.items()}
+    if new_rows:
+        db.execute(insert(Quote), new_rows)
+        for qid, sid, pid, start in db.execute(
+            select(
+                Quote.id, Quote.session_id, Quote.participant_id,
+                Quote.start_timecode,
+            ).where(Quote.project_id == project.id)
+        ):
+            ids.setdefault((sid, pid, start), qid)
+    return {key: ids[key] for key in incoming}
 
 
 # Jaccard quote-overlap at or above which an incoming cluster/theme is treated
@@ -948,54 +1132,69 @@ def _renamed_cluster_ids(db: Session, project_id: int) -> set[int]:
     return _renamed_group_ids(db, project_id, "section-cluster-")
 
 
+def _load_joins(
+    db: Session,
+    join_model: type[ClusterQuote] | type[ThemeQuote],
+    group_field: str,
+    group_ids: list[int],
+) -> dict[int, dict[int, str]]:
+    """Current joins for ``group_ids``: ``{group_id: {quote_id: assigned_by}}``.
+
+    ``group_field`` is the join's group column (``"cluster_id"`` /
+    ``"theme_id"``).  One query per ``_IN_BATCH`` groups instead of one per
+    group.
+    """
+    group_column = getattr(join_model, group_field)
+    joins: dict[int, dict[int, str]] = {}
+    for i in range(0, len(group_ids), _IN_BATCH):
+        for group_id, quote_id, assigned_by in db.execute(
+            select(group_column, join_model.quote_id, join_model.assigned_by)
+            .where(group_column.in_(group_ids[i:i + _IN_BATCH]))
+        ):
+            joins.setdefault(group_id, {})[quote_id] = assigned_by
+    return joins
+
+
+def _surviving_joins(joins: dict[int, str], strand_ids: set[int]) -> set[int]:
+    """Quote ids still joined to a reused group after its pipeline rebuild."""
+    return {
+        qid for qid, by in joins.items()
+        if by != "pipeline" or qid in strand_ids
+    }
+
+
 def _import_quotes_from_clusters(
     db: Session,
     project: Project,
-    session_map: dict[str, SessionModel],
     screen_clusters_data: list[dict],
+    quote_ids: dict[_QuoteKey, int],
     now: datetime,
-) -> dict[tuple, Quote]:
-    """Import screen clusters and their quotes.
+) -> None:
+    """Import screen clusters and their quote joins.
 
     Upserts each cluster by *membership* (quote overlap), not label, so a
     renamed section keeps its ``cluster_id`` — and therefore any researcher
-    HeadingEdit keyed on that id — across pipeline label drift.
-
-    Returns a quote_map keyed by (session_id, participant_id, start_timecode)
-    for deduplication when the same quote appears in themes.
+    HeadingEdit keyed on that id — across pipeline label drift.  Quotes are
+    already upserted; ``quote_ids`` maps each stable key to its row id.
     """
-    quote_map: dict[tuple, Quote] = {}
-
     # Resolve incoming quotes first so we can match clusters by membership.
-    incoming_quotes: list[list[Quote]] = []
+    incoming_quotes: list[list[int]] = []
     incoming_members: list[tuple[int, set[int]]] = []
     for i, cluster_data in enumerate(screen_clusters_data):
-        qs: list[Quote] = []
-        member_ids: set[int] = set()
-        for q_data in cluster_data.get("quotes", []):
-            q = _get_or_create_quote(db, project, q_data, now)
-            quote_map[(q.session_id, q.participant_id, q.start_timecode)] = q
-            qs.append(q)
-            member_ids.add(q.id)
-        incoming_quotes.append(qs)
-        incoming_members.append((i, member_ids))
-
-    # Existing pipeline clusters + their current membership.
+        qids = [quote_ids[_quote_key(q)] for q in cluster_data.get("quotes", [])]
+        incoming_quotes.append(qids)
+        incoming_members.append((i, set(qids)))
+
+    # Existing pipeline clusters + their current membership, in one query.
     existing_clusters = (
         db.query(ScreenCluster)
         .filter_by(project_id=project.id, created_by="pipeline")
         .all()
     )
     cluster_by_id = {c.id: c for c in existing_clusters}
+    joins = _load_joins(db, ClusterQuote, "cluster_id", list(cluster_by_id))
     existing_members = [
-        (
-            c.id,
-            {
-                cq.quote_id
-                for cq in db.query(ClusterQuote).filter_by(cluster_id=c.id).all()
-            },
-        )
-        for c in existing_clusters
+        (c.id, set(joins.get(c.id, {}))) for c in existing_clusters
     ]
     matched = _match_by_membership(existing_members, incoming_members)
 
@@ -1026,6 +1225,7 @@ def _import_quotes_from_clusters(
     }
     strand_ids = _pinned_quote_ids(db, project.id) - all_incoming - researcher_section_ids
 
+    new_joins: list[dict[str, Any]] = []
     for i, cluster_data in enumerate(screen_clusters_data):
         if not incoming_quotes[i]:
             continue  # a quote-less section is degenerate — don't persist a shell
@@ -1051,6 +1251,7 @@ def _import_quotes_from_clusters(
             if strand_ids:
                 rebuild = rebuild.filter(ClusterQuote.quote_id.notin_(strand_ids))
             rebuild.delete(synchronize_session="fetch")
+            kept = _surviving_joins(joins.get(cluster.id, {}), strand_ids)
         else:
             cluster = ScreenCluster(
                 project_id=project.id,
@@ -1062,36 +1263,31 @@ def _import_quotes_from_clusters(
             )
             db.add(cluster)
             db.flush()
+            kept = set()
 
-        for q in incoming_quotes[i]:
-            if q.id in researcher_section_ids:
+        for qid in incoming_quotes[i]:
+            if qid in researcher_section_ids:
                 continue  # researcher owns this quote's section placement
-            existing_cq = (
-                db.query(ClusterQuote)
-                .filter_by(cluster_id=cluster.id, quote_id=q.id)
-                .first()
-            )
-            if not existing_cq:
-                db.add(
-                    ClusterQuote(
-                        cluster_id=cluster.id,
-                        quote_id=q.id,
-                        assigned_by="pipeline",
-                    )
-                )
+            if qid not in kept:
+                kept.add(qid)
+                new_joins.append({
+                    "cluster_id": cluster.id,
+                    "quote_id": qid,
+                    "assigned_by": "pipeline",
+                })
 
-    return quote_map
+    if new_joins:
+        db.execute(insert(ClusterQuote), new_joins)
 
 
 def _import_quotes_from_themes(
     db: Session,
     project: Project,
-    session_map: dict[str, SessionModel],
     theme_groups_data: list[dict],
-    quote_map: dict[tuple, Quote],
+    quote_ids: dict[_QuoteKey, int],
     now: datetime,
 ) -> None:
-    """Import theme groups and their quotes.
+    """Import theme groups and their quote joins.
 
     Two-tier identity (themes diverge hard across re-runs, ARI ~0.43):
     - A **renamed** theme is matched by its **star-anchors** — its frozen pinned
@@ -1101,21 +1297,16 @@ def _import_quotes_from_themes(
       an *unchanged* theme keep its id; a diverged one gets a fresh id (fine, its
       label is the machine's and disposable).
 
-    Reuses quotes from quote_map if they already exist (from clusters).
+    Quotes are already upserted; ``quote_ids`` maps each stable key to its
+    row id.
     """
     # Resolve incoming quotes first so we can match themes by membership.
-    incoming_quotes: list[list[Quote]] = []
+    incoming_quotes: list[list[int]] = []
     incoming_members: list[tuple[int, set[int]]] = []
     for i, theme_data in enumerate(theme_groups_data):
-        qs: list[Quote] = []
-        member_ids: set[int] = set()
-        for q_data in theme_data.get("quotes", []):
-            q = _get_or_create_quote(db, project, q_data, now)
-            quote_map[(q.session_id, q.participant_id, q.start_timecode)] = q
-            qs.append(q)
-            member_ids.add(q.id)
-        incoming_quotes.append(qs)
-        incoming_members.append((i, member_ids))
+        qids = [quote_ids[_quote_key(q)] for q in theme_data.get("quotes", [])]
+        incoming_quotes.append(qids)
+        incoming_members.append((i, set(qids)))
 
     existing_themes = (
         db.query(ThemeGroup)
@@ -1123,15 +1314,9 @@ def _import_quotes_from_themes(
         .all()
     )
     theme_by_id = {t.id: t for t in existing_themes}
+    joins = _load_joins(db, ThemeQuote, "theme_id", list(theme_by_id))
     existing_members = [
-        (
-            t.id,
-            {
-                tq.quote_id
-                for tq in db.query(ThemeQuote).filter_by(theme_id=t.id).all()
-            },
-        )
-        for t in existing_themes
+        (t.id, set(joins.get(t.id, {}))) for t in existing_themes
     ]
 
     # Phase 3 — star-anchored theme name persistence.  A *renamed* theme is
@@ -1176,6 +1361,7 @@ def _import_quotes_from_themes(
     }
     strand_ids = pinned_ids - all_incoming - researcher_theme_ids
 
+    new_joins: list[dict[str, Any]] = []
     for i, theme_data in enumerate(theme_groups_data):
         if not incoming_quotes[i]:
             continue  # a quote-less theme is degenerate — don't persist a shell
@@ -1193,6 +1379,7 @@ def _import_quotes_from_themes(
             if strand_ids:
                 rebuild = rebuild.filter(ThemeQuote.quote_id.notin_(strand_ids))
             rebuild.delete(synchronize_session="fetch")
+            kept = _surviving_joins(joins.get(theme.id, {}), strand_ids)
         else:
             theme = ThemeGroup(
                 project_id=project.id,
@@ -1203,24 +1390,22 @@ def _import_quotes_from_themes(
             )
             db.add(theme)
             db.flush()
+            kept = set()
 
-        # Import quotes
-        for q in incoming_quotes[i]:
-            if q.id in researcher_theme_ids:
+        # Create theme_quote joins that don't exist yet
+        for qid in incoming_quotes[i]:
+            if qid in researcher_theme_ids:
                 continue  # researcher owns this quote's theme placement
-            # Create theme_quote join if not exists
-            existing_tq = (
-                db.query(ThemeQuote)
-                .filter_by(theme_id=theme.id, quote_id=q.id)
-                .first()
-            )
-            if not existing_tq:
-                tq = ThemeQuote(
-                    theme_id=theme.id,
-                    quote_id=q.id,
-                    assigned_by="pipeline",
-                )
-                db.add(tq)
+            if qid not in kept:
+                kept.add(qid)
+                new_joins.append({
+                    "theme_id": theme.id,
+                    "quote_id": qid,
+                    "assigned_by": "pipeline",
+                })
+
+    if new_joins:
+        db.execute(insert(ThemeQuote), new_joins)
 
 
 def _import_topic_boundaries(
@@ -1228,22 +1413,51 @@ def _import_topic_boundaries(
     session_map: dict[str, SessionModel],
     tb_path: Path,
 ) -> None:
-    """Import topic boundaries from JSON."""
+    """Replace the project's topic boundaries with those in ``tb_path``.
+
+    Boundaries carry no researcher state, so the file is the whole truth:
+    existing rows for these sessions are deleted and the file's rows
+    bulk-inserted (none when the file is gone).
+    """
+    db.query(TopicBoundary).filter(
+        TopicBoundary.session_id.in_([s.id for s in session_map.values()])
+    ).delete(synchronize_session=False)
+    if not tb_path.exists():
+        return
+
     data = json.loads(tb_path.read_text(encoding="utf-8"))
+    rows: list[dict[str, Any]] = []
     for item in data:
         sid = item.get("session_id", "")
         sess = session_map.get(sid)
         if not sess:
             continue
 
-        tb = TopicBoundary(
-            session_id=sess.id,
-            timecode_seconds=float(item.get("timecode_seconds", 0.0)),
-            topic_label=item.get("topic_label", ""),
-            transition_type=item.get("transition_type", ""),
-            confidence=float(item.get("confidence", 0.0)),
+        rows.append({
+            "session_id": sess.id,
+            "timecode_seconds": float(item.get("timecode_seconds", 0.0)),
+            "topic_label": item.get("topic_label", ""),
+            "transition_type": item.get("transition_type", ""),
+            "confidence": float(item.get("confidence", 0.0)),
+        })
+    if rows:
+        db.execute(insert(TopicBoundary), rows)
+
+
+def _restamp_pipeline_rows(db: Session, project: Project, now: datetime) -> None:
+    """Mark quotes, clusters and themes as seen by this import, in bulk.
+
+    Used when the quote files are unchanged: the upsert would have rewritten
+    every row with the values it already holds, so only ``last_imported_at``
+    needs moving — otherwise ``_cleanup_stale_data`` would read the whole
+    project as stale.
+    """
+    for model in (Quote, ScreenCluster, ThemeGroup):
+        db.execute(
+            update(model)
+            .where(model.project_id == project.id)
+            .values(last_imported_at=now)
         )
-        db.add(tb)
 
 
 def _auto_import_sentiment_framework(db: Session, project: Project) -> None:
@@ -1360,7 +1574,7 @@ def _auto_tag_from_sentiment_field(db: Session, project: Project) -> None:
 
     # Get all quotes with a sentiment for this project
     quotes_with_sentiment = (
-        db.query(Quote)
+        db.query(Quote.id, Quote.sentiment)
         .filter(
             Quote.project_id == project.id,
             Quote.sentiment.isnot(None),
@@ -1373,35 +1587,34 @@ def _auto_tag_from_sentiment_field(db: Session, project: Project) -> None:
         return
 
     # Get existing QuoteTag rows to avoid duplicates
-    existing_quote_tag_pairs: set[tuple[int, int]] = set()
-    for qt in (
-        db.query(QuoteTag)
+    existing_quote_tag_pairs: set[tuple[int, int]] = {
+        (quote_id, tag_id)
+        for quote_id, tag_id in db.query(QuoteTag.quote_id, QuoteTag.tag_definition_id)
         .filter(
             QuoteTag.tag_definition_id.in_([td.id for td in tag_defs]),
         )
-        .all()
-    ):
-        existing_quote_tag_pairs.add((qt.quote_id, qt.tag_definition_id))
+    }
 
-    created = 0
-    for quote in quotes_with_sentiment:
-        td = tag_by_name.get(quote.sentiment)
+    rows: list[dict[str, Any]] = []
+    for quote_id, sentiment in quotes_with_sentiment:
+        td = tag_by_name.get(sentiment)
         if td is None:
             continue
-        if (quote.id, td.id) in existing_quote_tag_pairs:
+        if (quote_id, td.id) in existing_quote_tag_pairs:
             continue
         # source="pipeline": sentiment tags are machine-authored from the
         # pipeline's sentiment field, NOT researcher effort.  Labelling them
         # "human" (the column default) would falsely pin every quote with a
         # sentiment under the Freeze pin predicate (source == "human").
-        db.add(QuoteTag(quote_id=quote.id, tag_definition_id=td.id, source="pipeline"))
-        created += 1
+        rows.append(
+            {"quote_id": quote_id, "tag_definition_id": td.id, "source": "pipeline"}
+        )
 
-    if created:
-        db.flush()
+    if rows:
+        db.execute(insert(QuoteTag), rows)
         logger.info(
             "Auto-tagged %d quotes with sentiment tags for project '%s'.",
-            created,
+            len(rows),
             project.name,
         )
 
@@ -1505,6 +1718,27 @@ def _delete_heading_edits(
     ).delete(synchronize_session="fetch")
 
 
+def _scrub_unpinned(db: Session, project_id: int) -> set[int]:
+    """Clear the frozen form + durable id of quotes that are no longer pinned.
+
+    The last star/edit/tag was removed.  frozen_form is a re-identification
+    key — don't leave a frozen copy of the words on a quote the researcher
+    deliberately un-pinned.  Re-pinning later re-mints from the current text.
+    Runs on every import, including one skipped as unchanged.  Returns the
+    ids of the quotes that are still pinned.
+    """
+    pinned_ids = _pinned_quote_ids(db, project_id)
+    db.query(Quote).filter(
+        Quote.project_id == project_id,
+        Quote.durable_id.isnot(None),
+        Quote.id.notin_(pinned_ids) if pinned_ids else sa_text("1=1"),
+    ).update(
+        {Quote.durable_id: None, Quote.frozen_form: None},
+        synchronize_session=False,
+    )
+    return pinned_ids
+
+
 def _cleanup_stale_data(
     db: Session,
     project: Project,
@@ -1534,20 +1768,7 @@ def _cleanup_stale_data(
     against the researcher removing an interview.
     """
     # Pinned quotes are protected only while their session is still present.
-    pinned_ids = _pinned_quote_ids(db, project.id)
-
-    # Scrub the frozen form + durable id from quotes that are no longer pinned
-    # (the last star/edit/tag was removed).  frozen_form is a re-identification
-    # key — don't leave a frozen copy of the words on a quote the researcher
-    # deliberately un-pinned.  Re-pinning later re-mints from the current text.
-    db.query(Quote).filter(
-        Quote.project_id == project.id,
-        Quote.durable_id.isnot(None),
-        Quote.id.notin_(pinned_ids) if pinned_ids else sa_text("1=1"),
-    ).update(
-        {Quote.durable_id: None, Quote.frozen_form: None},
-        synchronize_session=False,
-    )
+    pinned_ids = _scrub_unpinned(db, project.id)
 
     protected_ids: set[int] = set()
     if pinned_ids:
@@ -1698,6 +1919,9 @@ def _cleanup_stale_data(
         db.query(TopicBoundary).filter(
             TopicBoundary.session_id.in_(stale_session_db_ids)
         ).delete(synchronize_session="fetch")
+        db.query(SessionCoverage).filter(
+            SessionCoverage.session_id.in_(stale_session_db_ids)
+        ).delete(synchronize_session="fetch")
 
         # SessionSpeaker + orphaned Person rows
         stale_speakers = (
@@ -1729,41 +1953,33 @@ def _cleanup_stale_data(
             SessionModel.id.in_(stale_session_db_ids)
         ).delete(synchronize_session="fetch")
 
+        # Word timings live on disk, not in the DB
+        for sid in stale_session_str_ids:
+            session_timings_path(Path(project.output_dir), sid).unlink(missing_ok=True)
+
     # --- Clean stale pipeline join rows ----------------------------------
     # Reassignment (a surviving quote moving between sections/themes) is now
     # handled at import time, where a reused cluster/theme rebuilds its pipeline
     # membership from scratch (see _import_quotes_from_clusters).  This is a
     # defensive belt: drop any pipeline join whose quote no longer exists.
-    surviving_clusters = (
-        db.query(ScreenCluster)
-        .filter_by(project_id=project.id, created_by="pipeline")
-        .all()
-    )
-    for cluster in surviving_clusters:
-        # Get all pipeline-assigned joins for this cluster
-        pipeline_cqs = (
-            db.query(ClusterQuote)
-            .filter_by(cluster_id=cluster.id, assigned_by="pipeline")
-            .all()
-        )
-        for cq in pipeline_cqs:
-            # If the quote no longer exists, remove the join
-            quote = db.get(Quote, cq.quote_id)
-            if not quote:
-                db.delete(cq)
-
-    surviving_themes = (
-        db.query(ThemeGroup)
-        .filter_by(project_id=project.id, created_by="pipeline")
-        .all()
-    )
-    for theme in surviving_themes:
-        pipeline_tqs = (
-            db.query(ThemeQuote)
-            .filter_by(theme_id=theme.id, assigned_by="pipeline")
-            .all()
-        )
-        for tq in pipeline_tqs:
-            quote = db.get(Quote, tq.quote_id)
-            if not quote:
-                db.delete(tq)
+    live_quotes = select(Quote.id)
+    db.query(ClusterQuote).filter(
+        ClusterQuote.cluster_id.in_(
+            select(ScreenCluster.id).where(
+                ScreenCluster.project_id == project.id,
+                ScreenCluster.created_by == "pipeline",
+            )
+        ),
+        ClusterQuote.assigned_by == "pipeline",
+        ClusterQuote.quote_id.notin_(live_quotes),
+    ).delete(synchronize_session=False)
+    db.query(ThemeQuote).filter(
+        ThemeQuote.theme_id.in_(
+            select(ThemeGroup.id).where(
+                ThemeGroup.project_id == project.id,
+                ThemeGroup.created_by == "pipeline",
+            )
+        ),
+        ThemeQuote.assigned_by == "pipeline",
+        ThemeQuote.quote_id.notin_(live_quotes),
+    ).delete(synchronize_session=False)
@@ -0,0 +1,139 @@
+"""Local lexical relevance — BM25 ranking with no LLM and no model download.
+
+A cheap pre-filter in front of LLM calls that would otherwise read every
+candidate: AutoCode narrows each batch's taxonomy to the tags its quotes
+plausibly match, and the codebook builder scans the quotes most likely to
+fit a tag first.  Scores are Okapi BM25 over a light tokeniser (lowercase
+word runs, a stop list, plural/-ing/-ed folding), so "requires" and
+"required" share a term with "require".
+
+The ranking only ever *orders* — what is dropped is decided by the caller's
+recall knob, and a quote with no lexical evidence for any tag keeps the whole
+taxonomy rather than a guess.
+
+Public API::
+
+    tokenize(text)                          → normalised terms
+    BM25Index(documents).scores(query)      → one score per document
+    tag_shortlists(quotes, tags, top_k)     → per quote, its likeliest tags
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+
+_WORD = re.compile(r"\w+")
+
+_STOPWORDS = frozenset(
+    """
+    a about after again all also am an and any are as at be because been before
+    being but by can could did do does doing don for from get got had has have
+    having he her here him his how i if in into is it its just like me more most
+    my no not now of on one only or other our out over really she should so some
+    than that the their them then there these they thing things this those to
+    too up us very was we were what when where which while who why will with
+    would yeah you your
+    """.split()
+)
+
+#: Suffixes folded so inflections share a term; longest first.
+_SUFFIXES = ("ing", "ed", "es", "s")
+
+
+def _stem(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[: -len(suffix)]
+            break
+    # "stopped" → "stopp" → "stop"; "require" and "requires" → "requir"
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "aeiousl":
+        word = word[:-1]
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased, stop-listed, suffix-folded word terms of ``text``."""
+    return [
+        _stem(w)
+        for w in _WORD.findall(text.lower().replace("'", ""))
+        if w not in _STOPWORDS and not w.isdigit()
+    ]
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed list of documents.
+
+    Postings are plain dicts — the corpora here (a codebook's tags, a
+    project's quotes) are hundreds to low thousands of short texts, well
+    inside what pure Python scores in milliseconds.
+    """
+
+    def __init__(self, documents: list[str], *, k1: float = 1.2, b: float = 0.75) -> None:
+        self._k1 = k1
+        self._b = b
+        self._size = len(documents)
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._lengths: list[int] = []
+        for i, doc in enumerate(documents):
+            terms = Counter(tokenize(doc))
+            self._lengths.append(sum(terms.values()))
+            for term, tf in terms.items():
+                self._postings.setdefault(term, []).append((i, tf))
+        self._avg_length = (sum(self._lengths) / self._size) if self._size else 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        return math.log(1 + (self._size - df + 0.5) / (df + 0.5))
+
+    def scores(self, query: str) -> list[float]:
+        """BM25 score of every document against ``query`` (0.0 = no shared term)."""
+        out = [0.0] * self._size
+        if not self._avg_length:
+            return out
+        for term, qtf in Counter(tokenize(query)).items():
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf(term)
+            for doc, tf in postings:
+                norm = 1 - self._b + self._b * self._lengths[doc] / self._avg_length
+                out[doc] += qtf * idf * tf * (self._k1 + 1) / (tf + self._k1 * norm)
+        return out
+
+    def rank(self, query: str) -> list[int]:
+        """Document indices, best match first; ties keep document order."""
+        scores = self.scores(query)
+        return sorted(range(self._size), key=lambda i: -scores[i])
+
+
+def tag_shortlists(
+    quotes: list[str], tags: dict[str, str], top_k: int
+) -> list[list[str] | None]:
+    """Per quote, the names of the ``top_k`` tags it most plausibly matches.
+
+    ``tags`` maps tag name to the text describing it (definition, when to
+    apply).  Each shortlist is best match first.  ``None`` means "keep every
+    tag": ``top_k`` is 0 or covers the whole codebook, or the quote shares no
+    term with any tag, so a lexical miss (a paraphrase, another language)
+    never silently drops the right tag.
+    """
+    names = list(tags)
+    if top_k <= 0 or top_k >= len(names):
+        return [None] * len(quotes)
+    index = BM25Index([f"{name}\n{text}" for name, text in tags.items()])
+    out: list[list[str] | None] = []
+    for quote in quotes:
+        scores = index.scores(quote)
+        if not any(scores):
+            out.append(None)
+            continue
+        ranked = sorted(range(len(names)), key=lambda i: -scores[i])
+        out.append([names[i] for i in ranked[:top_k]])
+    return out
@@ -507,15 +507,27 @@ def _tool_search_quotes(
     limit: int,
     offset: int,
 ) -> dict:
+    from sqlalchemy import exists, false, func
+
     from bristlenose.models import Sentiment
     from bristlenose.server.models import (
         ClusterQuote,
+        DeletedBadge,
+        Quote,
+        QuoteEdit,
+        QuoteState,
         QuoteTag,
         ScreenCluster,
         TagDefinition,
         ThemeGroup,
         ThemeQuote,
     )
+    from bristlenose.server.quote_search import (
+        fallback_filter,
+        match_subquery,
+        quote_index_available,
+        to_match_query,
+    )
 
     project = _get_project(db, project_id)
     if sentiment is not None:
@@ -527,65 +539,122 @@ def _tool_search_quotes(
     limit = max(1, min(int(limit), SEARCH_LIMIT_CAP))
     offset = max(0, int(offset))
 
-    all_quotes, hidden, starred, edited, deleted = _curation_maps(db, project_id)
-    visible = [q for q in all_quotes if q.id not in hidden]
-    visible_pks = {q.id for q in visible}
+    # Filters run in SQL so a page costs one ranked, LIMITed query plus
+    # lookups for the page's own quotes — never a whole-project load.
+    matches = db.query(Quote.id).filter(
+        Quote.project_id == project_id,
+        ~exists().where(QuoteState.quote_id == Quote.id, QuoteState.is_hidden.is_(True)),
+    )
+    order: list[Any] = []
+    if query and query.strip():
+        expr = to_match_query(query)
+        if not expr:  # only punctuation typed: nothing can match
+            matches = matches.filter(false())
+        elif quote_index_available(db):
+            ranked = match_subquery(project_id, expr)
+            matches = matches.join(ranked, ranked.c.quote_id == Quote.id)
+            order.append(ranked.c.rank)  # BM25: best match first
+        else:
+            matches = matches.filter(fallback_filter(query))
+    if participant:
+        matches = matches.filter(func.lower(Quote.participant_id) == participant.lower())
+    if sentiment:
+        # A researcher-removed badge is curation: the quote no longer has it.
+        matches = matches.filter(
+            Quote.sentiment == sentiment,
+            ~exists().where(
+                DeletedBadge.quote_id == Quote.id, DeletedBadge.sentiment == Quote.sentiment,
+            ),
+        )
+    if starred_only:
+        matches = matches.filter(
+            exists().where(QuoteState.quote_id == Quote.id, QuoteState.is_starred.is_(True))
+        )
+    # Labels compare case-insensitively in Python (SQLite's lower() is
+    # ASCII-only); the label tables are small, the join tables are not.
+    if section:
+        cluster_ids = [
+            cid for cid, label in db.query(ScreenCluster.id, ScreenCluster.screen_label)
+            .filter_by(project_id=project_id)
+            if label.lower() == section.lower()
+        ]
+        matches = matches.filter(exists().where(
+            ClusterQuote.quote_id == Quote.id, ClusterQuote.cluster_id.in_(cluster_ids),
+        ))
+    if theme:
+        theme_ids = [
+            tid for tid, label in db.query(ThemeGroup.id, ThemeGroup.theme_label)
+            .filter_by(project_id=project_id)
+            if label.lower() == theme.lower()
+        ]
+        matches = matches.filter(exists().where(
+            ThemeQuote.quote_id == Quote.id, ThemeQuote.theme_id.in_(theme_ids),
+        ))
+    if tag:
+        tag_ids = [
+            tid for tid, name in db.query(TagDefinition.id, TagDefinition.name)
+            if name.lower() == tag.lower()
+        ]
+        matches = matches.filter(exists().where(
+            QuoteTag.quote_id == Quote.id, QuoteTag.tag_definition_id.in_(tag_ids),
+        ))
+
+    total = matches.order_by(None).count()
+    page_ids = [
+        row[0] for row in
+        matches.order_by(*order, Quote.session_id, Quote.start_timecode)
+        .offset(offset).limit(limit)
+    ]
 
-    # Batch-attach section / theme / tag names (the export_core pattern).
+    # Attach display data for the page only (the export_core batch pattern).
+    by_id = {q.id: q for q in db.query(Quote).filter(Quote.id.in_(page_ids))}
+    edited: dict[int, str] = {}
+    starred: set[int] = set()
+    deleted: set[tuple[int, str]] = set()
     section_of: dict[int, str] = {}
-    if visible_pks:
-        for cq, label in (
-            db.query(ClusterQuote, ScreenCluster.screen_label)
+    themes_of: dict[int, list[str]] = {}
+    tags_of: dict[int, list[str]] = {}
+    if page_ids:
+        for e in (
+            db.query(QuoteEdit)
+            .filter(QuoteEdit.quote_id.in_(page_ids))
+            .order_by(QuoteEdit.edited_at.asc(), QuoteEdit.id.asc())
+        ):  # ascending: latest edit wins
+            edited[e.quote_id] = e.edited_text
+        starred = {
+            qid for (qid,) in db.query(QuoteState.quote_id).filter(
+                QuoteState.quote_id.in_(page_ids), QuoteState.is_starred.is_(True),
+            )
+        }
+        deleted = set(
+            db.query(DeletedBadge.quote_id, DeletedBadge.sentiment)
+            .filter(DeletedBadge.quote_id.in_(page_ids))
+            .all()
+        )
+        for qid, label in (
+            db.query(ClusterQuote.quote_id, ScreenCluster.screen_label)
             .join(ScreenCluster, ScreenCluster.id == ClusterQuote.cluster_id)
-            .filter(ClusterQuote.quote_id.in_(visible_pks))
+            .filter(ClusterQuote.quote_id.in_(page_ids))
         ):
-            section_of[cq.quote_id] = label
-    themes_of: dict[int, list[str]] = {}
-    if visible_pks:
-        for tq, label in (
-            db.query(ThemeQuote, ThemeGroup.theme_label)
+            section_of[qid] = label
+        for qid, label in (
+            db.query(ThemeQuote.quote_id, ThemeGroup.theme_label)
             .join(ThemeGroup, ThemeGroup.id == ThemeQuote.theme_id)
-            .filter(ThemeQuote.quote_id.in_(visible_pks))
+            .filter(ThemeQuote.quote_id.in_(page_ids))
         ):
-            themes_of.setdefault(tq.quote_id, []).append(label)
-    tags_of: dict[int, list[str]] = {}
-    if visible_pks:
-        for qt, name in (
-            db.query(QuoteTag, TagDefinition.name)
+            themes_of.setdefault(qid, []).append(label)
+        for qid, name in (
+            db.query(QuoteTag.quote_id, TagDefinition.name)
             .join(TagDefinition, TagDefinition.id == QuoteTag.tag_definition_id)
-            .filter(QuoteTag.quote_id.in_(visible_pks))
+            .filter(QuoteTag.quote_id.in_(page_ids))
             .order_by(TagDefinition.name)
         ):
-            tags_of.setdefault(qt.quote_id, []).append(name)
-
-    def _matches(q: Any) -> bool:
-        text = edited.get(q.id, q.text)
-        if query and query.lower() not in text.lower():
-            return False
-        if participant and q.participant_id.lower() != participant.lower():
-            return False
-        if sentiment and (
-            (q.sentiment or "") != sentiment
-            or (q.id, q.sentiment) in deleted
-        ):
-            return False
-        if starred_only and q.id not in starred:
-            return False
-        if section and section.lower() != section_of.get(q.id, "").lower():
-            return False
-        if theme and theme.lower() not in [t.lower() for t in themes_of.get(q.id, [])]:
-            return False
-        if tag and tag.lower() not in [t.lower() for t in tags_of.get(q.id, [])]:
-            return False
-        return True
-
-    matched = sorted(
-        (q for q in visible if _matches(q)),
-        key=lambda q: (q.session_id, q.start_timecode),
-    )
-    page = matched[offset : offset + limit]
-    rows = [
-        {
+            tags_of.setdefault(qid, []).append(name)
+
+    rows = []
+    for qid in page_ids:
+        q = by_id[qid]
+        rows.append({
             "quote_id": quote_dom_id(q.participant_id, q.start_timecode),
             "text": edited.get(q.id, q.text),  # researcher's edit wins; never truncated
             "participant": q.participant_id,
@@ -598,9 +667,8 @@ def _tool_search_quotes(
             "themes": themes_of.get(q.id, []),
             "tags": tags_of.get(q.id, []),
             "starred": q.id in starred,
-        }
-        for q in page
-    ]
+        })
+    has_more = offset + limit < total
     return {
         # Identity in EVERY payload, not just the overview. `project_id` is a
         # slot, not a name: it resolves to whichever project is exposed, so a
@@ -610,11 +678,11 @@ def _tool_search_quotes(
         # arrive under study A's frame with nothing to signal the change:
         # correct retrieval, wrong attribution, no error anywhere.
         "project": _project_identity(project),
-        "total_matched": len(matched),
+        "total_matched": total,
         "returned": len(rows),
         "offset": offset,
-        "has_more": offset + limit < len(matched),
-        "next_offset": offset + limit if offset + limit < len(matched) else None,
+        "has_more": has_more,
+        "next_offset": offset + limit if has_more else None,
         "quotes": rows,
     }
 
@@ -945,8 +1013,12 @@ def create_mcp_server(
         offset: int = 0,
     ) -> dict:
         """Search the curated quotes (hidden quotes excluded, researcher
-        edits applied). Filters combine with AND; text is never truncated;
-        limit is capped at 50 — page with offset/next_offset."""
+        edits applied). query words are ANDed and match whole words;
+        "quoted words" match as a phrase; a trailing * matches a prefix
+        (navig* finds navigation, navig alone does not). With a query,
+        results are ranked best match first. Filters combine with AND;
+        text is never truncated; limit is capped at 50 — page with
+        offset/next_offset."""
         return _run(
             "search_quotes", project_id,
             lambda db: _tool_search_quotes(
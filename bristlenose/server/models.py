@@ -179,6 +179,13 @@ class Project(Base):
     output_dir: Mapped[str] = mapped_column(String(500))
     created_at: Mapped[datetime] = mapped_column(default=func.now())
     imported_at: Mapped[datetime | None] = mapped_column(default=None)
+    # What the last import read: JSON ``{input: sha256}`` over the
+    # intermediate files and transcripts. The importer skips an unchanged
+    # project and re-applies only the inputs that differ (see importer.py).
+    import_fingerprint: Mapped[str | None] = mapped_column(Text, default=None)
+    # Bumped in the same transaction as every committed write to project
+    # data; cached read models and their ETags key on it (read_model.py).
+    revision: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     # The Anonymise switch for the MCP agent surface — per-surface sticky,
     # same concept as the export/clips/Miro toggles. False (default) = the
     # researcher's names accompany speaker codes in get_project_overview;
@@ -303,11 +310,38 @@ class TranscriptSegment(Base):
     text: Mapped[str] = mapped_column(Text)
     source: Mapped[str] = mapped_column(String(50), default="")  # whisper, srt, vtt, docx
     segment_index: Mapped[int] = mapped_column(Integer, default=-1)
+    # Legacy per-word JSON; word timings now live in per-session .bnwt files
+    # (bristlenose/word_timings.py).  Read only as a fallback for old rows.
     words_json: Mapped[str | None] = mapped_column(Text, nullable=True, default=None)
 
     session: Mapped[Session] = relationship(back_populates="transcript_segments")
 
 
+class SessionCoverage(Base):
+    """Per-session transcript coverage, precomputed for the dashboard.
+
+    Derived entirely from the session's transcript segments and its quotes'
+    timecodes (see ``server/coverage_store.py``).  The importer — the only
+    writer of either — recomputes the rows of the sessions it touches; a row
+    that is missing, or was computed by an older ``version`` of the
+    algorithm, is recomputed on the next dashboard load.  ``omitted_json``
+    holds the omitted participant segments (longer than the fragment
+    threshold) and the fragment counts, in display order.
+    """
+
+    __tablename__ = "session_coverages"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), unique=True)
+    version: Mapped[int] = mapped_column(Integer, default=0)
+    segment_count: Mapped[int] = mapped_column(Integer, default=0)
+    participant_words: Mapped[int] = mapped_column(Integer, default=0)
+    participant_words_in_quotes: Mapped[int] = mapped_column(Integer, default=0)
+    moderator_words: Mapped[int] = mapped_column(Integer, default=0)
+    omitted_json: Mapped[str] = mapped_column(Text, default="{}")
+    computed_at: Mapped[datetime] = mapped_column(default=func.now())
+
+
 # ---------------------------------------------------------------------------
 # The AI's analysis
 # ---------------------------------------------------------------------------
@@ -714,6 +748,9 @@ class AutoCodeJob(Base):
     prompt_version: Mapped[str] = mapped_column(String(20), default="")
     input_tokens: Mapped[int] = mapped_column(default=0)
     output_tokens: Mapped[int] = mapped_column(default=0)
+    # Quotes whose verdict came from AutoCodeCache instead of an LLM call
+    # (counted in processed_quotes too).
+    cache_hits: Mapped[int] = mapped_column(default=0)
     started_at: Mapped[datetime] = mapped_column(default=func.now())
     completed_at: Mapped[datetime | None] = mapped_column(default=None)
 
@@ -751,3 +788,29 @@ class ProposedTag(Base):
     __table_args__ = (
         UniqueConstraint("job_id", "quote_id", name="uq_proposed_tag_job_quote"),
     )
+
+
+class AutoCodeCache(Base):
+    """Cached AutoCode verdict for one quote.
+
+    Keyed by (project_id, cache_key) where cache_key is a SHA-256 of the
+    framework id, prompt version, taxonomy text, provider/model and the
+    quote as the LLM sees it (effective text plus its batch metadata) —
+    change any of them and the quote is sent again.  ``assignments`` is the
+    JSON list of the LLM's ``{tag_name, confidence, rationale}`` for the
+    quote, empty when it assigned nothing; tag names are resolved to ids
+    when the verdict is replayed.
+    """
+
+    __tablename__ = "autocode_caches"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_id: Mapped[int] = mapped_column(Integer, index=True)
+    framework_id: Mapped[str] = mapped_column(String(50))  # for pruning on a full run
+    cache_key: Mapped[str] = mapped_column(String(64))
+    assignments: Mapped[str] = mapped_column(Text, default="[]")
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("project_id", "cache_key", name="uq_autocode_cache_project_key"),
+    )
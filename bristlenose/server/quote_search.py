@@ -0,0 +1,240 @@
+"""Full-text quote search — an SQLite FTS5 index over effective quote text.
+
+``quote_fts`` holds one row per quote, keyed by ``rowid = quotes.id``, whose
+text is what the researcher sees: the latest ``QuoteEdit`` if there is one,
+else the pipeline's text. It is a derived index, not part of the ORM schema:
+:func:`install_quote_index` creates it (and its triggers) on every
+``init_db`` and rebuilds it whenever its row count drifts from ``quotes``.
+
+Sync is done by SQLite triggers on ``quotes`` and ``quote_edits`` rather than
+by the writers. The importer bulk-inserts and bulk-updates quotes, the edits
+endpoint deletes and re-inserts ``quote_edits`` wholesale, and tests write
+rows directly — a trigger sees all of them, including writes added later,
+without any call site having to remember the index exists.
+
+Query syntax (:func:`to_match_query`) is deliberately small: bare words are
+ANDed, ``"a phrase"`` matches adjacent words, and a trailing ``*`` makes a
+word a prefix (``dash*``). Every term is quoted before it reaches FTS5, so
+operators and punctuation in researcher or model input cannot form FTS5
+syntax errors. Results are ranked with BM25.
+
+SQLite builds without FTS5 (and non-SQLite databases) get no index;
+:func:`quote_index_available` is False and callers fall back to
+:func:`fallback_filter` — a scan over :func:`effective_text_expr` with the
+same rules (whole tokens ANDed, phrases, ``*`` prefixes, case and diacritics
+folded), so a query finds the same quotes on either build, unranked.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Float, Integer, func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "quote_fts"
+
+# The researcher-facing text of quote ``q``: its latest edit, else its own
+# text. Same precedence as ``routes.data._effective_text``.
+_EFFECTIVE_TEXT_SQL = (
+    "COALESCE((SELECT e.edited_text FROM quote_edits e WHERE e.quote_id = q.id "
+    "ORDER BY e.edited_at DESC, e.id DESC LIMIT 1), q.text)"
+)
+
+_REFRESH_SQL = (
+    f"DELETE FROM {FTS_TABLE} WHERE rowid = {{qid}}; "
+    f"INSERT INTO {FTS_TABLE}(rowid, text, project_id) "
+    f"SELECT q.id, {_EFFECTIVE_TEXT_SQL}, q.project_id FROM quotes q WHERE q.id = {{qid}};"
+)
+
+_DDL = [
+    # prefix='2 3' keeps short prefix queries ("da*", "das*") off a full
+    # term-list scan; unicode61 with diacritics folded matches "cafe" to "café".
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "text, project_id UNINDEXED, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_quote_ai AFTER INSERT ON quotes BEGIN "
+    + _REFRESH_SQL.format(qid="NEW.id") + " END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_quote_au "
+    "AFTER UPDATE OF text, project_id ON quotes BEGIN "
+    + _REFRESH_SQL.format(qid="NEW.id") + " END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_quote_ad AFTER DELETE ON quotes BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE rowid = OLD.id; END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_edit_ai AFTER INSERT ON quote_edits BEGIN "
+    + _REFRESH_SQL.format(qid="NEW.quote_id") + " END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_edit_au AFTER UPDATE ON quote_edits BEGIN "
+    + _REFRESH_SQL.format(qid="OLD.quote_id")
+    + _REFRESH_SQL.format(qid="NEW.quote_id") + " END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_edit_ad AFTER DELETE ON quote_edits BEGIN "
+    + _REFRESH_SQL.format(qid="OLD.quote_id") + " END",
+]
+
+
+def install_quote_index(engine: Engine) -> bool:
+    """Create the FTS5 table and triggers; rebuild the index if it has drifted.
+
+    Idempotent — called from ``init_db`` on every serve start. A migration
+    that rebuilds ``quotes`` in batch mode drops the table's triggers with
+    it, so they are re-created here rather than once. Returns False when
+    the database cannot host the index (not SQLite, or no FTS5 module).
+    """
+    if engine.dialect.name != "sqlite":
+        return False
+    try:
+        with engine.begin() as conn:
+            for stmt in _DDL:
+                conn.exec_driver_sql(stmt)
+            indexed = conn.exec_driver_sql(f"SELECT count(*) FROM {FTS_TABLE}").scalar()
+            quotes = conn.exec_driver_sql("SELECT count(*) FROM quotes").scalar()
+            if indexed != quotes:
+                logger.info("Rebuilding quote search index (%s of %s quotes)", indexed, quotes)
+                conn.exec_driver_sql(f"DELETE FROM {FTS_TABLE}")
+                conn.exec_driver_sql(
+                    f"INSERT INTO {FTS_TABLE}(rowid, text, project_id) "
+                    f"SELECT q.id, {_EFFECTIVE_TEXT_SQL}, q.project_id FROM quotes q"
+                )
+    except OperationalError as exc:
+        # "no such module: fts5" — a Python linked against a minimal SQLite.
+        logger.info("Quote search index unavailable (%s) — substring search", exc)
+        return False
+    return True
+
+
+def quote_index_available(db: Session) -> bool:
+    """True when ``quote_fts`` exists in this database."""
+    if db.get_bind().dialect.name != "sqlite":
+        return False
+    return db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first() is not None
+
+
+_TERM_RE = re.compile(r'"([^"]*)"?|([^\s"]+)')
+
+# A unicode61 token: a run of letters and digits (underscore separates).
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def _terms(query: str) -> list[tuple[str, bool]]:
+    """``(phrase, is_prefix)`` per searchable term of ``query``."""
+    terms: list[tuple[str, bool]] = []
+    for phrase, word in _TERM_RE.findall(query):
+        prefix = False
+        if word:
+            prefix = word.endswith("*")
+            phrase = word.rstrip("*")
+        if not any(ch.isalnum() for ch in phrase):
+            continue
+        terms.append((" ".join(phrase.split()), prefix))
+    return terms
+
+
+def to_match_query(query: str) -> str:
+    """Translate a researcher's search box text into an FTS5 MATCH expression.
+
+    ``dashboard "hard to find" nav*`` becomes
+    ``"dashboard" "hard to find" "nav"*``. An unclosed quote runs to the end
+    of the input. Terms with no letters or digits are dropped; an empty
+    result means nothing searchable was typed.
+    """
+    return " ".join(
+        '"' + phrase + '"' + ("*" if prefix else "") for phrase, prefix in _terms(query)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fallback matching — the same rules without FTS5
+# ---------------------------------------------------------------------------
+
+#: SQL function registered on every SQLite connection (``db`` connect hook).
+MATCH_FUNCTION = "bn_quote_match"
+
+
+def _tokens(text_: str) -> list[str]:
+    """Tokens as FTS5's ``unicode61 remove_diacritics 2`` sees them."""
+    folded = "".join(
+        ch for ch in unicodedata.normalize("NFKD", text_.lower())
+        if not unicodedata.combining(ch)
+    )
+    return _TOKEN_RE.findall(folded)
+
+
+@lru_cache(maxsize=64)
+def _compiled_terms(query: str) -> tuple[tuple[tuple[str, ...], bool], ...]:
+    compiled = ((tuple(_tokens(phrase)), prefix) for phrase, prefix in _terms(query))
+    return tuple((tokens, prefix) for tokens, prefix in compiled if tokens)
+
+
+def _phrase_at(tokens: list[str], at: int, phrase: tuple[str, ...], prefix: bool) -> bool:
+    last = len(phrase) - 1
+    for offset, want in enumerate(phrase):
+        got = tokens[at + offset]
+        if not (got.startswith(want) if prefix and offset == last else got == want):
+            return False
+    return True
+
+
+def text_matches(text_: str | None, query: str | None) -> int:
+    """1 if ``text_`` satisfies every term of ``query``, as FTS5 MATCH would.
+
+    Bare words must equal a whole token, ``word*`` must start one, and a
+    phrase must match consecutive tokens (its last word a prefix when it
+    ends in ``*``). Returns an int because SQLite has no boolean type.
+    """
+    if text_ is None or query is None:
+        return 0
+    terms = _compiled_terms(query)
+    if not terms:
+        return 0
+    tokens = _tokens(text_)
+    for phrase, prefix in terms:
+        span = len(tokens) - len(phrase) + 1
+        if not any(_phrase_at(tokens, at, phrase, prefix) for at in range(span)):
+            return 0
+    return 1
+
+
+def register_match_function(dbapi_connection: Any) -> None:
+    """Make :data:`MATCH_FUNCTION` callable from SQL on this connection."""
+    dbapi_connection.create_function(MATCH_FUNCTION, 2, text_matches, deterministic=True)
+
+
+def fallback_filter(query: str) -> Any:
+    """WHERE clause matching ``query`` without an index (see :func:`text_matches`)."""
+    return getattr(func, MATCH_FUNCTION)(effective_text_expr(), query) == 1
+
+
+def match_subquery(project_id: int, match: str) -> Any:
+    """``(quote_id, rank)`` for one project's matches; lower rank is better."""
+    return (
+        text(
+            f"SELECT rowid AS quote_id, bm25({FTS_TABLE}) AS rank FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH :match AND project_id = :project_id"
+        )
+        .bindparams(match=match, project_id=project_id)
+        .columns(quote_id=Integer, rank=Float)
+        .subquery("quote_match")
+    )
+
+
+def effective_text_expr() -> Any:
+    """SQL expression for a quote's researcher-facing text (fallback search)."""
+    from bristlenose.server.models import Quote, QuoteEdit
+
+    latest_edit = (
+        select(QuoteEdit.edited_text)
+        .where(QuoteEdit.quote_id == Quote.id)
+        .order_by(QuoteEdit.edited_at.desc(), QuoteEdit.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return func.coalesce(latest_edit, Quote.text)
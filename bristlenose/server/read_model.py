@@ -0,0 +1,142 @@
+"""Project revisions and cached read-model projections.
+
+``GET /quotes`` walks every quote, join, tag and speaker of a project to
+build one JSON payload, and the SPA asks for it on every page load. Nothing
+in it changes between writes, so it is built once per *revision* and served
+from memory until the next write.
+
+Revision
+    ``Project.revision`` is bumped in the same transaction as every
+    committed write to project data. The bump is a session hook (installed
+    on the app's sessionmaker by :func:`track_revisions`), not a call each
+    writer has to remember: the data routes, codebook routes, AutoCode
+    acceptance, background AutoCode jobs and the importer all write through
+    that factory, and the hook sees unit-of-work flushes and bulk
+    ``insert()``/``update()``/``delete()`` statements alike. Writes to
+    :data:`_UNVERSIONED_TABLES` (caches and the project row itself) do not
+    count. The bump covers every project in the database — there is one
+    per serve database, and an over-bump only costs one rebuild.
+
+Projection cache
+    :class:`ProjectionCache` holds the last serialised body per
+    (projection, project), tagged with its ETag. The ETag folds in the
+    revision, the project's identity and the package version, so a cached
+    browser response can never validate against a different project,
+    a recreated database or a changed payload shape.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Any
+
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session, sessionmaker
+
+_DIRTY = "bn_revision_dirty"
+
+# Tables whose writes never change what a read model shows.
+_UNVERSIONED_TABLES = frozenset({
+    "projects",  # the bump itself; import bookkeeping
+    "elaboration_caches",
+    "session_coverages",  # filled lazily by the dashboard
+    "alembic_version",
+})
+
+
+def _counts(table: Any) -> bool:
+    name = getattr(table, "name", None)
+    return name is not None and name not in _UNVERSIONED_TABLES
+
+
+def _after_flush(session: Session, _flush_context: Any) -> None:
+    if session.info.get(_DIRTY):
+        return
+    # Still the pre-flush collections at this point in the flush.
+    for obj in (*session.new, *session.deleted):
+        if _counts(getattr(obj, "__table__", None)):
+            session.info[_DIRTY] = True
+            return
+    for obj in session.dirty:
+        if _counts(getattr(obj, "__table__", None)) and session.is_modified(obj):
+            session.info[_DIRTY] = True
+            return
+
+
+def _do_orm_execute(state: Any) -> None:
+    if (state.is_insert or state.is_update or state.is_delete) and _counts(
+        getattr(state.statement, "table", None)
+    ):
+        state.session.info[_DIRTY] = True
+
+
+def _before_commit(session: Session) -> None:
+    from bristlenose.server.models import Project
+
+    session.flush()  # pending objects only reach _after_flush here
+    if session.info.pop(_DIRTY, False):
+        session.execute(
+            update(Project)
+            .values(revision=Project.revision + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _after_rollback(session: Session, _previous_transaction: Any) -> None:
+    session.info.pop(_DIRTY, None)
+
+
+def track_revisions(factory: sessionmaker[Session]) -> None:
+    """Install the revision hooks on every session ``factory`` creates."""
+    event.listen(factory, "after_flush", _after_flush)
+    event.listen(factory, "do_orm_execute", _do_orm_execute)
+    event.listen(factory, "before_commit", _before_commit)
+    event.listen(factory, "after_soft_rollback", _after_rollback)
+
+
+def has_pending_writes(session: Session) -> bool:
+    """True when ``session`` holds writes its revision does not count yet.
+
+    Flushed-but-uncommitted and unflushed changes alike: a read model built
+    inside such a session must not be cached under the current revision.
+    """
+    return bool(session.info.get(_DIRTY) or session.new or session.dirty or session.deleted)
+
+
+def projection_etag(project: Any, name: str) -> str:
+    """Weak ETag for projection ``name`` of ``project`` at its current revision."""
+    from bristlenose import __version__
+
+    identity = f"{__version__}|{project.id}|{project.created_at}|{project.output_dir}"
+    token = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:12]
+    return f'W/"{name}-{token}-{project.revision}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True when an ``If-None-Match`` header names ``etag`` (or is ``*``)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    # Weak comparison (RFC 9110 §8.8.3.2): W/ prefixes are ignored.
+    bare = etag.removeprefix("W/")
+    return "*" in candidates or any(c.removeprefix("W/") == bare for c in candidates)
+
+
+class ProjectionCache:
+    """Last serialised body per (projection, project), keyed by ETag."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, int], tuple[str, bytes]] = {}
+
+    def get(self, name: str, project_id: int, etag: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get((name, project_id))
+        if entry is None or entry[0] != etag:
+            return None
+        return entry[1]
+
+    def put(self, name: str, project_id: int, etag: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[(name, project_id)] = (etag, body)
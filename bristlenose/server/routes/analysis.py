@@ -464,140 +464,152 @@ def get_sentiment_analysis(
     static render path.  Uses lightweight adapter objects to bridge DB
     models to the pipeline analysis functions.
     """
+    db = _get_db(request)
+    try:
+        _check_project(db, project_id)
+        return sentiment_analysis(db, project_id, _load_shared_data(db, project_id), top_n)
+    finally:
+        db.close()
+
+
+def sentiment_analysis(
+    db: Session,
+    project_id: int,
+    shared: _SharedProjectData | None,
+    top_n: int,
+) -> SentimentAnalysisResponse:
+    """Sentiment signal analysis over already-loaded project data.
+
+    The body of ``GET /analysis/sentiment``; the HTML export calls it with the
+    ``_SharedProjectData`` it also hands to :func:`codebook_analysis`.
+    """
     from dataclasses import dataclass, field
 
     from bristlenose.analysis.matrix import build_section_matrix, build_theme_matrix
     from bristlenose.analysis.signals import detect_signals
     from bristlenose.models import Sentiment
 
-    db = _get_db(request)
-    try:
-        _check_project(db, project_id)
-
-        shared = _load_shared_data(db, project_id)
-        if shared is None:
-            return _empty_sentiment_response()
-
-        # Build lightweight adapter objects matching pipeline model interfaces.
-        # Only the fields used by build_section_matrix / build_theme_matrix /
-        # detect_signals are needed.
-
-        @dataclass
-        class _QuoteAdapter:
-            text: str
-            participant_id: str
-            session_id: str
-            start_timecode: float
-            sentiment: Sentiment | None
-            intensity: int
-            segment_index: int
-
-        @dataclass
-        class _ClusterAdapter:
-            screen_label: str
-            display_order: int
-            quotes: list[_QuoteAdapter] = field(default_factory=list)
-
-        @dataclass
-        class _ThemeAdapter:
-            theme_label: str
-            quotes: list[_QuoteAdapter] = field(default_factory=list)
-
-        # Build adapter quotes from DB quotes
-        adapter_quotes: dict[int, _QuoteAdapter] = {}
-        for q in shared.all_quotes:
-            sent: Sentiment | None = None
-            if q.sentiment:
-                try:
-                    sent = Sentiment(q.sentiment)
-                except ValueError:
-                    pass
-            adapter_quotes[q.id] = _QuoteAdapter(
-                text=q.text,
-                participant_id=q.participant_id,
-                session_id=q.session_id,
-                start_timecode=q.start_timecode,
-                sentiment=sent,
-                intensity=q.intensity,
-                segment_index=q.segment_index,
-            )
-
-        # Build cluster adapters
-        clusters = (
-            db.query(ScreenCluster)
-            .filter_by(project_id=project_id)
-            .order_by(ScreenCluster.display_order)
-            .all()
+    if shared is None:
+        return _empty_sentiment_response()
+
+    # Build lightweight adapter objects matching pipeline model interfaces.
+    # Only the fields used by build_section_matrix / build_theme_matrix /
+    # detect_signals are needed.
+
+    @dataclass
+    class _QuoteAdapter:
+        text: str
+        participant_id: str
+        session_id: str
+        start_timecode: float
+        sentiment: Sentiment | None
+        intensity: int
+        segment_index: int
+
+    @dataclass
+    class _ClusterAdapter:
+        screen_label: str
+        display_order: int
+        quotes: list[_QuoteAdapter] = field(default_factory=list)
+
+    @dataclass
+    class _ThemeAdapter:
+        theme_label: str
+        quotes: list[_QuoteAdapter] = field(default_factory=list)
+
+    # Build adapter quotes from DB quotes
+    adapter_quotes: dict[int, _QuoteAdapter] = {}
+    for q in shared.all_quotes:
+        sent: Sentiment | None = None
+        if q.sentiment:
+            try:
+                sent = Sentiment(q.sentiment)
+            except ValueError:
+                pass
+        adapter_quotes[q.id] = _QuoteAdapter(
+            text=q.text,
+            participant_id=q.participant_id,
+            session_id=q.session_id,
+            start_timecode=q.start_timecode,
+            sentiment=sent,
+            intensity=q.intensity,
+            segment_index=q.segment_index,
         )
-        cluster_adapters: list[_ClusterAdapter] = []
-        for c in clusters:
-            ca = _ClusterAdapter(
-                screen_label=c.screen_label,
-                display_order=c.display_order,
-            )
-            cluster_adapters.append(ca)
 
-        # Attach quotes to clusters via ClusterQuote join
-        cluster_id_to_adapter = {c.id: ca for c, ca in zip(clusters, cluster_adapters)}
-        cqs = (
-            db.query(ClusterQuote)
-            .filter(ClusterQuote.cluster_id.in_(cluster_id_to_adapter.keys()))
-            .all()
-        ) if cluster_id_to_adapter else []
-        for cq in cqs:
-            aq = adapter_quotes.get(cq.quote_id)
-            ca = cluster_id_to_adapter.get(cq.cluster_id)
-            if aq and ca:
-                ca.quotes.append(aq)
-
-        # Build theme adapters
-        themes = db.query(ThemeGroup).filter_by(project_id=project_id).all()
-        theme_adapters: list[_ThemeAdapter] = []
-        for t in themes:
-            ta = _ThemeAdapter(theme_label=t.theme_label)
-            theme_adapters.append(ta)
-
-        # Attach quotes to themes via ThemeQuote join
-        theme_id_to_adapter = {t.id: ta for t, ta in zip(themes, theme_adapters)}
-        tqs = (
-            db.query(ThemeQuote)
-            .filter(ThemeQuote.theme_id.in_(theme_id_to_adapter.keys()))
-            .all()
-        ) if theme_id_to_adapter else []
-        for tq in tqs:
-            aq = adapter_quotes.get(tq.quote_id)
-            ta = theme_id_to_adapter.get(tq.theme_id)
-            if aq and ta:
-                ta.quotes.append(aq)
-
-        # Run analysis pipeline functions
-        section_matrix = build_section_matrix(cluster_adapters)  # type: ignore[arg-type]
-        theme_matrix = build_theme_matrix(theme_adapters)  # type: ignore[arg-type]
-
-        result = detect_signals(
-            section_matrix,
-            theme_matrix,
-            cluster_adapters,  # type: ignore[arg-type]
-            theme_adapters,  # type: ignore[arg-type]
-            shared.total_participants,
-            top_n=top_n,
+    # Build cluster adapters
+    clusters = (
+        db.query(ScreenCluster)
+        .filter_by(project_id=project_id)
+        .order_by(ScreenCluster.display_order)
+        .all()
+    )
+    cluster_adapters: list[_ClusterAdapter] = []
+    for c in clusters:
+        ca = _ClusterAdapter(
+            screen_label=c.screen_label,
+            display_order=c.display_order,
         )
+        cluster_adapters.append(ca)
 
-        # Collect participant IDs
-        all_pids: set[str] = set()
-        for s in result.signals:
-            all_pids.update(s.participants)
-
-        return SentimentAnalysisResponse(
-            signals=[_serialize_sentiment_signal(s) for s in result.signals],
-            section_matrix=_serialize_sentiment_matrix(result.section_matrix),
-            theme_matrix=_serialize_sentiment_matrix(result.theme_matrix),
-            total_participants=result.total_participants,
-            sentiments=result.sentiments,
-            participant_ids=_natural_sort_pids(all_pids),
-        )
-    finally:
-        db.close()
+    # Attach quotes to clusters via ClusterQuote join
+    cluster_id_to_adapter = {c.id: ca for c, ca in zip(clusters, cluster_adapters)}
+    cqs = (
+        db.query(ClusterQuote)
+        .filter(ClusterQuote.cluster_id.in_(cluster_id_to_adapter.keys()))
+        .all()
+    ) if cluster_id_to_adapter else []
+    for cq in cqs:
+        aq = adapter_quotes.get(cq.quote_id)
+        ca = cluster_id_to_adapter.get(cq.cluster_id)
+        if aq and ca:
+            ca.quotes.append(aq)
+
+    # Build theme adapters
+    themes = db.query(ThemeGroup).filter_by(project_id=project_id).all()
+    theme_adapters: list[_ThemeAdapter] = []
+    for t in themes:
+        ta = _ThemeAdapter(theme_label=t.theme_label)
+        theme_adapters.append(ta)
+
+    # Attach quotes to themes via ThemeQuote join
+    theme_id_to_adapter = {t.id: ta for t, ta in zip(themes, theme_adapters)}
+    tqs = (
+        db.query(ThemeQuote)
+        .filter(ThemeQuote.theme_id.in_(theme_id_to_adapter.keys()))
+        .all()
+    ) if theme_id_to_adapter else []
+    for tq in tqs:
+        aq = adapter_quotes.get(tq.quote_id)
+        ta = theme_id_to_adapter.get(tq.theme_id)
+        if aq and ta:
+            ta.quotes.append(aq)
+
+    # Run analysis pipeline functions
+    section_matrix = build_section_matrix(cluster_adapters)  # type: ignore[arg-type]
+    theme_matrix = build_theme_matrix(theme_adapters)  # type: ignore[arg-type]
+
+    result = detect_signals(
+        section_matrix,
+        theme_matrix,
+        cluster_adapters,  # type: ignore[arg-type]
+        theme_adapters,  # type: ignore[arg-type]
+        shared.total_participants,
+        top_n=top_n,
+    )
+
+    # Collect participant IDs
+    all_pids: set[str] = set()
+    for s in result.signals:
+        all_pids.update(s.participants)
+
+    return SentimentAnalysisResponse(
+        signals=[_serialize_sentiment_signal(s) for s in result.signals],
+        section_matrix=_serialize_sentiment_matrix(result.section_matrix),
+        theme_matrix=_serialize_sentiment_matrix(result.theme_matrix),
+        total_participants=result.total_participants,
+        sentiments=result.sentiments,
+        participant_ids=_natural_sort_pids(all_pids),
+    )
 
 
 def _empty_sentiment_response() -> SentimentAnalysisResponse:
@@ -874,71 +886,89 @@ async def get_codebook_analysis(
     db = _get_db(request)
     try:
         _check_project(db, project_id)
-        active_groups = _resolve_active_groups(db, project_id, groups=None)
-        if not active_groups:
-            return CodebookAnalysisListResponse(
-                codebooks=[], total_participants=0, trade_off_note=_TRADE_OFF_NOTE,
-            )
+        response = codebook_analysis(
+            db, project_id, _load_shared_data(db, project_id), top_n,
+        )
 
-        shared = _load_shared_data(db, project_id)
-        if shared is None:
-            return CodebookAnalysisListResponse(
-                codebooks=[], total_participants=0, trade_off_note=_TRADE_OFF_NOTE,
-            )
+        # Generate elaborations for top N framework signals
+        if elaborate and response.codebooks:
+            await _elaborate_top_signals(response.codebooks, db, project_id)
 
-        # Partition groups by codebook identity
-        partitions: dict[str, list[CodebookGroup]] = defaultdict(list)
-        for g in active_groups:
-            key = g.framework_id or "custom"
-            partitions[key].append(g)
-
-        codebooks: list[CodebookAnalysisOut] = []
-        for codebook_id, cb_groups in partitions.items():
-            result = _compute_group_analysis(cb_groups, shared, db, top_n)
-            if result is None:
-                continue
-
-            (
-                signals, section_matrix, theme_matrix,
-                col_labels, breakdown, colour_sets, quote_tag_names,
-            ) = result
-
-            signal_pids: set[str] = set()
-            for s in signals:
-                signal_pids.update(s.participants)  # type: ignore[attr-defined]
-
-            # Resolve codebook name and representative colour_set
-            codebook_name, codebook_colour = _resolve_codebook_identity(
-                codebook_id, cb_groups,
-            )
+        return response
+    finally:
+        db.close()
 
-            # Build tag_colour_indices: tag_name -> slot index within its group
-            tag_colour_indices = _build_tag_colour_indices(cb_groups, db)
-
-            codebooks.append(CodebookAnalysisOut(
-                codebook_id=codebook_id,
-                codebook_name=codebook_name,
-                colour_set=codebook_colour,
-                signals=[_serialize_signal(s, colour_sets) for s in signals],
-                section_matrix=_serialize_matrix(section_matrix),
-                theme_matrix=_serialize_matrix(theme_matrix),
-                columns=col_labels,
-                participant_ids=_natural_sort_pids(signal_pids),
-                source_breakdown=breakdown,
-                tag_colour_indices=tag_colour_indices,
-            ))
 
-        # Generate elaborations for top N framework signals
-        if elaborate and codebooks:
-            await _elaborate_top_signals(codebooks, db, project_id)
+def codebook_analysis(
+    db: Session,
+    project_id: int,
+    shared: _SharedProjectData | None,
+    top_n: int,
+) -> CodebookAnalysisListResponse:
+    """Per-codebook signal analysis, without LLM elaboration.
 
+    The body of ``GET /analysis/codebooks``; ``shared`` is None for a
+    project with no quotes.  The HTML export passes the same
+    ``_SharedProjectData`` it hands to :func:`sentiment_analysis`.
+    """
+    active_groups = _resolve_active_groups(db, project_id, groups=None)
+    if not active_groups:
         return CodebookAnalysisListResponse(
-            codebooks=codebooks,
-            total_participants=shared.total_participants,
-            trade_off_note=_TRADE_OFF_NOTE,
+            codebooks=[], total_participants=0, trade_off_note=_TRADE_OFF_NOTE,
         )
-    finally:
-        db.close()
+
+    if shared is None:
+        return CodebookAnalysisListResponse(
+            codebooks=[], total_participants=0, trade_off_note=_TRADE_OFF_NOTE,
+        )
+
+    # Partition groups by codebook identity
+    partitions: dict[str, list[CodebookGroup]] = defaultdict(list)
+    for g in active_groups:
+        key = g.framework_id or "custom"
+        partitions[key].append(g)
+
+    codebooks: list[CodebookAnalysisOut] = []
+    for codebook_id, cb_groups in partitions.items():
+        result = _compute_group_analysis(cb_groups, shared, db, top_n)
+        if result is None:
+            continue
+
+        (
+            signals, section_matrix, theme_matrix,
+            col_labels, breakdown, colour_sets, quote_tag_names,
+        ) = result
+
+        signal_pids: set[str] = set()
+        for s in signals:
+            signal_pids.update(s.participants)  # type: ignore[attr-defined]
+
+        # Resolve codebook name and representative colour_set
+        codebook_name, codebook_colour = _resolve_codebook_identity(
+            codebook_id, cb_groups,
+        )
+
+        # Build tag_colour_indices: tag_name -> slot index within its group
+        tag_colour_indices = _build_tag_colour_indices(cb_groups, db)
+
+        codebooks.append(CodebookAnalysisOut(
+            codebook_id=codebook_id,
+            codebook_name=codebook_name,
+            colour_set=codebook_colour,
+            signals=[_serialize_signal(s, colour_sets) for s in signals],
+            section_matrix=_serialize_matrix(section_matrix),
+            theme_matrix=_serialize_matrix(theme_matrix),
+            columns=col_labels,
+            participant_ids=_natural_sort_pids(signal_pids),
+            source_breakdown=breakdown,
+            tag_colour_indices=tag_colour_indices,
+        ))
+
+    return CodebookAnalysisListResponse(
+        codebooks=codebooks,
+        total_participants=shared.total_participants,
+        trade_off_note=_TRADE_OFF_NOTE,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -11,7 +11,8 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from bristlenose.config import load_settings
-from bristlenose.server.autocode import run_autocode_job
+from bristlenose.llm.concurrency import cancel_llm_job
+from bristlenose.server.autocode import llm_job_key, run_autocode_job
 from bristlenose.server.codebook import get_template
 from bristlenose.server.models import (
     AutoCodeJob,
@@ -51,6 +52,7 @@ class AutoCodeJobOut(BaseModel):
     llm_model: str
     input_tokens: int
     output_tokens: int
+    cache_hits: int
     started_at: str
     completed_at: str | None
 
@@ -124,6 +126,7 @@ def _job_to_out(job: AutoCodeJob) -> AutoCodeJobOut:
         llm_model=job.llm_model,
         input_tokens=job.input_tokens,
         output_tokens=job.output_tokens,
+        cache_hits=job.cache_hits,
         started_at=job.started_at.isoformat() if job.started_at else "",
         completed_at=job.completed_at.isoformat() if job.completed_at else None,
     )
@@ -320,9 +323,10 @@ def cancel_autocode_job(
 ) -> AutoCodeJobOut:
     """Cancel a running AutoCode job.
 
-    Sets the job status to "cancelled".  The background job runner checks
-    this between batches and stops gracefully — in-progress LLM calls
-    complete, but no further batches are started.
+    Sets the job status to "cancelled" and drops the job's batches still
+    queued for an LLM slot.  The background job runner also checks the status
+    before each batch and stops gracefully — in-progress LLM calls complete,
+    but no further batches are started.
 
     Guards:
     - 404 if project or job not found
@@ -342,6 +346,7 @@ def cancel_autocode_job(
         job.status = "cancelled"
         job.completed_at = datetime.now(timezone.utc)
         db.commit()
+        cancel_llm_job(llm_job_key(project_id, framework_id))
         return _job_to_out(job)
 
     finally:
@@ -112,6 +112,7 @@ async def chat_lens_ask(request: Request, body: _AskRequest) -> dict[str, object
             "total_quotes": result.corpus.total_quotes,
             "hidden_excluded": result.corpus.hidden_excluded,
             "truncated": result.corpus.truncated,
+            "retrieved": result.corpus.retrieved,
             "char_count": result.corpus.char_count,
             "approx_tokens": result.corpus.char_count // 4,
         },
@@ -192,7 +193,7 @@ _CHAT_LENS_HTML = r"""<!doctype html>
 </head>
 <body>
 <h1>Chat lens <span class="pill">experiment</span></h1>
-<div class="muted">Ask one question about this project's quotes. No history, no streaming. Each ask sends the whole curated corpus to your configured LLM provider on your own key, plus a second small support-check call. What this lab is testing: <b>are the citations honest</b> — every cited claim shows its quotes and a support verdict, and both layouts (inline vs sidebar) are here to compare, because the prior art contests which one keeps you critical.</div>
+<div class="muted">Ask one question about this project's quotes. No history, no streaming. Each ask sends the curated corpus (on a large project, the quotes most relevant to the question) to your configured LLM provider on your own key, plus a second small support-check call. What this lab is testing: <b>are the citations honest</b> — every cited claim shows its quotes and a support verdict, and both layouts (inline vs sidebar) are here to compare, because the prior art contests which one keeps you critical.</div>
 
 <fieldset>
   <legend>Question</legend>
@@ -325,6 +326,7 @@ function renderAnswer(j){
   $("metaLine").textContent =
     "corpus: " + co.quote_count + " of " + co.total_quotes + " quotes"
     + (co.hidden_excluded ? " (" + co.hidden_excluded + " hidden excluded)" : "")
+    + (co.retrieved ? " (most relevant to the question)" : "")
     + (co.truncated ? " · TRUNCATED" : "")
     + " · ~" + (co.approx_tokens || 0) + " input tokens"
     + " · " + (call.provider || "?") + "/" + (call.model || "?")
@@ -1,5 +1,8 @@
 """Video clip extraction endpoints — async FFmpeg stream-copy.
 
+Clips are cut by a small pool of concurrent FFmpeg processes (sized by
+``utils/hardware.py``); clips from the same source file share a process.
+
 POST /projects/{id}/export/clips  — start extraction job
 GET  /projects/{id}/export/clips/status — poll progress
 POST /projects/{id}/export/clips/reveal — open clips folder in Finder
@@ -18,7 +21,7 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
-from bristlenose.server.clip_backend import FFmpegBackend
+from bristlenose.server.clip_backend import MAX_CUTS_PER_PROCESS, FFmpegBackend
 from bristlenose.server.clip_manifest import (
     ClipSpec,
     _QuoteLike,
@@ -188,6 +191,22 @@ def _quotes_to_quotelike(
 # ---------------------------------------------------------------------------
 
 
+def _batch_by_source(clips: list[ClipSpec]) -> list[list[int]]:
+    """Group clip indices by source file, at most MAX_CUTS_PER_PROCESS each.
+
+    Batches come out in order of each source's first clip, and clips keep
+    their manifest order within a batch.
+    """
+    by_source: dict[Path, list[int]] = {}
+    for i, spec in enumerate(clips):
+        by_source.setdefault(spec.source_path, []).append(i)
+    return [
+        indices[n:n + MAX_CUTS_PER_PROCESS]
+        for indices in by_source.values()
+        for n in range(0, len(indices), MAX_CUTS_PER_PROCESS)
+    ]
+
+
 async def _run_clip_extraction(
     project_id: int,
     clips: list[ClipSpec],
@@ -196,44 +215,66 @@ async def _run_clip_extraction(
     use_hours: bool,
     anonymise: bool,
 ) -> None:
-    """Extract clips in background. Updates module-level _jobs state."""
+    """Extract clips in background. Updates module-level _jobs state.
+
+    Batches of same-source clips run concurrently, bounded by
+    ``recommended_ffmpeg_workers()``.  ``progress`` counts finished clips.
+    Cancelling stops batches that have not started; running ones finish.
+    The manifest lists clips in spec order whatever order they finished in.
+    """
+    from bristlenose.utils.hardware import detect_hardware
+
     backend = FFmpegBackend()
     job = _jobs.get(project_id)
     if job is None:
         return
 
-    manifest_entries: list[dict] = []
-
-    for i, spec in enumerate(clips):
-        if _jobs.get(project_id, {}).get("status") == "cancelled":
-            break
-
-        filename = build_clip_filename(
-            spec, participant_count, use_hours, anonymise=anonymise,
-        )
-        output_path = clips_dir / filename
-
-        job["progress"] = i
-        job["current_clip"] = filename.rsplit(".", 1)[0]  # strip extension
-
-        # Run FFmpeg in a thread to avoid blocking the event loop
-        result = await asyncio.to_thread(
-            backend.extract_clip, spec.source_path, output_path, spec.start, spec.end,
-        )
-
-        if result is not None:
-            job["completed_count"] = job.get("completed_count", 0) + 1
-            manifest_entries.append({
-                "quote_id": spec.quote_id,
-                "participant_id": spec.participant_id,
-                "session_id": spec.session_id,
-                "filename": filename,
-                "start": spec.start,
-                "end": spec.end,
-            })
-        else:
-            job["skipped_count"] = job.get("skipped_count", 0) + 1
-            logger.warning("Skipped clip %s (extraction failed)", filename)
+    filenames = [
+        build_clip_filename(spec, participant_count, use_hours, anonymise=anonymise)
+        for spec in clips
+    ]
+    results: list[Path | None] = [None] * len(clips)
+    hw = await asyncio.to_thread(detect_hardware)
+    slots = asyncio.Semaphore(hw.recommended_ffmpeg_workers())
+    done = 0
+
+    async def _extract(batch: list[int]) -> None:
+        nonlocal done
+        async with slots:
+            if _jobs.get(project_id, {}).get("status") == "cancelled":
+                return
+            job["current_clip"] = filenames[batch[0]].rsplit(".", 1)[0]  # strip extension
+            cuts = [
+                (clips_dir / filenames[i], clips[i].start, clips[i].end) for i in batch
+            ]
+            # Run FFmpeg in a thread to avoid blocking the event loop
+            batch_results = await asyncio.to_thread(
+                backend.extract_clips, clips[batch[0]].source_path, cuts,
+            )
+        for i, result in zip(batch, batch_results):
+            results[i] = result
+            if result is not None:
+                job["completed_count"] = job.get("completed_count", 0) + 1
+            else:
+                job["skipped_count"] = job.get("skipped_count", 0) + 1
+                logger.warning("Skipped clip %s (extraction failed)", filenames[i])
+        done += len(batch)
+        job["progress"] = done
+
+    await asyncio.gather(*(_extract(batch) for batch in _batch_by_source(clips)))
+
+    manifest_entries = [
+        {
+            "quote_id": spec.quote_id,
+            "participant_id": spec.participant_id,
+            "session_id": spec.session_id,
+            "filename": filename,
+            "start": spec.start,
+            "end": spec.end,
+        }
+        for spec, filename, result in zip(clips, filenames, results)
+        if result is not None
+    ]
 
     # Write clips_manifest.json
     manifest = {
@@ -247,9 +288,9 @@ async def _run_clip_extraction(
     manifest_path = clips_dir / "clips_manifest.json"
     manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=True))
 
-    # A cancelled job broke out of the loop early — record that, don't overwrite
-    # it with "completed". Clips written before the break stay on disk (a partial
-    # folder is honest and usable), so output_dir is set either way.
+    # A cancelled job stopped starting batches — record that, don't overwrite
+    # it with "completed". Clips written before the cancel stay on disk (a
+    # partial folder is honest and usable), so output_dir is set either way.
     cancelled = _jobs.get(project_id, {}).get("status") == "cancelled"
     job["status"] = "cancelled" if cancelled else "completed"
     if not cancelled:
@@ -446,9 +487,9 @@ async def get_clip_status(
 
 @router.post("/projects/{project_id}/export/clips/cancel")
 async def cancel_clip_extraction(project_id: int) -> dict:
-    """Signal a running clip-extraction job to stop after the current clip.
+    """Signal a running clip-extraction job to stop after the clips in flight.
 
-    The background loop polls the job's status each iteration and breaks when it
+    Each batch checks the job's status before it starts and is dropped once it
     sees ``cancelled``. Clips already written stay on disk. No-op-safe: 404 when
     nothing is in flight.
     """
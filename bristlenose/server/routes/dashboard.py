@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from collections import Counter
-
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from bristlenose.server.coverage_store import load_coverage, omitted_content
 from bristlenose.server.export_core import pick_featured_quotes
 from bristlenose.server.models import (
     Person,
@@ -18,7 +18,6 @@ from bristlenose.server.models import (
     ScreenCluster,
     SessionSpeaker,
     ThemeGroup,
-    TranscriptSegment,
 )
 from bristlenose.server.models import Session as SessionModel
 
@@ -241,16 +240,6 @@ def _resolve_speaker_names(
 # Coverage calculation
 # ---------------------------------------------------------------------------
 
-# Segments with this many words or fewer are collapsed into fragment summaries.
-# Matches FRAGMENT_THRESHOLD in bristlenose/coverage.py.
-_FRAGMENT_THRESHOLD = 3
-
-
-def _is_moderator_code(code: str) -> bool:
-    """Check if a speaker code is moderator or observer (not participant)."""
-    return code.startswith("m") or code.startswith("o")
-
-
 def _format_fragments_html(fragment_counts: list[tuple[str, int]]) -> str:
     """Format fragment counts as HTML for the frontend.
 
@@ -275,69 +264,21 @@ def _calculate_coverage(
     project_id: int,
     sessions: list[SessionModel],
 ) -> CoverageResponse | None:
-    """Calculate transcript coverage from the database.
+    """Assemble transcript coverage from the precomputed per-session rows.
 
-    Mirrors the algorithm in bristlenose/coverage.py but operates on
-    SQLAlchemy models instead of pipeline dataclasses.
+    The rows are written by the importer (see ``coverage_store``); any that
+    are missing are computed here once and stored.
     """
     if not sessions:
         return None
 
-    # Build session lookup: int PK → (string session_id, session_number)
-    session_map: dict[int, tuple[str, int]] = {
-        s.id: (s.session_id, s.session_number) for s in sessions
-    }
-    session_pks = list(session_map.keys())
-
-    # Load all transcript segments for this project
-    segments = (
-        db.query(TranscriptSegment)
-        .filter(TranscriptSegment.session_id.in_(session_pks))
-        .order_by(TranscriptSegment.session_id, TranscriptSegment.start_time)
-        .all()
-    )
-    if not segments:
+    rows, recomputed = load_coverage(db, sessions)
+    if not any(row.segment_count for row in rows.values()):
         return None
 
-    # Load all quotes and build coverage ranges: string_session_id → [(start, end)]
-    quotes = db.query(Quote).filter_by(project_id=project_id).all()
-    quote_ranges: dict[str, list[tuple[float, float]]] = {}
-    for q in quotes:
-        quote_ranges.setdefault(q.session_id, []).append(
-            (q.start_timecode, q.end_timecode)
-        )
-
-    # Walk segments
-    participant_words_total = 0
-    participant_words_in_quotes = 0
-    moderator_words_total = 0
-    # string_session_id → list of (speaker_code, start_time, text, word_count)
-    omitted_raw: dict[str, list[tuple[str, float, str, int]]] = {}
-
-    for seg in segments:
-        info = session_map.get(seg.session_id)
-        if not info:
-            continue
-        str_sid = info[0]
-        code = seg.speaker_code
-        text = seg.text
-        wc = len(text.split())
-
-        if _is_moderator_code(code):
-            moderator_words_total += wc
-        else:
-            # Participant (or unknown code — treat as participant)
-            participant_words_total += wc
-            ranges = quote_ranges.get(str_sid, [])
-            is_covered = any(
-                start <= seg.start_time <= end for start, end in ranges
-            )
-            if is_covered:
-                participant_words_in_quotes += wc
-            else:
-                omitted_raw.setdefault(str_sid, []).append(
-                    (code, seg.start_time, text, wc)
-                )
+    participant_words_total = sum(r.participant_words for r in rows.values())
+    participant_words_in_quotes = sum(r.participant_words_in_quotes for r in rows.values())
+    moderator_words_total = sum(r.moderator_words for r in rows.values())
 
     # Percentages
     total_words = participant_words_total + moderator_words_total
@@ -352,39 +293,23 @@ def _calculate_coverage(
         pct_moderator = 0
         pct_omitted = 0
 
-    # Build per-session omitted with fragment collapsing
-    # Sort by session number for stable output
-    str_sid_to_num: dict[str, int] = {
-        s.session_id: s.session_number for s in sessions
-    }
-    sorted_sids = sorted(
-        omitted_raw.keys(),
-        key=lambda sid: str_sid_to_num.get(sid, 0),
-    )
-
+    # Per-session omitted content, sorted by session number for stable output
     omitted_sessions: list[SessionOmittedResponse] = []
-    for str_sid in sorted_sids:
-        raw = omitted_raw[str_sid]
-        full_segs: list[OmittedSegmentResponse] = []
-        fragments: list[str] = []
-
-        for code, start_time, text, wc in raw:
-            if wc > _FRAGMENT_THRESHOLD:
-                full_segs.append(OmittedSegmentResponse(
-                    speaker_code=code,
-                    start_time=start_time,
-                    text=text,
-                    session_id=str_sid,
-                ))
-            else:
-                fragments.append(text)
-
-        fragment_counts = Counter(fragments).most_common()
-        frags_html = _format_fragments_html(fragment_counts)
-
+    for sess in sorted(sessions, key=lambda s: s.session_number):
+        full, fragment_counts = omitted_content(rows[sess.id])
         # Skip sessions with nothing omitted
-        if not full_segs and not fragment_counts:
+        if not full and not fragment_counts:
             continue
+        full_segs = [
+            OmittedSegmentResponse(
+                speaker_code=code,
+                start_time=start_time,
+                text=text,
+                session_id=sess.session_id,
+            )
+            for code, start_time, text in full
+        ]
+        frags_html = _format_fragments_html(fragment_counts)
 
         # Prepend "Also omitted:" label only when there are full segments above
         if full_segs and fragment_counts:
@@ -407,18 +332,24 @@ def _calculate_coverage(
             frags_html = ", ".join(parts)
 
         omitted_sessions.append(SessionOmittedResponse(
-            session_number=str_sid_to_num.get(str_sid, 0),
-            session_id=str_sid,
+            session_number=sess.session_number,
+            session_id=sess.session_id,
             full_segments=full_segs,
             fragments_html=frags_html,
         ))
 
-    return CoverageResponse(
+    coverage = CoverageResponse(
         pct_in_report=pct_in_report,
         pct_moderator=pct_moderator,
         pct_omitted=pct_omitted,
         omitted_by_session=omitted_sessions,
     )
+    if recomputed:
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()  # a concurrent load stored the same rows first
+    return coverage
 
 
 # ---------------------------------------------------------------------------
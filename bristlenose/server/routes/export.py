@@ -87,8 +87,16 @@ SERVER_ONLY_PATH_TEMPLATES: frozenset[str] = frozenset(
         "/projects/{project_id}/last-run",  # live run status
         "/projects/{project_id}/miro/auth-url",
         "/projects/{project_id}/miro/status",
+        "/projects/{project_id}/quotes/index",  # windowed /quotes; export embeds it whole
+        "/projects/{project_id}/quotes/search",  # no SPA callers; FTS5 needs the DB
+        "/projects/{project_id}/quotes/sections/{cluster_id}",  # windowed /quotes
+        "/projects/{project_id}/quotes/themes/{theme_id}",  # windowed /quotes
+        "/projects/{project_id}/quotes/uncategorised",  # windowed /quotes
         "/projects/{project_id}/starred",  # write-mirror; baked into /quotes
         "/projects/{project_id}/tags",  # write-mirror; baked into /quotes
+        # Raw .bnwt word columns; no SPA callers yet, and the embedded
+        # /transcripts/{session_id} already carries each segment's words.
+        "/projects/{project_id}/transcripts/{session_id}/words",
     }
 )
 
@@ -341,12 +349,12 @@ def export_report(
     Gathers all API data, embeds it in the React SPA shell, and returns
     a downloadable HTML file.
     """
-    from bristlenose.server.models import Quote
+    from bristlenose.server.models import Project
+    from bristlenose.server.models import Session as SessionModel
     from bristlenose.server.routes.analysis import (
-        get_codebook_analysis as _get_codebook_analysis_handler,
-    )
-    from bristlenose.server.routes.analysis import (
-        get_sentiment_analysis as _get_sentiment_analysis_handler,
+        _load_shared_data,
+        codebook_analysis,
+        sentiment_analysis,
     )
     from bristlenose.server.routes.codebook import get_codebook as _get_codebook_handler
     from bristlenose.server.routes.dashboard import (
@@ -362,87 +370,63 @@ def export_report(
         get_hidden_tag_groups as _get_hidden_tag_groups_handler,
     )
     from bristlenose.server.routes.data import get_people as _get_people_handler
-    from bristlenose.server.routes.quotes import _quote_dom_id
-    from bristlenose.server.routes.quotes import (
-        get_moderator_question as _get_moderator_question_handler,
-    )
-    from bristlenose.server.routes.quotes import get_quotes as _get_quotes_handler
+    from bristlenose.server.routes.quotes import moderator_questions as _moderator_questions
+    from bristlenose.server.routes.quotes import quotes_payload as _quotes_payload
     from bristlenose.server.routes.sessions import get_sessions as _get_sessions_handler
-    from bristlenose.server.routes.transcript import (
-        get_transcript as _get_transcript_handler,
-    )
+    from bristlenose.server.routes.transcript import transcript_pages as _transcript_pages
     from bristlenose.utils.text import slugify
 
-    # --- Gather data by calling existing route handlers ---
-    # Each handler manages its own DB session (opens + closes).  We embed the
-    # handlers' OWN return values serialised through FastAPI's jsonable_encoder
-    # (the exact serializer the HTTP path uses), so the offline shape can never
-    # drift from what the SPA sees over the wire.
+    # --- Gather data ---
+    # We embed the route handlers' OWN return values (or the builders behind
+    # them) serialised through FastAPI's jsonable_encoder — the exact
+    # serializer the HTTP path uses — so the offline shape can never drift
+    # from what the SPA sees over the wire.
 
     project_info = _get_project_info_handler(project_id, request)
     dashboard = _get_dashboard_handler(project_id, request)
-    quotes = _get_quotes_handler(project_id, request)
+    # The cached GET /quotes body itself — byte-for-byte what the SPA sees.
+    quotes = json.loads(_quotes_payload(project_id, request)[1])
     codebook = _get_codebook_handler(project_id, request)
     people = _get_people_handler(project_id, request)
     framework_states = _get_framework_states_handler(project_id, request)
     hidden_tag_groups = _get_hidden_tag_groups_handler(project_id, request)
 
-    # get_sessions uses Depends(_get_db) — call with explicit db
+    # The heavy payloads — both analyses, every transcript, every moderator
+    # question — come from one DB session and a fixed number of queries.
+    # Calling their handlers instead cost a session and a full reload of the
+    # project's quotes per analysis, and several queries per transcript and
+    # per quote.
     db = request.app.state.db_factory()
     try:
+        project = db.get(Project, project_id)
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
         sessions = _get_sessions_handler(project_id, db=db)
-    finally:
-        db.close()
-
-    # Sentiment analysis
-    sentiment = _get_sentiment_analysis_handler(project_id, request, top_n=20)
-
-    # Codebook analysis (async handler — call synchronously in this context)
-    # The handler is async only because of optional LLM elaboration.
-    # For export, we skip elaboration (elaborate=False) and call it in a
-    # synchronous context.  FastAPI route handlers can call async functions
-    # via asyncio.run() if needed, but get_codebook_analysis without
-    # elaborate=True is effectively sync.
-    import asyncio
 
-    codebook_analysis = asyncio.run(
-        _get_codebook_analysis_handler(project_id, request, top_n=20, elaborate=False)
-    )
-
-    # Transcripts — one embed key per session
-    transcripts: dict[str, object] = {}
-    for sess in dashboard.sessions:
-        try:
-            transcripts[sess.session_id] = _get_transcript_handler(
-                request, project_id, sess.session_id
+        # Sentiment and codebook analysis share one load of the quote set.
+        shared = _load_shared_data(db, project_id)
+        sentiment = sentiment_analysis(db, project_id, shared, top_n=20)
+        # No LLM elaboration offline.
+        codebook_analysis_out = codebook_analysis(db, project_id, shared, top_n=20)
+
+        # Transcripts — one embed key per dashboard session
+        dashboard_sids = [sess.session_id for sess in dashboard.sessions]
+        session_rows = {
+            row.session_id: row
+            for row in db.query(SessionModel).filter(
+                SessionModel.project_id == project_id,
+                SessionModel.session_id.in_(dashboard_sids),
             )
-        except HTTPException as exc:
-            # 404 = legitimately no transcript for this session (skip it). Any
-            # other status is a real failure — don't swallow it into a session
-            # that's silently absent from the embed and RouteErrors when the
-            # recipient clicks it offline.
-            if exc.status_code != 404:
-                raise
-            logger.warning("Export: transcript not found for %s", sess.session_id)
-
-    # Moderator questions — one embed key per quote that HAS a preceding
-    # moderator utterance.  Absence (404) is legitimate, not a coverage gap.
-    mod_db = request.app.state.db_factory()
-    try:
-        dom_ids = [
-            _quote_dom_id(q)
-            for q in mod_db.query(Quote).filter_by(project_id=project_id).all()
-        ]
+        }
+        transcripts = _transcript_pages(
+            db, project, [session_rows[sid] for sid in dashboard_sids if sid in session_rows],
+        )
+
+        # Moderator questions — one embed key per quote that HAS a preceding
+        # moderator utterance.  Absence is legitimate, not a coverage gap.
+        moderator_questions = _moderator_questions(db, project_id)
     finally:
-        mod_db.close()
-    moderator_questions: dict[str, Any] = {}
-    for dom_id in dom_ids:
-        try:
-            moderator_questions[dom_id] = _get_moderator_question_handler(
-                project_id, dom_id, request
-            )
-        except HTTPException:
-            pass  # no preceding moderator segment — normal, skip
+        db.close()
 
     # --- Assemble the path-keyed embed (keys = relative API paths the SPA calls) ---
     endpoints: dict[str, Any] = {
@@ -454,7 +438,7 @@ def export_report(
         "/people": jsonable_encoder(people),
         "/video-map": None,
         "/analysis/sentiment": jsonable_encoder(sentiment),
-        "/analysis/codebooks": jsonable_encoder(codebook_analysis),
+        "/analysis/codebooks": jsonable_encoder(codebook_analysis_out),
         "/framework-states": jsonable_encoder(framework_states),
         "/hidden-tag-groups": jsonable_encoder(hidden_tag_groups),
     }
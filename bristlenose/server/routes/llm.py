@@ -0,0 +1,31 @@
+"""LLM scheduler endpoint — queue depth and waits for the shared LLM window.
+
+Every serve-mode LLM request (chat, elaboration, codebook builder, AutoCode)
+and any pipeline run in this process queues for a slot at its provider's
+``ConcurrencyController`` (``bristlenose/llm/concurrency.py``). This endpoint
+reports that queue so the UI can explain a slow answer ("waiting behind
+AutoCode") instead of looking hung.
+
+Read-only and cheap (no provider call); behind the bearer token like every
+other ``/api/*`` route.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from bristlenose.llm.concurrency import queue_snapshot
+
+router = APIRouter(prefix="/api")
+
+
+@router.get("/llm/queue")
+def llm_queue() -> dict[str, object]:
+    """Per-provider window, requests in flight, and queue depth and waits.
+
+    ``priorities`` splits the queue by scheduling class (``interactive``,
+    ``normal``, ``background``) with the oldest queued request's wait and
+    the mean wait of recently granted ones; ``jobs`` counts queued requests
+    per job key. Providers appear once they have served a request.
+    """
+    return {"providers": queue_snapshot()}
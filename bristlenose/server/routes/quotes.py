@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Request
+import base64
+import json
+from bisect import bisect_left
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
+from sqlalchemy import case, func, tuple_
 from sqlalchemy.orm import Session
 
 from bristlenose.server.models import (
@@ -27,6 +34,7 @@ from bristlenose.server.models import (
     TranscriptSegment,
 )
 from bristlenose.server.models import Session as SessionModel
+from bristlenose.server.read_model import ProjectionCache, etag_matches, projection_etag
 
 router = APIRouter(prefix="/api")
 
@@ -204,21 +212,56 @@ def _resolve_speaker_names(
 
     Falls back to speaker_code if no name is set.
     """
-    sessions = db.query(SessionModel).filter_by(project_id=project_id).all()
-    result: dict[tuple[str, str], str] = {}
-    for sess in sessions:
-        speakers = (
-            db.query(SessionSpeaker).filter_by(session_id=sess.id).all()
+    rows = (
+        db.query(
+            SessionModel.session_id,
+            SessionSpeaker.speaker_code,
+            Person.short_name,
+            Person.full_name,
         )
-        for sp in speakers:
-            person = db.get(Person, sp.person_id)
-            name = ""
-            if person:
-                name = person.short_name or person.full_name or ""
-            result[(sess.session_id, sp.speaker_code)] = name or sp.speaker_code
+        .join(SessionSpeaker, SessionSpeaker.session_id == SessionModel.id)
+        .outerjoin(Person, Person.id == SessionSpeaker.person_id)
+        .filter(SessionModel.project_id == project_id)
+    )
+    result: dict[tuple[str, str], str] = {}
+    for session_id, code, short_name, full_name in rows:
+        result[(session_id, code)] = short_name or full_name or code
     return result
 
 
+def _group_tag_order(db: Session, group_ids: set[int]) -> dict[int, list[int]]:
+    """TagDefinition ids per codebook group in id order, in one query.
+
+    A tag's colour_index is its position in this list.
+    """
+    order: dict[int, list[int]] = {gid: [] for gid in group_ids}
+    if group_ids:
+        for td_id, gid in (
+            db.query(TagDefinition.id, TagDefinition.codebook_group_id)
+            .filter(TagDefinition.codebook_group_id.in_(group_ids))
+            .order_by(TagDefinition.id)
+        ):
+            order[gid].append(td_id)
+    return order
+
+
+def _has_moderator(db: Session, project_id: int) -> bool:
+    """Does any session have a moderator speaker (speaker_code "m…")?
+
+    Solo sessions (no moderator) shouldn't offer the "Question?" pill on
+    quotes.
+    """
+    return db.query(
+        db.query(TranscriptSegment)
+        .join(SessionModel, TranscriptSegment.session_id == SessionModel.id)
+        .filter(
+            SessionModel.project_id == project_id,
+            TranscriptSegment.speaker_code.like("m%"),
+        )
+        .exists()
+    ).scalar() or False
+
+
 def _load_researcher_state(
     db: Session, project_id: int, quote_ids: list[int],
 ) -> tuple[
@@ -262,16 +305,7 @@ def _load_researcher_state(
         .all()
     )
     # Build colour_index lookup: position of each tag within its group
-    tag_group_ids = {row[3] for row in tag_rows}  # codebook_group_id
-    tag_group_td_order: dict[int, list[int]] = {}
-    for gid in tag_group_ids:
-        tds = (
-            db.query(TagDefinition.id)
-            .filter_by(codebook_group_id=gid)
-            .order_by(TagDefinition.id)
-            .all()
-        )
-        tag_group_td_order[gid] = [td_id for (td_id,) in tds]
+    tag_group_td_order = _group_tag_order(db, {row[3] for row in tag_rows})
 
     tags_map: dict[int, list[TagResponse]] = {}
     for qt, tag_name, td_id, group_id, group_name, colour_set in tag_rows:
@@ -326,16 +360,7 @@ def _load_researcher_state(
             .all()
         )
         # Build colour_index lookup: position of each tag within its group
-        group_ids = {row[3] for row in proposed_rows}  # codebook_group_id
-        group_td_order: dict[int, list[int]] = {}
-        for gid in group_ids:
-            tds = (
-                db.query(TagDefinition.id)
-                .filter_by(codebook_group_id=gid)
-                .order_by(TagDefinition.id)
-                .all()
-            )
-            group_td_order[gid] = [td_id for (td_id,) in tds]
+        group_td_order = _group_tag_order(db, {row[3] for row in proposed_rows})
 
         for pt, tag_name, td_id, group_id, group_name, colour_set in proposed_rows:
             td_ids = group_td_order.get(group_id, [])
@@ -401,166 +426,575 @@ def _build_quote_response(
 def get_quotes(
     project_id: int,
     request: Request,
-) -> QuotesListResponse:
-    """Return all quotes for a project grouped by section and theme."""
+) -> Response:
+    """Return all quotes for a project grouped by section and theme.
+
+    Served from the per-revision projection cache with an ETag; a matching
+    ``If-None-Match`` gets a bodiless 304.
+    """
+    etag, body = quotes_payload(project_id, request)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+def quotes_payload(project_id: int, request: Request) -> tuple[str, bytes]:
+    """``(etag, JSON body)`` for ``GET /quotes`` — cached per project revision.
+
+    The revision is read in the same transaction as the build, so a body is
+    never filed under a revision newer than the data it was built from.
+    """
+    cache: ProjectionCache = request.app.state.projections
     db = _get_db(request)
     try:
-        _check_project(db, project_id)
+        project = _check_project(db, project_id)
+        etag = projection_etag(project, "quotes")
+        body = cache.get("quotes", project_id, etag)
+        if body is None:
+            body = _build_quotes(db, project_id).model_dump_json().encode("utf-8")
+            cache.put("quotes", project_id, etag, body)
+        return etag, body
+    finally:
+        db.close()
 
-        # Load all quotes
-        all_quotes = db.query(Quote).filter_by(project_id=project_id).all()
-        quote_by_id: dict[int, Quote] = {q.id: q for q in all_quotes}
-        quote_ids = list(quote_by_id.keys())
 
-        # Load grouping joins
-        cluster_quotes = (
-            db.query(ClusterQuote).filter(ClusterQuote.quote_id.in_(quote_ids)).all()
-            if quote_ids else []
-        )
-        cluster_to_quotes: dict[int, list[int]] = {}
-        for cq in cluster_quotes:
-            cluster_to_quotes.setdefault(cq.cluster_id, []).append(cq.quote_id)
+def _build_quotes(db: Session, project_id: int) -> QuotesListResponse:
+    """Walk every quote, join and researcher-state row into the full payload."""
+    # Load all quotes
+    all_quotes = db.query(Quote).filter_by(project_id=project_id).all()
+    quote_by_id: dict[int, Quote] = {q.id: q for q in all_quotes}
+    quote_ids = list(quote_by_id.keys())
 
-        theme_quotes = (
-            db.query(ThemeQuote).filter(ThemeQuote.quote_id.in_(quote_ids)).all()
-            if quote_ids else []
-        )
-        theme_to_quotes: dict[int, list[int]] = {}
-        for tq in theme_quotes:
-            theme_to_quotes.setdefault(tq.theme_id, []).append(tq.quote_id)
+    # Load grouping joins
+    cluster_quotes = (
+        db.query(ClusterQuote).filter(ClusterQuote.quote_id.in_(quote_ids)).all()
+        if quote_ids else []
+    )
+    cluster_to_quotes: dict[int, list[int]] = {}
+    for cq in cluster_quotes:
+        cluster_to_quotes.setdefault(cq.cluster_id, []).append(cq.quote_id)
 
-        # Load researcher state
-        state_map, edit_map, tags_map, badges_map, proposed_map = (
-            _load_researcher_state(db, project_id, quote_ids)
+    theme_quotes = (
+        db.query(ThemeQuote).filter(ThemeQuote.quote_id.in_(quote_ids)).all()
+        if quote_ids else []
+    )
+    theme_to_quotes: dict[int, list[int]] = {}
+    for tq in theme_quotes:
+        theme_to_quotes.setdefault(tq.theme_id, []).append(tq.quote_id)
+
+    # Load researcher state
+    state_map, edit_map, tags_map, badges_map, proposed_map = (
+        _load_researcher_state(db, project_id, quote_ids)
+    )
+
+    # Resolve speaker names
+    speaker_map = _resolve_speaker_names(db, project_id)
+
+    # Researcher heading renames, keyed on the durable cluster/theme id
+    # (Phase 2).  Applied as edited_label/edited_description below.
+    heading_edits = {
+        he.heading_key: he.edited_text
+        for he in db.query(HeadingEdit).filter_by(project_id=project_id).all()
+    }
+
+    # "New" flag (Phase 3, M3 gate): interviews added in the latest import.
+    new_session_ids, new_since = _new_session_ids(db, project_id)
+
+    # Build sections (screen clusters ordered by display_order)
+    clusters = (
+        db.query(ScreenCluster)
+        .filter_by(project_id=project_id)
+        .order_by(ScreenCluster.display_order)
+        .all()
+    )
+    sections: list[SectionResponse] = []
+    for cluster in clusters:
+        qids = cluster_to_quotes.get(cluster.id, [])
+        quotes = [quote_by_id[qid] for qid in qids if qid in quote_by_id]
+        quotes.sort(key=lambda q: q.start_timecode)
+        sections.append(SectionResponse(
+            cluster_id=cluster.id,
+            screen_label=cluster.screen_label,
+            description=cluster.description,
+            display_order=cluster.display_order,
+            edited_label=heading_edits.get(f"section-cluster-{cluster.id}:title"),
+            edited_description=heading_edits.get(
+                f"section-cluster-{cluster.id}:desc"
+            ),
+            is_new=_group_is_new(quotes, new_session_ids),
+            quotes=[
+                _build_quote_response(
+                    q, state_map, edit_map, tags_map, badges_map,
+                    proposed_map, speaker_map,
+                )
+                for q in quotes
+            ],
+        ))
+
+    # Build themes
+    themes_db = (
+        db.query(ThemeGroup).filter_by(project_id=project_id).all()
+    )
+    themes: list[ThemeResponse] = []
+    for theme in themes_db:
+        qids = theme_to_quotes.get(theme.id, [])
+        quotes = [quote_by_id[qid] for qid in qids if qid in quote_by_id]
+        quotes.sort(key=lambda q: (q.session_id, q.start_timecode))
+        themes.append(ThemeResponse(
+            theme_id=theme.id,
+            theme_label=theme.theme_label,
+            description=theme.description,
+            edited_label=heading_edits.get(f"theme-group-{theme.id}:title"),
+            edited_description=heading_edits.get(f"theme-group-{theme.id}:desc"),
+            is_new=_group_is_new(quotes, new_session_ids),
+            quotes=[
+                _build_quote_response(
+                    q, state_map, edit_map, tags_map, badges_map,
+                    proposed_map, speaker_map,
+                )
+                for q in quotes
+            ],
+        ))
+
+    # Uncategorised floor: pinned quotes with no section/theme join (see the
+    # retire path in importer._cleanup_stale_data).  A join-less quote only
+    # survives the importer if it is pinned, so this is exactly the
+    # researcher's protected quotes that lost their home.  Reuses the
+    # importer's pin predicate so the two never drift.
+    from bristlenose.server.importer import _pinned_quote_ids
+    grouped_ids = {qid for qids in cluster_to_quotes.values() for qid in qids}
+    grouped_ids |= {qid for qids in theme_to_quotes.values() for qid in qids}
+    uncat_quotes = [
+        quote_by_id[qid]
+        for qid in _pinned_quote_ids(db, project_id)
+        if qid in quote_by_id and qid not in grouped_ids
+    ]
+    uncat_quotes.sort(key=lambda q: (q.session_id, q.start_timecode))
+    uncategorised = [
+        _build_quote_response(
+            q, state_map, edit_map, tags_map, badges_map,
+            proposed_map, speaker_map,
         )
+        for q in uncat_quotes
+    ]
 
-        # Resolve speaker names
-        speaker_map = _resolve_speaker_names(db, project_id)
+    # Summary counts
+    total_hidden = sum(
+        1 for s in state_map.values() if s.is_hidden
+    )
+    total_starred = sum(
+        1 for s in state_map.values() if s.is_starred
+    )
+
+    return QuotesListResponse(
+        sections=sections,
+        themes=themes,
+        uncategorised=uncategorised,
+        total_quotes=len(all_quotes),
+        total_hidden=total_hidden,
+        total_starred=total_starred,
+        total_uncategorised=len(uncategorised),
+        has_moderator=_has_moderator(db, project_id),
+        new_since=new_since,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Search endpoint
+# ---------------------------------------------------------------------------
+
+
+class QuoteSearchResponse(BaseModel):
+    """Ranked quote matches — DOM ids only; the card data is already loaded."""
+
+    query: str
+    total: int
+    dom_ids: list[str]
 
-        # Researcher heading renames, keyed on the durable cluster/theme id
-        # (Phase 2).  Applied as edited_label/edited_description below.
-        heading_edits = {
-            he.heading_key: he.edited_text
-            for he in db.query(HeadingEdit).filter_by(project_id=project_id).all()
-        }
-
-        # "New" flag (Phase 3, M3 gate): interviews added in the latest import.
-        new_session_ids, new_since = _new_session_ids(db, project_id)
-
-        # Build sections (screen clusters ordered by display_order)
-        clusters = (
-            db.query(ScreenCluster)
-            .filter_by(project_id=project_id)
-            .order_by(ScreenCluster.display_order)
+
+@router.get(
+    "/projects/{project_id}/quotes/search",
+    response_model=QuoteSearchResponse,
+)
+def search_quotes(
+    project_id: int,
+    request: Request,
+    q: str = "",
+    limit: int = Query(default=200, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+) -> QuoteSearchResponse:
+    """Full-text search over effective quote text, best match first.
+
+    Words are ANDed, ``"quoted words"`` match as a phrase and ``word*`` is a
+    prefix — see :mod:`bristlenose.server.quote_search`. Hidden quotes are
+    included: hiding is a view filter the frontend already applies. Without
+    an FTS5 index the same quotes match, in session order rather than by
+    rank.
+    """
+    from bristlenose.server.quote_search import (
+        fallback_filter,
+        match_subquery,
+        quote_index_available,
+        to_match_query,
+    )
+
+    db = _get_db(request)
+    try:
+        _check_project(db, project_id)
+        matches = db.query(Quote).filter(Quote.project_id == project_id)
+        order: list = []
+        expr = to_match_query(q)
+        if not expr:
+            return QuoteSearchResponse(query=q, total=0, dom_ids=[])
+        if quote_index_available(db):
+            ranked = match_subquery(project_id, expr)
+            matches = matches.join(ranked, ranked.c.quote_id == Quote.id)
+            order.append(ranked.c.rank)
+        else:
+            matches = matches.filter(fallback_filter(q))
+        total = matches.order_by(None).count()
+        page = (
+            matches.order_by(*order, Quote.session_id, Quote.start_timecode)
+            .offset(offset)
+            .limit(limit)
             .all()
         )
-        sections: list[SectionResponse] = []
-        for cluster in clusters:
-            qids = cluster_to_quotes.get(cluster.id, [])
-            quotes = [quote_by_id[qid] for qid in qids if qid in quote_by_id]
-            quotes.sort(key=lambda q: q.start_timecode)
-            sections.append(SectionResponse(
-                cluster_id=cluster.id,
-                screen_label=cluster.screen_label,
-                description=cluster.description,
-                display_order=cluster.display_order,
-                edited_label=heading_edits.get(f"section-cluster-{cluster.id}:title"),
-                edited_description=heading_edits.get(
-                    f"section-cluster-{cluster.id}:desc"
-                ),
-                is_new=_group_is_new(quotes, new_session_ids),
-                quotes=[
-                    _build_quote_response(
-                        q, state_map, edit_map, tags_map, badges_map,
-                        proposed_map, speaker_map,
-                    )
-                    for q in quotes
-                ],
-            ))
-
-        # Build themes
-        themes_db = (
-            db.query(ThemeGroup).filter_by(project_id=project_id).all()
+        return QuoteSearchResponse(
+            query=q, total=total, dom_ids=[_quote_dom_id(quote) for quote in page],
         )
-        themes: list[ThemeResponse] = []
-        for theme in themes_db:
-            qids = theme_to_quotes.get(theme.id, [])
-            quotes = [quote_by_id[qid] for qid in qids if qid in quote_by_id]
-            quotes.sort(key=lambda q: (q.session_id, q.start_timecode))
-            themes.append(ThemeResponse(
-                theme_id=theme.id,
-                theme_label=theme.theme_label,
-                description=theme.description,
-                edited_label=heading_edits.get(f"theme-group-{theme.id}:title"),
-                edited_description=heading_edits.get(f"theme-group-{theme.id}:desc"),
-                is_new=_group_is_new(quotes, new_session_ids),
-                quotes=[
-                    _build_quote_response(
-                        q, state_map, edit_map, tags_map, badges_map,
-                        proposed_map, speaker_map,
-                    )
-                    for q in quotes
-                ],
-            ))
-
-        # Uncategorised floor: pinned quotes with no section/theme join (see the
-        # retire path in importer._cleanup_stale_data).  A join-less quote only
-        # survives the importer if it is pinned, so this is exactly the
-        # researcher's protected quotes that lost their home.  Reuses the
-        # importer's pin predicate so the two never drift.
-        from bristlenose.server.importer import _pinned_quote_ids
-        grouped_ids = {qid for qids in cluster_to_quotes.values() for qid in qids}
-        grouped_ids |= {qid for qids in theme_to_quotes.values() for qid in qids}
-        uncat_quotes = [
-            quote_by_id[qid]
-            for qid in _pinned_quote_ids(db, project_id)
-            if qid in quote_by_id and qid not in grouped_ids
-        ]
-        uncat_quotes.sort(key=lambda q: (q.session_id, q.start_timecode))
-        uncategorised = [
-            _build_quote_response(
-                q, state_map, edit_map, tags_map, badges_map,
-                proposed_map, speaker_map,
-            )
-            for q in uncat_quotes
-        ]
+    finally:
+        db.close()
+
+
+# ---------------------------------------------------------------------------
+# Windowed endpoints — an index of counts, then quotes one group-page at a time
+# ---------------------------------------------------------------------------
+#
+# ``GET /quotes`` serialises the whole project before the first byte leaves;
+# at 10k quotes that is megabytes of JSON the browser parses up front.  The
+# index below carries every section/theme header with counts only, and each
+# group's quotes are fetched as it scrolls into view — keyset-paginated, so a
+# page costs the same at the end of a long section as at the start, and a
+# quote added mid-scroll never shifts later pages.  Both carry the project
+# revision ETag (see read_model.py).
+
+
+class SectionSummary(BaseModel):
+    """A section header for the index (SectionResponse without its quotes)."""
+
+    cluster_id: int
+    screen_label: str
+    description: str
+    display_order: int
+    edited_label: str | None = None
+    edited_description: str | None = None
+    is_new: bool = False
+    quote_count: int
+
+
+class ThemeSummary(BaseModel):
+    """A theme header for the index (ThemeResponse without its quotes)."""
+
+    theme_id: int
+    theme_label: str
+    description: str
+    edited_label: str | None = None
+    edited_description: str | None = None
+    is_new: bool = False
+    quote_count: int
+
+
+class QuotesIndexResponse(BaseModel):
+    """Section/theme headers and project counts — no quotes."""
+
+    sections: list[SectionSummary]
+    themes: list[ThemeSummary]
+    total_quotes: int
+    total_hidden: int
+    total_starred: int
+    total_uncategorised: int
+    has_moderator: bool
+    new_since: str | None = None
+
+
+class QuotesPageResponse(BaseModel):
+    """One page of a group's quotes; ``next_cursor`` is null on the last page."""
+
+    quotes: list[QuoteResponse]
+    next_cursor: str | None = None
+
+
+_DEFAULT_PAGE = 50
+_MAX_PAGE = 500
+
+
+def _encode_cursor(values: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode()).decode()
+
+
+def _decode_cursor(cursor: str, arity: int) -> tuple:
+    """The sort key a cursor resumes after; 400 on anything malformed."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:  # bad base64, bad UTF-8 and bad JSON alike
+        values = None
+    if (
+        not isinstance(values, list)
+        or len(values) != arity
+        or not all(isinstance(v, (str, int, float)) for v in values)
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple(values)
+
+
+def _revalidate(request: Request, etag: str) -> Response | None:
+    """A 304 when the client already holds this revision, else None."""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
 
-        # Summary counts
-        total_hidden = sum(
-            1 for s in state_map.values() if s.is_hidden
+def _json(body: bytes, etag: str) -> Response:
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+@router.get(
+    "/projects/{project_id}/quotes/index",
+    response_model=QuotesIndexResponse,
+)
+def get_quotes_index(project_id: int, request: Request) -> Response:
+    """Every section and theme header with its quote count — no quotes."""
+    cache: ProjectionCache = request.app.state.projections
+    db = _get_db(request)
+    try:
+        project = _check_project(db, project_id)
+        etag = projection_etag(project, "quotes-index")
+        if (not_modified := _revalidate(request, etag)) is not None:
+            return not_modified
+        body = cache.get("quotes-index", project_id, etag)
+        if body is None:
+            body = _build_quotes_index(db, project_id).model_dump_json().encode("utf-8")
+            cache.put("quotes-index", project_id, etag, body)
+        return _json(body, etag)
+    finally:
+        db.close()
+
+
+def _build_quotes_index(db: Session, project_id: int) -> QuotesIndexResponse:
+    """Counts by GROUP BY; no quote row is loaded."""
+    new_session_ids, new_since = _new_session_ids(db, project_id)
+    is_new_quote = case((Quote.session_id.in_(new_session_ids), 1), else_=0)
+    heading_edits = {
+        he.heading_key: he.edited_text
+        for he in db.query(HeadingEdit).filter_by(project_id=project_id)
+    }
+
+    def _counts(join_model: type, group_col: Any) -> dict[int, tuple[int, int]]:
+        rows = (
+            db.query(group_col, func.count(Quote.id), func.sum(is_new_quote))
+            .join(Quote, Quote.id == join_model.quote_id)
+            .filter(Quote.project_id == project_id)
+            .group_by(group_col)
         )
-        total_starred = sum(
-            1 for s in state_map.values() if s.is_starred
+        return {gid: (n, new or 0) for gid, n, new in rows}
+
+    def _is_new(n: int, new: int) -> bool:
+        # Same M3 gate as _group_is_new, from counts.
+        return bool(new_session_ids) and n > 0 and new / n >= _NEW_MATERIAL_FRACTION
+
+    section_counts = _counts(ClusterQuote, ClusterQuote.cluster_id)
+    sections = []
+    for cluster in (
+        db.query(ScreenCluster)
+        .filter_by(project_id=project_id)
+        .order_by(ScreenCluster.display_order)
+    ):
+        n, new = section_counts.get(cluster.id, (0, 0))
+        sections.append(SectionSummary(
+            cluster_id=cluster.id,
+            screen_label=cluster.screen_label,
+            description=cluster.description,
+            display_order=cluster.display_order,
+            edited_label=heading_edits.get(f"section-cluster-{cluster.id}:title"),
+            edited_description=heading_edits.get(f"section-cluster-{cluster.id}:desc"),
+            is_new=_is_new(n, new),
+            quote_count=n,
+        ))
+
+    theme_counts = _counts(ThemeQuote, ThemeQuote.theme_id)
+    themes = []
+    for theme in db.query(ThemeGroup).filter_by(project_id=project_id):
+        n, new = theme_counts.get(theme.id, (0, 0))
+        themes.append(ThemeSummary(
+            theme_id=theme.id,
+            theme_label=theme.theme_label,
+            description=theme.description,
+            edited_label=heading_edits.get(f"theme-group-{theme.id}:title"),
+            edited_description=heading_edits.get(f"theme-group-{theme.id}:desc"),
+            is_new=_is_new(n, new),
+            quote_count=n,
+        ))
+
+    state_counts = (
+        db.query(
+            func.sum(case((QuoteState.is_hidden.is_(True), 1), else_=0)),
+            func.sum(case((QuoteState.is_starred.is_(True), 1), else_=0)),
         )
+        .join(Quote, Quote.id == QuoteState.quote_id)
+        .filter(Quote.project_id == project_id)
+        .one()
+    )
+    return QuotesIndexResponse(
+        sections=sections,
+        themes=themes,
+        total_quotes=db.query(Quote).filter_by(project_id=project_id).count(),
+        total_hidden=state_counts[0] or 0,
+        total_starred=state_counts[1] or 0,
+        total_uncategorised=len(_uncategorised_ids(db, project_id)),
+        has_moderator=_has_moderator(db, project_id),
+        new_since=new_since,
+    )
 
-        # Check if any session has a moderator speaker (speaker_code starting
-        # with "m").  Solo sessions (no moderator) shouldn't offer the
-        # "Question?" pill on quotes.
-        has_moderator = db.query(
-            db.query(TranscriptSegment)
-            .join(SessionModel, TranscriptSegment.session_id == SessionModel.id)
-            .filter(
-                SessionModel.project_id == project_id,
-                TranscriptSegment.speaker_code.like("m%"),
+
+def _uncategorised_ids(db: Session, project_id: int) -> set[int]:
+    """Pinned quotes with no section or theme join (see ``_build_quotes``)."""
+    from bristlenose.server.importer import _pinned_quote_ids
+
+    pinned = _pinned_quote_ids(db, project_id)
+    if not pinned:
+        return set()
+    grouped = {
+        qid for (qid,) in db.query(ClusterQuote.quote_id)
+        .filter(ClusterQuote.quote_id.in_(pinned))
+    }
+    grouped |= {
+        qid for (qid,) in db.query(ThemeQuote.quote_id)
+        .filter(ThemeQuote.quote_id.in_(pinned))
+    }
+    return pinned - grouped
+
+
+def _quotes_page(
+    request: Request,
+    project_id: int,
+    filter_quotes: Callable[[Session, Any], Any],
+    order: tuple,
+    cursor: str | None,
+    limit: int,
+) -> Response:
+    """One keyset page of a group's quotes, in ``order`` (ending in Quote.id)."""
+    db = _get_db(request)
+    try:
+        project = _check_project(db, project_id)
+        etag = projection_etag(project, "quotes-page")
+        if (not_modified := _revalidate(request, etag)) is not None:
+            return not_modified
+        q = filter_quotes(db, db.query(Quote).filter(Quote.project_id == project_id))
+        if cursor is not None:
+            q = q.filter(tuple_(*order) > tuple_(*_decode_cursor(cursor, len(order))))
+        # One extra row says whether another page exists.
+        rows = q.order_by(*order).limit(limit + 1).all()
+        page = rows[:limit]
+        quote_ids = [quote.id for quote in page]
+        state_map, edit_map, tags_map, badges_map, proposed_map = (
+            _load_researcher_state(db, project_id, quote_ids)
+        )
+        speaker_map = _resolve_speaker_names(db, project_id)
+        next_cursor = None
+        if len(rows) > limit:
+            last = page[-1]
+            next_cursor = _encode_cursor(
+                tuple(getattr(last, col.key) for col in order)
             )
-            .exists()
-        ).scalar() or False
-
-        return QuotesListResponse(
-            sections=sections,
-            themes=themes,
-            uncategorised=uncategorised,
-            total_quotes=len(all_quotes),
-            total_hidden=total_hidden,
-            total_starred=total_starred,
-            total_uncategorised=len(uncategorised),
-            has_moderator=has_moderator,
-            new_since=new_since,
+        response = QuotesPageResponse(
+            quotes=[
+                _build_quote_response(
+                    quote, state_map, edit_map, tags_map, badges_map,
+                    proposed_map, speaker_map,
+                )
+                for quote in page
+            ],
+            next_cursor=next_cursor,
         )
+        return _json(response.model_dump_json().encode("utf-8"), etag)
     finally:
         db.close()
 
 
+@router.get(
+    "/projects/{project_id}/quotes/sections/{cluster_id}",
+    response_model=QuotesPageResponse,
+)
+def get_section_quotes(
+    project_id: int,
+    cluster_id: int,
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(default=_DEFAULT_PAGE, ge=1, le=_MAX_PAGE),
+) -> Response:
+    """One page of a section's quotes, in timecode order."""
+    def _in_section(db: Session, q: Any) -> Any:
+        if not db.query(ScreenCluster.id).filter_by(
+            id=cluster_id, project_id=project_id,
+        ).first():
+            raise HTTPException(status_code=404, detail="Section not found")
+        return q.join(ClusterQuote, ClusterQuote.quote_id == Quote.id).filter(
+            ClusterQuote.cluster_id == cluster_id,
+        )
+
+    return _quotes_page(
+        request, project_id, _in_section,
+        (Quote.start_timecode, Quote.id), cursor, limit,
+    )
+
+
+@router.get(
+    "/projects/{project_id}/quotes/themes/{theme_id}",
+    response_model=QuotesPageResponse,
+)
+def get_theme_quotes(
+    project_id: int,
+    theme_id: int,
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(default=_DEFAULT_PAGE, ge=1, le=_MAX_PAGE),
+) -> Response:
+    """One page of a theme's quotes, in session then timecode order."""
+    def _in_theme(db: Session, q: Any) -> Any:
+        if not db.query(ThemeGroup.id).filter_by(
+            id=theme_id, project_id=project_id,
+        ).first():
+            raise HTTPException(status_code=404, detail="Theme not found")
+        return q.join(ThemeQuote, ThemeQuote.quote_id == Quote.id).filter(
+            ThemeQuote.theme_id == theme_id,
+        )
+
+    return _quotes_page(
+        request, project_id, _in_theme,
+        (Quote.session_id, Quote.start_timecode, Quote.id), cursor, limit,
+    )
+
+
+@router.get(
+    "/projects/{project_id}/quotes/uncategorised",
+    response_model=QuotesPageResponse,
+)
+def get_uncategorised_quotes(
+    project_id: int,
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(default=_DEFAULT_PAGE, ge=1, le=_MAX_PAGE),
+) -> Response:
+    """One page of the uncategorised floor, in session then timecode order."""
+    def _uncategorised(db: Session, q: Any) -> Any:
+        return q.filter(Quote.id.in_(_uncategorised_ids(db, project_id)))
+
+    return _quotes_page(
+        request, project_id, _uncategorised,
+        (Quote.session_id, Quote.start_timecode, Quote.id), cursor, limit,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Moderator question endpoint
 # ---------------------------------------------------------------------------
@@ -644,3 +1078,56 @@ def get_moderator_question(
         )
     finally:
         db.close()
+
+
+def moderator_questions(
+    db: Session, project_id: int,
+) -> dict[str, ModeratorQuestionResponse]:
+    """The preceding moderator utterance of every quote that has one.
+
+    The whole-project form of :func:`get_moderator_question`, for the HTML
+    export: two queries in all rather than three per quote.  Keyed by DOM id;
+    a DOM id shared by two quotes resolves to the first, as the endpoint does.
+    """
+    session_pks = dict(
+        db.query(SessionModel.session_id, SessionModel.id).filter_by(project_id=project_id)
+    )
+    moderator_segments: dict[int, list[TranscriptSegment]] = {}
+    for seg in (
+        db.query(TranscriptSegment)
+        .join(SessionModel, TranscriptSegment.session_id == SessionModel.id)
+        .filter(
+            SessionModel.project_id == project_id,
+            TranscriptSegment.speaker_code.like("m%"),
+        )
+        .order_by(TranscriptSegment.session_id, TranscriptSegment.segment_index)
+    ):
+        moderator_segments.setdefault(seg.session_id, []).append(seg)
+    positions = {
+        pk: [seg.segment_index for seg in segs]
+        for pk, segs in moderator_segments.items()
+    }
+
+    result: dict[str, ModeratorQuestionResponse] = {}
+    seen: set[str] = set()
+    for quote in db.query(Quote).filter_by(project_id=project_id).order_by(Quote.id):
+        dom_id = _quote_dom_id(quote)
+        if dom_id in seen:
+            continue
+        seen.add(dom_id)
+        pk = session_pks.get(quote.session_id)
+        if quote.segment_index < 1 or pk not in moderator_segments:
+            continue
+        # Last moderator segment strictly before the quote's segment
+        i = bisect_left(positions[pk], quote.segment_index)
+        if i == 0:
+            continue
+        segment = moderator_segments[pk][i - 1]
+        result[dom_id] = ModeratorQuestionResponse(
+            text=segment.text,
+            speaker_code=segment.speaker_code,
+            start_time=segment.start_time,
+            end_time=segment.end_time,
+            segment_index=segment.segment_index,
+        )
+    return result
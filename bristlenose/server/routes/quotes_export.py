@@ -1,6 +1,9 @@
 """Quotes export endpoints — CSV and XLSX downloads.
 
-Both endpoints share the extraction layer in ``export_core.py``.
+Both endpoints share the extraction layer in ``export_core.py`` and stream:
+the CSV is sent in chunks as rows come off one batched query, and the XLSX is
+written with openpyxl's write-only mode to a temporary file that is deleted
+once sent.  Peak memory is one batch of quotes, whatever the project size.
 Column headers are passed from the frontend via ``Accept-Language`` or
 a ``lang`` query parameter; the server returns English headers by default.
 """
@@ -9,16 +12,21 @@ from __future__ import annotations
 
 import csv
 import io
+import itertools
 import logging
+import os
+import tempfile
+from collections.abc import Iterator
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from starlette.responses import Response
+from starlette.background import BackgroundTask
+from starlette.responses import FileResponse, StreamingResponse
 
 from bristlenose.server.export_core import (
     ExportableQuote,
     csv_safe,
     excel_sheet_name,
-    extract_quotes_for_export,
+    iter_quotes_for_export,
 )
 from bristlenose.server.models import Project
 from bristlenose.utils.text import safe_filename
@@ -46,6 +54,12 @@ _DEFAULT_HEADERS = [
     "Source file",
 ]
 
+#: CSV rows written per chunk of the streamed response.
+_CSV_CHUNK_ROWS = 200
+
+#: Rows sampled to size the XLSX columns.
+_XLSX_WIDTH_SAMPLE = 100
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -100,13 +114,50 @@ def _quote_to_row(q: ExportableQuote) -> list[str]:
     ]
 
 
+def _open_quotes(
+    db, project_id: int, quote_ids: str | None, anonymise: bool,
+) -> Iterator[ExportableQuote]:
+    """Stream the matching quotes, or raise 404 if there are none.
+
+    The first row is fetched up front so an empty export fails before any
+    response headers are sent.
+    """
+    quotes = iter_quotes_for_export(
+        db, project_id, _parse_quote_ids(quote_ids), anonymise=anonymise,
+    )
+    first = next(quotes, None)
+    if first is None:
+        raise HTTPException(status_code=404, detail="No quotes match the filter")
+    return itertools.chain([first], quotes)
+
+
+def _csv_chunks(
+    db, quotes: Iterator[ExportableQuote], col_headers: list[str],
+) -> Iterator[str]:
+    """CSV text in chunks of rows; closes ``db`` when done (or abandoned)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    try:
+        buf.write("\ufeff")  # UTF-8 BOM for Excel on Windows
+        writer.writerow(col_headers)
+        for n, q in enumerate(quotes, start=1):
+            writer.writerow(csv_safe(v) for v in _quote_to_row(q))
+            if n % _CSV_CHUNK_ROWS == 0:
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+        yield buf.getvalue()
+    finally:
+        db.close()
+
+
 # ---------------------------------------------------------------------------
 # CSV endpoint
 # ---------------------------------------------------------------------------
 
 
 @router.get("/projects/{project_id}/export/quotes.csv")
-async def export_quotes_csv(
+def export_quotes_csv(
     request: Request,
     project_id: int,
     quote_ids: str | None = Query(None, description="Comma-separated DOM IDs"),
@@ -114,36 +165,24 @@ async def export_quotes_csv(
     headers: str | None = Query(None, alias="col_headers",
                                 description="Comma-separated translated column headers"),
 ):
-    """Export quotes as CSV with UTF-8 BOM."""
+    """Export quotes as CSV with UTF-8 BOM, streamed in chunks."""
     db = _get_db(request)
     try:
         project = _check_project(db, project_id)
-        ids = _parse_quote_ids(quote_ids)
-        quotes = extract_quotes_for_export(db, project_id, ids, anonymise=anonymise)
-
-        if not quotes:
-            raise HTTPException(status_code=404, detail="No quotes match the filter")
-
-        col_headers = _parse_headers(headers)
-
-        # Build CSV in memory with UTF-8 BOM
-        buf = io.StringIO()
-        buf.write("\ufeff")  # UTF-8 BOM for Excel on Windows
-        writer = csv.writer(buf)
-        writer.writerow(col_headers)
-        for q in quotes:
-            writer.writerow(csv_safe(v) for v in _quote_to_row(q))
-
+        quotes = _open_quotes(db, project_id, quote_ids, anonymise)
         filename = f"{safe_filename(project.name)}-quotes.csv"
-        return Response(
-            content=buf.getvalue(),
-            media_type="text/csv; charset=utf-8",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-            },
-        )
-    finally:
+    except Exception:
         db.close()
+        raise
+
+    # The generator owns the session from here and closes it when done.
+    return StreamingResponse(
+        _csv_chunks(db, quotes, _parse_headers(headers)),
+        media_type="text/csv; charset=utf-8",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -152,7 +191,7 @@ async def export_quotes_csv(
 
 
 @router.get("/projects/{project_id}/export/quotes.xlsx")
-async def export_quotes_xlsx(
+def export_quotes_xlsx(
     request: Request,
     project_id: int,
     quote_ids: str | None = Query(None, description="Comma-separated DOM IDs"),
@@ -164,64 +203,74 @@ async def export_quotes_xlsx(
     db = _get_db(request)
     try:
         project = _check_project(db, project_id)
-        ids = _parse_quote_ids(quote_ids)
-        quotes = extract_quotes_for_export(db, project_id, ids, anonymise=anonymise)
-
-        if not quotes:
-            raise HTTPException(status_code=404, detail="No quotes match the filter")
-
+        quotes = _open_quotes(db, project_id, quote_ids, anonymise)
         col_headers = _parse_headers(headers)
 
         # Lazy import — openpyxl is heavy and only needed for XLSX
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = excel_sheet_name(project.name)
-
-        # Header row (bold)
-        bold = Font(bold=True)
-        for col_idx, header in enumerate(col_headers, start=1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = bold
+        # Write-only mode streams rows to disk as they are appended, so the
+        # workbook never holds more than the rows sampled for column widths.
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(excel_sheet_name(project.name))
 
-        # Data rows. Apply csv_safe() for parity with the CSV writer — defends
-        # against formula injection (CWE-1236) if the .xlsx is reopened in a
+        # Column widths go in the sheet header, ahead of the first row, so
+        # size them from a sample of the first rows (approximate auto-fit).
+        # Apply csv_safe() for parity with the CSV writer — defends against
+        # formula injection (CWE-1236) if the .xlsx is reopened in a
         # spreadsheet app that evaluates leading =/+/-/@ cells.
-        for row_idx, q in enumerate(quotes, start=2):
-            for col_idx, value in enumerate(_quote_to_row(q), start=1):
-                ws.cell(row=row_idx, column=col_idx, value=csv_safe(value))
+        sample = [
+            [csv_safe(v) for v in _quote_to_row(q)]
+            for q in itertools.islice(quotes, _XLSX_WIDTH_SAMPLE)
+        ]
+        for col_idx, header in enumerate(col_headers):
+            max_width = len(header)
+            for row in sample:
+                max_width = max(max_width, min(len(row[col_idx]), 60))
+            col_letter = chr(ord("A") + col_idx)
+            ws.column_dimensions[col_letter].width = max_width + 2
 
         # Freeze header row
         ws.freeze_panes = "A2"
 
+        # Header row (bold)
+        bold = Font(bold=True)
+        header_cells = []
+        for header in col_headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = bold
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        n_rows = 0
+        for row in sample:
+            ws.append(row)
+            n_rows += 1
+        for q in quotes:
+            ws.append([csv_safe(v) for v in _quote_to_row(q)])
+            n_rows += 1
+
         # Auto-filter on all columns
         last_col_letter = chr(ord("A") + len(col_headers) - 1)
-        ws.auto_filter.ref = f"A1:{last_col_letter}{len(quotes) + 1}"
+        ws.auto_filter.ref = f"A1:{last_col_letter}{n_rows + 1}"
 
-        # Auto-fit column widths (approximate)
-        for col_idx, header in enumerate(col_headers, start=1):
-            max_width = len(header)
-            for q in quotes[:100]:  # Sample first 100 rows
-                row = _quote_to_row(q)
-                val = row[col_idx - 1]
-                max_width = max(max_width, min(len(val), 60))
-            col_letter = chr(ord("A") + col_idx - 1)
-            ws.column_dimensions[col_letter].width = max_width + 2
-
-        # Write to bytes
-        buf = io.BytesIO()
-        wb.save(buf)
-        buf.seek(0)
+        fd, path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+        try:
+            wb.save(path)
+        except Exception:
+            os.unlink(path)
+            raise
 
         filename = f"{safe_filename(project.name)}-quotes.xlsx"
-        return Response(
-            content=buf.getvalue(),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-            },
-        )
     finally:
         db.close()
+
+    return FileResponse(
+        path,
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        filename=filename,
+        background=BackgroundTask(os.unlink, path),
+    )
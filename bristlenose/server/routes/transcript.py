@@ -5,8 +5,10 @@ from __future__ import annotations
 import html
 import json
 import re
+from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -27,6 +29,7 @@ from bristlenose.server.models import (
     TranscriptSegment,
 )
 from bristlenose.server.models import Session as SessionModel
+from bristlenose.word_timings import WordTimings, session_timings_path
 
 router = APIRouter(prefix="/api")
 
@@ -109,6 +112,15 @@ def _check_project(db: Session, project_id: int) -> Project:
     return project
 
 
+def _word_timings(project: Project, sess: SessionModel) -> WordTimings | None:
+    """The session's columnar word timings, or None if the importer wrote none."""
+    path = session_timings_path(Path(project.output_dir), sess.session_id)
+    try:
+        return WordTimings.open(path)
+    except (OSError, ValueError):
+        return None
+
+
 def _esc(text: str) -> str:
     return html.escape(text, quote=False)
 
@@ -171,44 +183,136 @@ def _quote_dom_id(q: Quote) -> str:
 
 
 # ---------------------------------------------------------------------------
-# Endpoint
+# Page building
 # ---------------------------------------------------------------------------
 
 
-@router.get("/projects/{project_id}/transcripts/{session_id}")
-def get_transcript(
-    request: Request, project_id: int, session_id: str,
-) -> TranscriptPageResponse:
-    db = _get_db(request)
-    try:
-        project = _check_project(db, project_id)
+def _code_sort_key(row: tuple[SessionSpeaker, Person]) -> tuple[int, int]:
+    """Sort speakers: m-codes first, p-codes next, o-codes last."""
+    c = row[0].speaker_code
+    prefix_order = {"m": 0, "p": 1, "o": 2}
+    order = prefix_order.get(c[0], 3) if c else 3
+    num = int(c[1:]) if len(c) > 1 and c[1:].isdigit() else 0
+    return (order, num)
 
-        # Find the session
-        sess = (
-            db.query(SessionModel)
-            .filter_by(project_id=project_id, session_id=session_id)
-            .first()
-        )
-        if not sess:
-            raise HTTPException(status_code=404, detail="Session not found")
 
-        # Speakers
-        sp_rows = (
-            db.query(SessionSpeaker, Person)
-            .join(Person, SessionSpeaker.person_id == Person.id)
-            .filter(SessionSpeaker.session_id == sess.id)
-            .all()
+def transcript_pages(
+    db: Session,
+    project: Project,
+    sessions: list[SessionModel],
+) -> dict[str, TranscriptPageResponse]:
+    """Build the transcript page of every session in ``sessions``.
+
+    A fixed number of queries whatever the session count — speakers,
+    segments, quotes, their section/theme assignments, tags and badges are
+    each loaded once for all of ``sessions`` — so the HTML export can embed
+    every transcript for about the cost of one.
+    """
+    if not sessions:
+        return {}
+    project_id = project.id
+    pks = [s.id for s in sessions]
+    sids = [s.session_id for s in sessions]
+
+    sp_by_session: dict[int, list[tuple[SessionSpeaker, Person]]] = {pk: [] for pk in pks}
+    for sp, p in (
+        db.query(SessionSpeaker, Person)
+        .join(Person, SessionSpeaker.person_id == Person.id)
+        .filter(SessionSpeaker.session_id.in_(pks))
+    ):
+        sp_by_session[sp.session_id].append((sp, p))
+
+    # Transcript segments ordered by start_time
+    segs_by_session: dict[int, list[TranscriptSegment]] = {pk: [] for pk in pks}
+    for seg in (
+        db.query(TranscriptSegment)
+        .filter(TranscriptSegment.session_id.in_(pks))
+        .order_by(TranscriptSegment.session_id, TranscriptSegment.start_time)
+    ):
+        segs_by_session[seg.session_id].append(seg)
+
+    # Quotes for these sessions + their cluster/theme assignments
+    quotes_by_session: dict[str, list[Quote]] = {sid: [] for sid in sids}
+    for q in db.query(Quote).filter(
+        Quote.project_id == project_id, Quote.session_id.in_(sids),
+    ):
+        quotes_by_session[q.session_id].append(q)
+    in_sessions = (Quote.project_id == project_id, Quote.session_id.in_(sids))
+
+    # Build assignment lookup: quote_id -> (label, label_type)
+    assignment: dict[int, tuple[str, str]] = {}
+    for quote_id, label in (
+        db.query(ClusterQuote.quote_id, ScreenCluster.screen_label)
+        .join(ScreenCluster, ClusterQuote.cluster_id == ScreenCluster.id)
+        .join(Quote, ClusterQuote.quote_id == Quote.id)
+        .filter(*in_sessions)
+    ):
+        assignment[quote_id] = (label, "section")
+    for quote_id, label in (
+        db.query(ThemeQuote.quote_id, ThemeGroup.theme_label)
+        .join(ThemeGroup, ThemeQuote.theme_id == ThemeGroup.id)
+        .join(Quote, ThemeQuote.quote_id == Quote.id)
+        .filter(*in_sessions)
+    ):
+        assignment[quote_id] = (label, "theme")
+
+    # Tags and deleted badges per quote
+    tag_rows = (
+        db.query(
+            QuoteTag.quote_id,
+            TagDefinition.name,
+            TagDefinition.id,
+            TagDefinition.codebook_group_id,
+            CodebookGroup.name,
+            CodebookGroup.colour_set,
+        )
+        .join(TagDefinition, QuoteTag.tag_definition_id == TagDefinition.id)
+        .join(CodebookGroup, TagDefinition.codebook_group_id == CodebookGroup.id)
+        .join(Quote, QuoteTag.quote_id == Quote.id)
+        .filter(*in_sessions)
+        .all()
+    )
+    # Build colour_index lookup: a tag's position among its group's tags
+    colour_index: dict[int, int] = {}
+    t_group_ids = {row[3] for row in tag_rows}
+    if t_group_ids:
+        group_sizes: dict[int, int] = {}
+        for td_id, group_id in (
+            db.query(TagDefinition.id, TagDefinition.codebook_group_id)
+            .filter(TagDefinition.codebook_group_id.in_(t_group_ids))
+            .order_by(TagDefinition.id)
+        ):
+            colour_index[td_id] = group_sizes.get(group_id, 0)
+            group_sizes[group_id] = colour_index[td_id] + 1
+    tags_map: dict[int, list[TagResponse]] = {}
+    for quote_id, tag_name, td_id, _group_id, group_name, colour_set in tag_rows:
+        tags_map.setdefault(quote_id, []).append(
+            TagResponse(
+                name=tag_name,
+                codebook_group=group_name,
+                colour_set=colour_set,
+                colour_index=colour_index.get(td_id, 0),
+            )
         )
-        # Sort: m-codes first, p-codes next, o-codes last
-        def _code_sort_key(row: tuple[SessionSpeaker, Person]) -> tuple[int, int]:
-            c = row[0].speaker_code
-            prefix_order = {"m": 0, "p": 1, "o": 2}
-            order = prefix_order.get(c[0], 3) if c else 3
-            num = int(c[1:]) if len(c) > 1 and c[1:].isdigit() else 0
-            return (order, num)
 
-        sp_rows.sort(key=_code_sort_key)
+    badges_map: dict[int, list[str]] = {}
+    for quote_id, sentiment in (
+        db.query(DeletedBadge.quote_id, DeletedBadge.sentiment)
+        .join(Quote, DeletedBadge.quote_id == Quote.id)
+        .filter(*in_sessions)
+    ):
+        badges_map.setdefault(quote_id, []).append(sentiment)
+
+    # Journey labels are project-wide; derive them once
+    participant_screens = derive_journeys(db, project_id)
+
+    # Report filename for back link
+    slug = re.sub(r"[^a-z0-9]+", "-", project.name.lower()).strip("-")[:50]
+    report_filename = f"bristlenose-{slug}-report.html"
 
+    pages: dict[str, TranscriptPageResponse] = {}
+    for sess in sessions:
+        sp_rows = sorted(sp_by_session[sess.id], key=_code_sort_key)
         speakers = [
             TranscriptSpeakerResponse(
                 code=sp.speaker_code,
@@ -218,102 +322,12 @@ def get_transcript(
             for sp, p in sp_rows
         ]
 
-        # Transcript segments ordered by start_time
-        segments = (
-            db.query(TranscriptSegment)
-            .filter_by(session_id=sess.id)
-            .order_by(TranscriptSegment.start_time)
-            .all()
-        )
-
-        # Quotes for this session + their cluster/theme assignments
-        quotes = (
-            db.query(Quote)
-            .filter_by(project_id=project_id, session_id=session_id)
-            .all()
-        )
-        quote_ids = [q.id for q in quotes]
-
-        # Build assignment lookup: quote_id -> (label, label_type)
-        assignment: dict[int, tuple[str, str]] = {}
-        if quote_ids:
-            cluster_rows = (
-                db.query(ClusterQuote, ScreenCluster)
-                .join(ScreenCluster, ClusterQuote.cluster_id == ScreenCluster.id)
-                .filter(ClusterQuote.quote_id.in_(quote_ids))
-                .all()
-            )
-            for cq, sc in cluster_rows:
-                assignment[cq.quote_id] = (sc.screen_label, "section")
-
-            theme_rows = (
-                db.query(ThemeQuote, ThemeGroup)
-                .join(ThemeGroup, ThemeQuote.theme_id == ThemeGroup.id)
-                .filter(ThemeQuote.quote_id.in_(quote_ids))
-                .all()
-            )
-            for tq, tg in theme_rows:
-                assignment[tq.quote_id] = (tg.theme_label, "theme")
-
-        # Tags and deleted badges per quote
-        tags_map: dict[int, list[TagResponse]] = {}
-        badges_map: dict[int, list[str]] = {}
-        if quote_ids:
-            tag_rows = (
-                db.query(
-                    QuoteTag,
-                    TagDefinition.name,
-                    TagDefinition.id,
-                    TagDefinition.codebook_group_id,
-                    CodebookGroup.name,
-                    CodebookGroup.colour_set,
-                )
-                .join(TagDefinition, QuoteTag.tag_definition_id == TagDefinition.id)
-                .join(
-                    CodebookGroup,
-                    TagDefinition.codebook_group_id == CodebookGroup.id,
-                )
-                .filter(QuoteTag.quote_id.in_(quote_ids))
-                .all()
-            )
-            # Build colour_index lookup
-            t_group_ids = {row[3] for row in tag_rows}
-            t_group_td_order: dict[int, list[int]] = {}
-            for gid in t_group_ids:
-                tds = (
-                    db.query(TagDefinition.id)
-                    .filter_by(codebook_group_id=gid)
-                    .order_by(TagDefinition.id)
-                    .all()
-                )
-                t_group_td_order[gid] = [td_id for (td_id,) in tds]
-
-            for qt, tag_name, td_id, group_id, group_name, colour_set in tag_rows:
-                td_ids = t_group_td_order.get(group_id, [])
-                cidx = td_ids.index(td_id) if td_id in td_ids else 0
-                tags_map.setdefault(qt.quote_id, []).append(
-                    TagResponse(
-                        name=tag_name,
-                        codebook_group=group_name,
-                        colour_set=colour_set,
-                        colour_index=cidx,
-                    )
-                )
-
-            badge_rows = (
-                db.query(DeletedBadge)
-                .filter(DeletedBadge.quote_id.in_(quote_ids))
-                .all()
-            )
-            for b in badge_rows:
-                badges_map.setdefault(b.quote_id, []).append(b.sentiment)
-
         # Build annotations dict keyed by quote DOM ID
         annotations: dict[str, QuoteAnnotationResponse] = {}
         # Also build a lookup for segment-quote matching
         # quote_data: list of (dom_id, participant_id, start_tc, end_tc, verbatim)
-        quote_data: list[tuple[str, str, float, float, str, Quote]] = []
-        for q in quotes:
+        quote_data: list[tuple[str, str, float, float, str]] = []
+        for q in quotes_by_session[sess.session_id]:
             dom_id = _quote_dom_id(q)
             label, label_type = assignment.get(q.id, ("", ""))
             annotations[dom_id] = QuoteAnnotationResponse(
@@ -329,82 +343,146 @@ def get_transcript(
             )
             quote_data.append(
                 (dom_id, q.participant_id, q.start_timecode, q.end_timecode,
-                 q.verbatim_excerpt, q)
+                 q.verbatim_excerpt)
             )
 
-        # Build segment responses with quote overlap detection
-        seg_responses: list[TranscriptSegmentResponse] = []
-        for seg in segments:
-            is_moderator = seg.speaker_code.startswith("m")
-
-            # Find overlapping quotes (same logic as render/transcript_pages.py)
-            seg_quotes = [
-                (dom_id, pid, s_tc, e_tc, excerpt, q)
-                for dom_id, pid, s_tc, e_tc, excerpt, q in quote_data
-                if s_tc <= seg.start_time <= e_tc and pid == seg.speaker_code
-            ]
-            is_quoted = bool(seg_quotes) and not is_moderator
-
-            qids = [dom_id for dom_id, *_ in seg_quotes] if is_quoted else []
-
-            # Pre-render HTML text with <mark> highlights
-            html_text: str | None = None
-            if is_quoted:
-                mark_data = [(dom_id, excerpt) for dom_id, _, _, _, excerpt, _ in seg_quotes]
-                html_text = _highlight_quoted_text(seg.text, mark_data)
-
-            # Deserialise word-level timing from compact JSON
-            words: list[WordTimingResponse] | None = None
-            if seg.words_json:
-                try:
-                    raw_words = json.loads(seg.words_json)
-                    words = [
-                        WordTimingResponse(text=w["t"], start=w["s"], end=w["e"])
-                        for w in raw_words
-                    ]
-                except (json.JSONDecodeError, KeyError, TypeError):
-                    words = None
-
-            seg_responses.append(TranscriptSegmentResponse(
-                speaker_code=seg.speaker_code,
-                start_time=seg.start_time,
-                end_time=seg.end_time,
-                text=seg.text,
-                html_text=html_text,
-                is_moderator=is_moderator,
-                is_quoted=is_quoted,
-                quote_ids=qids,
-                segment_index=seg.segment_index,
-                words=words,
-            ))
-
         # Journey labels for this session
-        participant_screens = derive_journeys(db, project_id)
-        session_pids = [
-            sp.speaker_code for sp, _ in sp_rows
-            if sp.speaker_code.startswith("p")
-        ]
         journey_labels: list[str] = []
-        for pid in session_pids:
-            for label in participant_screens.get(pid, []):
+        for sp, _ in sp_rows:
+            if not sp.speaker_code.startswith("p"):
+                continue
+            for label in participant_screens.get(sp.speaker_code, []):
                 if label not in journey_labels:
                     journey_labels.append(label)
 
-        # Report filename for back link
-        slug = re.sub(r"[^a-z0-9]+", "-", project.name.lower()).strip("-")[:50]
-        report_filename = f"bristlenose-{slug}-report.html"
-
-        return TranscriptPageResponse(
-            session_id=session_id,
+        pages[sess.session_id] = TranscriptPageResponse(
+            session_id=sess.session_id,
             session_number=sess.session_number,
             duration_seconds=sess.duration_seconds,
             has_media=sess.has_media,
             project_name=project.name,
             report_filename=report_filename,
             speakers=speakers,
-            segments=seg_responses,
+            segments=_segment_responses(
+                segs_by_session[sess.id], quote_data, _word_timings(project, sess),
+            ),
             annotations=annotations,
             journey_labels=journey_labels,
         )
+    return pages
+
+
+def _segment_responses(
+    segments: list[TranscriptSegment],
+    quote_data: list[tuple[str, str, float, float, str]],
+    timings: WordTimings | None,
+) -> list[TranscriptSegmentResponse]:
+    """Segment responses with quote overlap detection and word timings."""
+    seg_responses: list[TranscriptSegmentResponse] = []
+    for seg in segments:
+        is_moderator = seg.speaker_code.startswith("m")
+
+        # Find overlapping quotes (same logic as render/transcript_pages.py)
+        seg_quotes = [
+            (dom_id, excerpt)
+            for dom_id, pid, s_tc, e_tc, excerpt in quote_data
+            if s_tc <= seg.start_time <= e_tc and pid == seg.speaker_code
+        ]
+        is_quoted = bool(seg_quotes) and not is_moderator
+
+        qids = [dom_id for dom_id, _ in seg_quotes] if is_quoted else []
+
+        # Pre-render HTML text with <mark> highlights
+        html_text: str | None = None
+        if is_quoted:
+            html_text = _highlight_quoted_text(seg.text, seg_quotes)
+
+        # Word-level timing: columnar file, else a legacy words_json row
+        words: list[WordTimingResponse] | None = None
+        if timings is not None and seg.segment_index in timings:
+            words = [
+                WordTimingResponse(
+                    text=timings.text(i), start=timings.start[i], end=timings.end[i],
+                )
+                for i in timings.segment(seg.segment_index)
+            ]
+        elif seg.words_json:
+            try:
+                raw_words = json.loads(seg.words_json)
+                words = [
+                    WordTimingResponse(text=w["t"], start=w["s"], end=w["e"])
+                    for w in raw_words
+                ]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                words = None
+
+        seg_responses.append(TranscriptSegmentResponse(
+            speaker_code=seg.speaker_code,
+            start_time=seg.start_time,
+            end_time=seg.end_time,
+            text=seg.text,
+            html_text=html_text,
+            is_moderator=is_moderator,
+            is_quoted=is_quoted,
+            quote_ids=qids,
+            segment_index=seg.segment_index,
+            words=words,
+        ))
+    return seg_responses
+
+
+# ---------------------------------------------------------------------------
+# Endpoint
+# ---------------------------------------------------------------------------
+
+
+@router.get("/projects/{project_id}/transcripts/{session_id}")
+def get_transcript(
+    request: Request, project_id: int, session_id: str,
+) -> TranscriptPageResponse:
+    db = _get_db(request)
+    try:
+        project = _check_project(db, project_id)
+
+        # Find the session
+        sess = (
+            db.query(SessionModel)
+            .filter_by(project_id=project_id, session_id=session_id)
+            .first()
+        )
+        if not sess:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        return transcript_pages(db, project, [sess])[session_id]
+    finally:
+        db.close()
+
+
+@router.get("/projects/{project_id}/transcripts/{session_id}/words")
+def get_word_timings(
+    request: Request, project_id: int, session_id: str,
+) -> FileResponse:
+    """The session's word timings as a raw ``.bnwt`` image.
+
+    For the karaoke-sync player: the columns are little-endian and 8-byte
+    aligned, so the browser can view them with typed arrays without parsing
+    (layout in ``bristlenose/word_timings.py``). Server-only: the offline
+    export does not embed it, so a caller under ``isExportMode()`` reads the
+    words inline in the transcript page instead.
+    """
+    db = _get_db(request)
+    try:
+        project = _check_project(db, project_id)
+        sess = (
+            db.query(SessionModel)
+            .filter_by(project_id=project_id, session_id=session_id)
+            .first()
+        )
+        if not sess:
+            raise HTTPException(status_code=404, detail="Session not found")
+        path = session_timings_path(Path(project.output_dir), sess.session_id)
     finally:
         db.close()
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="No word timings")
+    return FileResponse(path, media_type="application/octet-stream")
@@ -119,9 +119,11 @@ def load_llm_calls(internal_dir: Path) -> list[dict[str, Any]]:
     """Normalise llm-calls.jsonl rows into flat, display-ready dicts."""
     out: list[dict[str, Any]] = []
     for r in read_jsonl(internal_dir / JSONL_LLM):
-        cache = _int(_first(r, "gen_ai.usage.cache_read_input_tokens", "cache_read_input_tokens")) + _int(
+        cache_read = _int(_first(r, "gen_ai.usage.cache_read_input_tokens", "cache_read_input_tokens"))
+        cache_write = _int(
             _first(r, "gen_ai.usage.cache_creation_input_tokens", "cache_creation_input_tokens")
         )
+        cache = cache_read + cache_write
         system = (_first(r, "gen_ai.system", "gen_ai_system", default="") or "").lower()
         model = _first(r, "gen_ai.response.model", "gen_ai.request.model", "gen_ai_request_model", default="") or ""
         out.append(
@@ -136,6 +138,8 @@ def load_llm_calls(internal_dir: Path) -> list[dict[str, Any]]:
                 "in": _int(_first(r, "gen_ai.usage.input_tokens", "input_tokens")),
                 "out": _int(_first(r, "gen_ai.usage.output_tokens", "output_tokens")),
                 "cache": cache,
+                "cache_read": cache_read,
+                "cache_write": cache_write,
                 "ms": _int(r.get("elapsed_ms")),
                 "retries": _int(r.get("retry_count")),
                 "finish": r.get("finish_reason") or "—",
@@ -207,16 +211,31 @@ def summarise_calls(calls: list[dict[str, Any]]) -> dict[str, Any]:
 
 
 def cost_by_stage(calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Per-stage cost split (input / output / cache → derived from totals)."""
+    """Per-stage cost split (input / output / cache → derived from totals).
+
+    ``cache_read`` / ``cache_write`` / ``in`` are the prompt-cache view of a
+    stage's input: tokens served from cache, tokens written to it, and
+    uncached tokens. ``cache_ratio`` is reads over all input, and ``p50_ms``
+    sits beside it so a stage's latency can be read against its hit rate.
+    """
     agg: dict[str, dict[str, float]] = {}
+    latency: dict[str, list[float]] = {}
     for c in calls:
-        a = agg.setdefault(c["stage"], {"cost": 0.0, "in": 0, "out": 0, "cache": 0})
+        a = agg.setdefault(
+            c["stage"],
+            {"cost": 0.0, "in": 0, "out": 0, "cache": 0, "cache_read": 0, "cache_write": 0},
+        )
         a["cost"] += c["cost"] or 0.0
         a["in"] += c["in"]
         a["out"] += c["out"]
         a["cache"] += c["cache"]
+        a["cache_read"] += c.get("cache_read", 0)
+        a["cache_write"] += c.get("cache_write", 0)
+        if c.get("ms"):
+            latency.setdefault(c["stage"], []).append(c["ms"])
     rows = []
     for i, (stage, a) in enumerate(sorted(agg.items(), key=lambda kv: -kv[1]["cost"])):
+        total_in = a["in"] + a["cache"]
         rows.append(
             {
                 "stage": stage,
@@ -226,6 +245,10 @@ def cost_by_stage(calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
                 "in": a["in"],
                 "out": a["out"],
                 "cache": a["cache"],
+                "cache_read": a["cache_read"],
+                "cache_write": a["cache_write"],
+                "cache_ratio": round(a["cache_read"] / total_in, 4) if total_in else 0.0,
+                "p50_ms": round(percentile(latency.get(stage, []), 0.5)),
             }
         )
     return rows
@@ -698,7 +721,8 @@ function renderLLM(){
   let bars='';cbs.forEach(r=>{const w=v=>v/maxC*100;
     bars+=`<div style="display:flex;align-items:center;gap:10px;margin:7px 0"><span style="flex:0 0 120px;font-size:11.5px">${esc(r.label)}</span>
       <div style="flex:1;display:flex;height:18px;border-radius:4px;overflow:hidden;background:#10131a"><div style="width:${w(r.cost)}%;background:${r.colour}"></div></div>
-      <span class="mono" style="flex:0 0 56px;text-align:right;color:var(--muted);font-size:11px">$${r.cost.toFixed(3)}</span></div>`;});
+      <span class="mono" style="flex:0 0 56px;text-align:right;color:var(--muted);font-size:11px">$${r.cost.toFixed(3)}</span>
+      <span class="mono ${r.cache_read?'cache-hit':'miss'}" style="flex:0 0 150px;text-align:right;font-size:11px" title="uncached in / cache read / cache write · p50 latency">${fmtK(r.in)} · ${fmtK(r.cache_read||0)} · ${fmtK(r.cache_write||0)} · ${((r.p50_ms||0)/1000).toFixed(1)}s</span></div>`;});
 
   // table
   let rows='';calls.forEach(c=>{rows+=`<tr><td>${esc((c.ts||'').split('T').pop().slice(0,8))}</td><td><span class="chip" style="color:${c.colour}">${esc(c.stage_label)}</span></td><td>${esc(c.model)}</td>
@@ -709,7 +733,7 @@ function renderLLM(){
   host.innerHTML=`<div class="stats">${stats}</div>
     <div class="grid g-2"><div class="card"><h2>Latency × tokens <span class="sub">y=latency · ◯=retried · colour=stage</span></h2>${lp}</div>
       <div class="card"><h2>Cache hit ratio</h2>${cacheDonut}<p style="color:var(--muted);font-size:11px;margin:12px 0 0">Cached input is billed at a discount — the biggest re-run cost lever.</p></div></div>
-    <div class="card" style="margin-top:14px"><h2>Cost by stage</h2>${bars}</div>
+    <div class="card" style="margin-top:14px"><h2>Cost by stage <span class="sub">uncached in · cache read · cache write · p50</span></h2>${bars}</div>
     <div class="card" style="margin-top:14px"><h2>Calls <span class="sub">llm-calls.jsonl · ${calls.length} rows</span></h2><div style="overflow:auto"><table><thead><tr><th>time</th><th>stage</th><th>model</th><th class="num">in</th><th class="num">out</th><th class="num">cache</th><th class="num">latency</th><th>retry</th><th>finish</th><th class="num">cost</th></tr></thead><tbody>${rows}</tbody></table></div></div>`;
 }
 
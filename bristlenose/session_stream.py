@@ -0,0 +1,307 @@
+"""Per-session look-ahead through stages 5b–9 while transcription is running.
+
+The staged pipeline finishes Whisper for every session before the first LLM
+call, so a CPU-bound hour of transcription and a network-bound hour of topic
+and quote extraction run back to back. :class:`SessionStream` overlaps them:
+each session's transcript is handed over the moment it exists, and that
+session moves through speaker identification (5b), merge (6), PII removal
+(7), topic segmentation (8) and quote extraction (9) under one shared LLM
+semaphore while Whisper keeps decoding the next file.
+
+The stream only *computes*. ``Pipeline.run`` still owns every stage block —
+manifest records, intermediate JSON, ``StageOutcome`` rollups and abandon
+checks — and takes the stream's per-session results in place of the calls
+it would otherwise make. Anything the stream did not do (a session that
+arrived late, work skipped after repeated failures) runs through the normal
+stage call, so the two paths combine per session rather than either/or.
+
+Ordering constraints carried over from the staged pipeline:
+
+- Participant codes are numbered globally in session order, and those codes
+  are in the text the stage 8/9 prompts see. A session is released to stage
+  6 only once every earlier session has finished 5b.
+- Stage 9 runs ahead only for sessions whose stage 8 succeeded. A session
+  with failed topics waits for the stage block, which runs it after the
+  topic abandon check — exactly as before.
+- After ``_FAIL_THRESHOLD`` consecutive LLM failures the stream stops
+  starting stage 8/9 work, mirroring the early stop inside those stages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from bristlenose.config import BristlenoseSettings
+from bristlenose.events import StageOutcome
+from bristlenose.llm import telemetry as _llm_telemetry
+from bristlenose.llm.client import LLMClient
+from bristlenose.llm.concurrency import controller_for
+from bristlenose.models import (
+    ExtractedQuote,
+    FullTranscript,
+    InputSession,
+    PiiCleanTranscript,
+    SessionTopicMap,
+    TranscriptSegment,
+)
+
+if TYPE_CHECKING:  # annotation only — stages are imported where they run
+    from bristlenose.stages.s05b_identify_speakers import SpeakerInfo
+    from bristlenose.stages.s07_pii_removal import PiiRedaction
+
+logger = logging.getLogger(__name__)
+
+# Consecutive stage 8/9 failures before the stream stops running ahead.
+# Same value as the per-stage early stop in s08/s09.
+_FAIL_THRESHOLD = 3
+
+
+class SessionStream:
+    """Run stages 5b–9 per session as transcripts arrive.
+
+    Call :meth:`session_ready` (on the event loop) for each transcribed
+    session and :meth:`transcription_done` once transcription returns. The
+    ``wait_*`` coroutines block until a stage's look-ahead work has settled;
+    results are then read from the public dicts, keyed by session id.
+    """
+
+    def __init__(
+        self,
+        sessions: list[InputSession],
+        settings: BristlenoseSettings,
+        llm_client: LLMClient,
+        input_dir: Path,
+    ) -> None:
+        self.llm_client = llm_client
+        self._sessions = sessions
+        self._settings = settings
+        self._input_dir = input_dir
+        self._llm = controller_for(settings)
+        self._pii_lock = asyncio.Lock()
+        self._pii_engines: tuple[object, object] | None = None
+        self._consecutive_failures = 0
+        self._stopped = False
+
+        loop = asyncio.get_running_loop()
+        self._arrived: dict[str, asyncio.Future[list[TranscriptSegment]]] = {
+            s.session_id: loop.create_future() for s in sessions
+        }
+        self._speaker_tasks: dict[str, asyncio.Task[None]] = {}
+        self._pii_tasks: list[asyncio.Task[PiiCleanTranscript]] = []
+        self._topic_tasks: list[asyncio.Task[SessionTopicMap | None]] = []
+        self._quote_tasks: list[asyncio.Task[None]] = []
+
+        # Results, keyed by session id.
+        self.speaker_infos: dict[str, list[SpeakerInfo]] = {}
+        self.clean_transcripts: dict[str, PiiCleanTranscript] = {}
+        self.pii_redactions: dict[str, list[PiiRedaction]] = {}
+        self.topic_maps: dict[str, tuple[SessionTopicMap, StageOutcome]] = {}
+        self.quotes: dict[str, tuple[list[ExtractedQuote], StageOutcome]] = {}
+        self.speaker_errors: list[str] = []
+        self.topic_errors: list[str] = []
+        self.quote_errors: list[str] = []
+
+        self._release_task = asyncio.create_task(self._release_in_order())
+
+    # -- Inputs -------------------------------------------------------------
+
+    def session_ready(self, session_id: str, segments: list[TranscriptSegment]) -> None:
+        """Hand over one session's transcript and start its speaker pass.
+
+        ``segments`` must be the same list object the pipeline later keeps in
+        ``session_segments`` — 5b annotates it in place, exactly as the
+        stage block would.
+        """
+        fut = self._arrived.get(session_id)
+        if fut is None or fut.done():
+            return
+        fut.set_result(segments)
+        self._speaker_tasks[session_id] = asyncio.create_task(
+            self._speakers(session_id, segments),
+        )
+
+    def transcription_done(
+        self, session_segments: dict[str, list[TranscriptSegment]],
+    ) -> None:
+        """Settle every session that has not arrived (parsed, failed, skipped)."""
+        for session in self._sessions:
+            sid = session.session_id
+            self.session_ready(sid, session_segments.get(sid, []))
+
+    # -- Waiting ------------------------------------------------------------
+
+    async def wait_speakers(self) -> None:
+        """Block until 5b has finished for every arrived session."""
+        await asyncio.gather(*self._speaker_tasks.values())
+
+    async def wait_pii(self) -> None:
+        """Block until every session has been released through stage 7."""
+        await self._release_task
+        await asyncio.gather(*self._pii_tasks)
+
+    async def wait_topics(self) -> None:
+        """Block until every look-ahead stage 8 call has settled."""
+        await self.wait_pii()
+        await asyncio.gather(*self._topic_tasks)
+
+    async def wait_quotes(self) -> None:
+        """Block until every look-ahead stage 9 call has settled."""
+        await self.wait_topics()
+        await asyncio.gather(*self._quote_tasks)
+
+    def cancel(self) -> None:
+        """Abandon outstanding work (the run is being torn down)."""
+        self._release_task.cancel()
+        for task in [
+            *self._speaker_tasks.values(),
+            *self._pii_tasks, *self._topic_tasks, *self._quote_tasks,
+        ]:
+            task.cancel()
+
+    # -- Stage work ---------------------------------------------------------
+
+    async def _speakers(self, sid: str, segments: list[TranscriptSegment]) -> None:
+        """Stage 5b for one session — split pre-pass, heuristic, LLM refinement."""
+        from bristlenose.stages.s05b_identify_speakers import (
+            identify_speaker_roles_heuristic,
+            identify_speaker_roles_llm,
+            split_single_speaker_llm,
+        )
+
+        if not segments:
+            self.speaker_infos[sid] = []
+            return
+        with _llm_telemetry.stage("s05b_identify_speakers"), _llm_telemetry.session(sid):
+            # 5b calls ``analyze`` from this task, so the slot taken here is
+            # the one the call reuses.
+            if len({seg.speaker_label or "Unknown" for seg in segments}) <= 1:
+                async with self._llm:
+                    await split_single_speaker_llm(
+                        segments, self.llm_client, errors=self.speaker_errors,
+                    )
+            identify_speaker_roles_heuristic(segments)
+            async with self._llm:
+                infos = await identify_speaker_roles_llm(
+                    segments, self.llm_client, errors=self.speaker_errors,
+                )
+        self.speaker_infos[sid] = infos
+
+    async def _release_in_order(self) -> None:
+        """Assign participant codes and merge sessions strictly in input order."""
+        from bristlenose.stages.s05b_identify_speakers import assign_speaker_codes
+        from bristlenose.stages.s06_merge_transcript import merge_transcripts
+
+        next_pnum = 1
+        for session in self._sessions:
+            sid = session.session_id
+            segments = await self._arrived[sid]
+            if not segments:
+                continue
+            await self._speaker_tasks[sid]
+            label_map, next_pnum = assign_speaker_codes(next_pnum, segments)
+            p_codes = [c for c in label_map.values() if c.startswith("p")]
+            if p_codes:
+                session.participant_id = p_codes[0]
+                session.participant_number = int(p_codes[0][1:])
+            # Merge a copy: merging extends word lists in place, and stage 6
+            # merges the originals again for the files it writes.
+            copies = [seg.model_copy(deep=True) for seg in segments]
+            merged = merge_transcripts([session], {sid: copies}, self._input_dir)
+            if not merged:
+                continue
+            pii = asyncio.create_task(self._remove_pii(merged[0]))
+            topics = asyncio.create_task(self._topics(pii))
+            self._pii_tasks.append(pii)
+            self._topic_tasks.append(topics)
+            self._quote_tasks.append(asyncio.create_task(self._quotes(pii, topics)))
+
+    async def _topics(
+        self, pii: asyncio.Task[PiiCleanTranscript],
+    ) -> SessionTopicMap | None:
+        """Stage 8 for one session; the topic map only when the call succeeded."""
+        from bristlenose.stages.s08_topic_segmentation import segment_topics
+
+        clean = await pii
+        if self._stopped:
+            return None
+        # The stage takes its slot per call from the shared controller. Holding
+        # one here would deadlock: the stage gathers child tasks, and a slot is
+        # only reused by the task that acquired it.
+        with _llm_telemetry.stage("s08_topic_segmentation"):
+            maps, outcome = await segment_topics(
+                [clean], self.llm_client, errors=self.topic_errors, semaphore=self._llm,
+            )
+        self.topic_maps[clean.session_id] = (maps[0], outcome)
+        return maps[0] if self._record(outcome) else None
+
+    async def _quotes(
+        self,
+        pii: asyncio.Task[PiiCleanTranscript],
+        topics: asyncio.Task[SessionTopicMap | None],
+    ) -> None:
+        """Stage 9 for one session, only after its stage 8 succeeded."""
+        from bristlenose.stages.s09_quote_extraction import extract_quotes
+
+        clean = await pii
+        topic_map = await topics
+        if topic_map is None:
+            return
+        if self._stopped:
+            return
+        with _llm_telemetry.stage("s09_quote_extraction"):
+            quotes, outcome = await extract_quotes(
+                [clean], [topic_map], self.llm_client,
+                min_quote_words=self._settings.min_quote_words,
+                errors=self.quote_errors,
+                semaphore=self._llm,
+            )
+        self.quotes[clean.session_id] = (quotes, outcome)
+        self._record(outcome)
+
+    async def _remove_pii(self, transcript: FullTranscript) -> PiiCleanTranscript:
+        sid = transcript.session_id
+        if not self._settings.pii_enabled:
+            clean = PiiCleanTranscript(
+                session_id=transcript.session_id,
+                participant_id=transcript.participant_id,
+                source_file=transcript.source_file,
+                session_date=transcript.session_date,
+                duration_seconds=transcript.duration_seconds,
+                segments=transcript.segments,
+            )
+            self.clean_transcripts[sid] = clean
+            self.pii_redactions[sid] = []
+            return clean
+
+        from bristlenose.stages.s07_pii_removal import _init_presidio, remove_pii
+
+        # One Presidio instance for the whole stream, used by one thread at a
+        # time: spaCy loads once instead of once per session.
+        async with self._pii_lock:
+            if self._pii_engines is None:
+                self._pii_engines = await asyncio.to_thread(
+                    _init_presidio, self._settings,
+                )
+            cleaned, redactions = await asyncio.to_thread(
+                remove_pii, [transcript], self._settings, engines=self._pii_engines,
+            )
+        self.clean_transcripts[sid] = cleaned[0]
+        self.pii_redactions[sid] = redactions
+        return cleaned[0]
+
+    def _record(self, outcome: StageOutcome) -> bool:
+        """Track the failure streak; False when this call failed."""
+        if outcome.succeeded:
+            self._consecutive_failures = 0
+            return True
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= _FAIL_THRESHOLD and not self._stopped:
+            logger.warning(
+                "Stopping session look-ahead — %d consecutive LLM failures",
+                self._consecutive_failures,
+            )
+            self._stopped = True
+        return False
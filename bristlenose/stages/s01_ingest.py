@@ -5,10 +5,12 @@ from __future__ import annotations
 import logging
 import platform
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import NamedTuple
 
+from bristlenose.media_probe_cache import MediaProbeCache
 from bristlenose.models import (
     FileType,
     InputFile,
@@ -16,7 +18,7 @@ from bristlenose.models import (
     classify_file,
 )
 from bristlenose.refusals import MESSAGES, UnusableReason
-from bristlenose.utils.audio import probe_duration
+from bristlenose.utils.audio import probe_media
 from bristlenose.utils.fs import is_dataless, is_os_metadata
 
 logger = logging.getLogger(__name__)
@@ -98,6 +100,11 @@ OUTPUT_DIR_NAME = "bristlenose-output"
 
 _MAX_SCAN_DEPTH = 3
 
+# Max concurrent ffprobe processes at discovery.  Each is short and mostly
+# waits on the file's header — on a network or cloud-synced volume, on the
+# wire — so overlapping several is the whole win.
+_PROBE_CONCURRENCY = 8
+
 
 def _refuse_reason(input_dir: Path) -> str | None:
     """Return why *input_dir* cannot be a study folder, or None if it can.
@@ -124,7 +131,9 @@ def _refuse_reason(input_dir: Path) -> str | None:
 
 
 def discover_files(
-    input_dir: Path, skipped: list[SkippedFile] | None = None
+    input_dir: Path,
+    skipped: list[SkippedFile] | None = None,
+    probe_cache: Path | None = None,
 ) -> list[InputFile]:
     """Scan an input directory for supported files.
 
@@ -132,6 +141,8 @@ def discover_files(
         input_dir: Directory to scan.
         skipped: Optional list to collect files that were declined. Pass one to
             report them to the user; omit it and the behaviour is unchanged.
+        probe_cache: Optional ``media-probe.json`` (see ``media_probe_cache``).
+            Unchanged files take their duration from it instead of ffprobe.
 
     Returns a list of InputFile objects sorted by creation date.
 
@@ -147,6 +158,7 @@ def discover_files(
 
     files: list[InputFile] = []
     _scan_dir(input_dir, 0, files, skipped)
+    _probe_media_files(files, MediaProbeCache(probe_cache))
 
     # Sort by creation date, then filename as tiebreaker
     files.sort(key=lambda f: (f.created_at, f.path.name))
@@ -229,27 +241,56 @@ def _try_add_file(
     created_at = _get_creation_time(path)
     size_bytes = path.stat().st_size
 
-    # Probe duration for audio/video files — but never fault a cloud placeholder
-    # in to do it. `probe_duration` materialises before probing, so scanning a
-    # folder holding evicted recordings would download them all just to learn
-    # their length. Duration at scan time is a nicety; the bytes are genuinely
-    # needed at transcription, where the wait is expected and attributable.
-    duration: float | None = None
-    if file_type in (FileType.AUDIO, FileType.VIDEO) and not is_dataless(path):
-        duration = probe_duration(path)
-
     files.append(
         InputFile(
             path=path,
             file_type=file_type,
             created_at=created_at,
             size_bytes=size_bytes,
-            duration_seconds=duration,
         )
     )
     logger.debug("Found %s file: %s", file_type.value, path.name)
 
 
+def _probe_media_files(files: list[InputFile], cache: MediaProbeCache) -> None:
+    """Fill in duration and audio-stream presence for audio/video files.
+
+    Unchanged files are answered from *cache*; the rest are probed
+    concurrently, up to ``_PROBE_CONCURRENCY`` ffprobe processes at a time.
+
+    Never faults a cloud placeholder in to do it. `probe_media` materialises
+    before probing, so scanning a folder holding evicted recordings would
+    download them all just to learn their length. Duration at scan time is a
+    nicety; the bytes are genuinely needed at transcription, where the wait is
+    expected and attributable.
+    """
+    misses: list[InputFile] = []
+    hits = 0
+    for f in files:
+        if f.file_type not in (FileType.AUDIO, FileType.VIDEO) or is_dataless(f.path):
+            continue
+        probe = cache.get(f.path)
+        if probe is None:
+            misses.append(f)
+        else:
+            hits += 1
+            f.duration_seconds = probe.duration
+            f.has_audio_stream = probe.has_audio
+
+    if misses:
+        workers = min(len(misses), _PROBE_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            probes = list(pool.map(probe_media, [f.path for f in misses]))
+        for f, probe in zip(misses, probes):
+            if probe is None:
+                continue
+            f.duration_seconds = probe.duration
+            f.has_audio_stream = probe.has_audio
+            cache.put(f.path, probe)
+    logger.debug("Probed %d media file(s), %d more from cache", len(misses), hits)
+    cache.save()
+
+
 # -- Platform filename patterns --------------------------------------------------
 
 # Teams. Two real specimens, both captured 15 Aug 2026 — note the separator is
@@ -484,7 +525,9 @@ def group_into_sessions(files: list[InputFile]) -> list[InputSession]:
 
 
 def ingest(
-    input_dir: Path, skipped: list[SkippedFile] | None = None
+    input_dir: Path,
+    skipped: list[SkippedFile] | None = None,
+    probe_cache: Path | None = None,
 ) -> list[InputSession]:
     """Full ingestion pipeline: discover files, group into sessions.
 
@@ -494,6 +537,8 @@ def ingest(
             put it on the run's terminus summary. Omit it and the behaviour is
             unchanged — the refusals are still logged, they just reach no
             surface but the log. Mirrors ``discover_files``.
+        probe_cache: Optional media probe cache file, passed to
+            ``discover_files``.
 
     Returns:
         List of InputSession objects, ordered by participant number.
@@ -501,7 +546,7 @@ def ingest(
     logger.info("Ingesting files from %s", input_dir)
     if skipped is None:
         skipped = []
-    files = discover_files(input_dir, skipped)
+    files = discover_files(input_dir, skipped, probe_cache)
 
     # Say what was left out, by name. A count alone does not let a researcher
     # work out which participant is missing.
@@ -130,13 +130,20 @@ async def _extract_one(
         # the run loud rather than silently skip transcription. Its
         # MediaFileDamagedError subclass IS caught — that one is a verdict on
         # the file, not on the tool.
-        try:
-            has_audio = await asyncio.to_thread(has_audio_stream, video_path)
-        except MediaFileDamagedError as exc:
-            _record_unusable(
-                session, video_path, classify_unreadable(video_path), exc
-            )
-            return
+        #
+        # Ingest usually probed the file already (or took the answer from its
+        # cache) — only a file it could not probe is asked again here.
+        has_audio = next(
+            (f.has_audio_stream for f in session.files if f.path == video_path), None
+        )
+        if has_audio is None:
+            try:
+                has_audio = await asyncio.to_thread(has_audio_stream, video_path)
+            except MediaFileDamagedError as exc:
+                _record_unusable(
+                    session, video_path, classify_unreadable(video_path), exc
+                )
+                return
 
         if not has_audio:
             _record_unusable(session, video_path, UnusableReason.NO_AUDIO, None)
@@ -10,8 +10,13 @@ The backend can be overridden via settings.whisper_backend.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from bristlenose.config import BristlenoseSettings
 from bristlenose.events import (
@@ -20,6 +25,7 @@ from bristlenose.events import (
     StageFailure,
     StageOutcome,
 )
+from bristlenose.hashing import hash_file_metadata
 from bristlenose.models import InputSession, TranscriptSegment, Word
 from bristlenose.run_lifecycle import categorise_exception
 from bristlenose.utils.hardware import AcceleratorType, HardwareInfo, detect_hardware
@@ -104,7 +110,11 @@ def transcribe_sessions(
     settings: BristlenoseSettings,
     *,
     on_progress: ProgressCallback | None = None,
-    on_segment: object | None = None,
+    on_segment: Callable[[int, int, float, float], None] | None = None,
+    window_dir: Path | None = None,
+    resumed_windows: dict[str, set[str]] | None = None,
+    on_window: Callable[[str, str], None] | None = None,
+    on_session: Callable[[str, list[TranscriptSegment]], None] | None = None,
 ) -> tuple[dict[str, list[TranscriptSegment]], StageOutcome]:
     """Transcribe audio for sessions that need it.
 
@@ -121,6 +131,17 @@ def transcribe_sessions(
         on_segment: Optional callback(file_index, file_total, seconds_done,
             file_seconds) called repeatedly *within* a file as audio is
             transcribed — faster-whisper only (mlx is one blocking call).
+        window_dir: Where chunked transcription (``whisper_chunk_seconds``)
+            persists finished windows, one subdirectory per session. None =
+            windows stay in memory and an interrupted file restarts.
+        resumed_windows: session_id -> window keys a previous run recorded
+            as complete in the manifest; only these are read back.
+        on_window: Optional callback(session_id, window_key) after each
+            window is persisted, so the caller can record it in the manifest.
+        on_session: Optional callback(session_id, segments) as soon as each
+            session finishes, in completion order — the same list object that
+            ends up in ``results`` (empty on failure). Lets the caller start
+            downstream work before the whole batch is done.
 
     Returns:
         Tuple of (results, outcome). ``results`` maps session_id to
@@ -140,18 +161,46 @@ def transcribe_sessions(
     # Detect hardware and choose backend
     hw = detect_hardware()
     backend = _resolve_backend(settings.whisper_backend, hw)
+    workers = _resolve_workers(settings, hw, backend, len(needs_transcription))
 
     logger.info(
-        "Transcribing %d sessions | backend=%s | model=%s | %s",
+        "Transcribing %d sessions | backend=%s | model=%s | workers=%d | %s",
         len(needs_transcription),
         backend,
         settings.whisper_model,
+        workers,
         hw.summary(),
     )
 
+    chunked = backend == "faster-whisper" and settings.whisper_chunk_seconds > 0
+    stores: dict[str, WindowStore] = {}
+    if chunked:
+        stores = {
+            s.session_id: _window_store(
+                s, settings, window_dir, (resumed_windows or {}).get(s.session_id),
+            )
+            for s in needs_transcription
+        }
+
+    if workers > 1:
+        return _transcribe_pool(
+            needs_transcription, settings, hw, workers,
+            on_progress=on_progress, on_segment=on_segment,
+            stores=stores, on_window=on_window, on_session=on_session,
+        )
+
     # Initialise the chosen backend
     if backend == "mlx":
         transcribe_fn = _init_mlx_backend(settings)
+    elif chunked and not hw.cuda_available:
+        # One model, several ctranslate2 workers: windows of the same file
+        # decode side by side, each worker on its share of the cores.
+        window_workers = _requested_workers(settings, hw)
+        transcribe_fn = _init_faster_whisper_backend(
+            settings, hw,
+            cpu_threads=max(1, (hw.cpu_cores or window_workers) // window_workers),
+            window_workers=window_workers,
+        )
     else:
         transcribe_fn = _init_faster_whisper_backend(settings, hw)
 
@@ -173,51 +222,532 @@ def transcribe_sessions(
                 on_segment(_i, total, seconds_done, file_seconds)
 
         try:
-            # Only pass on_segment when a caller actually wants the within-file
-            # heartbeat — keeps backward-compat with transcribe_fn callables
-            # (and test stubs) that take only (audio_path, settings).
+            # Only pass on_segment / windows when a caller actually wants
+            # them — keeps backward-compat with transcribe_fn callables (and
+            # test stubs) that take only (audio_path, settings).
+            kwargs: dict[str, object] = {}
             if seg_cb is not None:
-                segments = transcribe_fn(
-                    session.audio_path, settings, on_segment=seg_cb,
-                )
-            else:
-                segments = transcribe_fn(session.audio_path, settings)
-            results[session.session_id] = segments
-            outcome.succeeded += 1
+                kwargs["on_segment"] = seg_cb
+            store = stores.get(session.session_id)
+            if store is not None:
+                if on_window is not None:
+                    store.on_complete = (
+                        lambda key, _sid=session.session_id: on_window(_sid, key)
+                    )
+                kwargs["windows"] = store
+            segments = transcribe_fn(session.audio_path, settings, **kwargs)
+            _record_success(results, outcome, session, segments)
+        except Exception as exc:
+            _record_failure(results, outcome, session, exc)
+
+        if on_session:
+            on_session(session.session_id, results[session.session_id])
+        if on_progress:
+            on_progress(i, total)
+
+    return results, outcome
+
+
+def _record_success(
+    results: dict[str, list[TranscriptSegment]],
+    outcome: StageOutcome,
+    session: InputSession,
+    segments: list[TranscriptSegment],
+) -> None:
+    results[session.session_id] = segments
+    outcome.succeeded += 1
+    logger.info(
+        "%s: Transcribed %d segments",
+        session.session_id,
+        len(segments),
+    )
+
+
+def _record_failure(
+    results: dict[str, list[TranscriptSegment]],
+    outcome: StageOutcome,
+    session: InputSession,
+    exc: BaseException,
+) -> None:
+    logger.error(
+        "%s: Transcription failed: %s",
+        session.session_id,
+        exc,
+    )
+    results.setdefault(session.session_id, [])
+    # Categorise the exception. Default-category fallback is WHISPER
+    # (more useful than UNKNOWN for transcription-stage failures).
+    cause = categorise_exception(exc)
+    if cause.category == CauseCategoryEnum.UNKNOWN:
+        cause = Cause(
+            category=CauseCategoryEnum.WHISPER,
+            message=cause.message,
+            stage="s05_transcribe",
+            session_id=session.session_id,
+        )
+    else:
+        cause = cause.model_copy(update={
+            "stage": "s05_transcribe",
+            "session_id": session.session_id,
+        })
+    outcome.failed.append(StageFailure(
+        session_id=session.session_id, cause=cause,
+    ))
+
+
+# ---------------------------------------------------------------------------
+# Chunked transcription (long files split on silences)
+# ---------------------------------------------------------------------------
+
+# Each window reaches this far into its neighbours so speech cut at a seam is
+# heard whole by at least one window; the duplicate is trimmed on stitching.
+_WINDOW_OVERLAP_SECONDS = 3.0
+_SAMPLE_RATE = 16000  # faster-whisper's native input rate
+
+
+@dataclass(frozen=True)
+class TranscribeWindow:
+    """One slice of a long recording.
+
+    ``start``/``end`` is the audio actually decoded (core plus overlap);
+    ``core_start``/``core_end`` is the span this window owns when stitching.
+    """
+
+    index: int
+    start: float
+    end: float
+    core_start: float
+    core_end: float
+
+    @property
+    def key(self) -> str:
+        return f"{int(self.start * 1000)}-{int(self.end * 1000)}"
+
+
+@dataclass
+class WindowStore:
+    """Per-session on-disk cache of finished windows.
+
+    ``fingerprint`` ties a window to the source media, model, language and
+    window length, so a changed recording or setting never reuses stale
+    text. Only keys in ``trusted`` (recorded complete in the manifest) are
+    read back — a file on disk without a manifest entry may be half-written.
+    """
+
+    directory: Path | None
+    fingerprint: str
+    trusted: frozenset[str] = frozenset()
+    on_complete: Callable[[str], None] | None = field(default=None, repr=False)
+
+    def _path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / f"{key}.json"
+
+    def window_key(self, window: TranscribeWindow) -> str:
+        return f"{self.fingerprint}-{window.key}"
+
+    def load(self, window: TranscribeWindow) -> list[TranscriptSegment] | None:
+        key = self.window_key(window)
+        path = self._path(key)
+        if key not in self.trusted or path is None or not path.exists():
+            return None
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            return [TranscriptSegment.model_validate(s) for s in raw]
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable transcription window %s", path)
+            return None
+
+    def save(self, window: TranscribeWindow, segments: list[TranscriptSegment]) -> None:
+        key = self.window_key(window)
+        path = self._path(key)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps([seg.model_dump(mode="json") for seg in segments]),
+                encoding="utf-8",
+            )
+            tmp.rename(path)
+        if self.on_complete is not None:
+            self.on_complete(key)
+
+
+def _window_store(
+    session: InputSession,
+    settings: BristlenoseSettings,
+    window_dir: Path | None,
+    trusted: set[str] | None,
+) -> WindowStore:
+    # Fingerprint the *source* files, not ``audio_path``: audio extracted from
+    # video is rewritten into .bristlenose/temp/ on every run.
+    source = hash_file_metadata([f.path for f in session.files])
+    fingerprint = hashlib.sha256(
+        f"{source}|{settings.whisper_model}|{settings.whisper_language}"
+        f"|{settings.whisper_chunk_seconds}".encode()
+    ).hexdigest()[:12]
+    return WindowStore(
+        directory=window_dir / session.session_id if window_dir else None,
+        fingerprint=fingerprint,
+        trusted=frozenset(trusted or ()),
+    )
+
+
+def plan_windows(
+    speech: list[tuple[float, float]],
+    duration: float,
+    target_seconds: float,
+    overlap: float = _WINDOW_OVERLAP_SECONDS,
+) -> list[TranscribeWindow]:
+    """Cut ``duration`` seconds of audio into windows of about ``target_seconds``.
+
+    Cuts land in the middle of the silence (gap between ``speech`` regions)
+    nearest each ideal boundary, searching a quarter-window either side; with
+    no silence in reach the cut falls on the ideal boundary and the overlap
+    absorbs the split word. A tail shorter than half a window is folded into
+    the last window rather than transcribed on its own.
+    """
+    if duration <= target_seconds * 1.5:
+        return [TranscribeWindow(0, 0.0, duration, 0.0, duration)]
+
+    gaps: list[float] = []
+    prev_end = 0.0
+    for start, end in sorted(speech):
+        if start > prev_end:
+            gaps.append((prev_end + start) / 2)
+        prev_end = max(prev_end, end)
+    if prev_end < duration:
+        gaps.append((prev_end + duration) / 2)
+
+    cuts: list[float] = []
+    core_start = 0.0
+    reach = target_seconds / 4
+    while duration - core_start > target_seconds * 1.5:
+        ideal = core_start + target_seconds
+        nearby = [g for g in gaps if abs(g - ideal) <= reach]
+        cut = min(nearby, key=lambda g: abs(g - ideal)) if nearby else ideal
+        cuts.append(cut)
+        core_start = cut
+
+    bounds = [0.0, *cuts, duration]
+    return [
+        TranscribeWindow(
+            index=i,
+            start=max(0.0, lo - overlap),
+            end=min(duration, hi + overlap),
+            core_start=lo,
+            core_end=hi,
+        )
+        for i, (lo, hi) in enumerate(zip(bounds, bounds[1:]))
+    ]
+
+
+def _norm_token(token: str) -> str:
+    return "".join(c for c in token.lower() if c.isalnum())
+
+
+def _words_after(words: list[Word], dropped: str) -> list[Word] | None:
+    """The words left once the normalised text ``dropped`` is consumed.
+
+    Whisper's word list need not split the way ``text.split()`` does
+    ("set" + "tings", "20" + "%"), so words are matched by their letters,
+    not their position. None when the words don't spell ``dropped``.
+    """
+    consumed = ""
+    for i, word in enumerate(words):
+        if consumed == dropped:
+            return words[i:]
+        consumed += _norm_token(word.text)
+        if not dropped.startswith(consumed):
+            return None
+    return [] if consumed == dropped else None
+
+
+def _trim_seam_repeat(
+    prev: TranscriptSegment, nxt: TranscriptSegment,
+) -> TranscriptSegment | None:
+    """Drop the head of ``nxt`` that repeats the tail of ``prev``.
+
+    Overlapping windows both hear the speech around a seam, so the last
+    words of one window and the first of the next often coincide. Same rule
+    as ``collapse_adjacent_repeats``: the longest matching n-gram (8 → 1)
+    wins, and a lone interjection ("yeah" / "yeah") is left alone because
+    people really do say it twice. Returns None when nothing of ``nxt`` is
+    left.
+    """
+    prev_tokens = [_norm_token(t) for t in prev.text.split()]
+    next_raw = nxt.text.split()
+    next_tokens = [_norm_token(t) for t in next_raw]
+    for n in range(min(8, len(prev_tokens), len(next_tokens)), 0, -1):
+        if prev_tokens[-n:] != next_tokens[:n]:
+            continue
+        if n == 1 and _is_reduplicable(next_raw[0]):
+            return nxt
+        rest = next_raw[n:]
+        if not rest:
+            return None
+        words = _words_after(nxt.words, "".join(next_tokens[:n]))
+        if words is None:
+            # Words that don't spell the text: drop the ones ``prev`` already
+            # covers in time instead.
+            words = [w for w in nxt.words if (w.start_time + w.end_time) / 2 >= prev.end_time]
+        return nxt.model_copy(update={
+            "text": " ".join(rest),
+            "words": words,
+            "start_time": words[0].start_time if words else nxt.start_time,
+        })
+    return nxt
+
+
+def stitch_windows(
+    windows: list[TranscribeWindow],
+    per_window: list[list[TranscriptSegment]],
+) -> list[TranscriptSegment]:
+    """Join per-window segments (already on the file's timeline) into one list.
+
+    Each segment belongs to the window whose core holds its midpoint, so a
+    sentence decoded twice in the overlap is kept once. What survives at each
+    seam is then checked for a repeated n-gram across the join.
+    """
+    stitched: list[TranscriptSegment] = []
+    last = len(windows) - 1
+    for window, segments in zip(windows, per_window):
+        owned = [
+            seg for seg in segments
+            if window.core_start <= (seg.start_time + seg.end_time) / 2
+            and (
+                (seg.start_time + seg.end_time) / 2 < window.core_end
+                or window.index == last
+            )
+        ]
+        if stitched and owned:
+            head = _trim_seam_repeat(stitched[-1], owned[0])
+            owned = owned[1:] if head is None else [head, *owned[1:]]
+        stitched.extend(owned)
+    return stitched
+
+
+# ---------------------------------------------------------------------------
+# Worker pool (faster-whisper on CPU)
+# ---------------------------------------------------------------------------
+
+# How often the parent wakes to drain worker heartbeats while files decode.
+_POOL_POLL_SECONDS = 0.25
+# How long the parent waits for a finished worker's last queued messages.
+_POOL_END_TIMEOUT_SECONDS = 10.0
+
+
+def _resolve_workers(
+    settings: BristlenoseSettings,
+    hw: HardwareInfo,
+    backend: str,
+    n_sessions: int,
+) -> int:
+    """How many model replicas to run for this batch.
+
+    Only faster-whisper on CPU fans out: CUDA and MLX already saturate one
+    device from a single model, and extra replicas would just contend for it.
+    Never more replicas than sessions — each one pays a full model load.
+    """
+    if backend != "faster-whisper" or hw.cuda_available:
+        return 1
+    return max(1, min(_requested_workers(settings, hw), n_sessions))
+
+
+def _requested_workers(settings: BristlenoseSettings, hw: HardwareInfo) -> int:
+    """``whisper_workers``, with 0 resolved from the detected hardware."""
+    if settings.whisper_workers == 0:
+        return hw.recommended_whisper_workers(settings.whisper_model)
+    return settings.whisper_workers
+
+
+# Per-process state for pool workers, populated once by ``_pool_init`` so the
+# model loads once per replica rather than once per session.
+_pool_transcribe_fn: object | None = None
+_pool_heartbeats: object | None = None
+
+
+def _pool_init(
+    init_backend: object,
+    settings: BristlenoseSettings,
+    hw: HardwareInfo,
+    cpu_threads: int,
+    heartbeats: object,
+) -> None:
+    global _pool_transcribe_fn, _pool_heartbeats
+    _pool_transcribe_fn = init_backend(  # type: ignore[operator]
+        settings, hw, cpu_threads=cpu_threads,
+    )
+    _pool_heartbeats = heartbeats
+
+
+def _pool_transcribe(
+    index: int,
+    audio_path: Path,
+    settings: BristlenoseSettings,
+    store: WindowStore | None = None,
+) -> list[TranscriptSegment]:
+    queue = _pool_heartbeats
+
+    def seg_cb(seconds_done: float, file_seconds: float) -> None:
+        queue.put(("segment", index, seconds_done, file_seconds))  # type: ignore[attr-defined]
+
+    kwargs: dict[str, object] = {"on_segment": seg_cb}
+    if store is not None:
+        # The manifest lives in the parent; report each persisted window back.
+        store.on_complete = lambda key: queue.put(("window", index, key, 0.0))  # type: ignore[attr-defined]
+        kwargs["windows"] = store
+    try:
+        return _pool_transcribe_fn(audio_path, settings, **kwargs)  # type: ignore[operator]
+    finally:
+        # Last message for this session: everything it sent is queued ahead.
+        queue.put(("end", index, 0.0, 0.0))  # type: ignore[attr-defined]
+
+
+def _transcribe_pool(
+    sessions: list[InputSession],
+    settings: BristlenoseSettings,
+    hw: HardwareInfo,
+    workers: int,
+    *,
+    on_progress: Callable[[int, int], None] | None = None,
+    on_segment: Callable[[int, int, float, float], None] | None = None,
+    init_backend: object | None = None,
+    stores: dict[str, WindowStore] | None = None,
+    on_window: Callable[[str, str], None] | None = None,
+    on_session: Callable[[str, list[TranscriptSegment]], None] | None = None,
+) -> tuple[dict[str, list[TranscriptSegment]], StageOutcome]:
+    """Shard sessions across ``workers`` faster-whisper replicas.
+
+    Each replica is a spawned process holding its own ``WhisperModel`` with
+    an even share of the cores as ctranslate2 threads. Spawn rather than fork:
+    the parent may already have ctranslate2 / tokenizer threads running, and
+    forking a threaded process is undefined behaviour.
+
+    Heartbeats flow back over a queue. Because several files decode at once,
+    ``on_segment`` reports the *batch*: ``file_index`` is completed files + 1
+    and ``seconds_done / file_seconds`` is audio decoded over audio in flight,
+    which keeps the caller's ``(file_index - 1 + fraction) / total`` maths
+    honest without it knowing about the pool. ``on_progress`` ticks once per
+    finished file, in completion order, and so does ``on_session``.
+
+    ``stores`` carries each session's :class:`WindowStore` into its worker
+    when chunking is on; window completions come back over the same queue
+    and are handed to ``on_window`` in the parent. A future can resolve
+    before its heartbeats are read, so each worker closes its session with
+    an ``"end"`` message and the parent keeps reading until every session
+    whose worker survived has sent one.
+
+    ``init_backend`` is the per-replica model loader (module-level, so it
+    pickles by reference); defaults to ``_init_faster_whisper_backend``.
+    """
+    import multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from concurrent.futures.process import BrokenProcessPool
+    from queue import Empty
+
+    total = len(sessions)
+    cpu_threads = max(1, (hw.cpu_cores or workers) // workers)
+    ctx = multiprocessing.get_context("spawn")
+    heartbeats = ctx.Queue()
+
+    by_index: dict[int, list[TranscriptSegment]] = {}
+    errors: dict[int, BaseException] = {}
+    in_flight: dict[int, tuple[float, float]] = {}
+    ended: set[int] = set()
+    done_count = 0
+
+    def _handle(kind: str, index: int, a: Any, b: float) -> None:
+        if kind == "end":
+            ended.add(index)
+        elif kind == "window":
+            if on_window is not None:
+                on_window(sessions[index - 1].session_id, a)
+        elif index not in by_index and index not in errors:
+            in_flight[index] = (a, b)
+
+    def _drain() -> None:
+        try:
+            while True:
+                _handle(*heartbeats.get_nowait())
+        except Empty:
+            pass
+        if on_segment is not None and in_flight:
+            seconds = sum(done for done, _ in in_flight.values())
+            span = sum(length for _, length in in_flight.values())
+            on_segment(done_count + 1, total, seconds, span)
+
+    logger.info(
+        "Whisper pool: %d replicas x %d threads", workers, cpu_threads,
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_pool_init,
+        initargs=(
+            init_backend or _init_faster_whisper_backend,
+            settings, hw, cpu_threads, heartbeats,
+        ),
+    ) as pool:
+        futures = {}
+        for i, session in enumerate(sessions, start=1):
+            assert session.audio_path is not None
             logger.info(
-                "%s: Transcribed %d segments",
+                "%s: Transcribing %s",
                 session.session_id,
-                len(segments),
+                session.audio_path.name,
             )
-        except Exception as exc:
-            logger.error(
-                "%s: Transcription failed: %s",
-                session.session_id,
-                exc,
+            futures[pool.submit(
+                _pool_transcribe, i, session.audio_path, settings,
+                (stores or {}).get(session.session_id),
+            )] = i
+
+        pending = set(futures)
+        while pending:
+            finished, pending = wait(
+                pending, timeout=_POOL_POLL_SECONDS, return_when=FIRST_COMPLETED,
             )
-            results[session.session_id] = []
-            # Categorise the exception. Default-category fallback is WHISPER
-            # (more useful than UNKNOWN for transcription-stage failures).
-            cause = categorise_exception(exc)
-            if cause.category == CauseCategoryEnum.UNKNOWN:
-                cause = Cause(
-                    category=CauseCategoryEnum.WHISPER,
-                    message=cause.message,
-                    stage="s05_transcribe",
-                    session_id=session.session_id,
+            for fut in finished:
+                index = futures[fut]
+                try:
+                    by_index[index] = fut.result()
+                except Exception as exc:
+                    errors[index] = exc
+                    by_index[index] = []
+                in_flight.pop(index, None)
+                if on_session:
+                    on_session(sessions[index - 1].session_id, by_index[index])
+                done_count += 1
+                if on_progress:
+                    on_progress(done_count, total)
+            _drain()
+        # Window reports can still be in the pipe after their future
+        # resolved. A worker that died sends no "end", so don't wait on it.
+        expected = {
+            i for i in futures.values()
+            if not isinstance(errors.get(i), BrokenProcessPool)
+        }
+        while not expected <= ended:
+            try:
+                _handle(*heartbeats.get(timeout=_POOL_END_TIMEOUT_SECONDS))
+            except Empty:
+                logger.warning(
+                    "Whisper pool: no end-of-session report for %d session(s)",
+                    len(expected - ended),
                 )
-            else:
-                cause = cause.model_copy(update={
-                    "stage": "s05_transcribe",
-                    "session_id": session.session_id,
-                })
-            outcome.failed.append(StageFailure(
-                session_id=session.session_id, cause=cause,
-            ))
-
-        if on_progress:
-            on_progress(i, total)
+                break
 
+    # Record in input order so results/outcome match the serial path exactly,
+    # keeping the list objects ``on_session`` was handed.
+    results: dict[str, list[TranscriptSegment]] = {}
+    outcome = StageOutcome(attempted=total)
+    for i, session in enumerate(sessions, start=1):
+        if i in errors:
+            results[session.session_id] = by_index[i]
+            _record_failure(results, outcome, session, errors[i])
+        else:
+            _record_success(results, outcome, session, by_index[i])
     return results, outcome
 
 
@@ -386,10 +916,18 @@ def _mlx_model_name(whisper_model: str) -> str:
 def _init_faster_whisper_backend(
     settings: BristlenoseSettings,
     hw: HardwareInfo,
+    *,
+    cpu_threads: int = 0,
+    window_workers: int = 1,
 ) -> callable:  # type: ignore[valid-type]
     """Initialise the faster-whisper backend.
 
     Uses CUDA on NVIDIA GPUs, CPU with INT8 quantization otherwise.
+    ``cpu_threads`` caps ctranslate2's intra-op threads (0 = library
+    default); pool workers pass their share of the cores.
+    ``window_workers`` is how many windows of one chunked file decode at
+    once — ctranslate2 keeps that many model workers, each on
+    ``cpu_threads`` threads.
 
     Returns:
         A function(audio_path, settings) -> list[TranscriptSegment]
@@ -429,17 +967,21 @@ def _init_faster_whisper_backend(
         model_id,
         device=device,
         compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=window_workers,
         local_files_only=local_only,
     )
 
-    def transcribe_faster_whisper(
-        audio_path: Path,
-        settings: BristlenoseSettings,
-        on_segment: object | None = None,
+    language = settings.whisper_language if settings.whisper_language != "auto" else None
+
+    def _decode(
+        audio: object,
+        offset: float,
+        on_decoded: Callable[[float, float], None] | None = None,
     ) -> list[TranscriptSegment]:
         segments_iter, info = model.transcribe(
-            str(audio_path),
-            language=settings.whisper_language if settings.whisper_language != "auto" else None,
+            audio,
+            language=language,
             word_timestamps=True,
             vad_filter=True,
         )
@@ -459,8 +1001,8 @@ def _init_faster_whisper_backend(
                 words = [
                     Word(
                         text=w.word.strip(),
-                        start_time=w.start,
-                        end_time=w.end,
+                        start_time=w.start + offset,
+                        end_time=w.end + offset,
                         confidence=w.probability,
                     )
                     for w in segment.words
@@ -469,20 +1011,92 @@ def _init_faster_whisper_backend(
 
             transcript_segments.append(
                 TranscriptSegment(
-                    start_time=segment.start,
-                    end_time=segment.end,
+                    start_time=segment.start + offset,
+                    end_time=segment.end + offset,
                     text=collapse_adjacent_repeats(segment.text.strip()),
                     words=words,
                     source="faster-whisper",
                 )
             )
 
-            # Within-file heartbeat: how far through this file's audio we are.
+            # Within-file heartbeat: how far through this audio we are.
             # info.duration is the total audio length; segment.end is the
             # timestamp of the segment just decoded.
-            if on_segment is not None and info.duration:
-                on_segment(segment.end, info.duration)
+            if on_decoded is not None and info.duration:
+                on_decoded(segment.end, info.duration)
 
         return transcript_segments
 
+    def _transcribe_windowed(
+        audio_path: Path,
+        settings: BristlenoseSettings,
+        store: WindowStore,
+        on_segment: object | None,
+    ) -> list[TranscriptSegment]:
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        from faster_whisper.audio import decode_audio
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        audio = decode_audio(str(audio_path), sampling_rate=_SAMPLE_RATE)
+        duration = len(audio) / _SAMPLE_RATE
+        speech = [
+            (ts["start"] / _SAMPLE_RATE, ts["end"] / _SAMPLE_RATE)
+            for ts in get_speech_timestamps(
+                audio, VadOptions(min_silence_duration_ms=500),
+            )
+        ]
+        plan = plan_windows(speech, duration, float(settings.whisper_chunk_seconds))
+        per_window = [store.load(w) for w in plan]
+        todo = [w for w, segs in zip(plan, per_window) if segs is None]
+        logger.info(
+            "%s: %d windows over %.0fs (%d resumed, %d concurrent)",
+            audio_path.name, len(plan), duration,
+            len(plan) - len(todo), window_workers,
+        )
+
+        # Seconds decoded per window, written by decoder threads and read by
+        # this thread, which alone calls back into the caller. Every key exists
+        # up front so the dict never resizes under a concurrent read.
+        progress = {
+            w.index: (w.end - w.start if segs is not None else 0.0)
+            for w, segs in zip(plan, per_window)
+        }
+        span = sum(w.end - w.start for w in plan)
+
+        def _run(window: TranscribeWindow) -> list[TranscriptSegment]:
+            def _tick(seconds: float, _total: float) -> None:
+                progress[window.index] = seconds
+
+            chunk = audio[int(window.start * _SAMPLE_RATE):int(window.end * _SAMPLE_RATE)]
+            return _decode(chunk, window.start, _tick)
+
+        with ThreadPoolExecutor(max_workers=window_workers) as pool:
+            futures = {pool.submit(_run, w): w for w in todo}
+            pending = set(futures)
+            while pending:
+                finished, pending = wait(
+                    pending, timeout=_POOL_POLL_SECONDS, return_when=FIRST_COMPLETED,
+                )
+                for fut in finished:
+                    window = futures[fut]
+                    segments = fut.result()
+                    per_window[window.index] = segments
+                    progress[window.index] = window.end - window.start
+                    store.save(window, segments)
+                if on_segment is not None:
+                    on_segment(sum(progress.values()), span)  # type: ignore[operator]
+
+        return stitch_windows(plan, [segs or [] for segs in per_window])
+
+    def transcribe_faster_whisper(
+        audio_path: Path,
+        settings: BristlenoseSettings,
+        on_segment: object | None = None,
+        windows: WindowStore | None = None,
+    ) -> list[TranscriptSegment]:
+        if windows is not None and settings.whisper_chunk_seconds > 0:
+            return _transcribe_windowed(audio_path, settings, windows, on_segment)
+        return _decode(str(audio_path), 0.0, on_segment)  # type: ignore[arg-type]
+
     return transcribe_faster_whisper
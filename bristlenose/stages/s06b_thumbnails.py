@@ -0,0 +1,41 @@
+"""Stage 6b: Extract video thumbnails in the background.
+
+A thumbnail needs the session's video and its speaker roles (to pick a frame
+where the participant has just finished speaking), and both are settled once
+transcripts are merged. Nothing downstream needs the thumbnails until render,
+so the pipeline starts this stage as a task after stage 6 and lets it overlap
+the LLM stages; render awaits the result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+
+from bristlenose.models import FullTranscript, InputSession
+from bristlenose.utils.video import extract_thumbnails
+
+logger = logging.getLogger(__name__)
+
+
+async def extract_session_thumbnails(
+    sessions: list[InputSession],
+    transcripts: list[FullTranscript],
+    thumbnails_dir: Path,
+) -> dict[str, Path]:
+    """Extract (or reuse cached) thumbnails for every video session.
+
+    Returns:
+        Mapping of session_id to the thumbnail JPEG on disk. Empty when there
+        are no transcripts to choose frames from.
+    """
+    if not transcripts:
+        return {}
+    # extract_thumbnails blocks on FFmpeg (subprocess.run), so keep it off
+    # the event loop the LLM stages are running on.
+    thumbnails = await asyncio.to_thread(
+        extract_thumbnails, sessions, transcripts, thumbnails_dir,
+    )
+    logger.info("Thumbnails ready for %d session(s)", len(thumbnails))
+    return thumbnails
@@ -146,12 +146,17 @@ class PiiRedaction:
 def remove_pii(
     transcripts: list[FullTranscript],
     settings: BristlenoseSettings,
+    *,
+    engines: tuple[object, object] | None = None,
 ) -> tuple[list[PiiCleanTranscript], list[PiiRedaction]]:
     """Remove PII from transcripts using Presidio.
 
     Args:
         transcripts: Raw transcripts with PII.
         settings: Application settings.
+        engines: Already-initialised ``(analyzer, anonymizer)`` from
+            ``_init_presidio``, for callers that redact one session at a
+            time and shouldn't reload spaCy per call. Always in-process.
 
     Returns:
         Tuple of (cleaned transcripts, all redactions across all sessions).
@@ -187,20 +192,33 @@ def remove_pii(
             "approach — see docs/design-redact-pii.md."
         )
 
-    logger.info("Initialising Presidio (loads spaCy NLP model on first run)...")
-    analyzer, anonymizer = _init_presidio(settings)
+    # Flatten every session into one batch: the spaCy pass is the expensive
+    # part and ``nlp.pipe`` (in-process or per worker) wants long runs of text.
+    texts = [seg.text for t in transcripts for seg in t.segments]
+    timecodes = [seg.start_time for t in transcripts for seg in t.segments]
+
+    workers = 1 if engines is not None else _resolve_pii_workers(settings, len(texts))
+    if workers > 1:
+        _ensure_spacy_model()
+        logger.info("Redacting PII across %d Presidio workers...", workers)
+        redacted = _redact_pool(texts, timecodes, settings, workers)
+    else:
+        if engines is None:
+            logger.info("Initialising Presidio (loads spaCy NLP model on first run)...")
+            engines = _init_presidio(settings)
+        analyzer, anonymizer = engines
+        redacted = _redact_texts(texts, timecodes, analyzer, anonymizer, settings)
 
     clean_transcripts: list[PiiCleanTranscript] = []
     all_redactions: list[PiiRedaction] = []
+    results = iter(redacted)
 
     for transcript in transcripts:
         total_entities = 0
         clean_segments: list[TranscriptSegment] = []
 
         for seg in transcript.segments:
-            clean_text, redactions = _redact_text(
-                seg.text, seg.start_time, analyzer, anonymizer, settings
-            )
+            clean_text, redactions = next(results)
             total_entities += len(redactions)
             all_redactions.extend(redactions)
 
@@ -420,7 +438,11 @@ def _init_presidio(
         (AnalyzerEngine, AnonymizerEngine) tuple.
     """
     _ensure_spacy_model()
+    return _build_presidio_engines()
 
+
+def _build_presidio_engines() -> tuple[object, object]:
+    """Construct the engines, assuming the spaCy model is already installed."""
     from presidio_analyzer import AnalyzerEngine
     from presidio_anonymizer import AnonymizerEngine
 
@@ -431,6 +453,134 @@ def _init_presidio(
     return analyzer, anonymizer
 
 
+# ---------------------------------------------------------------------------
+# Batched and multi-process redaction
+# ---------------------------------------------------------------------------
+
+# Texts per spaCy ``nlp.pipe`` batch. Segments are a sentence or two, so big
+# batches amortise per-call overhead while holding little memory.
+_NLP_BATCH_SIZE = 256
+
+# Smallest slice of segments worth shipping to a pool worker. Each worker
+# pays a multi-second spaCy load, so tiny studies stay in-process.
+_POOL_MIN_CHUNK = 500
+
+
+def _resolve_pii_workers(settings: BristlenoseSettings, n_texts: int) -> int:
+    """How many Presidio processes to run for ``n_texts`` segments.
+
+    Never more workers than ``_POOL_MIN_CHUNK``-sized slices of work, so a
+    small study doesn't spend longer loading spaCy replicas than redacting.
+    """
+    requested = settings.pii_workers
+    if requested == 0:
+        from bristlenose.utils.hardware import detect_hardware
+
+        requested = detect_hardware().recommended_pii_workers()
+    return max(1, min(requested, n_texts // _POOL_MIN_CHUNK))
+
+
+def _redact_texts(
+    texts: list[str],
+    timecodes: list[float],
+    analyzer: object,
+    anonymizer: object,
+    settings: BristlenoseSettings,
+) -> list[tuple[str, list[PiiRedaction]]]:
+    """Redact a batch of texts, one ``(redacted_text, redactions)`` per input.
+
+    ``AnalyzerEngine.analyze`` runs spaCy over its text with a fresh
+    ``nlp()`` call each time. Here the NLP pass runs once over the whole
+    batch through ``nlp_engine.process_batch`` (spaCy ``nlp.pipe``) and each
+    text's artifacts are handed to ``analyze``, which then only runs the
+    recognisers. Same pipeline, same documents — the output matches
+    :func:`_redact_text` exactly.
+    """
+    if not texts:
+        return []
+
+    from presidio_analyzer import AnalyzerEngine
+    from presidio_anonymizer import AnonymizerEngine
+
+    assert isinstance(analyzer, AnalyzerEngine)
+    assert isinstance(anonymizer, AnonymizerEngine)
+
+    docs = analyzer.nlp_engine.process_batch(
+        texts, language="en", batch_size=_NLP_BATCH_SIZE,
+    )
+    out: list[tuple[str, list[PiiRedaction]]] = []
+    for text, timecode, (_, nlp_artifacts) in zip(texts, timecodes, docs, strict=True):
+        results = analyzer.analyze(
+            text=text,
+            language="en",
+            entities=_DEFAULT_ENTITIES,
+            score_threshold=settings.pii_score_threshold,
+            nlp_artifacts=nlp_artifacts,
+        )
+        out.append(_apply_redactions(text, timecode, results, anonymizer))
+    return out
+
+
+# Per-process engines for pool workers, built once by ``_pii_pool_init``.
+_pool_engines: tuple[object, object] | None = None
+
+
+def _pii_pool_init(build_engines: object) -> None:
+    global _pool_engines
+    _pool_engines = build_engines()  # type: ignore[operator]
+
+
+def _pii_pool_redact(
+    texts: list[str],
+    timecodes: list[float],
+    settings: BristlenoseSettings,
+) -> list[tuple[str, list[PiiRedaction]]]:
+    analyzer, anonymizer = _pool_engines  # type: ignore[misc]
+    return _redact_texts(texts, timecodes, analyzer, anonymizer, settings)
+
+
+def _redact_pool(
+    texts: list[str],
+    timecodes: list[float],
+    settings: BristlenoseSettings,
+    workers: int,
+    *,
+    build_engines: object | None = None,
+) -> list[tuple[str, list[PiiRedaction]]]:
+    """Fan ``_redact_texts`` out over ``workers`` spawned processes.
+
+    Work is cut into about four slices per worker so one long session can't
+    leave the rest of the pool idle, and results are reassembled in input
+    order. Spawn, not fork, for the same reason as stage 5: the parent may
+    already hold native threads.
+
+    ``build_engines`` is the per-worker engine constructor (module-level, so
+    it pickles by reference); defaults to ``_build_presidio_engines``.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    n = len(texts)
+    size = max(_POOL_MIN_CHUNK, -(-n // (workers * 4)))
+    slices = [(start, min(start + size, n)) for start in range(0, n, size)]
+
+    ctx = multiprocessing.get_context("spawn")
+    out: list[tuple[str, list[PiiRedaction]]] = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_pii_pool_init,
+        initargs=(build_engines or _build_presidio_engines,),
+    ) as pool:
+        futures = [
+            pool.submit(_pii_pool_redact, texts[a:b], timecodes[a:b], settings)
+            for a, b in slices
+        ]
+        for future in futures:
+            out.extend(future.result())
+    return out
+
+
 def _redact_text(
     text: str,
     timecode: float,
@@ -445,7 +595,6 @@ def _redact_text(
     """
     from presidio_analyzer import AnalyzerEngine
     from presidio_anonymizer import AnonymizerEngine
-    from presidio_anonymizer.entities import OperatorConfig
 
     assert isinstance(analyzer, AnalyzerEngine)
     assert isinstance(anonymizer, AnonymizerEngine)
@@ -458,6 +607,18 @@ def _redact_text(
         score_threshold=settings.pii_score_threshold,
     )
 
+    return _apply_redactions(text, timecode, results, anonymizer)
+
+
+def _apply_redactions(
+    text: str,
+    timecode: float,
+    results: list,
+    anonymizer: object,
+) -> tuple[str, list[PiiRedaction]]:
+    """Replace analyser hits with their labels and record each one."""
+    from presidio_anonymizer.entities import OperatorConfig
+
     if not results:
         return text, []
 
@@ -9,6 +9,7 @@ from bristlenose.events import StageFailure, StageOutcome
 from bristlenose.llm import telemetry
 from bristlenose.llm.boundary import wrap_untrusted
 from bristlenose.llm.client import LLMClient
+from bristlenose.llm.concurrency import ConcurrencyController
 from bristlenose.llm.prompts import get_prompt_template
 from bristlenose.llm.structured import TopicSegmentationResult
 from bristlenose.models import (
@@ -31,6 +32,7 @@ async def segment_topics(
     llm_client: LLMClient,
     concurrency: int = 1,
     errors: list[str] | None = None,
+    semaphore: asyncio.Semaphore | ConcurrencyController | None = None,
 ) -> tuple[list[SessionTopicMap], StageOutcome]:
     """Identify topic/screen transitions in each transcript.
 
@@ -39,13 +41,15 @@ async def segment_topics(
         llm_client: LLM client for analysis.
         concurrency: Max concurrent LLM calls (default 1 = sequential).
         errors: Optional list to append error messages to (legacy short-form).
+        semaphore: Shared LLM concurrency limit — the provider's concurrency
+            controller in the pipeline. Overrides ``concurrency``.
 
     Returns:
         Tuple of (topic_maps, outcome). ``outcome`` records per-session
         attempts/successes/failures so the orchestrator can decide whether
         to abandon the run when every topic-segmentation call fails.
     """
-    semaphore = asyncio.Semaphore(concurrency)
+    semaphore = semaphore or asyncio.Semaphore(concurrency)
     stop = asyncio.Event()
     consecutive_failures = 0
     outcome = StageOutcome(attempted=len(transcripts))
@@ -10,6 +10,7 @@ from bristlenose.events import StageFailure, StageOutcome
 from bristlenose.llm import telemetry
 from bristlenose.llm.boundary import wrap_untrusted
 from bristlenose.llm.client import LLMClient, TruncatedResponseError
+from bristlenose.llm.concurrency import ConcurrencyController
 from bristlenose.llm.prompts import get_prompt_template
 from bristlenose.llm.structured import QuoteExtractionResult
 from bristlenose.models import (
@@ -101,6 +102,7 @@ async def extract_quotes(
     min_quote_words: int = 5,
     concurrency: int = 1,
     errors: list[str] | None = None,
+    semaphore: asyncio.Semaphore | ConcurrencyController | None = None,
 ) -> tuple[list[ExtractedQuote], StageOutcome]:
     """Extract verbatim quotes from all transcripts.
 
@@ -111,6 +113,8 @@ async def extract_quotes(
         min_quote_words: Minimum word count for a quote to be included.
         concurrency: Max concurrent LLM calls (default 1 = sequential).
         errors: Optional list to append error messages to (legacy short-form).
+        semaphore: Shared LLM concurrency limit — the provider's concurrency
+            controller in the pipeline. Overrides ``concurrency``.
 
     Returns:
         Tuple of (quotes, outcome). ``outcome`` records per-session
@@ -122,7 +126,7 @@ async def extract_quotes(
         tm.session_id: tm for tm in topic_maps
     }
 
-    semaphore = asyncio.Semaphore(concurrency)
+    semaphore = semaphore or asyncio.Semaphore(concurrency)
     stop = asyncio.Event()
     consecutive_failures = 0
     outcome = StageOutcome(attempted=len(transcripts))
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 
 from bristlenose.events import StageFailure, StageOutcome
 from bristlenose.llm.boundary import wrap_untrusted
 from bristlenose.llm.client import LLMClient
+from bristlenose.llm.concurrency import ConcurrencyController
 from bristlenose.llm.prompts import get_prompt_template
-from bristlenose.llm.structured import ScreenClusteringResult
+from bristlenose.llm.structured import ScreenClusteringResult, ScreenClusterMergeResult
 from bristlenose.models import ExtractedQuote, QuoteType, ScreenCluster
 from bristlenose.run_lifecycle import _build_cause
+from bristlenose.utils.batching import pack_by_session
 from bristlenose.utils.timecodes import format_timecode
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,8 @@ logger = logging.getLogger(__name__)
 async def cluster_by_screen(
     quotes: list[ExtractedQuote],
     llm_client: LLMClient,
+    batch_quotes: int = 400,
+    semaphore: asyncio.Semaphore | ConcurrencyController | None = None,
 ) -> tuple[list[ScreenCluster], StageOutcome]:
     """Cluster screen-specific quotes by the screen or task discussed.
 
@@ -27,9 +32,19 @@ async def cluster_by_screen(
     into coherent clusters, normalising screen labels across participants
     who may describe the same screen differently.
 
+    Up to ``batch_quotes`` quotes go to the LLM in one request. Larger sets
+    are clustered map-reduce style: sessions are packed into batches of at
+    most ``batch_quotes`` quotes, each batch is clustered on its own (in
+    parallel, bounded by ``semaphore``), then a merge pass reconciles the
+    per-batch labels and flow order into one set of screens.
+
     Args:
         quotes: All screen-specific quotes from all participants.
         llm_client: LLM client for analysis.
+        batch_quotes: Largest quote set clustered in a single request.
+        semaphore: Shared LLM concurrency limit for the batch calls — the
+            provider's concurrency controller in the pipeline (default: one
+            call at a time).
 
     Returns:
         Tuple of (clusters, outcome). The LLM call's success/failure is
@@ -45,9 +60,35 @@ async def cluster_by_screen(
         logger.info("No screen-specific quotes to cluster.")
         return [], StageOutcome()
 
+    if len(screen_quotes) > batch_quotes:
+        return await _cluster_batched(
+            screen_quotes, llm_client, batch_quotes,
+            semaphore or asyncio.Semaphore(1),
+        )
+
     logger.info("Clustering %d screen-specific quotes", len(screen_quotes))
     outcome = StageOutcome(attempted=1)
 
+    try:
+        clusters = await _cluster_once(screen_quotes, llm_client)
+    except Exception as exc:
+        logger.error("Screen clustering failed: %s", exc)
+        outcome.failed.append(_failure(exc, llm_client))
+        # Fallback: one cluster per unique topic label. Returned so downstream
+        # rendering has structured data; the orchestrator reads outcome.failed
+        # to decide whether to abandon.
+        return _fallback_clustering(screen_quotes), outcome
+
+    logger.info("Created %d screen clusters", len(clusters))
+    outcome.succeeded = 1
+    return clusters, outcome
+
+
+async def _cluster_once(
+    screen_quotes: list[ExtractedQuote],
+    llm_client: LLMClient,
+) -> list[ScreenCluster]:
+    """One clustering request over ``screen_quotes``, sorted by display order."""
     # Prepare quotes for the LLM — include index so it can reference them
     quotes_for_llm = [
         {
@@ -64,27 +105,12 @@ async def cluster_by_screen(
 
     _tmpl = get_prompt_template("quote-clustering")
 
-    try:
-        result = await llm_client.analyze(
-            system_prompt=_tmpl.system,
-            user_prompt=_tmpl.user.format(quotes_json=wrap_untrusted("quotes", quotes_json)),
-            response_model=ScreenClusteringResult,
-            prompt_template=_tmpl,
-        )
-    except Exception as exc:
-        logger.error("Screen clustering failed: %s", exc)
-        outcome.failed.append(StageFailure(
-            session_id=None,
-            cause=_build_cause(
-                exc,
-                stage="cluster_and_group",
-                provider=llm_client.provider,
-            ),
-        ))
-        # Fallback: one cluster per unique topic label. Returned so downstream
-        # rendering has structured data; the orchestrator reads outcome.failed
-        # to decide whether to abandon.
-        return _fallback_clustering(screen_quotes), outcome
+    result = await llm_client.analyze(
+        system_prompt=_tmpl.system,
+        user_prompt=_tmpl.user.format(quotes_json=wrap_untrusted("quotes", quotes_json)),
+        response_model=ScreenClusteringResult,
+        prompt_template=_tmpl,
+    )
 
     # Convert LLM output to domain models
     clusters: list[ScreenCluster] = []
@@ -109,12 +135,166 @@ async def cluster_by_screen(
 
     # Sort by display order
     clusters.sort(key=lambda c: c.display_order)
+    return clusters
+
+
+async def _cluster_batched(
+    screen_quotes: list[ExtractedQuote],
+    llm_client: LLMClient,
+    batch_quotes: int,
+    semaphore: asyncio.Semaphore | ConcurrencyController,
+) -> tuple[list[ScreenCluster], StageOutcome]:
+    """Map: cluster each session batch. Reduce: merge labels across batches.
+
+    Outcome counts one attempt per batch plus one for the merge. A batch that
+    fails contributes its topic-label fallback clusters to the merge, so its
+    quotes still land under normalised screen names when the merge succeeds.
+    If the merge itself fails, per-batch clusters are combined by label. If
+    every batch fails there is nothing real to merge: the whole-set fallback
+    is returned with ``succeeded == 0`` so the orchestrator can abandon.
+    """
+    batches = pack_by_session(screen_quotes, batch_quotes)
+    logger.info(
+        "Clustering %d screen-specific quotes in %d batches",
+        len(screen_quotes), len(batches),
+    )
+    outcome = StageOutcome(attempted=len(batches))
+
+    async def _map(indices: list[int]) -> list[ScreenCluster]:
+        batch = [screen_quotes[i] for i in indices]
+        async with semaphore:
+            try:
+                clusters = await _cluster_once(batch, llm_client)
+            except Exception as exc:
+                logger.error("Screen clustering batch failed: %s", exc)
+                outcome.failed.append(_failure(exc, llm_client))
+                return _fallback_clustering(batch)
+        outcome.succeeded += 1
+        return clusters
+
+    per_batch = await asyncio.gather(*(_map(b) for b in batches))
+    if outcome.succeeded == 0:
+        return _fallback_clustering(screen_quotes), outcome
+
+    # Flatten for the merge, remembering which batch each cluster came from.
+    partials: list[tuple[int, ScreenCluster]] = [
+        (batch_no, cluster)
+        for batch_no, clusters in enumerate(per_batch, start=1)
+        for cluster in clusters
+    ]
+
+    outcome.attempted += 1
+    try:
+        async with semaphore:
+            clusters = await _merge_clusters(partials, llm_client)
+    except Exception as exc:
+        logger.error("Screen cluster merge failed: %s", exc)
+        outcome.failed.append(_failure(exc, llm_client))
+        clusters = _merge_by_label([c for _, c in partials])
+    else:
+        outcome.succeeded += 1
 
     logger.info("Created %d screen clusters", len(clusters))
-    outcome.succeeded = 1
     return clusters, outcome
 
 
+async def _merge_clusters(
+    partials: list[tuple[int, ScreenCluster]],
+    llm_client: LLMClient,
+) -> list[ScreenCluster]:
+    """Reduce pass: ask the LLM which per-batch clusters are the same screen.
+
+    Per-batch clusters the LLM leaves unassigned keep their own cluster at
+    the end of the flow rather than losing their quotes.
+    """
+    clusters_for_llm = [
+        {
+            "index": i,
+            "batch": batch_no,
+            "screen_label": c.screen_label,
+            "description": c.description,
+            "display_order": c.display_order,
+            "quote_count": len(c.quotes),
+        }
+        for i, (batch_no, c) in enumerate(partials)
+    ]
+
+    clusters_json = json.dumps(clusters_for_llm, ensure_ascii=False, separators=(",", ":"))
+
+    _tmpl = get_prompt_template("quote-clustering-merge")
+
+    result = await llm_client.analyze(
+        system_prompt=_tmpl.system,
+        user_prompt=_tmpl.user.format(
+            clusters_json=wrap_untrusted("clusters", clusters_json),
+        ),
+        response_model=ScreenClusterMergeResult,
+        prompt_template=_tmpl,
+    )
+
+    merged: list[ScreenCluster] = []
+    used: set[int] = set()
+    for item in sorted(result.clusters, key=lambda c: c.display_order):
+        indices = [
+            i for i in dict.fromkeys(item.cluster_indices)
+            if 0 <= i < len(partials) and i not in used
+        ]
+        if not indices:
+            continue
+        used.update(indices)
+        merged.append(
+            ScreenCluster(
+                screen_label=item.screen_label,
+                description=item.description,
+                display_order=len(merged) + 1,
+                quotes=[q for i in indices for q in partials[i][1].quotes],
+            )
+        )
+
+    for i, (_, c) in enumerate(partials):
+        if i not in used:
+            merged.append(c.model_copy(update={"display_order": len(merged) + 1}))
+
+    return merged
+
+
+def _merge_by_label(clusters: list[ScreenCluster]) -> list[ScreenCluster]:
+    """Combine clusters whose labels match case-insensitively.
+
+    Used when the merge request fails. Screens are ordered by the mean of
+    their per-batch display orders, so a screen every batch put first stays
+    first.
+    """
+    groups: dict[str, list[ScreenCluster]] = {}
+    for c in clusters:
+        groups.setdefault(c.screen_label.strip().casefold(), []).append(c)
+
+    ordered = sorted(
+        groups.values(),
+        key=lambda g: sum(c.display_order for c in g) / len(g),
+    )
+    return [
+        ScreenCluster(
+            screen_label=group[0].screen_label,
+            description=group[0].description,
+            display_order=i,
+            quotes=[q for c in group for q in c.quotes],
+        )
+        for i, group in enumerate(ordered, start=1)
+    ]
+
+
+def _failure(exc: Exception, llm_client: LLMClient) -> StageFailure:
+    return StageFailure(
+        session_id=None,
+        cause=_build_cause(
+            exc,
+            stage="cluster_and_group",
+            provider=llm_client.provider,
+        ),
+    )
+
+
 def _fallback_clustering(quotes: list[ExtractedQuote]) -> list[ScreenCluster]:
     """Fallback clustering: group by topic_label when LLM fails."""
     groups: dict[str, list[ExtractedQuote]] = {}
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 
 from bristlenose.events import StageFailure, StageOutcome
 from bristlenose.llm.boundary import wrap_untrusted
 from bristlenose.llm.client import LLMClient
+from bristlenose.llm.concurrency import ConcurrencyController
 from bristlenose.llm.prompts import get_prompt_template
-from bristlenose.llm.structured import ThematicGroupingResult
+from bristlenose.llm.structured import ThematicGroupingResult, ThemeMergeResult
 from bristlenose.models import ExtractedQuote, QuoteType, ThemeGroup
 from bristlenose.run_lifecycle import _build_cause
+from bristlenose.utils.batching import pack_by_session
 from bristlenose.utils.timecodes import format_timecode
 
 logger = logging.getLogger(__name__)
@@ -20,15 +23,27 @@ logger = logging.getLogger(__name__)
 async def group_by_theme(
     quotes: list[ExtractedQuote],
     llm_client: LLMClient,
+    batch_quotes: int = 400,
+    semaphore: asyncio.Semaphore | ConcurrencyController | None = None,
 ) -> tuple[list[ThemeGroup], StageOutcome]:
     """Group general/contextual quotes into emergent themes.
 
     Takes all general_context quotes across all participants and identifies
     shared themes, patterns, and commonalities.
 
+    Up to ``batch_quotes`` quotes go to the LLM in one request. Larger sets
+    are grouped map-reduce style, as in stage 10: per-batch themes first,
+    then a merge pass that reconciles them. The minimum-evidence rule runs
+    after the merge, so a pattern spread thinly across batches is judged on
+    its study-wide count.
+
     Args:
         quotes: All general-context quotes from all participants.
         llm_client: LLM client for analysis.
+        batch_quotes: Largest quote set grouped in a single request.
+        semaphore: Shared LLM concurrency limit for the batch calls — the
+            provider's concurrency controller in the pipeline (default: one
+            call at a time).
 
     Returns:
         Tuple of (themes, outcome). The LLM call's success/failure is
@@ -45,9 +60,33 @@ async def group_by_theme(
         logger.info("No contextual quotes to group into themes.")
         return [], StageOutcome()
 
+    if len(context_quotes) > batch_quotes:
+        return await _group_batched(
+            context_quotes, llm_client, batch_quotes,
+            semaphore or asyncio.Semaphore(1),
+        )
+
     logger.info("Grouping %d contextual quotes into themes", len(context_quotes))
     outcome = StageOutcome(attempted=1)
 
+    try:
+        themes = await _group_once(context_quotes, llm_client)
+    except Exception as exc:
+        logger.error("Thematic grouping failed: %s", exc)
+        outcome.failed.append(_failure(exc, llm_client))
+        return _fallback_grouping(context_quotes), outcome
+
+    strong_themes = _fold_thin_themes(themes)
+    logger.info("Created %d theme groups", len(strong_themes))
+    outcome.succeeded = 1
+    return strong_themes, outcome
+
+
+async def _group_once(
+    context_quotes: list[ExtractedQuote],
+    llm_client: LLMClient,
+) -> list[ThemeGroup]:
+    """One grouping request over ``context_quotes``, before thin-theme folding."""
     # Prepare quotes for the LLM
     quotes_for_llm = [
         {
@@ -64,24 +103,12 @@ async def group_by_theme(
 
     _tmpl = get_prompt_template("thematic-grouping")
 
-    try:
-        result = await llm_client.analyze(
-            system_prompt=_tmpl.system,
-            user_prompt=_tmpl.user.format(quotes_json=wrap_untrusted("quotes", quotes_json)),
-            response_model=ThematicGroupingResult,
-            prompt_template=_tmpl,
-        )
-    except Exception as exc:
-        logger.error("Thematic grouping failed: %s", exc)
-        outcome.failed.append(StageFailure(
-            session_id=None,
-            cause=_build_cause(
-                exc,
-                stage="cluster_and_group",
-                provider=llm_client.provider,
-            ),
-        ))
-        return _fallback_grouping(context_quotes), outcome
+    result = await llm_client.analyze(
+        system_prompt=_tmpl.system,
+        user_prompt=_tmpl.user.format(quotes_json=wrap_untrusted("quotes", quotes_json)),
+        response_model=ThematicGroupingResult,
+        prompt_template=_tmpl,
+    )
 
     # Convert LLM output to domain models
     themes: list[ThemeGroup] = []
@@ -102,11 +129,15 @@ async def group_by_theme(
                 quotes=theme_quotes,
             )
         )
+    return themes
+
 
-    # Enforce minimum evidence threshold: themes with fewer than 2 quotes
-    # get folded into an "Uncategorised" bucket — quotes that don't have a home
-    # yet. Deliberately NOT "observations": an observation is a proto-finding a
-    # human noticed, whereas these are simply unplaced.
+def _fold_thin_themes(themes: list[ThemeGroup]) -> list[ThemeGroup]:
+    """Enforce the minimum evidence threshold on LLM themes."""
+    # Themes with fewer than 2 quotes get folded into an "Uncategorised"
+    # bucket — quotes that don't have a home yet. Deliberately NOT
+    # "observations": an observation is a proto-finding a human noticed,
+    # whereas these are simply unplaced.
     min_theme_quotes = 2
     strong_themes = [t for t in themes if len(t.quotes) >= min_theme_quotes]
     weak_quotes: list[ExtractedQuote] = []
@@ -138,11 +169,143 @@ async def group_by_theme(
             len(themes) - len(strong_themes) + 1,
         )
 
+    return strong_themes
+
+
+async def _group_batched(
+    context_quotes: list[ExtractedQuote],
+    llm_client: LLMClient,
+    batch_quotes: int,
+    semaphore: asyncio.Semaphore | ConcurrencyController,
+) -> tuple[list[ThemeGroup], StageOutcome]:
+    """Map: group each session batch. Reduce: merge themes across batches.
+
+    Outcome accounting and failure handling mirror stage 10's
+    ``_cluster_batched``.
+    """
+    batches = pack_by_session(context_quotes, batch_quotes)
+    logger.info(
+        "Grouping %d contextual quotes into themes in %d batches",
+        len(context_quotes), len(batches),
+    )
+    outcome = StageOutcome(attempted=len(batches))
+
+    async def _map(indices: list[int]) -> list[ThemeGroup]:
+        batch = [context_quotes[i] for i in indices]
+        async with semaphore:
+            try:
+                themes = await _group_once(batch, llm_client)
+            except Exception as exc:
+                logger.error("Thematic grouping batch failed: %s", exc)
+                outcome.failed.append(_failure(exc, llm_client))
+                return _fallback_grouping(batch)
+        outcome.succeeded += 1
+        return themes
+
+    per_batch = await asyncio.gather(*(_map(b) for b in batches))
+    if outcome.succeeded == 0:
+        return _fallback_grouping(context_quotes), outcome
+
+    partials: list[tuple[int, ThemeGroup]] = [
+        (batch_no, theme)
+        for batch_no, themes in enumerate(per_batch, start=1)
+        for theme in themes
+    ]
+
+    outcome.attempted += 1
+    try:
+        async with semaphore:
+            themes = await _merge_themes(partials, llm_client)
+    except Exception as exc:
+        logger.error("Theme merge failed: %s", exc)
+        outcome.failed.append(_failure(exc, llm_client))
+        themes = _merge_by_label([t for _, t in partials])
+    else:
+        outcome.succeeded += 1
+
+    strong_themes = _fold_thin_themes(themes)
     logger.info("Created %d theme groups", len(strong_themes))
-    outcome.succeeded = 1
     return strong_themes, outcome
 
 
+async def _merge_themes(
+    partials: list[tuple[int, ThemeGroup]],
+    llm_client: LLMClient,
+) -> list[ThemeGroup]:
+    """Reduce pass: ask the LLM which per-batch themes are the same pattern.
+
+    Per-batch themes the LLM leaves unassigned are kept as they are.
+    """
+    themes_for_llm = [
+        {
+            "index": i,
+            "batch": batch_no,
+            "theme_label": t.theme_label,
+            "description": t.description,
+            "quote_count": len(t.quotes),
+        }
+        for i, (batch_no, t) in enumerate(partials)
+    ]
+
+    themes_json = json.dumps(themes_for_llm, ensure_ascii=False, separators=(",", ":"))
+
+    _tmpl = get_prompt_template("thematic-grouping-merge")
+
+    result = await llm_client.analyze(
+        system_prompt=_tmpl.system,
+        user_prompt=_tmpl.user.format(themes_json=wrap_untrusted("themes", themes_json)),
+        response_model=ThemeMergeResult,
+        prompt_template=_tmpl,
+    )
+
+    merged: list[ThemeGroup] = []
+    used: set[int] = set()
+    for item in result.themes:
+        indices = [
+            i for i in dict.fromkeys(item.theme_indices)
+            if 0 <= i < len(partials) and i not in used
+        ]
+        if not indices:
+            continue
+        used.update(indices)
+        merged.append(
+            ThemeGroup(
+                theme_label=item.theme_label,
+                description=item.description,
+                quotes=[q for i in indices for q in partials[i][1].quotes],
+            )
+        )
+
+    merged.extend(t for i, (_, t) in enumerate(partials) if i not in used)
+    return merged
+
+
+def _merge_by_label(themes: list[ThemeGroup]) -> list[ThemeGroup]:
+    """Combine themes whose labels match case-insensitively (merge-failure path)."""
+    groups: dict[str, list[ThemeGroup]] = {}
+    for t in themes:
+        groups.setdefault(t.theme_label.strip().casefold(), []).append(t)
+    return [
+        ThemeGroup(
+            theme_label=group[0].theme_label,
+            description=group[0].description,
+            quotes=[q for t in group for q in t.quotes],
+        )
+        for group in groups.values()
+    ]
+
+
+def _failure(exc: Exception, llm_client: LLMClient) -> StageFailure:
+    return StageFailure(
+        session_id=None,
+        cause=_build_cause(
+            exc,
+            stage="cluster_and_group",
+            provider=llm_client.provider,
+        ),
+    )
+
+
 def _fallback_grouping(quotes: list[ExtractedQuote]) -> list[ThemeGroup]:
     """Fallback grouping: group by topic_label when LLM fails."""
     groups: dict[str, list[ExtractedQuote]] = {}
@@ -76,6 +76,7 @@ def render_html(
     transcripts: list[FullTranscript] | None = None,
     analysis: object | None = None,
     serve_mode: bool = False,
+    thumbnails: dict[str, Path] | None = None,
 ) -> Path:
     """Generate the HTML research report with external CSS stylesheet.
 
@@ -85,6 +86,8 @@ def render_html(
         self-contained HTML download.
 
     Args:
+        thumbnails: Session thumbnails already on disk, from stage 6b
+            (``extract_session_thumbnails``). Render never extracts them.
         serve_mode: When True, render React island mount points instead of
             Jinja2 session tables. The Sessions tab gets
             ``<div id="bn-sessions-table-root" data-project-id="1">``
@@ -135,13 +138,10 @@ def render_html(
     video_map = _build_video_map(sessions)
     has_media = bool(video_map)
 
-    # Extract video thumbnails (skips cached, audio-only, and failed).
+    # Video thumbnails were extracted by stage 6b; link the ones it wrote.
     thumbnail_map: dict[str, str] = {}
-    if has_media and transcripts:
-        from bristlenose.utils.video import extract_thumbnails
-
-        thumb_paths = extract_thumbnails(sessions, transcripts, paths.thumbnails_dir)
-        for sid in thumb_paths:
+    if has_media:
+        for sid in thumbnails or {}:
             thumbnail_map[sid] = f"assets/thumbnails/{sid}.jpg"
 
     # Write popout player page when media files exist
@@ -7,6 +7,7 @@ import logging
 import platform
 import subprocess
 from pathlib import Path
+from typing import NamedTuple
 
 from bristlenose.utils.bundled_binary import bundled_binary_path
 from bristlenose.utils.fs import CloudFetchTimeoutError, ensure_materialised
@@ -113,6 +114,57 @@ def probe_duration(file_path: Path) -> float | None:
     return None
 
 
+class MediaProbe(NamedTuple):
+    """What one ffprobe run learned about a media file."""
+
+    duration: float | None
+    has_audio: bool
+
+
+def probe_media(file_path: Path) -> MediaProbe | None:
+    """Probe duration and audio-stream presence with a single ffprobe run.
+
+    Returns None if probing fails, like :func:`probe_duration`.  A clean
+    probe that finds no audio stream returns ``has_audio=False`` — the same
+    verdict as :func:`has_audio_stream`, which a caller holding this result
+    need not run again.  Failures are only logged here; ``has_audio_stream``
+    is still the place that tells a broken toolchain from a damaged file.
+    """
+    ffprobe = bundled_binary_path("ffprobe") or "ffprobe"
+    try:
+        ensure_materialised(file_path)  # see probe_duration
+    except CloudFetchTimeoutError as exc:
+        logger.warning("Could not probe %s: %s", file_path, exc)
+        return None
+    try:
+        result = subprocess.run(
+            [
+                ffprobe,
+                "-v", "error",
+                "-print_format", "json",
+                "-show_entries", "format=duration:stream=codec_type",
+                str(file_path),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode != 0:
+            logger.warning("ffprobe failed for %s: %s", file_path, result.stderr)
+            return None
+        data = json.loads(result.stdout)
+    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError) as exc:
+        logger.warning("Could not probe %s: %s", file_path, exc)
+        return None
+    duration_str = data.get("format", {}).get("duration")
+    try:
+        duration = float(duration_str) if duration_str else None
+    except ValueError:
+        duration = None
+    has_audio = any(s.get("codec_type") == "audio" for s in data.get("streams", []))
+    return MediaProbe(duration, has_audio)
+
+
 def extract_audio_from_video(
     video_path: Path,
     output_path: Path,
@@ -0,0 +1,35 @@
+"""Packing quotes into LLM-sized batches for the map step of stages 10 and 11."""
+
+from __future__ import annotations
+
+from bristlenose.models import ExtractedQuote
+
+
+def pack_by_session(quotes: list[ExtractedQuote], max_quotes: int) -> list[list[int]]:
+    """Split ``quotes`` into batches of at most ``max_quotes`` indices.
+
+    Whole sessions are packed together so each batch sees a participant's
+    quotes side by side; a session larger than ``max_quotes`` is cut into
+    consecutive slices. Sessions keep their first-appearance order and
+    quotes keep their input order, so batches are deterministic (which keeps
+    the LLM response cache warm across re-runs).
+    """
+    by_session: dict[str, list[int]] = {}
+    for i, q in enumerate(quotes):
+        by_session.setdefault(q.session_id or q.participant_id, []).append(i)
+
+    batches: list[list[int]] = []
+    current: list[int] = []
+    for indices in by_session.values():
+        if current and len(current) + len(indices) > max_quotes:
+            batches.append(current)
+            current = []
+        for start in range(0, len(indices), max_quotes):
+            chunk = indices[start:start + max_quotes]
+            if len(chunk) == max_quotes:
+                batches.append(chunk)
+            else:
+                current.extend(chunk)
+    if current:
+        batches.append(current)
+    return batches
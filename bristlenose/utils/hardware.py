@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import platform
 import subprocess
 import time
@@ -39,6 +40,7 @@ class HardwareInfo:
     memory_gb: float | None = None
     mlx_available: bool = False
     cuda_available: bool = False
+    cpu_cores: int | None = None  # usable logical cores (affinity-aware)
 
     @property
     def recommended_whisper_backend(self) -> str:
@@ -59,6 +61,50 @@ class HardwareInfo:
                 return "medium"
         return "small"
 
+    def recommended_whisper_workers(self, whisper_model: str) -> int:
+        """How many faster-whisper CPU replicas this machine can run at once.
+
+        Bounded by cores (each replica gets at least
+        ``_MIN_THREADS_PER_WHISPER_WORKER`` ctranslate2 threads — fewer and
+        per-replica throughput collapses) and by RAM (each replica holds its
+        own copy of the int8 weights, plus decoding headroom; a quarter of
+        memory is left for the OS and the rest of the pipeline). GPU and MLX
+        backends always get one — they share a single device.
+        """
+        if self.accelerator != AcceleratorType.CPU or self.cuda_available:
+            return 1
+        by_cores = (self.cpu_cores or 1) // _MIN_THREADS_PER_WHISPER_WORKER
+        per_replica_gb = _WHISPER_REPLICA_GB.get(whisper_model, _DEFAULT_REPLICA_GB)
+        if self.memory_gb is not None:
+            by_ram = int(self.memory_gb * 0.75 // per_replica_gb)
+        else:
+            by_ram = 1
+        return max(1, min(by_cores, by_ram))
+
+    def recommended_pii_workers(self) -> int:
+        """How many Presidio processes this machine can run at once.
+
+        spaCy inference is single-threaded per process, so one worker per
+        core, less one for the parent. RAM bounds it the same way as Whisper:
+        every worker loads its own copy of the spaCy pipeline.
+        """
+        by_cores = (self.cpu_cores or 1) - 1
+        if self.memory_gb is not None:
+            by_ram = int(self.memory_gb * 0.75 // _PII_WORKER_GB)
+        else:
+            by_ram = 1
+        return max(1, min(by_cores, by_ram))
+
+    def recommended_ffmpeg_workers(self) -> int:
+        """How many stream-copy FFmpeg processes to run at once.
+
+        Stream copy barely touches the CPU — the time goes on process
+        start-up, seeking and disk I/O — so this allows a worker per core
+        but caps it at ``_MAX_FFMPEG_WORKERS``: past that, parallel seeks
+        on one disk (or a network volume) slow each other down.
+        """
+        return max(2, min(self.cpu_cores or 1, _MAX_FFMPEG_WORKERS))
+
     @property
     def label(self) -> str:
         """Short label for CLI header: 'Apple M2 Max · MLX' or 'RTX 4090 · CUDA'."""
@@ -78,11 +124,41 @@ class HardwareInfo:
             parts.append(f"Chip: {self.chip_name}")
         if self.memory_gb:
             parts.append(f"Memory: {self.memory_gb:.0f}GB")
+        if self.cpu_cores:
+            parts.append(f"Cores: {self.cpu_cores}")
         parts.append(f"Backend: {self.recommended_whisper_backend}")
         parts.append(f"Model suggestion: {self.recommended_whisper_model}")
         return " | ".join(parts)
 
 
+# Resident-set estimate per faster-whisper replica on CPU (int8 weights plus
+# decoder state for a 30s window), in GB. Deliberately pessimistic — an
+# over-subscribed box swaps, which is far slower than one replica fewer.
+_WHISPER_REPLICA_GB = {
+    "tiny": 0.5,
+    "tiny.en": 0.5,
+    "base": 0.6,
+    "base.en": 0.6,
+    "small": 1.0,
+    "small.en": 1.0,
+    "medium": 2.0,
+    "medium.en": 2.0,
+    "large-v3-turbo": 2.0,
+    "turbo": 2.0,
+    "large": 3.5,
+    "large-v2": 3.5,
+    "large-v3": 3.5,
+}
+_DEFAULT_REPLICA_GB = 3.5
+_MIN_THREADS_PER_WHISPER_WORKER = 4
+# Resident-set estimate per Presidio worker: AnalyzerEngine loads spaCy's
+# en_core_web_lg (~800 MB in memory) plus the recogniser registry.
+_PII_WORKER_GB = 1.5
+# Stream-copy FFmpeg processes are I/O-bound; more than this and concurrent
+# seeks on the same volume cost more than they overlap.
+_MAX_FFMPEG_WORKERS = 8
+
+
 _CACHE_DIR = Path("~/.config/bristlenose").expanduser()
 _CACHE_FILE = _CACHE_DIR / ".hardware-cache.json"
 _CACHE_TTL_SECONDS = 24 * 60 * 60  # 24 hours
@@ -163,6 +239,7 @@ def detect_hardware() -> HardwareInfo:
             info.chip_name = _get_cuda_device_name()
 
     info.memory_gb = info.memory_gb or _get_system_memory_gb()
+    info.cpu_cores = _get_cpu_cores()
 
     logger.info("Hardware detected: %s", info.summary())
     return info
@@ -256,6 +333,18 @@ def _get_system_memory_gb() -> float | None:
     return None
 
 
+def _get_cpu_cores() -> int | None:
+    """Get the number of logical cores this process may run on.
+
+    Prefers the scheduler affinity mask (respects ``taskset`` and container
+    CPU pinning on Linux) over the raw machine count.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count()
+
+
 def _check_mlx_available() -> bool:
     """Check if mlx and mlx-whisper are installed and importable."""
     try:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import platform
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -24,6 +25,10 @@ _FALLBACK_SECONDS = 60.0  # If no participant found, grab frame at 1 min
 _THUMB_WIDTH = 384
 _THUMB_QUALITY = 5  # JPEG quality scale: 2 = best, 31 = worst
 
+# Concurrent FFmpeg processes for thumbnails.  Each decodes one frame, so the
+# time is process start-up and the seek — overlapping a few is the win.
+_DEFAULT_WORKERS = 4
+
 
 def choose_thumbnail_time(
     transcript: FullTranscript,
@@ -72,8 +77,10 @@ def extract_thumbnail(
 ) -> Path | None:
     """Extract a single JPEG frame from a video file.
 
-    Uses FFmpeg's ``-ss`` (input seeking) for fast keyframe-based seeking,
-    then scales to *width* pixels (preserving aspect ratio).
+    Uses FFmpeg's ``-ss`` (input seeking) with ``-noaccurate_seek``: the
+    frame written is the keyframe at or before *timestamp*, so nothing
+    between the keyframe and the timestamp is decoded.  The frame is then
+    scaled to *width* pixels (preserving aspect ratio).
 
     Args:
         video_path: Path to the source video file.
@@ -106,6 +113,7 @@ def extract_thumbnail(
             [
                 ffmpeg,
                 *hwaccel,
+                "-noaccurate_seek",
                 "-ss", str(timestamp),
                 "-i", str(video_path),
                 "-frames:v", "1",
@@ -140,16 +148,20 @@ def extract_thumbnails(
     sessions: list[InputSession],
     transcripts: list[FullTranscript],
     thumbnails_dir: Path,
+    *,
+    workers: int = _DEFAULT_WORKERS,
 ) -> dict[str, Path]:
     """Extract thumbnail frames for all video sessions.
 
     Skips sessions without video files and sessions where the thumbnail
-    already exists on disk (cache-friendly for resume).
+    already exists on disk (cache-friendly for resume).  The rest are
+    extracted concurrently, up to *workers* FFmpeg processes at a time.
 
     Args:
         sessions: All input sessions (for video file paths).
         transcripts: All transcripts (for speaker role heuristic).
         thumbnails_dir: Directory to write thumbnails into.
+        workers: Max concurrent FFmpeg processes.
 
     Returns:
         Mapping of session_id to path of the thumbnail JPEG.
@@ -162,6 +174,7 @@ def extract_thumbnails(
     }
 
     thumbnail_map: dict[str, Path] = {}
+    pending: list[tuple[str, Path, Path, float]] = []
 
     for session in sessions:
         if not session.has_video:
@@ -190,9 +203,20 @@ def extract_thumbnails(
         else:
             timestamp = _FALLBACK_SECONDS
 
-        # Extract.
-        result = extract_thumbnail(video_file.path, output_path, timestamp)
-        if result is not None:
-            thumbnail_map[sid] = result
+        pending.append((sid, video_file.path, output_path, timestamp))
+
+    if not pending:
+        return thumbnail_map
+
+    # Extract.
+    with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+        futures = [
+            (sid, pool.submit(extract_thumbnail, video_path, output_path, timestamp))
+            for sid, video_path, output_path, timestamp in pending
+        ]
+        for sid, future in futures:
+            result = future.result()
+            if result is not None:
+                thumbnail_map[sid] = result
 
     return thumbnail_map
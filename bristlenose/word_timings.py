@@ -0,0 +1,242 @@
+"""Columnar word timings — one compact, memory-mappable file per session.
+
+Whisper gives every word a start, an end and a confidence.  Held as one
+pydantic ``Word`` per word (and as JSON objects in ``session_segments.json``)
+a three-hour session is hundreds of thousands of Python objects, re-parsed on
+every transcript request.  :class:`WordTimings` holds the same data as flat
+arrays instead:
+
+- ``start`` / ``end`` — float64 seconds, one entry per word
+- ``confidence`` — float32, one entry per word
+- ``text_ids`` — uint32 index into a string table of distinct word texts
+  (a conversation's vocabulary is a few thousand words, so this is small)
+- ``segment_keys`` / ``segment_offsets`` — the words of the segment with
+  ``segment_index`` ``segment_keys[i]`` are ``segment_offsets[i]`` up to
+  ``segment_offsets[i + 1]``
+
+File layout (``.bnwt``, little-endian, every section 8-byte aligned)::
+
+    header      "BNWT" u32 version u32 n_segments u32 n_words
+                u32 n_strings u32 strings_bytes
+    segment_keys      int32[n_segments]
+    segment_offsets   uint32[n_segments + 1]
+    start             float64[n_words]
+    end               float64[n_words]
+    confidence        float32[n_words]
+    text_ids          uint32[n_words]
+    string_offsets    uint32[n_strings + 1]
+    strings           UTF-8 bytes
+
+:meth:`WordTimings.open` maps the file and casts each section in place, so
+opening costs nothing per word; the same bytes can be served as-is to the
+frontend, which reads them with typed arrays.  :meth:`WordTimings.words`
+builds ``Word`` objects for one segment only, for callers that need them.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from bristlenose.models import Word
+
+MAGIC = b"BNWT"
+FORMAT_VERSION = 1
+SUFFIX = ".bnwt"
+
+_HEADER = struct.Struct("<4sIIIII")
+_LITTLE = sys.byteorder == "little"
+
+# ``array`` / ``memoryview.cast`` type codes used by the sections.
+_TypeCode = Literal["i", "I", "d", "f"]
+
+
+def _pad(n: int) -> int:
+    return -n % 8
+
+
+def session_timings_path(output_dir: Path, session_id: str) -> Path:
+    """Where the importer keeps a session's timings: ``.bristlenose/word-timings/``."""
+    return output_dir / ".bristlenose" / "word-timings" / f"{session_id}{SUFFIX}"
+
+
+class WordTimings:
+    """Word timings for one session, as columns over a string table."""
+
+    def __init__(
+        self,
+        segment_keys: Sequence[int],
+        segment_offsets: Sequence[int],
+        start: Sequence[float],
+        end: Sequence[float],
+        confidence: Sequence[float],
+        text_ids: Sequence[int],
+        strings: Sequence[str],
+        *,
+        _buffer: object | None = None,
+    ) -> None:
+        self.segment_keys = segment_keys
+        self.segment_offsets = segment_offsets
+        self.start = start
+        self.end = end
+        self.confidence = confidence
+        self.text_ids = text_ids
+        self.strings = strings
+        self._row = {key: i for i, key in enumerate(segment_keys)}
+        self._buffer = _buffer  # keeps an mmap alive while views point into it
+
+    # -- Building -----------------------------------------------------------
+
+    @classmethod
+    def from_segments(
+        cls, segments: Iterable[tuple[int, Iterable[Mapping[str, Any]]]],
+    ) -> WordTimings:
+        """Build from ``(segment_index, words)`` pairs.
+
+        ``words`` are mappings with ``text``, ``start_time``, ``end_time`` and
+        optionally ``confidence`` — the ``Word`` fields, as found in
+        ``session_segments.json``.  Words with empty text are dropped, and so
+        are segments left with none.
+        """
+        keys, offsets = array("i"), array("I", [0])
+        start, end, confidence = array("d"), array("d"), array("f")
+        text_ids = array("I")
+        string_ids: dict[str, int] = {}
+        for key, words in segments:
+            n = len(text_ids)
+            for w in words:
+                text = w.get("text")
+                if not text:
+                    continue
+                text_ids.append(string_ids.setdefault(text, len(string_ids)))
+                start.append(w["start_time"])
+                end.append(w["end_time"])
+                confidence.append(w.get("confidence", 1.0))
+            if len(text_ids) > n:
+                keys.append(key)
+                offsets.append(len(text_ids))
+        return cls(keys, offsets, start, end, confidence, text_ids, list(string_ids))
+
+    # -- Reading ------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.text_ids)
+
+    def __contains__(self, segment_index: int) -> bool:
+        return segment_index in self._row
+
+    def segment(self, segment_index: int) -> range:
+        """Word positions of a segment (empty when it has no timings)."""
+        row = self._row.get(segment_index)
+        if row is None:
+            return range(0)
+        return range(self.segment_offsets[row], self.segment_offsets[row + 1])
+
+    def text(self, i: int) -> str:
+        return self.strings[self.text_ids[i]]
+
+    def words(self, segment_index: int) -> list[Word]:
+        """A segment's words as ``Word`` objects — built on demand."""
+        from bristlenose.models import Word
+
+        return [
+            Word(
+                text=self.text(i),
+                start_time=self.start[i],
+                end_time=self.end[i],
+                confidence=self.confidence[i],
+            )
+            for i in self.segment(segment_index)
+        ]
+
+    # -- Serialisation ------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        encoded = [s.encode("utf-8") for s in self.strings]
+        string_offsets = array("I", [0])
+        for b in encoded:
+            string_offsets.append(string_offsets[-1] + len(b))
+        sections: list[array[Any]] = [
+            array("i", self.segment_keys),
+            array("I", self.segment_offsets),
+            array("d", self.start),
+            array("d", self.end),
+            array("f", self.confidence),
+            array("I", self.text_ids),
+            string_offsets,
+        ]
+        out = bytearray(_HEADER.pack(
+            MAGIC, FORMAT_VERSION, len(self.segment_keys), len(self.text_ids),
+            len(encoded), string_offsets[-1],
+        ))
+        for section in sections:
+            if not _LITTLE:
+                section.byteswap()
+            out += section.tobytes()
+            out += bytes(_pad(len(out)))
+        out += b"".join(encoded)
+        return bytes(out)
+
+    @classmethod
+    def from_buffer(cls, buf: object) -> WordTimings:
+        """Read a ``.bnwt`` image, viewing the columns in place."""
+        view = memoryview(buf).cast("B")  # type: ignore[arg-type]
+        if len(view) < _HEADER.size:
+            raise ValueError("word timings: truncated header")
+        magic, version, n_segments, n_words, n_strings, strings_bytes = (
+            _HEADER.unpack_from(view)
+        )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"word timings: not a v{FORMAT_VERSION} {SUFFIX} file")
+
+        pos = _HEADER.size
+        layout: list[tuple[_TypeCode, int]] = [
+            ("i", n_segments), ("I", n_segments + 1),
+            ("d", n_words), ("d", n_words), ("f", n_words), ("I", n_words),
+            ("I", n_strings + 1),
+        ]
+        columns: list[Sequence[Any]] = []
+        for code, count in layout:
+            size = array(code).itemsize * count
+            if pos + size > len(view):
+                raise ValueError("word timings: truncated")
+            chunk = view[pos:pos + size]
+            if _LITTLE:
+                columns.append(chunk.cast(code))
+            else:
+                column = array(code, chunk.tobytes())
+                column.byteswap()
+                columns.append(column)
+            pos += size + _pad(pos + size)
+
+        keys, offsets, start, end, confidence, text_ids, string_offsets = columns
+        blob = bytes(view[pos:pos + strings_bytes])
+        strings = [
+            blob[string_offsets[i]:string_offsets[i + 1]].decode("utf-8")
+            for i in range(n_strings)
+        ]
+        return cls(
+            keys, offsets, start, end, confidence, text_ids, strings, _buffer=buf,
+        )
+
+    def write(self, path: Path) -> None:
+        """Write atomically (a reader never maps a half-written file)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(self.to_bytes())
+        tmp.replace(path)
+
+    @classmethod
+    def open(cls, path: Path) -> WordTimings:
+        """Memory-map ``path``; the columns are views into the mapping."""
+        with path.open("rb") as fh:
+            if path.stat().st_size == 0:
+                raise ValueError("word timings: empty file")
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(mapped)
@@ -25,6 +25,7 @@ function makeStatus(overrides: Partial<AutoCodeJobStatus> = {}): AutoCodeJobStat
     llm_model: "claude-sonnet-4-5-20250929",
     input_tokens: 0,
     output_tokens: 0,
+    cache_hits: 0,
     started_at: "2026-02-20T10:00:00Z",
     completed_at: null,
     ...overrides,
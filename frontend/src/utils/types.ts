@@ -320,6 +320,7 @@ export interface AutoCodeJobStatus {
   llm_model: string;
   input_tokens: number;
   output_tokens: number;
+  cache_hits: number;
   started_at: string;
   completed_at: string | null;
 }
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""AutoCode lexical pre-filter: taxonomy tokens sent vs recall of the right tag.
+
+Usage: scripts/bench-autocode-prefilter.py [--shortlist 0,3,5,8] [--batch-size 25]
+
+Runs the hand-tagged Garrett golden quotes (tests/test_autocode_discrimination.py)
+through ``plan_batches`` at each ``autocode_tag_shortlist`` value and prints,
+against the unfiltered path (0), the estimated taxonomy tokens the batches
+send (characters / 4), the share of quotes whose correct tag is still listed
+in their batch's prompt (recall), and the share whose plausible-wrong tag is
+listed too (the confusable the LLM has to discriminate against). A second
+table does the same for the codebook builder's candidate scan: where each
+golden quote lands when the pool is ordered for its correct tag.
+
+No LLM is called — this measures what the prompt *offers*, which bounds
+what the model can get right.  Use a small ``--batch-size`` to see how the
+shortlist behaves on a study with many batches.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shortlist", default="0,3,5,8",
+                        help="comma-separated autocode_tag_shortlist values to try")
+    parser.add_argument("--batch-size", type=int, default=25,
+                        help="quotes per AutoCode batch")
+    args = parser.parse_args()
+
+    from bristlenose.server import codebook_builder as cb
+    from bristlenose.server.autocode import QuoteBatchItem, build_tag_taxonomy, plan_batches
+    from bristlenose.server.codebook import get_template
+    from tests.test_autocode_discrimination import GOLDEN_QUOTES
+
+    template = get_template("garrett")
+    if template is None:
+        print("garrett codebook not found", file=sys.stderr)
+        return 1
+    items = [
+        QuoteBatchItem(
+            db_id=i, text=gq.text, session_id="s1", participant_id="p1",
+            topic_label="", sentiment="",
+        )
+        for i, gq in enumerate(GOLDEN_QUOTES)
+    ]
+    full = build_tag_taxonomy(template)
+    names = {tag.name for group in template.groups for tag in group.tags}
+    # Quotes whose plausible-wrong tag is in this codebook at all.
+    rivals = [i for i, gq in enumerate(GOLDEN_QUOTES) if gq.plausible_wrong_tag in names]
+
+    print(f"{len(items)} golden quotes, garrett codebook, batches of {args.batch_size}")
+    print(f"  {'shortlist':>9} {'batches':>7} {'tax tokens':>10} {'saved':>6} "
+          f"{'recall':>6} {'confusable':>10}")
+    baseline = 0
+    for k in (int(v) for v in args.shortlist.split(",")):
+        batches = plan_batches(items, template, k, batch_size=args.batch_size)
+        tokens = sum(
+            len(full if keep is None else build_tag_taxonomy(template, keep)) // 4
+            for _, keep in batches
+        )
+        baseline = baseline or tokens
+        listed: dict[int, set[str] | None] = {
+            item.db_id: keep for batch, keep in batches for item in batch
+        }
+
+        def offered(i: int, tag: str) -> bool:
+            keep = listed[i]
+            return keep is None or tag in keep
+
+        recall = sum(
+            offered(i, gq.correct_tag) for i, gq in enumerate(GOLDEN_QUOTES)
+        ) / len(items)
+        confusable = sum(
+            offered(i, GOLDEN_QUOTES[i].plausible_wrong_tag) for i in rivals
+        ) / len(rivals)
+        print(f"  {k:>9} {len(batches):>7} {tokens:>10} {1 - tokens / baseline:>6.0%} "
+              f"{recall:>6.0%} {confusable:>10.0%}")
+
+    print("\ncandidate scan: position of each tag's golden quote(s) in the pool")
+    print(f"  {'order':>9} {'mean pos':>8} {'in top 5':>8}")
+    pool = [cb.CandidateQuote(db_id=i, text=gq.text) for i, gq in enumerate(GOLDEN_QUOTES)]
+    tags = {tag.name: tag for group in template.groups for tag in group.tags}
+    for label in ("pool", "lexical"):
+        positions: list[int] = []
+        for name in sorted({gq.correct_tag for gq in GOLDEN_QUOTES}):
+            tag = tags[name]
+            draft = cb.PromptDraft(definition=tag.definition, apply_when=tag.apply_when)
+            ordered = pool if label == "pool" else cb.order_by_relevance(name, draft, pool)
+            ids = [q.db_id for q in ordered]
+            positions.extend(
+                ids.index(i) for i, gq in enumerate(GOLDEN_QUOTES) if gq.correct_tag == name
+            )
+        top = sum(1 for p in positions if p < 5) / len(positions)
+        print(f"  {label:>9} {sum(positions) / len(positions) + 1:>8.1f} {top:>8.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
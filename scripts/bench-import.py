@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Serve-start import timings: cold, unchanged, one transcript changed.
+
+Usage: scripts/bench-import.py <project-dir> [--repeat 3]
+  where <project-dir> is a fixture from scripts/generate-stress-fixture.py
+  (e.g. trial-runs/stress-test-1500) or any real project folder
+
+Imports the project into a scratch SQLite file three ways and prints the
+best wall-clock of each: a cold import into an empty database, a re-import
+with nothing changed (the fingerprint short-circuit every ``bristlenose
+serve`` start takes), and a re-import after one transcript changed (the
+delta path). The project folder is copied to a temp directory first, so the
+fixture itself is never modified.
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("project_dir", type=Path)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per scenario; the best is reported")
+    args = parser.parse_args()
+
+    from bristlenose.server.db import create_session_factory, get_engine, init_db
+    from bristlenose.server.importer import _find_transcripts_dir, import_project
+    from bristlenose.server.models import Quote
+
+    if not args.project_dir.is_dir():
+        print(f"not a directory: {args.project_dir}", file=sys.stderr)
+        return 1
+
+    timings: dict[str, list[float]] = {"cold": [], "unchanged": [], "one transcript": []}
+    quotes = 0
+    for _ in range(args.repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp) / "project"
+            shutil.copytree(args.project_dir, project)
+            engine = get_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+            init_db(engine)
+            factory = create_session_factory(engine)
+
+            def timed(label: str) -> None:
+                db = factory()
+                try:
+                    t0 = time.perf_counter()
+                    import_project(db, project)
+                    timings[label].append(time.perf_counter() - t0)
+                finally:
+                    db.close()
+
+            timed("cold")
+            timed("unchanged")
+
+            output = project / "bristlenose-output"
+            transcripts = _find_transcripts_dir(
+                project, output if output.is_dir() else project,
+            )
+            first = next(iter(sorted(transcripts.glob("*.txt"))), None)
+            if first is not None:
+                with first.open("a", encoding="utf-8") as fh:
+                    fh.write("[99:59] [p1] Benchmark edit.\n")
+                timed("one transcript")
+
+            db = factory()
+            quotes = db.query(Quote).count()
+            db.close()
+            engine.dispose()
+
+    print(f"{quotes} quotes, best of {args.repeat}")
+    for label, runs in timings.items():
+        if runs:
+            print(f"  {label:<16} {min(runs) * 1000:9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""PII redaction throughput: per-segment vs batched vs process pool.
+
+Usage: scripts/bench-pii.py <transcripts-dir> [--workers 2,4] [--repeat 1]
+  where <transcripts-dir> is a transcripts-raw/ folder from a previous run
+
+Times stage 7's three paths over the same segments and prints segments per
+second for each: the original one-``analyze``-per-segment loop, the batched
+``nlp.pipe`` engine in-process, and the batched engine fanned out over a
+process pool at each worker count. Every path's output is compared against
+the per-segment baseline and the script fails loudly if any byte differs.
+Engine construction (spaCy model load) is outside the in-process timings
+and inside the pool timings — each worker pays it, which is what makes
+small studies stay in-process.
+
+Needs Presidio's spaCy model installed (`bristlenose doctor --fetch`).
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("transcripts_dir", type=Path)
+    parser.add_argument("--workers", default="2,4",
+                        help="comma-separated pool sizes to try")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="repeat the corpus N times to simulate a larger study")
+    args = parser.parse_args()
+
+    from bristlenose.config import BristlenoseSettings
+    from bristlenose.pipeline import load_transcripts_from_dir
+    from bristlenose.stages import s07_pii_removal as s07
+
+    transcripts = load_transcripts_from_dir(args.transcripts_dir)
+    texts = [seg.text for t in transcripts for seg in t.segments] * args.repeat
+    timecodes = [seg.start_time for t in transcripts for seg in t.segments] * args.repeat
+    if not texts:
+        print(f"no transcript segments in {args.transcripts_dir}", file=sys.stderr)
+        return 1
+    print(f"{len(transcripts)} sessions x{args.repeat}, {len(texts)} segments\n")
+
+    settings = BristlenoseSettings(pii_enabled=True)
+    analyzer, anonymizer = s07._init_presidio(settings)
+
+    def flat(results: list) -> list:
+        return [
+            (text, [(r.entity_type, r.original_text, r.replacement, r.score, r.timecode)
+                    for r in reds])
+            for text, reds in results
+        ]
+
+    print(f"{'path':>16} {'wall_s':>9} {'segments/s':>11} {'identical':>10}")
+
+    t0 = time.perf_counter()
+    baseline = [
+        s07._redact_text(text, tc, analyzer, anonymizer, settings)
+        for text, tc in zip(texts, timecodes)
+    ]
+    wall = time.perf_counter() - t0
+    expected = flat(baseline)
+    print(f"{'per-segment':>16} {wall:>9.1f} {len(texts) / wall:>11.0f} {'—':>10}")
+
+    t0 = time.perf_counter()
+    batched = s07._redact_texts(texts, timecodes, analyzer, anonymizer, settings)
+    wall = time.perf_counter() - t0
+    same = flat(batched) == expected
+    print(f"{'batched':>16} {wall:>9.1f} {len(texts) / wall:>11.0f} {str(same):>10}")
+
+    ok = same
+    for raw in args.workers.split(","):
+        workers = int(raw)
+        t0 = time.perf_counter()
+        pooled = s07._redact_pool(texts, timecodes, settings, workers)
+        wall = time.perf_counter() - t0
+        same = flat(pooled) == expected
+        ok = ok and same
+        label = f"pool x{workers}"
+        print(f"{label:>16} {wall:>9.1f} {len(texts) / wall:>11.0f} {str(same):>10}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Transcription throughput vs Whisper worker count.
+
+Usage: scripts/bench-transcribe-workers.py <input-dir> [--workers 1,2,4,8] [--model small]
+  where <input-dir> is a folder of recordings (anything `bristlenose run` ingests)
+
+Runs stage 5 once per worker count over the same sessions and prints
+audio-minutes per wall-minute for each. Audio is extracted once up front
+into a temp dir so every pass times transcription alone. Model load is
+inside the timing on purpose — every replica pays it, and that cost is
+what caps the useful worker count on short corpora.
+
+Needs the Whisper model already cached (`bristlenose doctor --fetch`).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input_dir", type=Path)
+    parser.add_argument("--workers", default="1,2,4,8",
+                        help="comma-separated worker counts (0 = auto)")
+    parser.add_argument("--model", default="small")
+    args = parser.parse_args()
+
+    from bristlenose.config import BristlenoseSettings
+    from bristlenose.stages.s01_ingest import ingest
+    from bristlenose.stages.s02_extract_audio import extract_audio_for_sessions
+    from bristlenose.stages.s05_transcribe import transcribe_sessions
+    from bristlenose.utils.hardware import detect_hardware
+
+    sessions = ingest(args.input_dir)
+    if not sessions:
+        print(f"no supported files in {args.input_dir}", file=sys.stderr)
+        return 1
+
+    hw = detect_hardware()
+    print(hw.summary())
+    print(f"auto workers for {args.model}: {hw.recommended_whisper_workers(args.model)}")
+
+    with tempfile.TemporaryDirectory(prefix="bn-bench-") as tmp:
+        sessions = asyncio.run(extract_audio_for_sessions(sessions, Path(tmp)))
+        audio_minutes = sum(
+            (f.duration_seconds or 0) for s in sessions for f in s.files
+            if s.audio_path is not None and not s.has_existing_transcript
+        ) / 60.0
+        n = sum(1 for s in sessions if s.audio_path and not s.has_existing_transcript)
+        print(f"{n} sessions, {audio_minutes:.1f} audio-minutes\n")
+
+        print(f"{'workers':>8} {'wall_s':>9} {'audio_min/wall_min':>19} {'failed':>7}")
+        for raw in args.workers.split(","):
+            workers = int(raw)
+            settings = BristlenoseSettings(whisper_model=args.model, whisper_workers=workers)
+            t0 = time.perf_counter()
+            _, outcome = transcribe_sessions(sessions, settings)
+            wall = time.perf_counter() - t0
+            rate = audio_minutes / (wall / 60.0) if wall else 0.0
+            print(f"{workers:>8} {wall:>9.1f} {rate:>19.2f} {len(outcome.failed):>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,7 @@ Produces a serve-mode-ready project directory containing:
 
 The output bypasses the pipeline entirely — no LLM calls, no audio, no
 transcription.  The quote JSON is structured to match the importer's
-expectations (`_get_or_create_quote` stable key, `_SEGMENT_RE` format).
+expectations (`_quote_key` stable key, `_SEGMENT_RE` format).
 
 Determinism: `random.seed(0)` at import time.  Same flags → identical
 fixtures, so before/after virtualisation comparisons stay apples-to-apples.
@@ -8,7 +8,8 @@
 #   5. Identity guard: confirm we hit the fixture we just wrote, not a zombie
 #   6. Run Playwright stress spec (DOM + API + export measurements)
 #   7. Optional: Lighthouse against /report/quotes/
-#   8. Print summary, clean up via a single EXIT trap
+#   8. Export size; quotes API TTFB + payload (full vs index + first page)
+#   9. Print summary, clean up via a single EXIT trap
 #
 # Flags:
 #   --quotes N          Total quote count (default 1500).
@@ -50,7 +51,7 @@ while [[ $# -gt 0 ]]; do
     -v|--verbose) VERBOSE=true; shift ;;
     -h|--help)
       # Print the header comment block (lines 2 through the last doc line).
-      sed -n '2,25p' "$0"
+      sed -n '2,26p' "$0"
       exit 0
       ;;
     *) echo "Unknown arg: $1" >&2; exit 1 ;;
@@ -380,8 +381,47 @@ export_bytes=$(wc -c < "$EXPORT_FILE" | tr -d ' ')
 export_mb=$(.venv/bin/python -c "print(f'{$export_bytes/1024/1024:.2f}')")
 t_export=$(( SECONDS - t_export_start ))
 
-# Nothing downstream needs the auth token any more (Playwright + export
-# + lighthouse are all done).  Drop it from the environment so the merge
+# ---------------------------------------------------------------------------
+# 8b. Quotes API — full payload vs index + first section page
+#
+# Time to first byte and body size for what the quotes page loads first.
+# Run with --quotes 10000 for the 10k-quote scenario.
+# ---------------------------------------------------------------------------
+
+echo "── Measuring quotes endpoints ──"
+
+# Prints "<ttfb-seconds> <bytes>" for one GET; body to stdout if $2 is set.
+_probe() {
+  local path="$1" body="${2:-/dev/null}"
+  { set +x; } 2>/dev/null
+  printf 'header = "Authorization: Bearer %s"\n' "$_BRISTLENOSE_AUTH_TOKEN" \
+    | curl -sSf -K - -o "$body" -w '%{time_starttransfer} %{size_download}' \
+        "http://127.0.0.1:$PORT$path"
+  if [[ "$VERBOSE" == "true" ]]; then
+    set -x
+  fi
+}
+
+_prev_umask=$(umask)
+umask 077
+INDEX_FILE="$(mktemp "${TMPDIR:-/tmp}/bristlenose-index.XXXXXX")"
+umask "$_prev_umask"
+read -r quotes_ttfb quotes_bytes < <(_probe /api/projects/1/quotes)
+read -r index_ttfb index_bytes < <(_probe /api/projects/1/quotes/index "$INDEX_FILE")
+first_cluster=$(.venv/bin/python -c "
+import json, sys
+sections = json.load(open(sys.argv[1]))['sections']
+print(sections[0]['cluster_id'] if sections else '')
+" "$INDEX_FILE")
+rm -f "$INDEX_FILE"
+page_ttfb=0
+page_bytes=0
+if [[ -n "$first_cluster" ]]; then
+  read -r page_ttfb page_bytes < <(_probe "/api/projects/1/quotes/sections/$first_cluster")
+fi
+
+# Nothing downstream needs the auth token any more (Playwright, export,
+# quotes probes + lighthouse are all done).  Drop it from the environment so the merge
 # python child process and any other descendants can't read it via
 # /proc/<pid>/environ.  Mask xtrace so the unset line itself doesn't
 # trace the value as it's being cleared.
@@ -404,6 +444,7 @@ fi
 
 export STRESS_EXPORT_BYTES="$export_bytes"
 export STRESS_EXPORT_MB="$export_mb"
+export STRESS_QUOTES_API="$quotes_ttfb $quotes_bytes $index_ttfb $index_bytes $page_ttfb $page_bytes"
 
 # Quoted heredoc delimiter ('PY') disables shell interpolation inside the
 # body, so a surprise-empty variable can no longer become a SyntaxError
@@ -418,6 +459,12 @@ data["quotes"] = int(os.environ["STRESS_QUOTES"])
 data["startup_seconds"] = int(os.environ["STRESS_STARTUP_S"])
 data["export_bytes"] = int(os.environ["STRESS_EXPORT_BYTES"])
 data["export_mb"] = float(os.environ["STRESS_EXPORT_MB"])
+q_ttfb, q_bytes, i_ttfb, i_bytes, p_ttfb, p_bytes = os.environ["STRESS_QUOTES_API"].split()
+data["quotes_api"] = {
+    "full": {"ttfb_seconds": float(q_ttfb), "bytes": int(q_bytes)},
+    "index": {"ttfb_seconds": float(i_ttfb), "bytes": int(i_bytes)},
+    "first_page": {"ttfb_seconds": float(p_ttfb), "bytes": int(p_bytes)},
+}
 path.write_text(json.dumps(data, indent=2) + "\n")
 PY
 
@@ -432,6 +479,9 @@ echo "┌─ Stress test summary ───────────────
 printf "│  Quotes           %6d                          │\n" "$QUOTES"
 printf "│  Startup          %6ds                         │\n" "$startup_elapsed"
 printf "│  Export HTML      %8s MB                      │\n" "$export_mb"
+printf "│  /quotes          %6.2fs TTFB %9d bytes    │\n" "$quotes_ttfb" "$quotes_bytes"
+printf "│  index + page 1   %6.2fs TTFB %9d bytes    │\n" \
+  "$(.venv/bin/python -c "print($index_ttfb + $page_ttfb)")" "$(( index_bytes + page_bytes ))"
 echo "│                                                   │"
 echo "│  Stage timings (wall-clock):                      │"
 printf "│    fixture      %4ds                            │\n" "$t_fixture"
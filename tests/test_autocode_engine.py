@@ -125,6 +125,9 @@ def _mock_settings():
     settings.llm_max_tokens = 32768
     settings.llm_temperature = 0.1
     settings.llm_concurrency = 1
+    settings.llm_concurrency_max = 1
+    settings.llm_tokens_per_minute = 0
+    settings.autocode_tag_shortlist = 0
     settings.anthropic_api_key = "test-key"
     return settings
 
@@ -1304,6 +1307,170 @@ class TestStartCatchUps:
             db.close()
 
 
+class TestVerdictCache:
+    """Per-quote verdict cache — a re-run sends only changed quotes."""
+
+    def _run(self, db_factory, project_id, framework_id, analyze, settings=None) -> AutoCodeJob:
+        """Run a fresh job (as the start endpoint does for a retry) and return it."""
+        db = db_factory()
+        try:
+            old = (
+                db.query(AutoCodeJob)
+                .filter_by(project_id=project_id, framework_id=framework_id)
+                .first()
+            )
+            if old is not None:
+                db.query(ProposedTag).filter_by(job_id=old.id).delete()
+                db.delete(old)
+                db.flush()
+            db.add(AutoCodeJob(project_id=project_id, framework_id=framework_id, status="pending"))
+            db.commit()
+        finally:
+            db.close()
+        with _patch_llm(analyze):
+            asyncio.run(
+                run_autocode_job(db_factory, project_id, framework_id, settings or _mock_settings())
+            )
+        db = db_factory()
+        try:
+            job = (
+                db.query(AutoCodeJob)
+                .filter_by(project_id=project_id, framework_id=framework_id)
+                .one()
+            )
+            db.expunge(job)
+            return job
+        finally:
+            db.close()
+
+    def test_rerun_restores_every_quote_from_cache(self, project_with_garrett) -> None:
+        project_id, framework_id, db_factory = project_with_garrett
+        self._run(
+            db_factory, project_id, framework_id,
+            AsyncMock(return_value=_make_batch_result(10, "user need", 0.85)),
+        )
+        analyze = AsyncMock()
+        job = self._run(db_factory, project_id, framework_id, analyze)
+
+        analyze.assert_not_awaited()
+        assert job.status == "completed"
+        assert job.cache_hits == 10
+        assert job.processed_quotes == 10
+        assert job.proposed_count == 10
+
+    def test_edited_quote_is_the_only_one_sent(self, project_with_garrett) -> None:
+        from bristlenose.server.models import AutoCodeCache, QuoteEdit
+
+        project_id, framework_id, db_factory = project_with_garrett
+        self._run(
+            db_factory, project_id, framework_id,
+            AsyncMock(return_value=_make_batch_result(10, "user need", 0.85)),
+        )
+        db = db_factory()
+        try:
+            quote = db.query(Quote).filter_by(project_id=project_id).first()
+            db.add(QuoteEdit(quote_id=quote.id, edited_text="Corrected wording"))
+            db.commit()
+        finally:
+            db.close()
+
+        analyze = AsyncMock(return_value=_make_batch_result(1, "user need", 0.9))
+        job = self._run(db_factory, project_id, framework_id, analyze)
+
+        assert analyze.await_count == 1
+        assert "Corrected wording" in analyze.await_args.kwargs["user_prompt"]
+        assert job.cache_hits == 9
+        assert job.processed_quotes == 10
+        assert job.proposed_count == 10
+        db = db_factory()
+        try:
+            # The edited quote's old verdict was pruned; one row per quote.
+            assert db.query(AutoCodeCache).count() == 10
+        finally:
+            db.close()
+
+    def test_model_change_misses(self, project_with_garrett) -> None:
+        project_id, framework_id, db_factory = project_with_garrett
+        self._run(
+            db_factory, project_id, framework_id,
+            AsyncMock(return_value=_make_batch_result(10, "user need", 0.85)),
+        )
+        settings = _mock_settings()
+        settings.llm_model = "claude-opus-4-20250514"
+        analyze = AsyncMock(return_value=_make_batch_result(10, "user need", 0.85))
+        job = self._run(db_factory, project_id, framework_id, analyze, settings)
+
+        assert analyze.await_count == 1
+        assert job.cache_hits == 0
+
+    def test_untagged_quotes_are_cached_too(self, project_with_garrett) -> None:
+        """An empty verdict is cached: a re-run doesn't re-send quotes the LLM skipped."""
+        project_id, framework_id, db_factory = project_with_garrett
+        self._run(
+            db_factory, project_id, framework_id,
+            AsyncMock(return_value=_make_batch_result(4, "user need", 0.85)),
+        )
+        analyze = AsyncMock()
+        job = self._run(db_factory, project_id, framework_id, analyze)
+
+        analyze.assert_not_awaited()
+        assert job.cache_hits == 10
+        assert job.proposed_count == 4
+
+    def test_cache_key_tracks_what_the_prompt_shows(self) -> None:
+        from bristlenose.server.autocode import QuoteBatchItem, autocode_cache_key
+
+        item = QuoteBatchItem(
+            db_id=1, text="It was slow", session_id="s1", participant_id="p1",
+            topic_label="Checkout", sentiment="frustration",
+        )
+        moved = QuoteBatchItem(**{**item.__dict__, "db_id": 99})
+        retopiced = QuoteBatchItem(**{**item.__dict__, "topic_label": "Search"})
+        key = autocode_cache_key("scope", item)
+        assert autocode_cache_key("scope", moved) == key  # row id isn't content
+        assert autocode_cache_key("scope", retopiced) != key
+        assert autocode_cache_key("other-scope", item) != key
+
+    def test_scope_follows_the_requested_model(self) -> None:
+        from bristlenose.server.autocode import autocode_cache_scope
+
+        def scope(**overrides) -> str:
+            settings = _mock_settings()
+            for name, value in overrides.items():
+                setattr(settings, name, value)
+            return autocode_cache_scope("garrett", "1.0", "taxonomy", settings)
+
+        # Ollama and Azure request local_model / the deployment, not llm_model.
+        assert scope(llm_provider="local", local_model="llama3.2:3b") != scope(
+            llm_provider="local", local_model="qwen2.5:7b"
+        )
+        assert scope(llm_provider="azure", azure_deployment="gpt-4o-a") != scope(
+            llm_provider="azure", azure_deployment="gpt-4o-b"
+        )
+        assert scope(llm_provider="local", local_model="m", llm_model="x") == scope(
+            llm_provider="local", local_model="m", llm_model="y"
+        )
+
+    def test_shortlisted_run_sends_fewer_tags_and_misses_cache(
+        self, project_with_garrett
+    ) -> None:
+        project_id, framework_id, db_factory = project_with_garrett
+        full = AsyncMock(return_value=_make_batch_result(10, "user need", 0.85))
+        self._run(db_factory, project_id, framework_id, full)
+
+        settings = _mock_settings()
+        settings.autocode_tag_shortlist = 3
+        narrow = AsyncMock(return_value=_make_batch_result(10, "user need", 0.85))
+        job = self._run(db_factory, project_id, framework_id, narrow, settings)
+
+        assert narrow.await_count == 1
+        assert job.cache_hits == 0
+        assert job.proposed_count == 10
+        sent = narrow.await_args.kwargs
+        assert sent["cacheable_prefix"] is None
+        assert sent["user_prompt"].count("**") < full.await_args.kwargs["user_prompt"].count("**")
+
+
 class TestReconcileOrphanedJobs:
     """Startup reconciliation of AutoCodeJob rows stranded by a crash.
 
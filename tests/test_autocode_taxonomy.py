@@ -8,6 +8,7 @@ from bristlenose.server.autocode import (
     build_quote_batch,
     build_tag_name_map,
     build_tag_taxonomy,
+    plan_batches,
     resolve_tag_name_to_id,
 )
 from bristlenose.server.codebook import CodebookTemplate, TemplateGroup, TemplateTag, get_template
@@ -156,6 +157,16 @@ class TestBuildTagTaxonomy:
         taxonomy = build_tag_taxonomy(template)
         assert "Is the product solving the right problem" in taxonomy
 
+    def test_keep_limits_tags_and_drops_empty_groups(self) -> None:
+        """A shortlist keeps only its tags, under their own group headers."""
+        template = get_template("garrett")
+        assert template is not None
+        taxonomy = build_tag_taxonomy(template, keep={"user need", "task flow"})
+        assert "**user need**" in taxonomy
+        assert "**task flow**" in taxonomy
+        assert "**business objective**" not in taxonomy
+        assert taxonomy.count("### ") == 2
+
 
 # ---------------------------------------------------------------------------
 # build_quote_batch
@@ -207,6 +218,54 @@ class TestBuildQuoteBatch:
         assert "24." in text
 
 
+# ---------------------------------------------------------------------------
+# plan_batches
+# ---------------------------------------------------------------------------
+
+
+class TestPlanBatches:
+    """Tests for chunking quotes with the lexical tag shortlist."""
+
+    def _template(self) -> CodebookTemplate:
+        return _make_template(groups=[
+            _make_group("Money", "Cost", "emo", [
+                _make_tag("price", definition="Cost, price or fee of the product"),
+                _make_tag("refund", definition="Getting money back after a purchase"),
+            ]),
+            _make_group("Finding", "Search", "ux", [
+                _make_tag("search", definition="Searching for items with the search box"),
+                _make_tag("filter", definition="Narrowing results with a filter"),
+            ]),
+        ])
+
+    def test_off_sends_whole_taxonomy(self) -> None:
+        quotes = [_make_quote(i) for i in range(BATCH_SIZE + 1)]
+        batches = plan_batches(quotes, self._template(), 0)
+        assert [len(b) for b, _ in batches] == [BATCH_SIZE, 1]
+        assert [keep for _, keep in batches] == [None, None]
+
+    def test_batches_group_quotes_by_likeliest_tag(self) -> None:
+        texts = ["The price is too high", "I searched the search box", "The fee surprised me"]
+        quotes = [_make_quote(i, t) for i, t in enumerate(texts)]
+        batches = plan_batches(quotes, self._template(), 1, batch_size=2)
+        assert [[q.text for q in b] for b, _ in batches] == [
+            ["The price is too high", "The fee surprised me"],
+            ["I searched the search box"],
+        ]
+        assert [keep for _, keep in batches] == [{"price"}, {"search"}]
+
+    def test_unmatched_quote_keeps_whole_taxonomy(self) -> None:
+        quotes = [_make_quote(0, "The price is too high"), _make_quote(1, "Lovely weather")]
+        [(batch, keep)] = plan_batches(quotes, self._template(), 1)
+        assert len(batch) == 2
+        assert keep is None
+
+    def test_shortlist_covering_codebook_is_off(self) -> None:
+        quotes = [_make_quote(0, "The price is too high")]
+        [(_, keep)] = plan_batches(quotes, self._template(), 4)
+        assert keep is None
+
+
 # ---------------------------------------------------------------------------
 # resolve_tag_name_to_id
 # ---------------------------------------------------------------------------
@@ -34,10 +34,12 @@ from bristlenose.llm.structured import (
 from bristlenose.server.app import create_app
 from bristlenose.server.chat_lens import format_claims_for_support_check
 from bristlenose.server.grounding import (
+    _corpus_snapshot,
     assemble_corpus_context,
     quote_dom_id,
     resolve_quote_ids,
     resolve_quote_indices,
+    retrieve_corpus_context,
 )
 from bristlenose.server.models import (
     Project,
@@ -60,6 +62,7 @@ def _mock_settings() -> MagicMock:
     s.llm_model = "test-model"
     s.llm_max_tokens = 1000
     s.anthropic_api_key = "sk-test"
+    s.chat_lens_corpus_chars = 120_000
     return s
 
 
@@ -208,6 +211,65 @@ class TestCorpusAssembly:
         assert "[corpus truncated:" in corpus.text
 
 
+# ---------------------------------------------------------------------------
+# Grounding — per-question retrieval and the revision cache
+# ---------------------------------------------------------------------------
+
+
+class TestRetrieval:
+    def test_corpus_that_fits_is_sent_whole(self) -> None:
+        app = _make_app()
+        db = app.state.db_factory()
+        try:
+            whole = assemble_corpus_context(db, 1)
+            corpus = retrieve_corpus_context(db, 1, "hamburger menu")
+        finally:
+            db.close()
+
+        assert corpus.text == whole.text
+        assert corpus.quote_count == 4
+        assert not corpus.retrieved
+        assert "[excerpt:" not in corpus.text
+
+    def test_large_corpus_packs_the_relevant_quotes_under_a_stated_excerpt(self) -> None:
+        app = _make_app()
+        db = app.state.db_factory()
+        try:
+            # Room for the prelude, the excerpt note and one quote.
+            corpus = retrieve_corpus_context(db, 1, "hamburger menu", max_chars=400)
+        finally:
+            db.close()
+
+        assert corpus.retrieved
+        assert not corpus.truncated
+        assert corpus.quote_count == 1
+        assert corpus.total_quotes == 4
+        assert "[excerpt: the 1 of 4 quotes most relevant" in corpus.text
+        assert len(corpus.text) <= 400
+        # Indices stay dense over what was sent, so validation is unchanged.
+        assert [q.dom_id for q in corpus.quotes_by_index.values()] == ["q-p1-26"]
+        resolved, rejected = resolve_quote_indices([1, 2], corpus)
+        assert [q.dom_id for q in resolved] == ["q-p1-26"]
+        assert rejected == [2]
+
+    def test_snapshot_cached_until_the_next_committed_write(self) -> None:
+        app = _make_app()
+        db = app.state.db_factory()
+        try:
+            first = _corpus_snapshot(db, 1)
+            assert _corpus_snapshot(db, 1) is first
+
+            pks = _quote_pks_by_dom_id(db)
+            db.add(QuoteState(quote_id=pks["q-p1-26"], is_hidden=True))
+            db.commit()
+
+            after = _corpus_snapshot(db, 1)
+            assert after is not first
+            assert after.total_quotes == 3
+        finally:
+            db.close()
+
+
 # ---------------------------------------------------------------------------
 # Grounding — citation validation
 # ---------------------------------------------------------------------------
@@ -550,6 +612,24 @@ class TestAsk:
         assert body["call"]["model"] == "test-model"
         assert body["call"]["prompt_version"]
 
+    def test_large_corpus_sends_the_question_relevant_excerpt(self) -> None:
+        app = _make_app()
+        app.state.settings.chat_lens_corpus_chars = 400
+        mock = AsyncMock(return_value=_answer([]))
+        with _patch_llm(mock):
+            r = AuthTestClient(app).post(
+                "/api/dev/chat-lens/ask",
+                json={"question": "What about the hamburger menu?"},
+            )
+        assert r.status_code == 200
+        body = r.json()
+        assert body["corpus"]["retrieved"] is True
+        assert body["corpus"]["quote_count"] == 1
+        assert body["corpus"]["total_quotes"] == 4
+        user_prompt = mock.await_args.kwargs["user_prompt"]
+        assert "[excerpt: the 1 of 4 quotes" in user_prompt
+        assert "hamburger menu. I kept looking" in user_prompt
+
     def test_prompt_carries_corpus_invariants_question_and_restated_rules(self) -> None:
         """The context-stuffed single-project route, §5a-shaped: integer
         markers in the corpus, and the core rules restated *after* the
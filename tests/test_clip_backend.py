@@ -139,3 +139,73 @@ class TestExtractClip:
             output.write_bytes(b"clip")
             FFmpegBackend().extract_clip(source, output, 10.0, 20.0)
             assert mock_run.call_args[1]["timeout"] == timeout
+
+
+class TestExtractClips:
+    def _cuts(self, tmp_path: Path, n: int) -> list[tuple[Path, float, float]]:
+        return [(tmp_path / f"clip{i}.mp4", 10.0 * i, 10.0 * i + 5) for i in range(n)]
+
+    def test_one_process_for_several_cuts(self, tmp_path: Path) -> None:
+        source = tmp_path / "source.mp4"
+        source.write_bytes(b"fake")
+        cuts = self._cuts(tmp_path, 3)
+
+        def fake_run(args, **kwargs):
+            for output, _, _ in cuts:
+                output.write_bytes(b"clip")
+            return MagicMock(returncode=0, stderr="")
+
+        with patch(
+            "bristlenose.server.clip_backend.subprocess.run", side_effect=fake_run,
+        ) as mock_run:
+            results = FFmpegBackend().extract_clips(source, cuts)
+
+        assert results == [output for output, _, _ in cuts]
+        assert mock_run.call_count == 1
+        args = mock_run.call_args[0][0]
+        assert args.count("-i") == 3
+        assert args.count(str(source)) == 3
+        # Each output draws from its own seeked input.
+        assert "2:v:0?" in args
+        assert "2:a:0?" in args
+
+    def test_failed_batch_retries_each_cut(self, tmp_path: Path) -> None:
+        source = tmp_path / "source.mp4"
+        source.write_bytes(b"fake")
+        cuts = self._cuts(tmp_path, 2)
+        calls: list[list[str]] = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            if args.count("-i") > 1:
+                return MagicMock(returncode=1, stderr="Invalid data")
+            output = Path(args[-1])
+            if output.name == "clip1.mp4":
+                return MagicMock(returncode=1, stderr="bad range")
+            output.write_bytes(b"clip")
+            return MagicMock(returncode=0, stderr="")
+
+        with patch("bristlenose.server.clip_backend.subprocess.run", side_effect=fake_run):
+            results = FFmpegBackend().extract_clips(source, cuts)
+
+        assert results == [cuts[0][0], None]
+        assert len(calls) == 3  # one batched run, then one per cut
+
+    def test_audio_only_output_maps_no_video(self, tmp_path: Path) -> None:
+        source = tmp_path / "source.m4a"
+        source.write_bytes(b"fake")
+        cuts = [(tmp_path / "a.m4a", 0.0, 5.0), (tmp_path / "b.m4a", 20.0, 25.0)]
+
+        with patch(
+            "bristlenose.server.clip_backend.subprocess.run",
+            return_value=MagicMock(returncode=0, stderr=""),
+        ) as mock_run:
+            FFmpegBackend().extract_clips(source, cuts)
+
+        args = mock_run.call_args_list[0][0][0]
+        assert "0:v:0?" not in args
+        assert "1:a:0?" in args
+
+    def test_too_many_cuts_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            FFmpegBackend().extract_clips(tmp_path / "s.mp4", self._cuts(tmp_path, 9))
@@ -0,0 +1,201 @@
+"""Tests for batched (map-reduce) clustering and theming in stages 10 and 11."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from bristlenose.llm.structured import (
+    ScreenClusteringResult,
+    ScreenClusterItem,
+    ScreenClusterMergeItem,
+    ScreenClusterMergeResult,
+    ThematicGroupingResult,
+    ThemeGroupItem,
+    ThemeMergeItem,
+    ThemeMergeResult,
+)
+from bristlenose.models import ExtractedQuote, QuoteType
+from bristlenose.stages.s10_quote_clustering import cluster_by_screen
+from bristlenose.stages.s11_thematic_grouping import group_by_theme
+from bristlenose.utils.batching import pack_by_session
+
+
+def _quote(session: str, n: int, qtype: QuoteType = QuoteType.SCREEN_SPECIFIC) -> ExtractedQuote:
+    return ExtractedQuote(
+        session_id=session,
+        participant_id=f"p{session[1:]}",
+        start_timecode=float(n),
+        end_timecode=float(n) + 2.0,
+        text=f"{session} quote {n}",
+        topic_label="Dashboard",
+        quote_type=qtype,
+    )
+
+
+def _client(side_effect) -> AsyncMock:
+    client = AsyncMock()
+    client.provider = "anthropic"
+    client.analyze = AsyncMock(side_effect=side_effect)
+    return client
+
+
+# ---------------------------------------------------------------------------
+# pack_by_session
+# ---------------------------------------------------------------------------
+
+
+class TestPackBySession:
+    def test_keeps_sessions_together(self) -> None:
+        quotes = [_quote("s1", i) for i in range(3)] + [_quote("s2", i) for i in range(3)]
+        assert pack_by_session(quotes, 4) == [[0, 1, 2], [3, 4, 5]]
+
+    def test_packs_small_sessions(self) -> None:
+        quotes = [_quote(f"s{s}", 0) for s in range(1, 6)]
+        assert pack_by_session(quotes, 2) == [[0, 1], [2, 3], [4]]
+
+    def test_splits_oversized_session(self) -> None:
+        quotes = [_quote("s1", i) for i in range(5)]
+        batches = pack_by_session(quotes, 2)
+        assert batches == [[0, 1], [2, 3], [4]]
+        assert sorted(i for b in batches for i in b) == list(range(5))
+
+
+# ---------------------------------------------------------------------------
+# Stage 10
+# ---------------------------------------------------------------------------
+
+
+def _screen_batch_result(n_quotes: int, label: str) -> ScreenClusteringResult:
+    return ScreenClusteringResult(clusters=[
+        ScreenClusterItem(
+            screen_label=f"{label} B", description="", display_order=2,
+            quote_indices=list(range(1, n_quotes)),
+        ),
+        ScreenClusterItem(
+            screen_label=f"{label} A", description="", display_order=1,
+            quote_indices=[0],
+        ),
+    ])
+
+
+class TestClusterByScreenBatched:
+    def test_small_set_is_one_request(self) -> None:
+        quotes = [_quote("s1", i) for i in range(3)]
+        client = _client([_screen_batch_result(3, "x")])
+        clusters, outcome = asyncio.run(cluster_by_screen(quotes, client, batch_quotes=20))
+        assert client.analyze.await_count == 1
+        assert (outcome.attempted, outcome.succeeded) == (1, 1)
+        assert [c.screen_label for c in clusters] == ["x A", "x B"]
+
+    def test_map_then_merge(self) -> None:
+        quotes = [_quote("s1", i) for i in range(3)] + [_quote("s2", i) for i in range(3)]
+        merge = ScreenClusterMergeResult(clusters=[
+            ScreenClusterMergeItem(
+                screen_label="Checkout", description="d", display_order=2,
+                cluster_indices=[1, 3],
+            ),
+            ScreenClusterMergeItem(
+                screen_label="Home", description="d", display_order=1,
+                cluster_indices=[0, 2],
+            ),
+        ])
+        client = _client([
+            _screen_batch_result(3, "one"),
+            _screen_batch_result(3, "two"),
+            merge,
+        ])
+
+        clusters, outcome = asyncio.run(cluster_by_screen(
+            quotes, client, batch_quotes=3, semaphore=asyncio.Semaphore(2),
+        ))
+
+        assert client.analyze.await_count == 3
+        assert (outcome.attempted, outcome.succeeded) == (3, 3)
+        assert [(c.screen_label, c.display_order) for c in clusters] == [
+            ("Home", 1), ("Checkout", 2),
+        ]
+        assert sorted(len(c.quotes) for c in clusters) == [2, 4]
+        assert sum(len(c.quotes) for c in clusters) == len(quotes)
+
+    def test_unassigned_partials_keep_their_quotes(self) -> None:
+        quotes = [_quote("s1", i) for i in range(3)] + [_quote("s2", i) for i in range(3)]
+        merge = ScreenClusterMergeResult(clusters=[
+            ScreenClusterMergeItem(
+                screen_label="Home", description="", display_order=1,
+                cluster_indices=[0, 2],
+            ),
+        ])
+        client = _client([
+            _screen_batch_result(3, "one"),
+            _screen_batch_result(3, "two"),
+            merge,
+        ])
+        clusters, _ = asyncio.run(cluster_by_screen(quotes, client, batch_quotes=3))
+        assert sum(len(c.quotes) for c in clusters) == len(quotes)
+        assert [c.display_order for c in clusters] == [1, 2, 3]
+
+    def test_merge_failure_combines_by_label(self) -> None:
+        quotes = [_quote("s1", i) for i in range(3)] + [_quote("s2", i) for i in range(3)]
+        client = _client([
+            _screen_batch_result(3, "same"),
+            _screen_batch_result(3, "Same"),
+            RuntimeError("500 Internal Server Error"),
+        ])
+        clusters, outcome = asyncio.run(cluster_by_screen(quotes, client, batch_quotes=3))
+        assert (outcome.attempted, outcome.succeeded, len(outcome.failed)) == (3, 2, 1)
+        assert [c.screen_label for c in clusters] == ["same A", "same B"]
+        assert sum(len(c.quotes) for c in clusters) == len(quotes)
+
+    def test_all_batches_failing_skips_merge(self) -> None:
+        quotes = [_quote("s1", i) for i in range(3)] + [_quote("s2", i) for i in range(3)]
+        client = _client(RuntimeError("500 Internal Server Error"))
+        clusters, outcome = asyncio.run(cluster_by_screen(quotes, client, batch_quotes=3))
+        assert client.analyze.await_count == 2
+        assert (outcome.attempted, outcome.succeeded) == (2, 0)
+        assert clusters  # topic-label fallback for rendering
+
+
+# ---------------------------------------------------------------------------
+# Stage 11
+# ---------------------------------------------------------------------------
+
+
+def _theme_batch_result(n_quotes: int, label: str) -> ThematicGroupingResult:
+    # One strong theme and one single-quote theme per batch.
+    return ThematicGroupingResult(themes=[
+        ThemeGroupItem(theme_label=f"{label} big", description="", quote_indices=list(range(1, n_quotes))),
+        ThemeGroupItem(theme_label=f"{label} thin", description="", quote_indices=[0]),
+    ])
+
+
+class TestGroupByThemeBatched:
+    def test_thin_themes_judged_after_merge(self) -> None:
+        g = QuoteType.GENERAL_CONTEXT
+        quotes = [_quote("s1", i, g) for i in range(3)] + [_quote("s2", i, g) for i in range(3)]
+        merge = ThemeMergeResult(themes=[
+            ThemeMergeItem(theme_label="Workflow", description="", theme_indices=[0, 2]),
+            # Thin in each batch, but two quotes study-wide.
+            ThemeMergeItem(theme_label="Tool habits", description="", theme_indices=[1, 3]),
+        ])
+        client = _client([
+            _theme_batch_result(3, "one"),
+            _theme_batch_result(3, "two"),
+            merge,
+        ])
+
+        themes, outcome = asyncio.run(group_by_theme(quotes, client, batch_quotes=3))
+
+        assert (outcome.attempted, outcome.succeeded) == (3, 3)
+        assert [(t.theme_label, len(t.quotes)) for t in themes] == [
+            ("Workflow", 4), ("Tool habits", 2),
+        ]
+
+    def test_all_batches_failing_skips_merge(self) -> None:
+        g = QuoteType.GENERAL_CONTEXT
+        quotes = [_quote("s1", i, g) for i in range(3)] + [_quote("s2", i, g) for i in range(3)]
+        client = _client(RuntimeError("invalid api key 401"))
+        themes, outcome = asyncio.run(group_by_theme(quotes, client, batch_quotes=3))
+        assert client.analyze.await_count == 2
+        assert (outcome.attempted, outcome.succeeded) == (2, 0)
+        assert themes
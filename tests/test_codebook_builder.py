@@ -125,6 +125,25 @@ class TestRankCandidates:
         assert cb.rank_candidates(verdicts, quotes) == []
 
 
+class TestOrderByRelevance:
+    def test_likeliest_quotes_first(self) -> None:
+        quotes = [
+            cb.CandidateQuote(db_id=1, text="The colours are nice"),
+            cb.CandidateQuote(db_id=2, text="Shipping cost more than the fish"),
+            cb.CandidateQuote(db_id=3, text="I like the layout"),
+            cb.CandidateQuote(db_id=4, text="Way too expensive for what it is"),
+        ]
+        draft = cb.PromptDraft(definition="Complaints that the price is expensive or a cost")
+        ordered = cb.order_by_relevance("pricing", draft, quotes)
+        assert [q.db_id for q in ordered][:2] in ([2, 4], [4, 2])
+        assert sorted(q.db_id for q in ordered) == [1, 2, 3, 4]
+
+    def test_no_match_keeps_pool_order(self) -> None:
+        quotes = [cb.CandidateQuote(db_id=i, text=f"q{i}") for i in range(3)]
+        ordered = cb.order_by_relevance("pricing", cb.PromptDraft(), quotes)
+        assert [q.db_id for q in ordered] == [0, 1, 2]
+
+
 # ---------------------------------------------------------------------------
 # Fixtures for API tests
 # ---------------------------------------------------------------------------
@@ -133,6 +152,8 @@ class TestRankCandidates:
 def _mock_settings() -> MagicMock:
     s = MagicMock()
     s.llm_concurrency = 2
+    s.llm_concurrency_max = 2
+    s.llm_tokens_per_minute = 0
     s.llm_provider = "anthropic"
     s.llm_model = "test-model"
     s.llm_max_tokens = 1000
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+from bristlenose.server.coverage_store import _is_moderator_code
 from bristlenose.server.routes.dashboard import (
     _calculate_coverage,
     _format_fragments_html,
-    _is_moderator_code,
 )
 
 # ---------------------------------------------------------------------------
@@ -10,7 +10,7 @@ Three behaviours that used to be one conflated guard:
 * **Resilience** — one unreadable directory must not end the walk, and one
   cloud placeholder must not trigger a download.
 
-No test here shells out: `probe_duration` is patched, so these run in CI where
+No test here shells out: `probe_media` is patched, so these run in CI where
 there is no ffmpeg.
 """
 
@@ -29,11 +29,12 @@ from bristlenose.stages.s01_ingest import (
     discover_files,
     group_into_sessions,
 )
+from bristlenose.utils.audio import MediaProbe
 
 
 @pytest.fixture(autouse=True)
 def _no_probe(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(s01_ingest, "probe_duration", lambda p: 12.0)
+    monkeypatch.setattr(s01_ingest, "probe_media", lambda p: MediaProbe(12.0, True))
 
 
 def _touch(path: Path) -> Path:
@@ -131,14 +132,14 @@ class TestResilience:
                                                    monkeypatch: pytest.MonkeyPatch) -> None:
         """Duration at scan time is a nicety; it must not cost a download.
 
-        Discovery probes every media file, and probe_duration materialises
+        Discovery probes every media file, and probe_media materialises
         first — so without this, scanning a folder of evicted recordings pulls
         every one of them down before the researcher has agreed to anything.
         """
         _touch(tmp_path / "evicted.mp4")
         monkeypatch.setattr(s01_ingest, "is_dataless", lambda p: True)
         monkeypatch.setattr(
-            s01_ingest, "probe_duration",
+            s01_ingest, "probe_media",
             lambda p: pytest.fail("probed a cloud placeholder — this downloads it"),
         )
 
@@ -12,6 +12,7 @@ from bristlenose.server.export_core import (
     csv_safe,
     excel_sheet_name,
     extract_quotes_for_export,
+    iter_quotes_for_export,
 )
 from bristlenose.server.models import QuoteEdit, QuoteState
 
@@ -244,3 +245,33 @@ class TestExtractQuotesForExport:
             db_session, project_id=1, quote_ids=["invalid-id"]
         )
         assert quotes == []
+
+
+# ---------------------------------------------------------------------------
+# iter_quotes_for_export()
+# ---------------------------------------------------------------------------
+
+
+class TestIterQuotesForExport:
+    def test_batches_match_list(self, db_session):
+        """Streaming in batches of one gives the same rows in the same order."""
+        expected = extract_quotes_for_export(db_session, project_id=1)
+        streamed = list(iter_quotes_for_export(db_session, project_id=1, batch_size=1))
+        assert streamed == expected
+
+    def test_ordered_by_section_then_timecode(self, db_session):
+        from bristlenose.server.models import ScreenCluster
+
+        order = {
+            c.screen_label: c.display_order
+            for c in db_session.query(ScreenCluster).filter_by(project_id=1)
+        }
+        quotes = list(iter_quotes_for_export(db_session, project_id=1, batch_size=2))
+        keys = [order.get(q.section, 999) for q in quotes]
+        assert keys == sorted(keys)
+
+    def test_is_lazy(self, db_session):
+        quotes = iter_quotes_for_export(db_session, project_id=1, batch_size=1)
+        first = next(quotes)
+        assert isinstance(first, ExportableQuote)
+        assert len(list(quotes)) == 3
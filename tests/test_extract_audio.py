@@ -12,7 +12,7 @@ import pytest
 
 from bristlenose.models import FileType, InputFile, InputSession
 from bristlenose.stages.s02_extract_audio import extract_audio_for_sessions
-from bristlenose.utils.audio import AudioToolError, has_audio_stream
+from bristlenose.utils.audio import AudioToolError, MediaProbe, has_audio_stream, probe_media
 
 
 def _ffprobe_result(returncode: int, stdout: str = "", stderr: str = "") -> SimpleNamespace:
@@ -174,3 +174,52 @@ async def test_genuine_no_audio_stream_skips_without_aborting(tmp_path: Path) ->
     ):
         result = await extract_audio_for_sessions([session], tmp_path)
     assert result[0].audio_path is None
+
+
+# ── probe_media: one ffprobe for duration and audio presence ────────────────
+
+
+def test_probe_media_reads_duration_and_audio() -> None:
+    stdout = (
+        '{"streams": [{"codec_type": "video"}, {"codec_type": "audio"}],'
+        ' "format": {"duration": "61.5"}}'
+    )
+    with patch(
+        "bristlenose.utils.audio.subprocess.run",
+        return_value=_ffprobe_result(0, stdout=stdout),
+    ):
+        assert probe_media(Path("/input/recording.mp4")) == MediaProbe(61.5, True)
+
+
+def test_probe_media_silent_video() -> None:
+    stdout = '{"streams": [{"codec_type": "video"}], "format": {"duration": "8"}}'
+    with patch(
+        "bristlenose.utils.audio.subprocess.run",
+        return_value=_ffprobe_result(0, stdout=stdout),
+    ):
+        assert probe_media(Path("/input/screen-capture.mp4")) == MediaProbe(8.0, False)
+
+
+def test_probe_media_none_on_failure() -> None:
+    """A failed probe is "unknown", never "no audio" — stage 2 asks again."""
+    with patch(
+        "bristlenose.utils.audio.subprocess.run",
+        return_value=_ffprobe_result(1, stderr="moov atom not found"),
+    ):
+        assert probe_media(Path("/input/recording.mp4")) is None
+
+
+@pytest.mark.asyncio
+async def test_ingest_probe_spares_second_ffprobe(tmp_path: Path) -> None:
+    """A video ingest already probed as silent is not probed again."""
+    session = _session()
+    session.files[0].has_audio_stream = False
+    with patch(
+        "bristlenose.stages.s02_extract_audio.has_audio_stream",
+        side_effect=AssertionError("probed twice"),
+    ), patch(
+        "bristlenose.stages.s02_extract_audio.extract_audio_from_video",
+    ) as mock_extract:
+        await extract_audio_for_sessions([session], tmp_path)
+    mock_extract.assert_not_called()
+    assert session.files[0].error is not None
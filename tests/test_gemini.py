@@ -138,8 +138,10 @@ class TestFlattenSchemaForGemini:
         from bristlenose.llm.structured import (
             QuoteExtractionResult,
             ScreenClusteringResult,
+            ScreenClusterMergeResult,
             SpeakerRoleAssignment,
             ThematicGroupingResult,
+            ThemeMergeResult,
             TopicSegmentationResult,
         )
 
@@ -148,7 +150,9 @@ class TestFlattenSchemaForGemini:
             TopicSegmentationResult,
             QuoteExtractionResult,
             ScreenClusteringResult,
+            ScreenClusterMergeResult,
             ThematicGroupingResult,
+            ThemeMergeResult,
         ]:
             schema = model_cls.model_json_schema()
             result = _flatten_schema_for_gemini(schema)
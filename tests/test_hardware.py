@@ -54,6 +54,31 @@ class TestHardwareInfo:
         info = HardwareInfo(accelerator=AcceleratorType.CPU)
         assert info.recommended_whisper_model == "small"
 
+    def test_whisper_workers_bounded_by_ram(self):
+        info = HardwareInfo(accelerator=AcceleratorType.CPU, cpu_cores=32, memory_gb=8.0)
+        # 32 cores allow 8 replicas, but 8GB * 0.75 / 3.5GB (large-v3) = 1.
+        assert info.recommended_whisper_workers("large-v3") == 1
+        assert info.recommended_whisper_workers("small") == 6
+
+    def test_whisper_workers_single_on_gpu(self):
+        info = HardwareInfo(accelerator=AcceleratorType.CUDA, cuda_available=True, cpu_cores=32)
+        assert info.recommended_whisper_workers("small") == 1
+
+    def test_pii_workers_one_per_spare_core_bounded_by_ram(self):
+        info = HardwareInfo(accelerator=AcceleratorType.CPU, cpu_cores=8, memory_gb=64.0)
+        assert info.recommended_pii_workers() == 7
+        # 4GB * 0.75 / 1.5GB = 2 spaCy replicas.
+        info = HardwareInfo(accelerator=AcceleratorType.CPU, cpu_cores=8, memory_gb=4.0)
+        assert info.recommended_pii_workers() == 2
+
+    def test_ffmpeg_workers_one_per_core_capped(self):
+        info = HardwareInfo(accelerator=AcceleratorType.CPU, cpu_cores=4)
+        assert info.recommended_ffmpeg_workers() == 4
+        info = HardwareInfo(accelerator=AcceleratorType.CPU, cpu_cores=64)
+        assert info.recommended_ffmpeg_workers() == 8
+        # Unknown core count still overlaps two processes.
+        assert HardwareInfo(accelerator=AcceleratorType.CPU).recommended_ffmpeg_workers() == 2
+
     def test_label_apple_mlx(self):
         info = HardwareInfo(
             accelerator=AcceleratorType.APPLE_SILICON,
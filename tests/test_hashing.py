@@ -5,7 +5,7 @@ from __future__ import annotations
 import hashlib
 from pathlib import Path
 
-from bristlenose.hashing import hash_bytes, hash_file_metadata
+from bristlenose.hashing import file_identity, hash_bytes, hash_file_metadata
 
 
 def test_hash_bytes_known_vector():
@@ -97,3 +97,11 @@ def test_hash_file_metadata_detects_new_file(tmp_path: Path):
     f2.write_bytes(b"bbb")
     h2 = hash_file_metadata([f1, f2])
     assert h1 != h2
+
+
+def test_file_identity_matches_metadata_hash_inputs(tmp_path: Path):
+    f = tmp_path / "a.mp4"
+    f.write_bytes(b"abc")
+    st = f.stat()
+    assert file_identity(tmp_path / "." / "a.mp4") == (str(f.resolve()), 3, st.st_mtime_ns)
+    assert file_identity(tmp_path / "missing.mp4") is None
@@ -0,0 +1,78 @@
+"""Tests for the local BM25 ranker (bristlenose/server/lexical.py)."""
+
+from __future__ import annotations
+
+from bristlenose.server.codebook import get_template
+from bristlenose.server.lexical import BM25Index, tag_shortlists, tokenize
+from tests.test_autocode_discrimination import GOLDEN_QUOTES
+
+
+class TestTokenize:
+    def test_drops_stopwords_and_folds_inflections(self) -> None:
+        assert tokenize("I was checking the prices") == ["check", "pric"]
+
+    def test_inflections_share_a_term(self) -> None:
+        assert len({*tokenize("require requires required requiring")}) == 1
+
+    def test_keeps_non_latin_words(self) -> None:
+        assert tokenize("café 價格") == ["café", "價格"]
+
+
+class TestBM25Index:
+    def test_scores_rank_the_matching_document_first(self) -> None:
+        index = BM25Index(["the checkout failed", "the search box is great", "nice colours"])
+        assert index.rank("search results")[0] == 1
+
+    def test_rare_terms_outweigh_common_ones(self) -> None:
+        index = BM25Index(["checkout page", "checkout button", "checkout refund"])
+        scores = index.scores("checkout refund")
+        assert scores[2] > scores[0] == scores[1] > 0
+
+    def test_no_shared_term_scores_zero(self) -> None:
+        assert BM25Index(["checkout page"]).scores("weather") == [0.0]
+
+    def test_empty_index(self) -> None:
+        index = BM25Index([])
+        assert len(index) == 0
+        assert index.scores("anything") == []
+
+    def test_ties_keep_document_order(self) -> None:
+        assert BM25Index(["a b", "c d", "e f"]).rank("weather") == [0, 1, 2]
+
+
+class TestTagShortlists:
+    def _tags(self) -> dict[str, str]:
+        return {
+            "price": "Cost or fee of the product",
+            "search": "Using the search box",
+            "layout": "Arrangement of the page",
+        }
+
+    def test_best_match_first(self) -> None:
+        [shortlist] = tag_shortlists(["The fee is a rip-off"], self._tags(), 2)
+        assert shortlist is not None
+        assert shortlist[0] == "price"
+        assert len(shortlist) == 2
+
+    def test_no_match_keeps_every_tag(self) -> None:
+        assert tag_shortlists(["Lovely weather"], self._tags(), 1) == [None]
+
+    def test_zero_or_whole_codebook_is_off(self) -> None:
+        assert tag_shortlists(["fee"], self._tags(), 0) == [None]
+        assert tag_shortlists(["fee"], self._tags(), 3) == [None]
+
+    def test_golden_recall(self) -> None:
+        """At 5 of Garrett's 20 tags, the right tag survives for nearly every golden quote."""
+        template = get_template("garrett")
+        assert template is not None
+        tags = {
+            tag.name: f"{tag.definition}\n{tag.apply_when}"
+            for group in template.groups
+            for tag in group.tags
+        }
+        shortlists = tag_shortlists([gq.text for gq in GOLDEN_QUOTES], tags, 5)
+        kept = sum(
+            1 for gq, shortlist in zip(GOLDEN_QUOTES, shortlists)
+            if shortlist is None or gq.correct_tag in shortlist
+        )
+        assert kept >= len(GOLDEN_QUOTES) - 1
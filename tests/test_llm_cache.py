@@ -0,0 +1,239 @@
+"""Tests for the content-addressed LLM response cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import BaseModel
+
+from bristlenose.config import BristlenoseSettings
+from bristlenose.llm import telemetry
+from bristlenose.llm.cache import CACHE_DIRNAME, ResponseCache, make_key
+from bristlenose.llm.client import LLMClient
+
+
+class _Answer(BaseModel):
+    text: str
+    score: int = 0
+
+
+class _OtherAnswer(BaseModel):
+    text: str
+    label: str = ""
+
+
+def _key(**overrides: object) -> str:
+    kwargs: dict[str, object] = {
+        "provider": "anthropic",
+        "model": "claude-sonnet-4-6",
+        "temperature": 0.1,
+        "system_prompt": "sys",
+        "user_prompt": "user",
+        "response_model": _Answer,
+        "prompt_sha": "abc123",
+    }
+    kwargs.update(overrides)
+    return make_key(**kwargs)  # type: ignore[arg-type]
+
+
+def _cache(tmp_path: Path, **overrides: object) -> ResponseCache:
+    kwargs: dict[str, object] = {"max_bytes": 10 * 1024 * 1024, "max_age_seconds": 86400}
+    kwargs.update(overrides)
+    return ResponseCache(tmp_path / CACHE_DIRNAME, **kwargs)  # type: ignore[arg-type]
+
+
+class TestMakeKey:
+    def test_stable(self) -> None:
+        assert _key() == _key()
+
+    @pytest.mark.parametrize("field,value", [
+        ("provider", "openai"),
+        ("model", "claude-opus-4-1"),
+        ("temperature", 0.2),
+        ("system_prompt", "sys2"),
+        ("user_prompt", "user2"),
+        ("response_model", _OtherAnswer),
+        ("prompt_sha", "def456"),
+        ("prompt_sha", None),
+    ])
+    def test_every_input_changes_key(self, field: str, value: object) -> None:
+        assert _key(**{field: value}) != _key()
+
+    def test_field_boundaries_are_unambiguous(self) -> None:
+        assert _key(system_prompt="ab", user_prompt="c") != _key(
+            system_prompt="a", user_prompt="bc"
+        )
+
+    def test_untrusted_envelope_nonce_does_not_change_key(self) -> None:
+        from bristlenose.llm.boundary import wrap_untrusted
+
+        def prompt(text: str) -> str:
+            return f"Quotes:\n{wrap_untrusted('speaker_quotes', text)}\nGo."
+
+        assert _key(user_prompt=prompt("hello")) == _key(user_prompt=prompt("hello"))
+        assert _key(user_prompt=prompt("hello")) != _key(user_prompt=prompt("goodbye"))
+
+
+class TestResponseCache:
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+        key = _key()
+        assert cache.get(key, _Answer) is None
+        cache.put(key, _Answer(text="hello", score=3))
+        assert cache.get(key, _Answer) == _Answer(text="hello", score=3)
+
+    def test_entry_file_mode_is_0o600(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+        key = _key()
+        cache.put(key, _Answer(text="x"))
+        path = tmp_path / CACHE_DIRNAME / key[:2] / f"{key}.json"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_corrupt_entry_is_a_miss_and_removed(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+        key = _key()
+        cache.put(key, _Answer(text="x"))
+        path = tmp_path / CACHE_DIRNAME / key[:2] / f"{key}.json"
+        path.write_text("{not json")
+        assert cache.get(key, _Answer) is None
+        assert not path.exists()
+
+    def test_schema_mismatch_is_a_miss(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+        key = _key()
+        path = tmp_path / CACHE_DIRNAME / key[:2] / f"{key}.json"
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({"response": {"score": "nope"}}))
+        assert cache.get(key, _Answer) is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path, max_age_seconds=60)
+        key = _key()
+        cache.put(key, _Answer(text="x"))
+        path = tmp_path / CACHE_DIRNAME / key[:2] / f"{key}.json"
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert cache.get(key, _Answer) is None
+        assert not path.exists()
+
+    def test_prune_evicts_least_recently_used_over_cap(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+        keys = [_key(user_prompt=f"u{i}") for i in range(3)]
+        now = time.time()
+        for i, key in enumerate(keys):
+            cache.put(key, _Answer(text="x" * 100))
+            path = tmp_path / CACHE_DIRNAME / key[:2] / f"{key}.json"
+            os.utime(path, (now - 100 + i, now - 100 + i))
+        size = (tmp_path / CACHE_DIRNAME / keys[0][:2] / f"{keys[0]}.json").stat().st_size
+        # A hit refreshes the oldest entry, so the middle one goes first.
+        cache.get(keys[0], _Answer)
+        cache.max_bytes = size * 2
+        removed, kept = cache.prune()
+        assert removed == 1
+        assert kept <= size * 2
+        assert cache.get(keys[0], _Answer) is not None
+        assert cache.get(keys[1], _Answer) is None
+        assert cache.get(keys[2], _Answer) is not None
+
+    def test_prune_missing_directory(self, tmp_path: Path) -> None:
+        assert _cache(tmp_path).prune() == (0, 0)
+
+
+# ---------------------------------------------------------------------------
+# LLMClient integration
+# ---------------------------------------------------------------------------
+
+
+def _client(**overrides: object) -> LLMClient:
+    kwargs: dict[str, object] = {
+        "llm_provider": "anthropic",
+        "anthropic_api_key": "sk-ant-test-key",
+        "llm_model": "claude-sonnet-4-20250514",
+        "llm_max_tokens": 8192,
+    }
+    kwargs.update(overrides)
+    client = LLMClient(BristlenoseSettings(**kwargs))  # type: ignore[arg-type]
+    response = SimpleNamespace(
+        stop_reason="end_turn",
+        model="claude-sonnet-4-20250514",
+        content=[SimpleNamespace(
+            type="tool_use", name="structured_output", input={"text": "hi", "score": 1},
+        )],
+        usage=SimpleNamespace(input_tokens=100, output_tokens=10),
+    )
+    mock = AsyncMock()
+    mock.messages.create = AsyncMock(return_value=response)
+    client._anthropic_client = mock
+    return client
+
+
+async def _analyze_twice(client: LLMClient, run_dir: Path) -> list[_Answer]:
+    tokens = telemetry.set_run_context("run-1", run_dir)
+    try:
+        with telemetry.stage("s09_quote_extraction"):
+            return [
+                await client.analyze("sys", "user", _Answer),
+                await client.analyze("sys", "user", _Answer),
+            ]
+    finally:
+        telemetry.reset_run_context(tokens)
+
+
+class TestClientCache:
+    @pytest.fixture(autouse=True)
+    def _telemetry_on(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("BRISTLENOSE_LLM_TELEMETRY", raising=False)
+
+    @pytest.mark.asyncio
+    async def test_second_identical_call_is_served_from_disk(self, tmp_path: Path) -> None:
+        client = _client()
+        results = await _analyze_twice(client, tmp_path)
+
+        assert results[0] == results[1] == _Answer(text="hi", score=1)
+        assert client._anthropic_client.messages.create.await_count == 1
+        assert (client.tracker.cache_misses, client.tracker.cache_hits) == (1, 1)
+
+        rows = [
+            json.loads(line)
+            for line in (tmp_path / telemetry.JSONL_FILENAME).read_text().splitlines()
+        ]
+        assert [r["response_cache"] for r in rows] == ["miss", "hit"]
+        assert rows[1]["usage_source"] == "missing"
+        assert rows[1]["outcome"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_calls_provider(self, tmp_path: Path) -> None:
+        client = _client(llm_cache=False)
+        await _analyze_twice(client, tmp_path)
+
+        assert client._anthropic_client.messages.create.await_count == 2
+        assert client.tracker.cache_hits == 0
+        assert not (tmp_path / CACHE_DIRNAME).exists()
+
+    @pytest.mark.asyncio
+    async def test_no_run_context_means_no_cache(self) -> None:
+        client = _client()
+        await client.analyze("sys", "user", _Answer)
+        await client.analyze("sys", "user", _Answer)
+        assert client._anthropic_client.messages.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_not_cached(self, tmp_path: Path) -> None:
+        client = _client()
+        client._anthropic_client.messages.create = AsyncMock(
+            side_effect=RuntimeError("boom"),
+        )
+        tokens = telemetry.set_run_context("run-1", tmp_path)
+        try:
+            with telemetry.stage("s09_quote_extraction"), pytest.raises(RuntimeError):
+                await client.analyze("sys", "user", _Answer)
+        finally:
+            telemetry.reset_run_context(tokens)
+        assert not list((tmp_path / CACHE_DIRNAME).glob("*/*.json"))
@@ -441,3 +441,293 @@ class TestConcurrencySpeedup:
             f"Expected >= 1.5x speedup, got {speedup:.2f}x "
             f"(sequential={sequential_time:.3f}s, concurrent={concurrent_time:.3f}s)"
         )
+
+
+# ---------------------------------------------------------------------------
+# Adaptive concurrency controller (bristlenose/llm/concurrency.py)
+# ---------------------------------------------------------------------------
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _controller(**kwargs: object):
+    from bristlenose.llm.concurrency import ConcurrencyController
+
+    clock = _Clock()
+    defaults: dict[str, object] = {"initial": 2, "ceiling": 4, "clock": clock}
+    defaults.update(kwargs)
+    return ConcurrencyController("anthropic", **defaults), clock  # type: ignore[arg-type]
+
+
+class TestAdaptiveWindow:
+    """AIMD: grow one slot per window of healthy calls, halve on congestion."""
+
+    @pytest.mark.asyncio
+    async def test_grows_additively_on_healthy_calls(self) -> None:
+        controller, _ = _controller()
+        async with controller as slot:
+            decisions = [
+                controller.observe(slot, elapsed_s=1.0, input_chars=4000, outcome="ok")
+                for _ in range(3)
+            ]
+        # 2 -> 2.5 -> 2.9 -> 3.24: one new slot after a window's worth of calls.
+        assert decisions == ["hold", "hold", "increase"]
+        assert controller.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_never_grows_past_ceiling(self) -> None:
+        controller, _ = _controller(ceiling=2)
+        async with controller as slot:
+            for _ in range(10):
+                controller.observe(slot, elapsed_s=1.0, input_chars=4000, outcome="ok")
+        assert controller.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_call_holds_the_window(self) -> None:
+        controller, _ = _controller()
+        async with controller as slot:
+            controller.observe(slot, elapsed_s=1.0, input_chars=4000, outcome="ok")
+            decision = controller.observe(
+                slot, elapsed_s=30.0, input_chars=4000, outcome="ok",
+            )
+        assert decision == "hold"
+
+    @pytest.mark.asyncio
+    async def test_timeout_halves_but_other_errors_hold(self) -> None:
+        controller, _ = _controller(initial=4)
+        async with controller as slot:
+            assert controller.observe(
+                slot, elapsed_s=1.0, input_chars=10, outcome="error",
+                error=ValueError("schema mismatch"),
+            ) == "hold"
+            assert controller.observe(
+                slot, elapsed_s=600.0, input_chars=10, outcome="error",
+                error=TimeoutError(),
+            ) == "decrease"
+        assert controller.limit == 2
+
+    def test_congestion_burst_cuts_once(self) -> None:
+        controller, clock = _controller(initial=4)
+        assert controller.congestion() == "decrease"
+        assert controller.congestion() == "hold"  # same overload
+        assert controller.limit == 2
+        clock.now += 5
+        assert controller.congestion() == "decrease"
+        clock.now += 5
+        controller.congestion()
+        assert controller.limit == 1  # floor
+
+    @pytest.mark.asyncio
+    async def test_throttled_call_does_not_grow_the_window(self) -> None:
+        """A 429 the SDK retried: the hook cut the window; success doesn't undo it."""
+        controller, _ = _controller(initial=4)
+        async with controller as slot:
+            controller.congestion(controller.current_slot())
+            decision = controller.observe(slot, elapsed_s=9.0, input_chars=10, outcome="ok")
+        assert decision == "decrease"
+        assert controller.limit == 2
+
+
+class TestSlots:
+    @pytest.mark.asyncio
+    async def test_waiters_queue_beyond_the_window(self) -> None:
+        controller, _ = _controller(initial=1)
+        first = await controller.acquire()
+        second = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0.01)
+        assert not second.done()
+        assert controller.queued == 1
+        controller.release(first)
+        slot = await asyncio.wait_for(second, 1)
+        assert controller.in_flight == 1
+        controller.release(slot)
+        controller.release(slot)  # idempotent
+        assert controller.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_the_queue(self) -> None:
+        controller, _ = _controller(initial=1)
+        first = await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert controller.queued == 0
+        controller.release(first)
+
+    @pytest.mark.asyncio
+    async def test_slot_is_reentrant_within_a_task(self) -> None:
+        """analyze() inside a call site's slot reuses it instead of deadlocking."""
+        controller, _ = _controller(initial=1)
+        async with controller as outer:
+            async with controller as inner:
+                assert inner is outer
+                assert controller.current_slot() is outer
+            assert controller.in_flight == 1
+        assert controller.in_flight == 0
+        assert controller.current_slot() is None
+
+    @pytest.mark.asyncio
+    async def test_child_tasks_do_not_inherit_the_slot(self) -> None:
+        controller, _ = _controller(initial=2)
+        async with controller:
+            child = asyncio.create_task(_holds_own_slot(controller))
+            assert await child is True
+
+    @pytest.mark.asyncio
+    async def test_token_budget_delays_requests(self) -> None:
+        controller, clock = _controller(tokens_per_minute=100)
+        assert await controller.spend(400) == 0  # 100 tokens: the whole budget
+        pending = asyncio.create_task(controller.spend(40))
+        await asyncio.sleep(0.05)
+        assert not pending.done()
+        clock.now += 61
+        assert await asyncio.wait_for(pending, 2) == pytest.approx(61)
+
+
+async def _holds_own_slot(controller) -> bool:
+    async with controller as slot:
+        return controller.in_flight == 2 and controller.current_slot() is slot
+
+
+class TestControllerRegistry:
+    def test_one_controller_per_provider(self) -> None:
+        from bristlenose.config import BristlenoseSettings
+        from bristlenose.llm.concurrency import controller_for, reset_controllers
+
+        reset_controllers()
+        try:
+            cloud = BristlenoseSettings(llm_provider="anthropic", llm_concurrency=3)
+            first = controller_for(cloud)
+            assert controller_for(cloud) is first
+            assert first.limit == 3
+
+            local = controller_for(
+                BristlenoseSettings(llm_provider="local", llm_concurrency=2),
+            )
+            assert local is not first
+
+            async def _grow() -> None:
+                async with local as slot:
+                    for _ in range(10):
+                        local.observe(slot, elapsed_s=1.0, input_chars=10, outcome="ok")
+
+            asyncio.run(_grow())
+            assert local.limit == 2  # a local model never grows
+        finally:
+            reset_controllers()
+
+
+class TestScheduling:
+    """Priority first, then fair share between jobs, then arrival order."""
+
+    @staticmethod
+    async def _queue(controller, priority, job: str, order: list[str], tag: str):
+        from bristlenose.llm.concurrency import llm_work
+
+        with llm_work(priority, job):
+            async with controller:
+                order.append(tag)
+                await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_interactive_jumps_background_queue(self) -> None:
+        from bristlenose.llm.concurrency import Priority
+
+        controller, _ = _controller(initial=1)
+        order: list[str] = []
+        held = await controller.acquire()
+        tasks = [
+            asyncio.create_task(
+                self._queue(controller, Priority.BACKGROUND, "autocode", order, f"bg{i}"),
+            )
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        tasks.append(asyncio.create_task(
+            self._queue(controller, Priority.INTERACTIVE, "chat", order, "chat"),
+        ))
+        await asyncio.sleep(0.01)
+        controller.release(held)
+        await asyncio.gather(*tasks)
+        assert order == ["chat", "bg0", "bg1", "bg2"]
+
+    @pytest.mark.asyncio
+    async def test_jobs_at_one_priority_take_turns(self) -> None:
+        from bristlenose.llm.concurrency import Priority
+
+        controller, _ = _controller(initial=1)
+        order: list[str] = []
+        held = await controller.acquire()
+        tasks = [
+            asyncio.create_task(
+                self._queue(controller, Priority.BACKGROUND, job, order, f"{job}{i}"),
+            )
+            for job in ("a", "b")
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        controller.release(held)
+        await asyncio.gather(*tasks)
+        assert order == ["a0", "b0", "a1", "b1", "a2", "b2"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_job_drops_only_its_queued_requests(self) -> None:
+        from bristlenose.llm.concurrency import LLMJobCancelledError, Priority, llm_work
+
+        controller, _ = _controller(initial=1)
+        order: list[str] = []
+        held = await controller.acquire()
+        doomed = [
+            asyncio.create_task(
+                self._queue(controller, Priority.BACKGROUND, "a", order, f"a{i}"),
+            )
+            for i in range(2)
+        ]
+        survivor = asyncio.create_task(
+            self._queue(controller, Priority.BACKGROUND, "b", order, "b0"),
+        )
+        await asyncio.sleep(0.01)
+        assert controller.cancel_job("a") == 2
+        results = await asyncio.gather(*doomed, return_exceptions=True)
+        assert all(isinstance(r, LLMJobCancelledError) for r in results)
+        controller.release(held)
+        await survivor
+        assert order == ["b0"]
+        assert controller.queued == 0
+        with llm_work(Priority.BACKGROUND, "a"):
+            async with controller:  # a cancel is not sticky
+                pass
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reports_queue_by_priority_and_job(self) -> None:
+        from bristlenose.llm.concurrency import Priority
+
+        controller, clock = _controller(initial=1)
+        order: list[str] = []
+        held = await controller.acquire()
+        waiting = asyncio.create_task(
+            self._queue(controller, Priority.BACKGROUND, "autocode:1:garrett", order, "bg"),
+        )
+        await asyncio.sleep(0.01)
+        clock.now += 4
+        snap = controller.snapshot()
+        assert snap["limit"] == 1
+        assert snap["in_flight"] == 1
+        assert snap["queued"] == 1
+        assert snap["jobs"] == {"autocode:1:garrett": 1}
+        background = snap["priorities"]["background"]
+        assert background["queued"] == 1
+        assert background["oldest_wait_s"] == pytest.approx(4)
+        assert snap["priorities"]["interactive"]["queued"] == 0
+        controller.release(held)
+        await waiting
+        assert controller.snapshot()["priorities"]["background"]["recent_wait_s"] == (
+            pytest.approx(4)
+        )
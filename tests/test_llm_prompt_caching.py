@@ -0,0 +1,92 @@
+"""Tests for Anthropic prompt-cache breakpoint placement."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import BaseModel
+
+from bristlenose.config import BristlenoseSettings
+from bristlenose.llm.boundary import wrap_untrusted
+from bristlenose.llm.client import LLMClient, _anthropic_cache_breakpoints
+from bristlenose.server.autocode import _taxonomy_prefix
+
+
+class _Answer(BaseModel):
+    text: str
+
+
+def _client(**overrides: object) -> LLMClient:
+    kwargs: dict[str, object] = {
+        "llm_provider": "anthropic",
+        "anthropic_api_key": "sk-ant-test-key",
+        "llm_model": "claude-sonnet-4-20250514",
+        "llm_max_tokens": 8192,
+    }
+    kwargs.update(overrides)
+    client = LLMClient(BristlenoseSettings(**kwargs))  # type: ignore[arg-type]
+    response = SimpleNamespace(
+        stop_reason="end_turn",
+        model="claude-sonnet-4-20250514",
+        content=[SimpleNamespace(type="tool_use", name="structured_output", input={"text": "ok"})],
+        usage=SimpleNamespace(
+            input_tokens=50, output_tokens=5,
+            cache_read_input_tokens=2000, cache_creation_input_tokens=0,
+        ),
+    )
+    mock = AsyncMock()
+    mock.messages.create = AsyncMock(return_value=response)
+    client._anthropic_client = mock
+    return client
+
+
+class TestBreakpoints:
+    def test_system_block_always_marked(self) -> None:
+        system, user = _anthropic_cache_breakpoints("sys", "user", None)
+        assert system == [
+            {"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}},
+        ]
+        assert user == "user"
+
+    def test_prefix_split_into_cached_and_fresh_blocks(self) -> None:
+        _, user = _anthropic_cache_breakpoints("sys", "TAXONOMY\nquotes", "TAXONOMY\n")
+        assert user == [
+            {"type": "text", "text": "TAXONOMY\n", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "quotes"},
+        ]
+
+    def test_prefix_not_at_start_is_ignored(self) -> None:
+        _, user = _anthropic_cache_breakpoints("sys", "quotes then TAXONOMY", "TAXONOMY")
+        assert user == "quotes then TAXONOMY"
+
+
+class TestAnthropicRequest:
+    @pytest.mark.asyncio
+    async def test_request_carries_breakpoints(self) -> None:
+        client = _client()
+        await client.analyze("sys", "PREFIX body", _Answer, cacheable_prefix="PREFIX ")
+        kwargs = client._anthropic_client.messages.create.call_args.kwargs
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        content = kwargs["messages"][0]["content"]
+        assert [b["text"] for b in content] == ["PREFIX ", "body"]
+        assert "cache_control" in content[0] and "cache_control" not in content[1]
+
+    @pytest.mark.asyncio
+    async def test_disabled_sends_plain_strings(self) -> None:
+        client = _client(llm_prompt_caching=False)
+        await client.analyze("sys", "PREFIX body", _Answer, cacheable_prefix="PREFIX ")
+        kwargs = client._anthropic_client.messages.create.call_args.kwargs
+        assert kwargs["system"] == "sys"
+        assert kwargs["messages"][0]["content"] == "PREFIX body"
+
+
+class TestAutoCodePrefix:
+    def test_prefix_stops_before_quotes(self) -> None:
+        prompt = (
+            "## Tags\n\nUser need\n\n## Quotes\n\n"
+            + wrap_untrusted("quotes", "1. hi")
+            + "\n\n## Instructions"
+        )
+        assert _taxonomy_prefix(prompt) == "## Tags\n\nUser need\n\n## Quotes\n\n"
@@ -177,6 +177,21 @@ def test_retry_count_recorded(tmp_path: Path) -> None:
     assert rows[0]["retry_count"] == 2
 
 
+def test_concurrency_fields_recorded(tmp_path: Path) -> None:
+    _record_basic(
+        tmp_path,
+        concurrency_limit=4,
+        concurrency_in_flight=3,
+        concurrency_wait_ms=120,
+        concurrency_decision="increase",
+    )
+    row = next(iter_rows(tmp_path))
+    assert row["concurrency_limit"] == 4
+    assert row["concurrency_in_flight"] == 3
+    assert row["concurrency_wait_ms"] == 120
+    assert row["concurrency_decision"] == "increase"
+
+
 def test_trim_to_cap_truncates_oldest(tmp_path: Path) -> None:
     path = tmp_path / JSONL_FILENAME
     # Write 1500 hand-crafted rows; trim to 1000 keeps the last 1000.
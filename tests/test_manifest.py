@@ -453,3 +453,24 @@ def test_mark_stage_complete_missing_path_is_no_op_guard(tmp_path: Path):
     rec = m.stages[STAGE_QUOTE_EXTRACTION]
     assert rec.status == StageStatus.COMPLETE
     assert rec.content_hash == "abc"
+
+
+def test_window_records_roundtrip_and_clear_on_session_complete(tmp_path: Path):
+    from bristlenose.manifest import get_completed_windows, mark_window_complete
+
+    m = create_manifest("test", "0.1.0")
+    mark_stage_running(m, STAGE_TRANSCRIBE)
+    mark_window_complete(m, STAGE_TRANSCRIBE, "s1", "fp-0-603000")
+    mark_window_complete(m, STAGE_TRANSCRIBE, "s1", "fp-0-603000")
+    mark_window_complete(m, STAGE_TRANSCRIBE, "s1", "fp-597000-1203000")
+    write_manifest(m, tmp_path)
+
+    loaded = load_manifest(tmp_path)
+    assert get_completed_windows(loaded, STAGE_TRANSCRIBE) == {
+        "s1": {"fp-0-603000", "fp-597000-1203000"},
+    }
+    # Windows don't count as sessions for stage-status purposes.
+    assert get_completed_session_ids(loaded, STAGE_TRANSCRIBE) == set()
+
+    mark_session_complete(loaded, STAGE_TRANSCRIBE, "s1")
+    assert get_completed_windows(loaded, STAGE_TRANSCRIBE) == {}
@@ -235,6 +235,22 @@ class TestSearchQuotes:
         assert result["total_matched"] == 1
         assert result["quotes"][0]["starred"] is True
 
+    def test_query_is_word_based_and_ranked(self, db) -> None:
+        result = _search(db, query="dashboard")
+        assert [q["quote_id"] for q in result["quotes"]] == ["q-p1-10"]
+        # Words are ANDed, wherever they fall in the quote.
+        assert _search(db, query="search fast")["total_matched"] == 1
+        assert _search(db, query="search dashboard")["total_matched"] == 0
+
+    def test_prefix_and_phrase_queries(self, db) -> None:
+        assert _search(db, query="navig*")["quotes"][0]["quote_id"] == "q-p1-26"
+        assert _search(db, query='"hamburger menu"')["total_matched"] == 1
+        assert _search(db, query='"menu hamburger"')["total_matched"] == 0
+
+    def test_query_syntax_is_never_an_error(self, db) -> None:
+        for query in ("NEAR(", "AND OR", "---", '"unclosed', "col:value"):
+            assert _search(db, query=query)["total_matched"] >= 0
+
     def test_limit_is_clamped_and_paginated(self, db) -> None:
         result = _search(db, limit=99999)
         assert result["returned"] <= SEARCH_LIMIT_CAP
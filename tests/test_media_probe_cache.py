@@ -0,0 +1,96 @@
+"""Tests for the ingest media probe cache (bristlenose/media_probe_cache.py)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from bristlenose.media_probe_cache import MediaProbeCache, cache_path
+from bristlenose.stages import s01_ingest
+from bristlenose.stages.s01_ingest import discover_files
+from bristlenose.utils.audio import MediaProbe
+
+
+def _media(path: Path, data: bytes = b"\x00") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+class TestCache:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        video = _media(tmp_path / "a.mp4")
+        cache = MediaProbeCache(tmp_path / "probe.json")
+        cache.put(video, MediaProbe(12.5, True))
+        cache.save()
+        assert MediaProbeCache(tmp_path / "probe.json").get(video) == MediaProbe(12.5, True)
+
+    def test_changed_file_is_a_miss(self, tmp_path: Path) -> None:
+        video = _media(tmp_path / "a.mp4")
+        cache = MediaProbeCache(tmp_path / "probe.json")
+        cache.put(video, MediaProbe(12.5, True))
+        cache.save()
+        st = video.stat()
+        os.utime(video, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert MediaProbeCache(tmp_path / "probe.json").get(video) is None
+
+    def test_unseen_files_dropped_on_save(self, tmp_path: Path) -> None:
+        a, b = _media(tmp_path / "a.mp4"), _media(tmp_path / "b.mp4")
+        cache = MediaProbeCache(tmp_path / "probe.json")
+        cache.put(a, MediaProbe(1.0, True))
+        cache.put(b, MediaProbe(2.0, True))
+        cache.save()
+
+        rescan = MediaProbeCache(tmp_path / "probe.json")
+        assert rescan.get(a) is not None
+        rescan.save()
+        assert MediaProbeCache(tmp_path / "probe.json").get(b) is None
+
+    def test_unreadable_cache_is_empty(self, tmp_path: Path) -> None:
+        video = _media(tmp_path / "a.mp4")
+        (tmp_path / "probe.json").write_text("{not json")
+        assert MediaProbeCache(tmp_path / "probe.json").get(video) is None
+
+
+class TestDiscovery:
+    def test_second_scan_does_not_probe(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _media(tmp_path / "in" / "one.mp4")
+        _media(tmp_path / "in" / "two.m4a")
+        probed: list[str] = []
+
+        def fake_probe(path: Path) -> MediaProbe:
+            probed.append(path.name)
+            return MediaProbe(30.0, path.suffix == ".m4a")
+
+        monkeypatch.setattr(s01_ingest, "probe_media", fake_probe)
+        cache = cache_path(tmp_path / "out")
+
+        first = discover_files(tmp_path / "in", probe_cache=cache)
+        assert sorted(probed) == ["one.mp4", "two.m4a"]
+        assert cache.is_file()
+
+        probed.clear()
+        second = discover_files(tmp_path / "in", probe_cache=cache)
+        assert probed == []
+        assert [(f.duration_seconds, f.has_audio_stream) for f in second] == [
+            (f.duration_seconds, f.has_audio_stream) for f in first
+        ]
+
+    def test_failed_probe_is_retried(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _media(tmp_path / "in" / "one.mp4")
+        calls: list[Path] = []
+        monkeypatch.setattr(s01_ingest, "probe_media", lambda p: calls.append(p))
+        cache = cache_path(tmp_path / "out")
+
+        [found] = discover_files(tmp_path / "in", probe_cache=cache)
+        discover_files(tmp_path / "in", probe_cache=cache)
+
+        assert found.duration_seconds is None
+        assert found.has_audio_stream is None
+        assert len(calls) == 2
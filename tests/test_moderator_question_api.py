@@ -153,3 +153,26 @@ class TestModeratorQuestionEndpoint:
         ).json()
         assert isinstance(data["start_time"], (int, float))
         assert isinstance(data["end_time"], (int, float))
+
+
+class TestModeratorQuestionsBatch:
+    """The export's whole-project builder agrees with the endpoint."""
+
+    def test_matches_endpoint_per_quote(self, client: TestClient) -> None:
+        from bristlenose.server.routes.quotes import moderator_questions
+
+        for timecode, seg_idx in (("10", 1), ("26", 3), ("46", 0)):
+            _set_quote_segment_index(client, timecode, segment_index=seg_idx)
+        db = client.app.state.db_factory()  # type: ignore[union-attr]
+        try:
+            batch = moderator_questions(db, 1)
+        finally:
+            db.close()
+
+        assert set(batch) == {"q-p1-10", "q-p1-26"}
+        for dom_id, mq in batch.items():
+            resp = client.get(f"/api/projects/1/quotes/{dom_id}/moderator-question")
+            assert resp.json() == mq.model_dump()
+        for dom_id in ("q-p1-46", "q-p1-66"):
+            resp = client.get(f"/api/projects/1/quotes/{dom_id}/moderator-question")
+            assert resp.status_code == 404
@@ -247,9 +247,9 @@ class TestWordLeakPrevention:
         settings = BristlenoseSettings(pii_enabled=True)
 
         with patch("bristlenose.stages.s07_pii_removal._init_presidio") as mock_init, \
-                patch("bristlenose.stages.s07_pii_removal._redact_text") as mock_redact:
+                patch("bristlenose.stages.s07_pii_removal._redact_texts") as mock_redact:
             mock_init.return_value = (MagicMock(), MagicMock())
-            mock_redact.return_value = ("[NAME] said hello", [])
+            mock_redact.return_value = [("[NAME] said hello", [])]
 
             clean_transcripts, _ = remove_pii([transcript], settings)
             # Words must be cleared even if no PII was found in this segment
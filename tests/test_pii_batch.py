@@ -0,0 +1,95 @@
+"""Batched and multi-process PII redaction must match the per-segment path.
+
+Uses a blank spaCy English pipeline (tokeniser only, no NER) so these run
+without downloading a model: the pattern recognisers (email, phone, card,
+IBAN, IP) still fire, which is enough to compare the two code paths.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bristlenose.config import BristlenoseSettings
+from bristlenose.stages import s07_pii_removal as s07
+
+TRANSCRIPT_PATH = Path(__file__).parent / "fixtures" / "pii_horror_transcript.txt"
+
+
+def _blank_engines() -> tuple[object, object]:
+    """Presidio engines over ``spacy.blank("en")`` — module-level so it pickles."""
+    import spacy
+    from presidio_analyzer import AnalyzerEngine
+    from presidio_analyzer.nlp_engine import SpacyNlpEngine
+    from presidio_anonymizer import AnonymizerEngine
+
+    nlp_engine = SpacyNlpEngine(models=[{"lang_code": "en", "model_name": "blank"}])
+    nlp_engine.nlp = {"en": spacy.blank("en")}
+    return (
+        AnalyzerEngine(nlp_engine=nlp_engine, supported_languages=["en"]),
+        AnonymizerEngine(),
+    )
+
+
+def _texts() -> list[str]:
+    lines = [
+        line.split("] ", 1)[-1]
+        for line in TRANSCRIPT_PATH.read_text(encoding="utf-8").splitlines()
+        if line.startswith("[")
+    ]
+    return lines + ["", "write to jo@example.com or call +44 7700 900123"]
+
+
+def _flat(results: list[tuple[str, list[s07.PiiRedaction]]]) -> list[tuple]:
+    return [
+        (text, [(r.entity_type, r.original_text, r.replacement, r.score, r.timecode) for r in reds])
+        for text, reds in results
+    ]
+
+
+class TestBatchedRedaction:
+    def test_matches_per_segment_path(self) -> None:
+        analyzer, anonymizer = _blank_engines()
+        settings = BristlenoseSettings()
+        texts = _texts()
+        timecodes = [float(i) for i in range(len(texts))]
+
+        one_by_one = [
+            s07._redact_text(t, tc, analyzer, anonymizer, settings)
+            for t, tc in zip(texts, timecodes)
+        ]
+        batched = s07._redact_texts(texts, timecodes, analyzer, anonymizer, settings)
+
+        assert _flat(batched) == _flat(one_by_one)
+        assert any(reds for _, reds in batched)
+
+    def test_empty_batch(self) -> None:
+        assert s07._redact_texts([], [], object(), object(), BristlenoseSettings()) == []
+
+
+class TestRedactPool:
+    def test_pool_matches_in_process_and_keeps_order(self) -> None:
+        analyzer, anonymizer = _blank_engines()
+        settings = BristlenoseSettings()
+        texts = _texts() * 20
+        timecodes = [float(i) for i in range(len(texts))]
+
+        expected = s07._redact_texts(texts, timecodes, analyzer, anonymizer, settings)
+        pooled = s07._redact_pool(
+            texts, timecodes, settings, 2, build_engines=_blank_engines,
+        )
+
+        assert _flat(pooled) == _flat(expected)
+
+
+class TestResolvePiiWorkers:
+    @pytest.mark.parametrize("requested,n_texts,expected", [
+        (1, 100_000, 1),
+        (4, 100_000, 4),
+        (4, 1_200, 2),   # capped by _POOL_MIN_CHUNK slices
+        (4, 10, 1),
+    ])
+    def test_caps(self, requested: int, n_texts: int, expected: int) -> None:
+        settings = BristlenoseSettings(pii_workers=requested)
+        assert s07._resolve_pii_workers(settings, n_texts) == expected
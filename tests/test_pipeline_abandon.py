@@ -252,15 +252,23 @@ def test_pipeline_run_abandons_when_all_transcribe_fail(tmp_path: Path) -> None:
     settings.llm_model = "claude-sonnet-4-5-20250929"
     settings.skip_transcription = False
     settings.write_intermediate = True
+    settings.intermediate_format = "json"
     settings.llm_concurrency = 1
+    settings.llm_concurrency_max = 1
+    settings.llm_tokens_per_minute = 0
     settings.whisper_backend = "mlx"
     settings.whisper_model = "tiny"
+    settings.whisper_chunk_seconds = 0
     settings.color_scheme = "default"
     settings.pii_score_threshold = 0.5
     # Slice C: Whisper preflight checks settings.no_fetch — opt out so the
     # test reaches the real-failure path (transcribe stage), not the
     # preflight-abort path.
     settings.no_fetch = False
+    # Per-session look-ahead on (the default): the stream is created before
+    # transcription and must not swallow the abandon.
+    settings.pipeline_streaming = True
+    settings.anthropic_api_key = "sk-ant-test-key"
 
     pipeline = Pipeline(settings)
 
@@ -312,7 +320,10 @@ def test_pipeline_run_abandons_when_all_transcribe_fail(tmp_path: Path) -> None:
         for i in range(1, 4)
     ]
 
-    def _fake_transcribe_sessions(needs, _settings, *, on_progress=None, on_segment=None):
+    def _fake_transcribe_sessions(
+        needs, _settings, *, on_progress=None, on_segment=None, on_session=None,
+        **_window_kwargs,
+    ):
         return (
             {s.session_id: [] for s in needs},
             StageOutcome(
@@ -340,6 +351,8 @@ def test_pipeline_run_abandons_when_all_transcribe_fail(tmp_path: Path) -> None:
         with pytest.raises(PipelineAbandonedError) as exc_info:
             asyncio.run(pipeline.run(input_dir, output_dir))
 
+    assert pipeline._session_stream is None  # torn down by run()'s finally
+
     exc = exc_info.value
     assert exc.cause.category == CauseCategoryEnum.MISSING_BINARY, (
         f"expected MISSING_BINARY, got {exc.cause.category}"
@@ -573,6 +586,8 @@ def test_run_analysis_only_abandons_at_s08_for_quota_failure(tmp_path: Path) ->
     settings.azure_deployment = None
     settings.write_intermediate = True
     settings.llm_concurrency = 1
+    settings.llm_concurrency_max = 1
+    settings.llm_tokens_per_minute = 0
     settings.min_quote_words = 3
     settings.color_scheme = "default"
     settings.pii_enabled = False
@@ -31,6 +31,8 @@ PROMPTS_WITH_BOUNDARY: list[str] = [
     "quote-extraction",
     "quote-clustering",
     "thematic-grouping",
+    "quote-clustering-merge",
+    "thematic-grouping-merge",
     "signal-elaboration",
     "autocode",
     "codebook-synthesize",
@@ -151,7 +153,9 @@ CALL_SITES: list[tuple[str, str]] = [
     ("bristlenose/stages/s08_topic_segmentation.py", "transcript_text"),
     ("bristlenose/stages/s09_quote_extraction.py", "transcript_text"),
     ("bristlenose/stages/s10_quote_clustering.py", "quotes_json"),
+    ("bristlenose/stages/s10_quote_clustering.py", "clusters_json"),
     ("bristlenose/stages/s11_thematic_grouping.py", "quotes_json"),
+    ("bristlenose/stages/s11_thematic_grouping.py", "themes_json"),
     ("bristlenose/stages/s05b_identify_speakers.py", "transcript_sample"),
     ("bristlenose/server/elaboration.py", "signals_text"),
     ("bristlenose/server/autocode.py", "formatted_quotes"),
@@ -14,6 +14,8 @@ PROMPT_NAMES = [
     "quote-extraction",
     "quote-clustering",
     "thematic-grouping",
+    "quote-clustering-merge",
+    "thematic-grouping-merge",
 ]
 
 EXPECTED_VARIABLES: dict[str, set[str]] = {
@@ -22,6 +24,8 @@ EXPECTED_VARIABLES: dict[str, set[str]] = {
     "quote-extraction": {"topic_boundaries", "transcript_text"},
     "quote-clustering": {"quotes_json"},
     "thematic-grouping": {"quotes_json"},
+    "quote-clustering-merge": {"clusters_json"},
+    "thematic-grouping-merge": {"themes_json"},
 }
 
 _VAR_RE = re.compile(r"\{(\w+)\}")
@@ -64,6 +68,8 @@ class TestPromptLoading:
             "transcript_text": "text",
             "topic_boundaries": "bounds",
             "quotes_json": "[]",
+            "clusters_json": "[]",
+            "themes_json": "[]",
         }
         pair = get_prompt(name)
         expected = EXPECTED_VARIABLES[name]
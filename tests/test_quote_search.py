@@ -0,0 +1,135 @@
+"""Tests for the FTS5 quote search index (server/quote_search.py)."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from bristlenose.server.db import create_session_factory, get_engine, init_db
+from bristlenose.server.models import Project, Quote, QuoteEdit
+from bristlenose.server.quote_search import (
+    FTS_TABLE,
+    fallback_filter,
+    install_quote_index,
+    match_subquery,
+    quote_index_available,
+    text_matches,
+    to_match_query,
+)
+
+
+@pytest.fixture()
+def engine():
+    eng = get_engine("sqlite://")
+    init_db(eng)
+    return eng
+
+
+@pytest.fixture()
+def db(engine) -> Session:
+    session = create_session_factory(engine)()
+    session.add(Project(id=1, name="Test", slug="test", input_dir="/in", output_dir="/out"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _quote(db: Session, start: float, body: str) -> Quote:
+    q = Quote(
+        project_id=1, session_id="s1", participant_id="p1",
+        start_timecode=start, end_timecode=start + 5, text=body,
+        quote_type="screen_specific",
+    )
+    db.add(q)
+    db.commit()
+    return q
+
+
+def _ids(db: Session, query: str) -> list[int]:
+    ranked = match_subquery(1, to_match_query(query))
+    return [row[0] for row in db.execute(ranked.select().order_by(ranked.c.rank))]
+
+
+class TestToMatchQuery:
+    @pytest.mark.parametrize(("query", "expected"), [
+        ("dashboard", '"dashboard"'),
+        ("nav* menu", '"nav"* "menu"'),
+        ('"hard  to find" now', '"hard to find" "now"'),
+        ('"unclosed phrase', '"unclosed phrase"'),
+        ("AND NEAR(", '"AND" "NEAR("'),
+        ("--- *", ""),
+    ])
+    def test_translation(self, query: str, expected: str) -> None:
+        assert to_match_query(query) == expected
+
+
+class TestIndexSync:
+    def test_index_installed(self, db: Session) -> None:
+        assert quote_index_available(db)
+
+    def test_insert_update_delete_follow_quotes(self, db: Session) -> None:
+        q = _quote(db, 1.0, "The checkout flow was slow")
+        assert _ids(db, "checkout") == [q.id]
+        q.text = "The payment flow was slow"
+        db.commit()
+        assert _ids(db, "checkout") == []
+        assert _ids(db, "payment") == [q.id]
+        db.delete(q)
+        db.commit()
+        assert _ids(db, "payment") == []
+
+    def test_researcher_edit_takes_precedence(self, db: Session) -> None:
+        q = _quote(db, 1.0, "The dashbord was confusing")
+        db.add(QuoteEdit(quote_id=q.id, edited_text="The dashboard was confusing"))
+        db.commit()
+        assert _ids(db, "dashboard") == [q.id]
+        assert _ids(db, "dashbord") == []
+        db.query(QuoteEdit).delete()
+        db.commit()
+        assert _ids(db, "dashbord") == [q.id]
+
+    def test_bm25_ranks_denser_match_first(self, db: Session) -> None:
+        sparse = _quote(db, 1.0, "Search results were fine but the layout and colours were off")
+        dense = _quote(db, 2.0, "Search, search, search — all I did was search")
+        assert _ids(db, "search") == [dense.id, sparse.id]
+
+    def test_drifted_index_is_rebuilt(self, engine, db: Session) -> None:
+        q = _quote(db, 1.0, "Onboarding needed a tutorial")
+        db.execute(text(f"DELETE FROM {FTS_TABLE}"))
+        db.commit()
+        assert _ids(db, "tutorial") == []
+        assert install_quote_index(engine)
+        assert _ids(db, "tutorial") == [q.id]
+
+
+class TestFallbackMatching:
+    """Without FTS5 the same query must find the same quotes."""
+
+    _TEXT = "The navigation was hidden behind a hamburger menu. Café-style, I'd say."
+
+    @pytest.mark.parametrize(("query", "expected"), [
+        ("navigation", 1),
+        ("navig", 0),  # whole tokens, not substrings
+        ("navig*", 1),
+        ("MENU hamburger", 1),
+        ("hamburger sidebar", 0),  # every term must match
+        ('"hamburger menu"', 1),
+        ('"menu hamburger"', 0),
+        ('"a hamb"*', 0),  # "*" after a closed phrase is dropped, as in FTS5
+        ('"a hamburger', 1),  # an unclosed quote runs to the end
+        ("cafe", 1),  # diacritics folded
+        ("--- *", 0),
+    ])
+    def test_rules_match_fts5(self, query: str, expected: int) -> None:
+        assert text_matches(self._TEXT, query) == expected
+
+    def test_filter_agrees_with_index(self, db: Session) -> None:
+        nav = _quote(db, 1.0, "The navigation was hidden behind a hamburger menu")
+        _quote(db, 2.0, "Search was quick and the results were useful")
+        for query in ("navig", "navig*", "hamburger menu", '"behind a"', "search*"):
+            scanned = [
+                q.id for q in db.query(Quote).filter(fallback_filter(query)).order_by(Quote.id)
+            ]
+            assert scanned == sorted(_ids(db, query)), query
+        assert [q.id for q in db.query(Quote).filter(fallback_filter("navig*"))] == [nav.id]
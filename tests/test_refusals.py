@@ -295,6 +295,7 @@ class TestTranscribeOnlyStatesSilenceToo:
         settings = MagicMock()
         settings.project_name = "silent-mix"
         settings.write_intermediate = False
+        settings.intermediate_format = "json"
         settings.color_scheme = "default"
         pipeline = Pipeline(settings)
 
@@ -108,6 +108,22 @@ def test_cost_by_stage_sorted_desc():
     assert rows[0]["cost"] == 0.6
 
 
+def test_cost_by_stage_splits_cached_and_uncached_input(tmp_path):
+    rows = [
+        _call(stage="autocode", tin=500, cache=0, ms=4000),
+        _call(stage="autocode", tin=100, cache=900, ms=2000),
+        _call(stage="speakers", tin=300, cache=0, ms=1000),
+    ]
+    rows[0]["gen_ai.usage.cache_creation_input_tokens"] = 900
+    _write_jsonl(tmp_path / ri.JSONL_LLM, rows)
+    by_stage = {r["stage"]: r for r in ri.cost_by_stage(ri.load_llm_calls(tmp_path))}
+    a = by_stage["autocode"]
+    assert (a["in"], a["cache_read"], a["cache_write"]) == (600, 900, 900)
+    assert a["cache_ratio"] == round(900 / 2400, 4)
+    assert a["p50_ms"] == 3000
+    assert by_stage["speakers"]["cache_ratio"] == 0.0
+
+
 def test_calibration_only_pairs_with_both_values():
     calls = [
         {"stage": "a", "cost": 0.05, "cost_pred": 0.04, "in": 1, "out": 1, "cache": 0},
@@ -0,0 +1,145 @@
+"""Tests for the sharded transcript-segment store (bristlenose/segment_store.py)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bristlenose.models import SpeakerRole, TranscriptSegment, Word
+from bristlenose.segment_store import LEGACY_FILENAME, SegmentStore
+
+
+def _segments(sid: str, n: int = 2) -> list[TranscriptSegment]:
+    return [
+        TranscriptSegment(
+            start_time=i * 10.0,
+            end_time=i * 10.0 + 9.0,
+            text=f"{sid} segment {i}",
+            speaker_role=SpeakerRole.PARTICIPANT,
+            speaker_code="p1",
+            words=[Word(text=f"{sid}-{i}", start_time=i * 10.0, end_time=i * 10.0 + 0.5)],
+            source="whisper",
+            segment_index=i,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(params=["json", "binary"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> SegmentStore:
+    return SegmentStore(tmp_path / "intermediate", request.param)
+
+
+class TestRoundTrip:
+    def test_put_then_load(self, store: SegmentStore) -> None:
+        store.put("s1", _segments("s1"))
+        store.put("s2", _segments("s2", 3))
+        loaded = SegmentStore(store.intermediate).load()
+        assert loaded == {"s1": _segments("s1"), "s2": _segments("s2", 3)}
+
+    def test_load_only_requested_sessions(self, store: SegmentStore) -> None:
+        for sid in ("s1", "s2", "s3"):
+            store.put(sid, _segments(sid))
+        assert list(store.load(["s3", "s9"])) == ["s3"]
+
+    def test_load_raw_yields_dicts(self, store: SegmentStore) -> None:
+        store.put("s1", _segments("s1"))
+        [(sid, raw)] = list(store.load_raw())
+        assert sid == "s1"
+        assert raw[1]["words"][0]["text"] == "s1-1"
+
+    def test_silent_session_round_trips_empty(self, store: SegmentStore) -> None:
+        store.put("s1", [])
+        assert store.load() == {"s1": []}
+
+    def test_binary_shard_is_compressed(self, tmp_path: Path) -> None:
+        segs = _segments("s1", 50)
+        text_store = SegmentStore(tmp_path / "a", "json")
+        bin_store = SegmentStore(tmp_path / "b", "binary")
+        text_store.put("s1", segs)
+        bin_store.put("s1", segs)
+        assert (bin_store.dir / "s1.bin").stat().st_size < (
+            (text_store.dir / "s1.json").stat().st_size / 2
+        )
+
+    def test_unknown_format_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            SegmentStore(tmp_path, "yaml")
+
+
+class TestIndex:
+    def test_put_replaces_one_shard(self, store: SegmentStore) -> None:
+        store.put("s1", _segments("s1"))
+        store.put("s2", _segments("s2"))
+        before = store.shard_hashes()
+        store.put("s2", _segments("s2", 4))
+        after = store.shard_hashes()
+        assert after["s1"] == before["s1"]
+        assert after["s2"] != before["s2"]
+        assert len(store.load(["s2"])["s2"]) == 4
+
+    def test_switching_format_replaces_file(self, tmp_path: Path) -> None:
+        SegmentStore(tmp_path, "json").put("s1", _segments("s1"))
+        binary = SegmentStore(tmp_path, "binary")
+        binary.put("s1", _segments("s1"))
+        assert sorted(p.name for p in binary.dir.iterdir()) == ["index.json", "s1.bin"]
+        assert binary.load() == {"s1": _segments("s1")}
+
+    def test_content_hash_tracks_shards(self, store: SegmentStore) -> None:
+        assert store.content_hash() is None
+        store.put("s1", _segments("s1"))
+        first = store.content_hash()
+        store.put("s1", _segments("s1", 3))
+        assert store.content_hash() != first
+
+    def test_prune_drops_other_sessions(self, store: SegmentStore) -> None:
+        store.put("s1", _segments("s1"))
+        store.put("s2", _segments("s2"))
+        store.prune(["s1"])
+        assert store.session_ids() == ["s1"]
+        assert not any(p.stem == "s2" for p in store.dir.iterdir())
+
+
+class TestDamage:
+    def test_tampered_shard_is_missing(self, store: SegmentStore) -> None:
+        store.put("s1", _segments("s1"))
+        store.put("s2", _segments("s2"))
+        shard = next(p for p in store.dir.iterdir() if p.stem == "s2")
+        shard.write_bytes(shard.read_bytes()[:-5])
+        assert list(SegmentStore(store.intermediate).load()) == ["s1"]
+
+    def test_unreadable_index_reads_as_empty(self, store: SegmentStore) -> None:
+        store.put("s1", _segments("s1"))
+        store.index_path.write_text("{not json")
+        assert SegmentStore(store.intermediate).load() == {}
+
+
+class TestLegacy:
+    def _write_legacy(self, tmp_path: Path) -> Path:
+        intermediate = tmp_path / "intermediate"
+        intermediate.mkdir()
+        (intermediate / LEGACY_FILENAME).write_text(json.dumps({
+            sid: [s.model_dump(mode="json") for s in _segments(sid)]
+            for sid in ("s1", "s2")
+        }, indent=2))
+        return intermediate
+
+    def test_reads_monolithic_file(self, tmp_path: Path) -> None:
+        intermediate = self._write_legacy(tmp_path)
+        store = SegmentStore(intermediate)
+        assert store.exists()
+        assert store.session_ids() == ["s1", "s2"]
+        assert store.load(["s2"]) == {"s2": _segments("s2")}
+
+    def test_prune_removes_monolithic_file(self, tmp_path: Path) -> None:
+        intermediate = self._write_legacy(tmp_path)
+        store = SegmentStore(intermediate)
+        for sid, segs in store.load().items():
+            store.put(sid, segs)
+        store.prune(["s1", "s2"])
+        assert not (intermediate / LEGACY_FILENAME).exists()
+        assert SegmentStore(intermediate).load() == {
+            "s1": _segments("s1"), "s2": _segments("s2"),
+        }
@@ -583,11 +583,21 @@ class TestProjectApiNoStore:
     """
 
     def test_api_projects_path_carries_no_store(self, client: TestClient) -> None:
-        resp = client.get("/api/projects/1/quotes")
+        resp = client.get("/api/projects/1/sessions")
         # 200 (smoke data) or 404 (no project_dir bound in this fixture) both
         # exercise the middleware. Header is set on every response in scope.
         assert resp.headers.get("Cache-Control") == "no-store"
 
+    def test_etag_response_is_revalidated_not_stored_blind(self) -> None:
+        """GET /quotes carries an ETag: ``no-cache`` (always revalidate),
+        never a cache entry that could be reused without asking the server."""
+        fixture = Path(__file__).parent / "fixtures" / "smoke-test" / "input"
+        app = create_app(project_dir=fixture, dev=True, db_url="sqlite://")
+        resp = AuthTestClient(app).get("/api/projects/1/quotes")
+        assert resp.status_code == 200
+        assert resp.headers.get("ETag")
+        assert resp.headers.get("Cache-Control") == "no-cache"
+
     def test_api_health_unaffected(self, client: TestClient) -> None:
         # Sanity — middleware must not over-scope.
         resp = client.get("/api/health")
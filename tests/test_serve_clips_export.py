@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from pathlib import Path
 from unittest.mock import patch
 
@@ -9,6 +11,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from bristlenose.server.app import create_app
+from bristlenose.server.clip_manifest import ClipSpec
 from bristlenose.server.routes import clips_export
 from tests.conftest import AuthTestClient
 
@@ -176,6 +179,61 @@ class TestClipStatus:
         assert data["output_dir"] == "/tmp/clips"
 
 
+def _spec(quote_id: str, source: str, start: float) -> ClipSpec:
+    return ClipSpec(
+        quote_id=quote_id, participant_id="p1", session_id="s1",
+        source_path=Path(source), start=start, end=start + 5, raw_start=start,
+        speaker_name="", quote_gist=quote_id, is_audio_only=False,
+        is_starred=True, is_hero=False,
+    )
+
+
+class TestRunClipExtraction:
+    def _run(self, specs: list[ClipSpec], clips_dir: Path, fake) -> dict:
+        clips_export._jobs.clear()
+        clips_export._jobs[1] = {"status": "running", "progress": 0, "total": len(specs)}
+        with patch.object(clips_export.FFmpegBackend, "extract_clips", fake):
+            asyncio.run(clips_export._run_clip_extraction(1, specs, clips_dir, 1, False, False))
+        return clips_export._jobs[1]
+
+    def test_batches_by_source_and_keeps_manifest_order(self, tmp_path: Path) -> None:
+        specs = [
+            _spec("q-p1-10", "/media/a.mp4", 10),
+            _spec("q-p1-20", "/media/b.mp4", 20),
+            _spec("q-p1-30", "/media/a.mp4", 30),
+        ]
+        calls: list[tuple[Path, int]] = []
+
+        def fake(self, source, cuts):
+            calls.append((source, len(cuts)))
+            return [None if start == 20 else out for out, start, _ in cuts]
+
+        job = self._run(specs, tmp_path, fake)
+
+        assert sorted(calls) == [(Path("/media/a.mp4"), 2), (Path("/media/b.mp4"), 1)]
+        assert job["status"] == "completed"
+        assert job["progress"] == 3
+        assert job["completed_count"] == 2
+        assert job["skipped_count"] == 1
+        manifest = json.loads((tmp_path / "clips_manifest.json").read_text())
+        assert [c["quote_id"] for c in manifest["clips"]] == ["q-p1-10", "q-p1-30"]
+
+    def test_cancel_stops_unstarted_batches(self, tmp_path: Path) -> None:
+        specs = [_spec(f"q-p1-{n}", f"/media/{n}.mp4", n) for n in range(20)]
+
+        def fake(self, source, cuts):
+            clips_export._jobs[1]["status"] = "cancelled"
+            return [out for out, _, _ in cuts]
+
+        with patch("bristlenose.utils.hardware.detect_hardware") as hw:
+            hw.return_value.recommended_ffmpeg_workers.return_value = 2
+            job = self._run(specs, tmp_path, fake)
+
+        assert job["status"] == "cancelled"
+        assert 0 < job["completed_count"] < 20
+        assert job["output_dir"] == str(tmp_path)
+
+
 class TestRevealClips:
     def test_no_job_returns_404(self, client: TestClient) -> None:
         resp = client.post("/api/projects/1/export/clips/reveal")
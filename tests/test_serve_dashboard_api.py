@@ -438,3 +438,36 @@ class TestDashboardCoverage:
             for seg in sess["full_segments"]:
                 expected = {"speaker_code", "start_time", "text", "session_id"}
                 assert set(seg.keys()) == expected
+
+    def test_import_stores_coverage_per_session(self, app_fx) -> None:
+        from bristlenose.server.models import Session as SessionModel
+        from bristlenose.server.models import SessionCoverage
+
+        db = app_fx.state.db_factory()
+        try:
+            rows = db.query(SessionCoverage).all()
+            assert {r.session_id for r in rows} == {s.id for s in db.query(SessionModel)}
+            assert all(r.segment_count > 0 for r in rows)
+        finally:
+            db.close()
+
+    def test_missing_rows_are_recomputed_identically(self, app_fx, client: TestClient) -> None:
+        from bristlenose.server.models import Project, SessionCoverage
+
+        before = client.get("/api/projects/1/dashboard").json()["coverage"]
+        db = app_fx.state.db_factory()
+        try:
+            db.query(SessionCoverage).delete()
+            db.commit()
+            revision = db.get(Project, 1).revision
+        finally:
+            db.close()
+
+        assert client.get("/api/projects/1/dashboard").json()["coverage"] == before
+        db = app_fx.state.db_factory()
+        try:
+            assert db.query(SessionCoverage).count() == 1
+            # A derived cache: filling it is not a project write.
+            assert db.get(Project, 1).revision == revision
+        finally:
+            db.close()
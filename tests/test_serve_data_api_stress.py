@@ -15,10 +15,13 @@ coverage in test_serve_data_api.py.  Scenarios include:
 - Heading keys with special characters
 - Deleted badges with duplicate sentiment names
 - PUT with a mix of valid and invalid quote IDs (partial success)
+- A 10k-quote project: full /quotes vs the index + first page (TTFB, bytes)
 """
 
 from __future__ import annotations
 
+import time
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -697,3 +700,106 @@ class TestIdempotency:
 
         data = client.get("/api/projects/1/deleted-badges").json()
         assert data["q-p1-10"] == ["confusion"]
+
+
+# ---------------------------------------------------------------------------
+# 10k quotes — full payload vs index + first page
+# ---------------------------------------------------------------------------
+
+_BIG_SECTIONS = 20
+_BIG_PER_SECTION = 500
+
+
+@pytest.fixture(scope="module")
+def big_client() -> Iterator[TestClient]:
+    """The smoke project plus 10,000 seeded quotes in 20 sections."""
+    from sqlalchemy import insert
+
+    from bristlenose.server.models import ClusterQuote, Quote, ScreenCluster
+
+    app = create_app(project_dir=_FIXTURE_DIR, dev=True, db_url="sqlite://")
+    db = app.state.db_factory()
+    try:
+        for s in range(_BIG_SECTIONS):
+            cluster = ScreenCluster(
+                project_id=1, screen_label=f"Stress {s}", display_order=100 + s,
+            )
+            db.add(cluster)
+            db.flush()
+            quote_ids = db.scalars(
+                insert(Quote).returning(Quote.id),
+                [
+                    {
+                        "project_id": 1,
+                        "session_id": f"s{s + 10}",
+                        "participant_id": f"p{s + 10}",
+                        "start_timecode": float(i * 7),
+                        "end_timecode": float(i * 7 + 5),
+                        "text": f"Stress quote {i} about the dashboard and the search page.",
+                        "quote_type": "screen_specific",
+                        "sentiment": "frustration",
+                    }
+                    for i in range(_BIG_PER_SECTION)
+                ],
+            ).all()
+            db.execute(
+                insert(ClusterQuote),
+                [{"cluster_id": cluster.id, "quote_id": qid} for qid in quote_ids],
+            )
+        db.commit()
+    finally:
+        db.close()
+    yield AuthTestClient(app)
+
+
+def _timed_get(client: TestClient, path: str) -> tuple[float, int, dict]:
+    """Seconds to a complete response, body bytes, and the parsed body."""
+    t0 = time.perf_counter()
+    resp = client.get(path)
+    elapsed = time.perf_counter() - t0
+    assert resp.status_code == 200
+    return elapsed, len(resp.content), resp.json()
+
+
+class TestTenThousandQuotes:
+    """The windowed endpoints keep first paint independent of project size.
+
+    TestClient buffers whole responses, so "time to first byte" here is the
+    time to the complete index or page — an upper bound on the real TTFB.
+    """
+
+    def test_index_and_first_page_are_small_and_fast(self, big_client: TestClient) -> None:
+        full_s, full_bytes, full = _timed_get(big_client, "/api/projects/1/quotes")
+        assert full["total_quotes"] >= _BIG_SECTIONS * _BIG_PER_SECTION
+
+        index_s, index_bytes, index = _timed_get(big_client, "/api/projects/1/quotes/index")
+        assert index["total_quotes"] == full["total_quotes"]
+        biggest = max(index["sections"], key=lambda s: s["quote_count"])
+        assert biggest["quote_count"] == _BIG_PER_SECTION
+
+        page_s, page_bytes, page = _timed_get(
+            big_client, f"/api/projects/1/quotes/sections/{biggest['cluster_id']}",
+        )
+        assert len(page["quotes"]) == 50
+        assert page["next_cursor"] is not None
+
+        # First paint needs index + one page: a small fraction of the full
+        # payload, in well under the time the full build takes.
+        assert index_bytes + page_bytes < full_bytes / 20
+        assert index_s + page_s < full_s
+
+    def test_deep_page_costs_the_same_as_the_first(self, big_client: TestClient) -> None:
+        index = big_client.get("/api/projects/1/quotes/index").json()
+        cluster_id = max(index["sections"], key=lambda s: s["quote_count"])["cluster_id"]
+        path = f"/api/projects/1/quotes/sections/{cluster_id}"
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            params = {"limit": 200} | ({"cursor": cursor} if cursor else {})
+            page = big_client.get(path, params=params).json()
+            seen += [q["dom_id"] for q in page["quotes"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert len(seen) == len(set(seen)) == _BIG_PER_SECTION
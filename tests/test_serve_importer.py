@@ -10,6 +10,7 @@ from pathlib import Path
 import pytest
 from sqlalchemy.orm import Session
 
+from bristlenose.segment_store import SegmentStore
 from bristlenose.server.db import create_session_factory, get_engine, init_db
 from bristlenose.server.importer import _find_transcripts_dir, import_project
 from bristlenose.server.models import (
@@ -29,11 +30,13 @@ from bristlenose.server.models import (
     TagDefinition,
     ThemeGroup,
     ThemeQuote,
+    TopicBoundary,
     TranscriptSegment,
 )
 from bristlenose.server.models import (
     Session as SessionModel,
 )
+from bristlenose.word_timings import SUFFIX, WordTimings, session_timings_path
 
 _FIXTURE_DIR = Path(__file__).parent / "fixtures" / "smoke-test" / "input"
 
@@ -1387,11 +1390,11 @@ def _write_transcript_and_words(
     return tmp_path
 
 
-class TestWordEnrichment:
-    """Test that word-level timing from intermediate JSON populates words_json."""
+class TestWordTimings:
+    """Word-level timing from intermediate JSON lands in a columnar .bnwt file."""
 
-    def test_words_populated_when_available(self, db: Session, tmp_path: Path) -> None:
-        """Segments with word data in session_segments.json get words_json."""
+    def test_timings_written_when_available(self, db: Session, tmp_path: Path) -> None:
+        """Segments with word data in session_segments.json get timings."""
         project_dir = _write_transcript_and_words(
             tmp_path,
             words=[
@@ -1407,64 +1410,77 @@ class TestWordEnrichment:
             .all()
         )
         assert len(segs) == 2
+        assert all(seg.words_json is None for seg in segs)
 
-        # First segment (m1) has word data
-        assert segs[0].words_json is not None
-        parsed = json.loads(segs[0].words_json)
-        assert len(parsed) == 2
-        assert parsed[0]["t"] == "Hello,"
-        assert parsed[0]["s"] == 2.0
-        assert parsed[0]["e"] == 2.5
+        timings = WordTimings.open(
+            session_timings_path(project_dir / "bristlenose-output", "s1"),
+        )
+        # First segment (m1) has word data, keyed by the DB segment_index
+        first = timings.segment(segs[0].segment_index)
+        assert [timings.text(i) for i in first] == ["Hello,", "how"]
+        assert timings.start[first[0]] == 2.0
+        assert timings.end[first[0]] == 2.5
 
         # Second segment (p1) also has word data
-        assert segs[1].words_json is not None
-        parsed1 = json.loads(segs[1].words_json)
-        assert len(parsed1) == 3
-        assert parsed1[0]["t"] == "I'm"
+        words = timings.words(segs[1].segment_index)
+        assert [w.text for w in words] == ["I'm", "doing", "well,"]
+        assert words[0].confidence == pytest.approx(0.9)
 
-    def test_words_null_when_no_intermediate(self, db: Session) -> None:
+    def test_no_file_when_no_intermediate(self, db: Session, tmp_path: Path) -> None:
         """Smoke-test fixture (VTT source, no session_segments.json with words)."""
         import_project(db, _FIXTURE_DIR)
-        segs = db.query(TranscriptSegment).all()
-        for seg in segs:
+        for seg in db.query(TranscriptSegment):
             assert seg.words_json is None
+        assert not list(_FIXTURE_DIR.rglob("*" + SUFFIX))
 
-    def test_words_null_when_empty_words_array(
+    def test_no_file_when_empty_words_array(
         self, db: Session, tmp_path: Path,
     ) -> None:
-        """Segments with empty words arrays get no words_json."""
+        """Segments with empty words arrays get no timings."""
         project_dir = _write_transcript_and_words(tmp_path, words=[])
         import_project(db, project_dir)
 
-        segs = db.query(TranscriptSegment).all()
-        for seg in segs:
-            assert seg.words_json is None
+        path = session_timings_path(project_dir / "bristlenose-output", "s1")
+        assert not path.exists()
 
-    def test_compact_json_format(self, db: Session, tmp_path: Path) -> None:
-        """words_json uses compact keys (t, s, e) and no whitespace."""
+    def test_timings_read_from_segment_shards(
+        self, db: Session, tmp_path: Path,
+    ) -> None:
+        """Sharded segments are read, and an edited shard alone re-imports."""
         project_dir = _write_transcript_and_words(
             tmp_path,
-            words=[
-                {"text": "Hello", "start_time": 2.0, "end_time": 2.5, "confidence": 0.9},
-            ],
+            words=[{"text": "Hello,", "start_time": 2.0, "end_time": 2.5}],
         )
+        out = project_dir / "bristlenose-output"
+        store = SegmentStore(out / ".bristlenose" / "intermediate")
+        segments = store.load()
+        for sid, segs in segments.items():
+            store.put(sid, segs)
+        store.prune(segments)
         import_project(db, project_dir)
+        path = session_timings_path(out, "s1")
+        assert WordTimings.open(path).text(0) == "Hello,"
 
-        seg = (
-            db.query(TranscriptSegment)
-            .order_by(TranscriptSegment.start_time)
-            .first()
+        segments["s1"][0].words[0].text = "Hi,"
+        store.put("s1", segments["s1"])
+        import_project(db, project_dir)
+        assert WordTimings.open(path).text(0) == "Hi,"
+
+    def test_removed_session_file_deleted(self, db: Session, tmp_path: Path) -> None:
+        """A session gone from the pipeline output loses its timings file."""
+        project_dir = _write_transcript_and_words(
+            tmp_path,
+            words=[{"text": "Hello,", "start_time": 2.0, "end_time": 2.5}],
         )
-        assert seg is not None
-        assert seg.words_json is not None
-        # No whitespace (compact separators)
-        assert " " not in seg.words_json
-        # Uses short keys
-        assert '"t":' in seg.words_json
-        assert '"s":' in seg.words_json
-        assert '"e":' in seg.words_json
-        # Does NOT include confidence
-        assert "confidence" not in seg.words_json
+        out = project_dir / "bristlenose-output"
+        import_project(db, project_dir)
+        path = session_timings_path(out, "s1")
+        assert path.exists()
+
+        (out / "transcripts-raw" / "s1.txt").unlink()
+        import_project(db, project_dir)
+        assert db.query(SessionModel).count() == 0
+        assert not path.exists()
 
 
 # ---------------------------------------------------------------------------
@@ -1613,3 +1629,211 @@ class TestSentimentAutoImport:
             assert len(tags) == 1, (
                 f"Quote {quote.id} has {len(tags)} sentiment tags, expected 1"
             )
+
+
+# ---------------------------------------------------------------------------
+# Incremental import (fingerprint)
+# ---------------------------------------------------------------------------
+
+
+_TRANSCRIPT_S1 = (
+    "# Transcript: s1\n"
+    "# Date: 2026-02-20\n"
+    "# Duration: 00:01:00\n"
+    "\n"
+    "[00:02] [m1] Welcome.\n"
+    "[00:10] [p1] Thanks for having me.\n"
+)
+
+
+class TestIncrementalImport:
+    """Unchanged projects skip the import; changed ones re-apply the delta."""
+
+    def _make_project(self, tmp_path: Path) -> Path:
+        clusters = [
+            {
+                "screen_label": "Login",
+                "description": "",
+                "display_order": 1,
+                "quotes": [_make_quote("s1", "p1", 10.0, "Login was easy")],
+            },
+        ]
+        _write_pipeline_output(tmp_path, clusters, [])
+        _write_transcript(tmp_path / "bristlenose-output", "s1", _TRANSCRIPT_S1)
+        return tmp_path
+
+    def test_records_fingerprint(self, db: Session, tmp_path: Path) -> None:
+        project = import_project(db, self._make_project(tmp_path))
+        fingerprint = json.loads(project.import_fingerprint)
+        assert "screen_clusters.json" in fingerprint
+        assert "transcript:s1" in fingerprint
+
+    def test_unchanged_project_is_skipped(
+        self, db: Session, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from bristlenose.server import importer
+
+        project_dir = self._make_project(tmp_path)
+        first = import_project(db, project_dir)
+        imported_at = first.imported_at
+
+        def _fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("unchanged project must not re-import")
+
+        monkeypatch.setattr(importer, "_import_quotes_from_clusters", _fail)
+        monkeypatch.setattr(importer, "_import_transcript_segments", _fail)
+        again = import_project(db, project_dir)
+
+        assert again.id == first.id
+        assert again.imported_at == imported_at
+        assert db.query(Quote).count() == 1
+        assert db.query(TranscriptSegment).count() == 2
+
+    def test_changed_transcript_replaces_its_segments(
+        self, db: Session, tmp_path: Path,
+    ) -> None:
+        project_dir = self._make_project(tmp_path)
+        import_project(db, project_dir)
+
+        _write_transcript(
+            tmp_path / "bristlenose-output", "s1",
+            _TRANSCRIPT_S1.replace("Thanks for having me.", "Glad to be here."),
+        )
+        import_project(db, project_dir)
+
+        texts = [
+            seg.text
+            for seg in db.query(TranscriptSegment).order_by(TranscriptSegment.start_time)
+        ]
+        assert texts == ["Welcome.", "Glad to be here."]
+
+    def test_quotes_survive_when_only_a_transcript_changes(
+        self, db: Session, tmp_path: Path,
+    ) -> None:
+        project_dir = self._make_project(tmp_path)
+        import_project(db, project_dir)
+        quote = db.query(Quote).one()
+        db.add(QuoteState(quote_id=quote.id, is_starred=True))
+        db.commit()
+
+        _write_transcript(
+            tmp_path / "bristlenose-output", "s1", _TRANSCRIPT_S1 + "[00:20] [p1] More.\n",
+        )
+        import_project(db, project_dir)
+
+        assert db.query(Quote).one().id == quote.id
+        assert db.query(ScreenCluster).count() == 1
+        assert db.query(ClusterQuote).count() == 1
+        assert db.query(QuoteState).one().is_starred is True
+
+    def test_topic_boundaries_replaced_not_appended(
+        self, db: Session, tmp_path: Path,
+    ) -> None:
+        project_dir = self._make_project(tmp_path)
+        tb_path = (
+            tmp_path / "bristlenose-output" / ".bristlenose" / "intermediate"
+            / "topic_boundaries.json"
+        )
+        boundary = {
+            "session_id": "s1",
+            "timecode_seconds": 2.0,
+            "topic_label": "Intro",
+            "transition_type": "topic_shift",
+            "confidence": 0.9,
+        }
+        tb_path.write_text(json.dumps([boundary]))
+        import_project(db, project_dir)
+
+        tb_path.write_text(json.dumps([{**boundary, "topic_label": "Welcome"}]))
+        import_project(db, project_dir)
+
+        assert [tb.topic_label for tb in db.query(TopicBoundary)] == ["Welcome"]
+
+
+# ---------------------------------------------------------------------------
+# Bulk quote upsert
+# ---------------------------------------------------------------------------
+
+
+class TestBulkQuoteUpsert:
+    """Quotes are resolved against one in-memory stable-key index."""
+
+    def _clusters(self, n: int, text: str = "Quote") -> list[dict]:
+        return [
+            {
+                "screen_label": f"Section {c}",
+                "description": "",
+                "display_order": c,
+                "quotes": [
+                    _make_quote(f"s{c}", f"p{c}", float(i), f"{text} {c}-{i}")
+                    for i in range(n)
+                ],
+            }
+            for c in range(1, 4)
+        ]
+
+    def test_statement_count_does_not_grow_with_quotes(
+        self, db: Session, tmp_path: Path,
+    ) -> None:
+        from sqlalchemy import event
+
+        counts: list[int] = []
+        for n in (10, 200):
+            project_dir = tmp_path / f"p{n}"
+            project_dir.mkdir()
+            _write_pipeline_output(project_dir, self._clusters(n), [])
+            statements = 0
+
+            def _count(*args: object) -> None:
+                nonlocal statements
+                statements += 1
+
+            engine = db.get_bind()
+            event.listen(engine, "before_cursor_execute", _count)
+            try:
+                import_project(db, project_dir)
+            finally:
+                event.remove(engine, "before_cursor_execute", _count)
+            counts.append(statements)
+
+        assert db.query(Quote).count() == 3 * 10 + 3 * 200
+        # 570 extra quotes; a per-quote query anywhere would add hundreds.
+        assert counts[1] - counts[0] < 20
+
+    def test_changed_quote_updated_in_place(
+        self, db: Session, tmp_path: Path,
+    ) -> None:
+        _write_pipeline_output(tmp_path, self._clusters(3), [])
+        import_project(db, tmp_path)
+        ids = {
+            q.start_timecode: q.id
+            for q in db.query(Quote).filter_by(session_id="s1")
+        }
+
+        clusters = self._clusters(3)
+        clusters[0]["quotes"][1]["text"] = "Reworded by the pipeline"
+        _write_pipeline_output(tmp_path, clusters, [])
+        import_project(db, tmp_path)
+
+        db.expire_all()
+        rows = {q.start_timecode: q for q in db.query(Quote).filter_by(session_id="s1")}
+        assert {t: q.id for t, q in rows.items()} == ids
+        assert rows[1.0].text == "Reworded by the pipeline"
+        assert rows[0.0].text == "Quote 1-0"
+        assert db.query(ClusterQuote).count() == 9
+
+    def test_quote_in_section_and_theme_is_one_row(
+        self, db: Session, tmp_path: Path,
+    ) -> None:
+        quote = _make_quote("s1", "p1", 5.0, "Shared quote")
+        clusters = [
+            {"screen_label": "A", "description": "", "display_order": 1, "quotes": [quote]},
+        ]
+        themes = [{"theme_label": "T", "description": "", "quotes": [quote]}]
+        _write_pipeline_output(tmp_path, clusters, themes)
+        import_project(db, tmp_path)
+
+        assert db.query(Quote).count() == 1
+        q_id = db.query(Quote).one().id
+        assert db.query(ClusterQuote).one().quote_id == q_id
+        assert db.query(ThemeQuote).one().quote_id == q_id
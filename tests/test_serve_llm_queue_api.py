@@ -0,0 +1,47 @@
+"""Tests for the serve-mode ``GET /api/llm/queue`` scheduler endpoint."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from bristlenose.llm import concurrency
+from bristlenose.llm.concurrency import ConcurrencyController
+from bristlenose.server.app import create_app
+from tests.conftest import AuthTestClient
+
+
+@pytest.fixture()
+def app():
+    concurrency.reset_controllers()
+    yield create_app(dev=True, db_url="sqlite://")
+    concurrency.reset_controllers()
+
+
+@pytest.fixture()
+def client(app) -> TestClient:
+    return AuthTestClient(app)
+
+
+def test_empty_before_any_request(client: TestClient) -> None:
+    resp = client.get("/api/llm/queue")
+    assert resp.status_code == 200
+    assert resp.json() == {"providers": []}
+
+
+def test_reports_each_provider(client: TestClient) -> None:
+    concurrency._controllers["anthropic"] = ConcurrencyController(
+        "anthropic", initial=3, ceiling=16,
+    )
+    [provider] = client.get("/api/llm/queue").json()["providers"]
+    assert provider["provider"] == "anthropic"
+    assert provider["limit"] == 3
+    assert provider["in_flight"] == 0
+    assert provider["queued"] == 0
+    assert set(provider["priorities"]) == {"interactive", "normal", "background"}
+    assert provider["jobs"] == {}
+
+
+def test_requires_auth(app) -> None:
+    resp = TestClient(app).get("/api/llm/queue")
+    assert resp.status_code == 401
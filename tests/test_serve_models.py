@@ -79,6 +79,7 @@ class TestTableCreation:
         "source_files",
         "session_speakers",
         "transcript_segments",
+        "session_coverages",
         "quotes",
         "screen_clusters",
         "theme_groups",
@@ -96,10 +97,18 @@ class TestTableCreation:
         "import_conflicts",
         "autocode_jobs",
         "proposed_tags",
+        "autocode_caches",
         "tag_prompts",
         "tag_prompt_decisions",
         "project_framework_states",
         "alembic_version",
+        # FTS5 quote search index and its shadow tables (quote_search.py).
+        "quote_fts",
+        "quote_fts_data",
+        "quote_fts_idx",
+        "quote_fts_content",
+        "quote_fts_docsize",
+        "quote_fts_config",
     }
 
     def test_all_tables_exist(self, engine) -> None:  # type: ignore[no-untyped-def]
@@ -394,3 +394,183 @@ class TestQuotesErrors:
     def test_404_on_empty_db(self, client_empty: TestClient) -> None:
         resp = client_empty.get("/api/projects/1/quotes")
         assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------------------
+
+
+class TestQuoteSearch:
+    def _search(self, client: TestClient, q: str, **params: int) -> dict:
+        resp = client.get("/api/projects/1/quotes/search", params={"q": q, **params})
+        assert resp.status_code == 200
+        return resp.json()
+
+    def test_word_prefix_and_phrase(self, client: TestClient) -> None:
+        assert self._search(client, "dashboard")["dom_ids"] == ["q-p1-10"]
+        assert self._search(client, "hamb*")["dom_ids"] == ["q-p1-26"]
+        assert self._search(client, '"results were really"')["dom_ids"] == ["q-p1-46"]
+
+    def test_edit_is_searchable_immediately(self, client: TestClient) -> None:
+        client.put("/api/projects/1/edits", json={"q-p1-10": "The wayfinding was confusing"})
+        assert self._search(client, "wayfinding")["dom_ids"] == ["q-p1-10"]
+        assert self._search(client, "dashboard")["dom_ids"] == []
+
+    def test_paged(self, client: TestClient) -> None:
+        first = self._search(client, "the", limit=1)
+        rest = self._search(client, "the", limit=10, offset=1)
+        assert first["total"] == rest["total"] == 1 + len(rest["dom_ids"])
+        assert first["dom_ids"][0] not in rest["dom_ids"]
+
+    def test_nothing_searchable(self, client: TestClient) -> None:
+        assert self._search(client, "--")["total"] == 0
+
+    def test_404_nonexistent_project(self, client: TestClient) -> None:
+        resp = client.get("/api/projects/999/quotes/search", params={"q": "x"})
+        assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Revision-stamped ETags
+# ---------------------------------------------------------------------------
+
+
+class TestQuotesETag:
+    def test_repeat_load_revalidates_to_304(self, client: TestClient) -> None:
+        first = client.get("/api/projects/1/quotes")
+        etag = first.headers["ETag"]
+        assert client.get("/api/projects/1/quotes").headers["ETag"] == etag
+
+        resp = client.get("/api/projects/1/quotes", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    def test_write_route_changes_etag_and_body(self, client: TestClient) -> None:
+        etag = client.get("/api/projects/1/quotes").headers["ETag"]
+        client.put("/api/projects/1/starred", json={"q-p1-10": True})
+
+        resp = client.get("/api/projects/1/quotes", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+        assert resp.json()["total_starred"] == 1
+
+    def test_direct_session_write_bumps_revision(self, client: TestClient) -> None:
+        """Background writers (AutoCode jobs, the importer) use the same
+        session factory, so any committed write invalidates the cache."""
+        from bristlenose.server.models import Project, Quote, QuoteState
+
+        etag = client.get("/api/projects/1/quotes").headers["ETag"]
+        db = client.app.state.db_factory()
+        try:
+            before = db.get(Project, 1).revision
+            quote = db.query(Quote).first()
+            db.add(QuoteState(quote_id=quote.id, is_hidden=True))
+            db.commit()
+            assert db.get(Project, 1).revision == before + 1
+        finally:
+            db.close()
+        data = client.get("/api/projects/1/quotes").json()
+        assert data["total_hidden"] == 1
+        assert client.get("/api/projects/1/quotes").headers["ETag"] != etag
+
+    def test_read_only_and_rolled_back_sessions_do_not_bump(
+        self, client: TestClient,
+    ) -> None:
+        from bristlenose.server.models import Project, QuoteEdit
+
+        etag = client.get("/api/projects/1/quotes").headers["ETag"]
+        db = client.app.state.db_factory()
+        try:
+            db.query(QuoteEdit).all()
+            db.commit()
+            db.add(QuoteEdit(quote_id=1, edited_text="discarded"))
+            db.flush()
+            db.rollback()
+            db.commit()
+            revision = db.get(Project, 1).revision
+        finally:
+            db.close()
+        assert client.get("/api/projects/1/quotes").headers["ETag"] == etag
+        assert etag.endswith(f'-{revision}"')
+
+
+# ---------------------------------------------------------------------------
+# Windowed endpoints — index + cursor pages
+# ---------------------------------------------------------------------------
+
+
+def _walk(client: TestClient, path: str, limit: int) -> list[str]:
+    """Every dom_id of a group, following next_cursor one page at a time."""
+    dom_ids: list[str] = []
+    params: dict[str, str | int] = {"limit": limit}
+    while True:
+        resp = client.get(path, params=params)
+        assert resp.status_code == 200
+        page = resp.json()
+        assert len(page["quotes"]) <= limit
+        dom_ids += [q["dom_id"] for q in page["quotes"]]
+        if page["next_cursor"] is None:
+            return dom_ids
+        params["cursor"] = page["next_cursor"]
+
+
+class TestQuotesWindowed:
+    def test_index_matches_full_payload(self, client: TestClient) -> None:
+        client.put("/api/projects/1/starred", json={"q-p1-10": True})
+        full = client.get("/api/projects/1/quotes").json()
+        index = client.get("/api/projects/1/quotes/index").json()
+
+        assert [s["cluster_id"] for s in index["sections"]] == [
+            s["cluster_id"] for s in full["sections"]
+        ]
+        assert [s["quote_count"] for s in index["sections"]] == [
+            len(s["quotes"]) for s in full["sections"]
+        ]
+        assert [t["quote_count"] for t in index["themes"]] == [
+            len(t["quotes"]) for t in full["themes"]
+        ]
+        for key in ("total_quotes", "total_hidden", "total_starred",
+                    "total_uncategorised", "has_moderator", "new_since"):
+            assert index[key] == full[key]
+        assert "quotes" not in index["sections"][0]
+
+    def test_pages_reassemble_each_group_in_order(self, client: TestClient) -> None:
+        full = client.get("/api/projects/1/quotes").json()
+        for section in full["sections"]:
+            path = f"/api/projects/1/quotes/sections/{section['cluster_id']}"
+            assert _walk(client, path, limit=1) == [q["dom_id"] for q in section["quotes"]]
+        for theme in full["themes"]:
+            path = f"/api/projects/1/quotes/themes/{theme['theme_id']}"
+            assert _walk(client, path, limit=1) == [q["dom_id"] for q in theme["quotes"]]
+        assert _walk(client, "/api/projects/1/quotes/uncategorised", limit=1) == []
+
+    def test_page_quotes_carry_researcher_state(self, client: TestClient) -> None:
+        client.put("/api/projects/1/starred", json={"q-p1-10": True})
+        full = client.get("/api/projects/1/quotes").json()
+        cluster_id = next(
+            s["cluster_id"] for s in full["sections"]
+            if any(q["dom_id"] == "q-p1-10" for q in s["quotes"])
+        )
+        page = client.get(f"/api/projects/1/quotes/sections/{cluster_id}").json()
+        quote = next(q for q in page["quotes"] if q["dom_id"] == "q-p1-10")
+        assert quote["is_starred"] is True
+
+    def test_page_revalidates_to_304(self, client: TestClient) -> None:
+        cluster_id = client.get("/api/projects/1/quotes/index").json()["sections"][0]["cluster_id"]
+        path = f"/api/projects/1/quotes/sections/{cluster_id}"
+        etag = client.get(path).headers["ETag"]
+        assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+        client.put("/api/projects/1/hidden", json={"q-p1-10": True})
+        assert client.get(path, headers={"If-None-Match": etag}).status_code == 200
+
+    def test_bad_cursor_is_400(self, client: TestClient) -> None:
+        cluster_id = client.get("/api/projects/1/quotes/index").json()["sections"][0]["cluster_id"]
+        path = f"/api/projects/1/quotes/sections/{cluster_id}"
+        assert client.get(path, params={"cursor": "not-a-cursor"}).status_code == 400
+        assert client.get(path, params={"cursor": "WzFd"}).status_code == 400  # [1]
+
+    def test_404s(self, client: TestClient) -> None:
+        assert client.get("/api/projects/1/quotes/sections/999").status_code == 404
+        assert client.get("/api/projects/1/quotes/themes/999").status_code == 404
+        assert client.get("/api/projects/999/quotes/index").status_code == 404
@@ -111,6 +111,28 @@ class TestCsvExport:
         resp = client.get("/api/projects/999/export/quotes.csv")
         assert resp.status_code == 404
 
+    def test_streamed_in_chunks(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Rows are yielded over several chunks, identical to one-shot output.
+
+        Drives the generator directly: TestClient buffers the whole body, so
+        chunk boundaries are not observable through it.
+        """
+        from bristlenose.server.routes import quotes_export
+
+        whole = client.get("/api/projects/1/export/quotes.csv").text
+        monkeypatch.setattr(quotes_export, "_CSV_CHUNK_ROWS", 1)
+        db = client.app.state.db_factory()
+        quotes = quotes_export._open_quotes(db, 1, None, anonymise=False)
+        chunks = list(quotes_export._csv_chunks(db, quotes, quotes_export._parse_headers(None)))
+        assert len(chunks) > 1
+        assert "".join(chunks) == whole
+
+    def test_404_when_no_quotes_match(self, client: TestClient) -> None:
+        resp = client.get("/api/projects/1/export/quotes.csv?quote_ids=invalid-id")
+        assert resp.status_code == 404
+
     def test_custom_headers(self, client: TestClient) -> None:
         custom = ",".join(["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K"])
         resp = client.get(f"/api/projects/1/export/quotes.csv?col_headers={custom}")
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
 from bristlenose.server.app import create_app
+from bristlenose.word_timings import WordTimings, session_timings_path
 from tests.conftest import AuthTestClient
 
 _FIXTURE_DIR = Path(__file__).parent / "fixtures" / "smoke-test" / "input"
@@ -134,6 +136,35 @@ class TestTranscriptSegments:
         for seg in data["segments"]:
             assert seg["words"] is None
 
+    def test_words_from_columnar_timings(self, tmp_path: Path) -> None:
+        project_dir = tmp_path / "input"
+        shutil.copytree(_FIXTURE_DIR, project_dir)
+        client = AuthTestClient(
+            create_app(project_dir=project_dir, dev=True, db_url="sqlite://"),
+        )
+        first = client.get("/api/projects/1/transcripts/s1").json()["segments"][0]
+        WordTimings.from_segments([
+            (first["segment_index"], [
+                {"text": "Okay", "start_time": 1.0, "end_time": 1.25},
+                {"text": "so", "start_time": 1.25, "end_time": 1.5},
+            ]),
+        ]).write(session_timings_path(project_dir / "bristlenose-output", "s1"))
+
+        segs = client.get("/api/projects/1/transcripts/s1").json()["segments"]
+        assert segs[0]["words"] == [
+            {"text": "Okay", "start": 1.0, "end": 1.25},
+            {"text": "so", "start": 1.25, "end": 1.5},
+        ]
+        assert all(seg["words"] is None for seg in segs[1:])
+
+        raw = client.get("/api/projects/1/transcripts/s1/words")
+        assert raw.status_code == 200
+        assert raw.content[:4] == b"BNWT"
+
+    def test_raw_words_404_without_timings(self, client: TestClient) -> None:
+        assert client.get("/api/projects/1/transcripts/s1/words").status_code == 404
+        assert client.get("/api/projects/1/transcripts/s9/words").status_code == 404
+
 
 # ---------------------------------------------------------------------------
 # Quoted segments and annotations
@@ -210,3 +241,29 @@ class TestTranscriptResearcherState:
         ann = data["annotations"].get("q-p1-10")
         if ann:
             assert "confusion" in ann["deleted_badges"]
+
+
+# ---------------------------------------------------------------------------
+# Batch builder (HTML export)
+# ---------------------------------------------------------------------------
+
+
+class TestTranscriptPagesBatch:
+    def test_matches_endpoint(self, client: TestClient) -> None:
+        """The export's batch builder produces the endpoint's exact body."""
+        from bristlenose.server.models import Project
+        from bristlenose.server.models import Session as SessionModel
+        from bristlenose.server.routes.transcript import transcript_pages
+
+        client.put("/api/projects/1/tags", json={"q-p1-10": ["usability"]})
+        client.put("/api/projects/1/deleted-badges", json={"q-p1-10": ["confusion"]})
+        db = client.app.state.db_factory()  # type: ignore[union-attr]
+        try:
+            project = db.get(Project, 1)
+            pages = transcript_pages(db, project, db.query(SessionModel).all())
+        finally:
+            db.close()
+
+        assert list(pages) == ["s1"]
+        expected = client.get("/api/projects/1/transcripts/s1").json()
+        assert pages["s1"].model_dump() == expected
@@ -0,0 +1,208 @@
+"""Tests for the per-session look-ahead through stages 5b–9."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bristlenose.config import BristlenoseSettings
+from bristlenose.events import StageOutcome
+from bristlenose.llm import concurrency
+from bristlenose.llm.client import LLMClient
+from bristlenose.llm.structured import (
+    QuoteExtractionResult,
+    SpeakerRoleAssignment,
+    TopicSegmentationResult,
+)
+from bristlenose.models import (
+    FileType,
+    InputFile,
+    InputSession,
+    SessionTopicMap,
+    SpeakerRole,
+    TranscriptSegment,
+)
+from bristlenose.session_stream import SessionStream
+from bristlenose.stages import (
+    s05b_identify_speakers,
+    s08_topic_segmentation,
+    s09_quote_extraction,
+)
+
+
+def _session(n: int) -> InputSession:
+    path = Path("/nonexistent") / f"s{n}.wav"
+    return InputSession(
+        session_id=f"s{n}",
+        session_number=n,
+        participant_id=f"p{n}",
+        participant_number=n,
+        files=[InputFile(
+            path=path, file_type=FileType.AUDIO,
+            created_at=datetime(2026, 1, 1), size_bytes=1,
+        )],
+        audio_path=path,
+        session_date=datetime(2026, 1, 1),
+    )
+
+
+def _segments() -> list[TranscriptSegment]:
+    return [
+        TranscriptSegment(start_time=0.0, end_time=2.0, text="How was it?", speaker_label="A"),
+        TranscriptSegment(start_time=2.0, end_time=5.0, text="It was fine really.", speaker_label="B"),
+    ]
+
+
+def _heuristic(segments: list[TranscriptSegment]) -> None:
+    for seg in segments:
+        seg.speaker_role = (
+            SpeakerRole.RESEARCHER if seg.speaker_label == "A" else SpeakerRole.PARTICIPANT
+        )
+
+
+@pytest.fixture()
+def stages(monkeypatch):
+    """Stub every LLM call the stream makes; record stage 8/9 calls in order."""
+    calls: list[tuple[str, str]] = []
+
+    async def topics(transcripts, client, **kwargs):
+        t = transcripts[0]
+        calls.append(("topics", t.session_id))
+        return (
+            [SessionTopicMap(session_id=t.session_id, participant_id=t.participant_id, boundaries=[])],
+            StageOutcome(attempted=1, succeeded=1),
+        )
+
+    async def quotes(transcripts, topic_maps, client, **kwargs):
+        calls.append(("quotes", transcripts[0].session_id))
+        return [], StageOutcome(attempted=1, succeeded=1)
+
+    monkeypatch.setattr(s05b_identify_speakers, "identify_speaker_roles_heuristic", _heuristic)
+    monkeypatch.setattr(s05b_identify_speakers, "split_single_speaker_llm", AsyncMock())
+    monkeypatch.setattr(
+        s05b_identify_speakers, "identify_speaker_roles_llm", AsyncMock(return_value=[]),
+    )
+    monkeypatch.setattr(s08_topic_segmentation, "segment_topics", topics)
+    monkeypatch.setattr(s09_quote_extraction, "extract_quotes", quotes)
+    return calls
+
+
+def _settings() -> BristlenoseSettings:
+    return BristlenoseSettings(pii_enabled=False, llm_concurrency=1)
+
+
+class TestSessionStream:
+    def test_releases_sessions_in_input_order(self, stages) -> None:
+        sessions = [_session(1), _session(2)]
+
+        async def run() -> SessionStream:
+            stream = SessionStream(sessions, _settings(), AsyncMock(), Path("/nonexistent"))
+            # s2 finishes transcribing first; its codes must still come after s1's.
+            stream.session_ready("s2", _segments())
+            await asyncio.sleep(0)
+            assert stages == []
+            stream.session_ready("s1", _segments())
+            await stream.wait_quotes()
+            return stream
+
+        stream = asyncio.run(run())
+
+        assert [s.participant_id for s in sessions] == ["p1", "p2"]
+        assert [c for c in stages if c[0] == "topics"] == [("topics", "s1"), ("topics", "s2")]
+        assert set(stream.topic_maps) == {"s1", "s2"}
+        assert set(stream.quotes) == {"s1", "s2"}
+        assert stream.clean_transcripts["s2"].participant_id == "p2"
+
+    def test_missing_session_settled_by_transcription_done(self, stages) -> None:
+        sessions = [_session(1), _session(2)]
+
+        async def run() -> SessionStream:
+            stream = SessionStream(sessions, _settings(), AsyncMock(), Path("/nonexistent"))
+            stream.session_ready("s2", _segments())
+            # s1 failed to transcribe and never arrives on its own.
+            stream.transcription_done({"s2": _segments()})
+            await stream.wait_quotes()
+            return stream
+
+        stream = asyncio.run(run())
+
+        assert set(stream.topic_maps) == {"s2"}
+        assert sessions[1].participant_id == "p1"
+
+    def test_stops_after_consecutive_failures(self, stages, monkeypatch) -> None:
+        async def failing_topics(transcripts, client, **kwargs):
+            stages.append(("topics", transcripts[0].session_id))
+            t = transcripts[0]
+            return (
+                [SessionTopicMap(session_id=t.session_id, participant_id=t.participant_id, boundaries=[])],
+                StageOutcome(attempted=1, succeeded=0),
+            )
+
+        monkeypatch.setattr(s08_topic_segmentation, "segment_topics", failing_topics)
+        sessions = [_session(n) for n in range(1, 6)]
+
+        async def run() -> SessionStream:
+            stream = SessionStream(sessions, _settings(), AsyncMock(), Path("/nonexistent"))
+            for s in sessions:
+                stream.session_ready(s.session_id, _segments())
+            await stream.wait_quotes()
+            return stream
+
+        stream = asyncio.run(run())
+
+        # Three failures trip the threshold; s4 and s5 are left to the stage block.
+        assert stages == [("topics", "s1"), ("topics", "s2"), ("topics", "s3")]
+        assert set(stream.topic_maps) == {"s1", "s2", "s3"}
+        assert stream.quotes == {}
+
+
+class TestSessionStreamConcurrency:
+    """Real stages and the real ``analyze`` → controller path; only the provider is faked."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_controllers(self):
+        concurrency.reset_controllers()
+        yield
+        concurrency.reset_controllers()
+
+    @pytest.mark.parametrize("llm_concurrency", [1, 3])
+    @pytest.mark.parametrize("n_sessions", [1, 6])
+    def test_runs_to_completion(self, monkeypatch, llm_concurrency, n_sessions) -> None:
+        responses = {
+            SpeakerRoleAssignment: {"assignments": []},
+            TopicSegmentationResult: {"boundaries": []},
+            QuoteExtractionResult: {"quotes": []},
+        }
+        calls: list[str] = []
+
+        async def provider(self, system_prompt, user_prompt, response_model, *args, **kwargs):
+            calls.append(response_model.__name__)
+            await asyncio.sleep(0)
+            return response_model.model_validate(responses[response_model])
+
+        monkeypatch.setattr(LLMClient, "_analyze_anthropic", provider)
+        settings = BristlenoseSettings(
+            llm_provider="anthropic",
+            anthropic_api_key="sk-ant-test-key",
+            llm_concurrency=llm_concurrency,
+            llm_cache=False,
+            pii_enabled=False,
+        )
+        sessions = [_session(n) for n in range(1, n_sessions + 1)]
+
+        async def run() -> SessionStream:
+            stream = SessionStream(sessions, settings, LLMClient(settings), Path("/nonexistent"))
+            for s in sessions:
+                stream.session_ready(s.session_id, _segments())
+            await asyncio.wait_for(stream.wait_quotes(), timeout=10)
+            return stream
+
+        stream = asyncio.run(run())
+
+        assert set(stream.topic_maps) == {s.session_id for s in sessions}
+        assert set(stream.quotes) == {s.session_id for s in sessions}
+        assert calls.count("QuoteExtractionResult") == n_sessions
@@ -71,3 +71,297 @@ class TestCollapseAdjacentRepeats:
     def test_short_input(self) -> None:
         assert collapse_adjacent_repeats("") == ""
         assert collapse_adjacent_repeats("hi") == "hi"
+
+
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+
+def _fake_backend(settings, hw, cpu_threads=0):
+    """Module-level stand-in for ``_init_faster_whisper_backend``.
+
+    Must be importable by name: pool workers are spawned, so the loader is
+    pickled by reference rather than patched in.
+    """
+    from bristlenose.models import TranscriptSegment
+
+    def transcribe(audio_path, settings, on_segment=None):
+        if "broken" in audio_path.name:
+            raise RuntimeError("decoder exploded")
+        if on_segment is not None:
+            on_segment(5.0, 10.0)
+        return [
+            TranscriptSegment(
+                start_time=0.0, end_time=1.0,
+                text=f"{audio_path.stem} threads={cpu_threads}",
+                source="faster-whisper",
+            )
+        ]
+
+    return transcribe
+
+
+def _windowed_fake_backend(settings, hw, cpu_threads=0):
+    """Like ``_fake_backend``, but reports two finished windows per file."""
+    from bristlenose.models import TranscriptSegment
+
+    def transcribe(audio_path, settings, on_segment=None, windows=None):
+        for key in ("w0", "w1"):
+            windows.on_complete(f"{audio_path.stem}-{key}")
+        return [
+            TranscriptSegment(
+                start_time=0.0, end_time=1.0, text=audio_path.stem, source="faster-whisper",
+            )
+        ]
+
+    return transcribe
+
+
+def _session(n: int, audio_name: str):
+    from datetime import datetime
+    from pathlib import Path
+
+    from bristlenose.models import FileType, InputFile, InputSession
+
+    path = Path("/nonexistent") / audio_name
+    return InputSession(
+        session_id=f"s{n}",
+        session_number=n,
+        participant_id=f"p{n}",
+        participant_number=n,
+        files=[InputFile(
+            path=path, file_type=FileType.AUDIO,
+            created_at=datetime(2026, 1, 1), size_bytes=1,
+        )],
+        audio_path=path,
+        session_date=datetime(2026, 1, 1),
+    )
+
+
+class TestResolveWorkers:
+    def _settings(self, workers: int):
+        from bristlenose.config import BristlenoseSettings
+
+        return BristlenoseSettings(whisper_workers=workers, whisper_model="small")
+
+    def _cpu(self, cores: int = 32, memory_gb: float = 64.0):
+        from bristlenose.utils.hardware import AcceleratorType, HardwareInfo
+
+        return HardwareInfo(
+            accelerator=AcceleratorType.CPU, cpu_cores=cores, memory_gb=memory_gb,
+        )
+
+    def test_default_is_serial(self) -> None:
+        from bristlenose.stages.s05_transcribe import _resolve_workers
+
+        assert _resolve_workers(self._settings(1), self._cpu(), "faster-whisper", 40) == 1
+
+    def test_explicit_capped_by_sessions(self) -> None:
+        from bristlenose.stages.s05_transcribe import _resolve_workers
+
+        assert _resolve_workers(self._settings(8), self._cpu(), "faster-whisper", 3) == 3
+
+    def test_auto_sizes_from_hardware(self) -> None:
+        from bristlenose.stages.s05_transcribe import _resolve_workers
+
+        # 32 cores / 4 threads = 8; 64GB * 0.75 / 1GB (small) = 48 → 8.
+        assert _resolve_workers(self._settings(0), self._cpu(), "faster-whisper", 40) == 8
+
+    def test_window_workers_follow_setting(self) -> None:
+        from bristlenose.stages.s05_transcribe import _requested_workers
+
+        assert _requested_workers(self._settings(3), self._cpu()) == 3
+        assert _requested_workers(self._settings(0), self._cpu()) == 8
+
+    def test_mlx_and_cuda_never_fan_out(self) -> None:
+        from bristlenose.stages.s05_transcribe import _resolve_workers
+        from bristlenose.utils.hardware import AcceleratorType, HardwareInfo
+
+        assert _resolve_workers(self._settings(8), self._cpu(), "mlx", 40) == 1
+        cuda = HardwareInfo(accelerator=AcceleratorType.CUDA, cuda_available=True)
+        assert _resolve_workers(self._settings(8), cuda, "faster-whisper", 40) == 1
+
+
+class TestTranscribePool:
+    def test_shards_sessions_and_accounts_failures(self) -> None:
+        from bristlenose.config import BristlenoseSettings
+        from bristlenose.stages.s05_transcribe import _transcribe_pool
+        from bristlenose.utils.hardware import AcceleratorType, HardwareInfo
+
+        sessions = [
+            _session(1, "one.wav"),
+            _session(2, "broken.wav"),
+            _session(3, "three.wav"),
+        ]
+        hw = HardwareInfo(accelerator=AcceleratorType.CPU, cpu_cores=8)
+        progress: list[tuple[int, int]] = []
+        handed_over: dict[str, list] = {}
+
+        results, outcome = _transcribe_pool(
+            sessions, BristlenoseSettings(), hw, 2,
+            on_progress=lambda cur, tot: progress.append((cur, tot)),
+            init_backend=_fake_backend,
+            on_session=lambda sid, segs: handed_over.__setitem__(sid, segs),
+        )
+
+        assert list(results) == ["s1", "s2", "s3"]
+        assert results["s1"][0].text == "one threads=4"
+        assert results["s2"] == []
+        assert outcome.attempted == 3
+        assert outcome.succeeded == 2
+        assert [f.session_id for f in outcome.failed] == ["s2"]
+        assert outcome.failed[0].cause.stage == "s05_transcribe"
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert sorted(handed_over) == ["s1", "s2", "s3"]
+        assert handed_over["s2"] == []
+        assert all(handed_over[sid] is results[sid] for sid in results)
+        assert handed_over["s1"][0].text == "one threads=4"
+
+    def test_every_window_report_reaches_the_parent(self) -> None:
+        from bristlenose.config import BristlenoseSettings
+        from bristlenose.stages.s05_transcribe import WindowStore, _transcribe_pool
+        from bristlenose.utils.hardware import AcceleratorType, HardwareInfo
+
+        sessions = [_session(n, f"f{n}.wav") for n in range(1, 5)]
+        hw = HardwareInfo(accelerator=AcceleratorType.CPU, cpu_cores=4)
+        reported: list[tuple[str, str]] = []
+
+        _transcribe_pool(
+            sessions, BristlenoseSettings(), hw, 2,
+            init_backend=_windowed_fake_backend,
+            stores={s.session_id: WindowStore(None, "fp") for s in sessions},
+            on_window=lambda sid, key: reported.append((sid, key)),
+        )
+
+        assert sorted(reported) == [
+            (f"s{n}", f"f{n}-{key}") for n in range(1, 5) for key in ("w0", "w1")
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Chunked transcription
+# ---------------------------------------------------------------------------
+
+
+def _seg(start: float, end: float, text: str):
+    from bristlenose.models import TranscriptSegment, Word
+
+    tokens = text.split()
+    step = (end - start) / max(1, len(tokens))
+    return TranscriptSegment(
+        start_time=start,
+        end_time=end,
+        text=text,
+        words=[
+            Word(text=t, start_time=start + i * step, end_time=start + (i + 1) * step)
+            for i, t in enumerate(tokens)
+        ],
+        source="faster-whisper",
+    )
+
+
+class TestPlanWindows:
+    def test_short_file_is_one_window(self) -> None:
+        from bristlenose.stages.s05_transcribe import plan_windows
+
+        windows = plan_windows([(0.0, 100.0)], 400.0, 300.0)
+        assert len(windows) == 1
+        assert (windows[0].start, windows[0].end) == (0.0, 400.0)
+
+    def test_cuts_land_in_nearest_silence(self) -> None:
+        from bristlenose.stages.s05_transcribe import plan_windows
+
+        # Silences centred on 290s and 610s; ideal cuts at 300s and ~590s.
+        speech = [(0.0, 288.0), (292.0, 608.0), (612.0, 1000.0)]
+        windows = plan_windows(speech, 1000.0, 300.0, overlap=2.0)
+        assert [w.core_start for w in windows] == [0.0, 290.0, 610.0]
+        assert windows[-1].core_end == 1000.0
+        assert windows[1].start == 288.0 and windows[1].end == 612.0
+
+    def test_no_silence_in_reach_cuts_on_the_boundary(self) -> None:
+        from bristlenose.stages.s05_transcribe import plan_windows
+
+        windows = plan_windows([(0.0, 1000.0)], 1000.0, 300.0, overlap=0.0)
+        assert [w.core_start for w in windows] == [0.0, 300.0, 600.0]
+        # 400s tail is under 1.5 windows, so it folds into the last window.
+        assert windows[-1].core_end == 1000.0
+
+
+class TestStitchWindows:
+    def test_overlap_segments_kept_once(self) -> None:
+        from bristlenose.stages.s05_transcribe import TranscribeWindow, stitch_windows
+
+        windows = [
+            TranscribeWindow(0, 0.0, 63.0, 0.0, 60.0),
+            TranscribeWindow(1, 57.0, 120.0, 60.0, 120.0),
+        ]
+        first = [_seg(0.0, 10.0, "hello there"), _seg(56.0, 62.0, "we tried the app")]
+        second = [_seg(56.5, 62.0, "we tried the app"), _seg(70.0, 80.0, "and it crashed")]
+        out = stitch_windows(windows, [first, second])
+        assert [s.text for s in out] == ["hello there", "we tried the app", "and it crashed"]
+
+    def test_repeated_ngram_across_seam_is_trimmed(self) -> None:
+        from bristlenose.stages.s05_transcribe import TranscribeWindow, stitch_windows
+
+        windows = [
+            TranscribeWindow(0, 0.0, 63.0, 0.0, 60.0),
+            TranscribeWindow(1, 57.0, 120.0, 60.0, 120.0),
+        ]
+        first = [_seg(50.0, 59.0, "I opened the settings page")]
+        second = [_seg(59.5, 66.0, "the settings page, and nothing happened")]
+        out = stitch_windows(windows, [first, second])
+        assert out[1].text == "and nothing happened"
+        assert out[1].words[0].text == "and"
+        assert out[1].start_time == out[1].words[0].start_time
+
+    def test_natural_interjection_doubling_survives_seam(self) -> None:
+        from bristlenose.stages.s05_transcribe import TranscribeWindow, stitch_windows
+
+        windows = [
+            TranscribeWindow(0, 0.0, 63.0, 0.0, 60.0),
+            TranscribeWindow(1, 57.0, 120.0, 60.0, 120.0),
+        ]
+        out = stitch_windows(
+            windows,
+            [[_seg(55.0, 59.0, "it was fine yeah")], [_seg(61.0, 63.0, "yeah really")]],
+        )
+        assert [s.text for s in out] == ["it was fine yeah", "yeah really"]
+
+    def test_seam_trim_matches_words_by_text(self) -> None:
+        from bristlenose.models import Word
+        from bristlenose.stages.s05_transcribe import TranscribeWindow, stitch_windows
+
+        windows = [
+            TranscribeWindow(0, 0.0, 63.0, 0.0, 60.0),
+            TranscribeWindow(1, 57.0, 120.0, 60.0, 120.0),
+        ]
+        first = [_seg(50.0, 59.0, "I opened the settings page")]
+        second = _seg(59.5, 66.0, "the settings page and it froze")
+        # Whisper split "settings" into two word tokens.
+        second.words = [
+            Word(text=t, start_time=59.5 + i, end_time=60.5 + i)
+            for i, t in enumerate([" the", " set", "tings", " page", " and", " it", " froze"])
+        ]
+        out = stitch_windows(windows, [first, [second]])
+        assert out[1].text == "and it froze"
+        assert [w.text for w in out[1].words] == [" and", " it", " froze"]
+        assert out[1].start_time == 63.5
+
+
+class TestWindowStore:
+    def test_only_trusted_windows_are_reused(self, tmp_path) -> None:
+        from bristlenose.stages.s05_transcribe import TranscribeWindow, WindowStore
+
+        window = TranscribeWindow(0, 0.0, 63.0, 0.0, 60.0)
+        completed: list[str] = []
+        writer = WindowStore(tmp_path, "abc", on_complete=completed.append)
+        writer.save(window, [_seg(0.0, 5.0, "hello")])
+        assert completed == ["abc-0-63000"]
+
+        assert WindowStore(tmp_path, "abc").load(window) is None
+        resumed = WindowStore(tmp_path, "abc", trusted=frozenset(completed))
+        assert [s.text for s in resumed.load(window)] == ["hello"]
+        # Different source/model fingerprint never reads another's windows.
+        other = WindowStore(tmp_path, "xyz", trusted=frozenset(completed))
+        assert other.load(window) is None
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -15,6 +17,7 @@ from bristlenose.models import (
     SpeakerRole,
     TranscriptSegment,
 )
+from bristlenose.stages.s06b_thumbnails import extract_session_thumbnails
 from bristlenose.utils.video import (
     choose_thumbnail_time,
     extract_thumbnail,
@@ -198,11 +201,16 @@ class TestExtractThumbnail:
             Path(cmd[-1]).write_bytes(b"\xff\xd8fake-jpeg")
             return subprocess.CompletedProcess(cmd, 0, "", "")
 
-        with patch("bristlenose.utils.video.subprocess.run", side_effect=_fake_run):
+        with patch(
+            "bristlenose.utils.video.subprocess.run", side_effect=_fake_run,
+        ) as mock_run:
             result = extract_thumbnail(Path("/fake/video.mp4"), output, 30.0)
 
         assert result == output
         assert output.exists()
+        # Keyframe seek: -noaccurate_seek must precede the input -ss.
+        cmd = mock_run.call_args[0][0]
+        assert cmd.index("-noaccurate_seek") < cmd.index("-ss") < cmd.index("-i")
 
     def test_ffmpeg_failure(self, tmp_path: Path) -> None:
         """FFmpeg fails — returns None."""
@@ -346,3 +354,58 @@ class TestExtractThumbnails:
 
         mock.assert_not_called()
         assert result == {}
+
+    def test_extracts_sessions_concurrently(self, tmp_path: Path) -> None:
+        """Sessions are extracted in parallel; failures are left out."""
+        sessions, transcripts = [], []
+        for sid in ("s1", "s2", "s3"):
+            video_path = tmp_path / f"{sid}.mp4"
+            video_path.write_bytes(b"fake-video")
+            sessions.append(_video_session(session_id=sid, video_path=video_path))
+            transcripts.append(_transcript([_seg(0, 30)], session_id=sid))
+
+        # Every call waits for all three, so this only finishes if they overlap.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _fake_extract(video: Path, output: Path, timestamp: float) -> Path | None:
+            barrier.wait()
+            return None if video.stem == "s2" else output
+
+        with patch("bristlenose.utils.video.extract_thumbnail", side_effect=_fake_extract):
+            result = extract_thumbnails(sessions, transcripts, tmp_path, workers=3)
+
+        assert result == {"s1": tmp_path / "s1.jpg", "s3": tmp_path / "s3.jpg"}
+
+
+# ---------------------------------------------------------------------------
+# extract_session_thumbnails — stage 6b
+# ---------------------------------------------------------------------------
+
+
+class TestExtractSessionThumbnails:
+    def test_no_transcripts_skips_extraction(self, tmp_path: Path) -> None:
+        with patch("bristlenose.stages.s06b_thumbnails.extract_thumbnails") as mock:
+            result = asyncio.run(
+                extract_session_thumbnails([_video_session()], [], tmp_path),
+            )
+
+        mock.assert_not_called()
+        assert result == {}
+
+    def test_runs_extraction_off_the_event_loop(self, tmp_path: Path) -> None:
+        thumb = tmp_path / "s1.jpg"
+        threads: list[threading.Thread] = []
+
+        def _fake(*args: object) -> dict[str, Path]:
+            threads.append(threading.current_thread())
+            return {"s1": thumb}
+
+        sessions = [_video_session()]
+        transcripts = [_transcript([_seg(0, 30)])]
+        with patch("bristlenose.stages.s06b_thumbnails.extract_thumbnails", side_effect=_fake):
+            result = asyncio.run(
+                extract_session_thumbnails(sessions, transcripts, tmp_path),
+            )
+
+        assert result == {"s1": thumb}
+        assert threads[0] is not threading.main_thread()
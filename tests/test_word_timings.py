@@ -0,0 +1,90 @@
+"""Tests for the columnar word-timing store (bristlenose/word_timings.py)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bristlenose.models import Word
+from bristlenose.word_timings import WordTimings, session_timings_path
+
+_SEGMENTS = [
+    (0, [
+        {"text": "Hello", "start_time": 0.5, "end_time": 0.9, "confidence": 0.8},
+        {"text": "café", "start_time": 1.0, "end_time": 1.3},
+    ]),
+    (1, []),
+    (4, [
+        {"text": "Hello", "start_time": 5.0, "end_time": 5.4},
+        {"text": "", "start_time": 5.4, "end_time": 5.5},
+    ]),
+]
+
+
+def _columns(t: WordTimings) -> tuple:
+    return (
+        list(t.segment_keys), list(t.segment_offsets), list(t.start), list(t.end),
+        list(t.text_ids), list(t.strings),
+    )
+
+
+class TestBuild:
+    def test_string_table_deduplicates(self) -> None:
+        t = WordTimings.from_segments(_SEGMENTS)
+        assert list(t.strings) == ["Hello", "café"]
+        assert list(t.text_ids) == [0, 1, 0]
+
+    def test_segments_without_words_are_absent(self) -> None:
+        t = WordTimings.from_segments(_SEGMENTS)
+        assert 1 not in t
+        assert list(t.segment(1)) == []
+        assert [t.text(i) for i in t.segment(4)] == ["Hello"]  # empty text dropped
+
+    def test_confidence_defaults_to_one(self) -> None:
+        t = WordTimings.from_segments(_SEGMENTS)
+        assert t.confidence[0] == pytest.approx(0.8)
+        assert t.confidence[1] == 1.0
+
+
+class TestRoundTrip:
+    def test_bytes_round_trip(self) -> None:
+        t = WordTimings.from_segments(_SEGMENTS)
+        assert _columns(WordTimings.from_buffer(t.to_bytes())) == _columns(t)
+
+    def test_open_maps_written_file(self, tmp_path: Path) -> None:
+        path = session_timings_path(tmp_path, "s1")
+        WordTimings.from_segments(_SEGMENTS).write(path)
+        assert path == tmp_path / ".bristlenose" / "word-timings" / "s1.bnwt"
+
+        t = WordTimings.open(path)
+        assert isinstance(t.start, memoryview)  # a view, not a copy
+        assert [t.text(i) for i in t.segment(0)] == ["Hello", "café"]
+        assert t.start[t.segment(4)[0]] == 5.0
+
+    def test_empty(self) -> None:
+        t = WordTimings.from_buffer(WordTimings.from_segments([]).to_bytes())
+        assert len(t) == 0
+        assert list(t.segment(0)) == []
+
+    @pytest.mark.parametrize("data", [b"", b"BNWT", b"XXXX" + bytes(40)])
+    def test_rejects_bad_images(self, data: bytes) -> None:
+        with pytest.raises(ValueError):
+            WordTimings.from_buffer(data)
+
+    def test_truncated_image(self) -> None:
+        data = WordTimings.from_segments(_SEGMENTS).to_bytes()
+        with pytest.raises(ValueError):
+            WordTimings.from_buffer(data[:40])
+
+
+class TestWordView:
+    def test_words_are_built_on_demand(self) -> None:
+        t = WordTimings.from_segments(_SEGMENTS)
+        words = t.words(0)
+        assert all(isinstance(w, Word) for w in words)
+        assert [(w.text, w.start_time, w.end_time) for w in words] == [
+            ("Hello", 0.5, 0.9), ("café", 1.0, 1.3),
+        ]
+        assert words[0].confidence == pytest.approx(0.8)
+        assert t.words(99) == []